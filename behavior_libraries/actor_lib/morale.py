@@ -27,7 +27,8 @@ Usage:
 
 from dataclasses import dataclass
 from typing import List, Optional
-import random
+
+from src.state_accessor import accessor_rng
 
 
 # Default values
@@ -263,7 +264,7 @@ def attempt_flee(
         success = force_success
     else:
         # 50% base chance to flee successfully
-        success = random.random() < 0.5
+        success = accessor_rng(accessor).random() < 0.5
 
     if not success:
         return FleeResult(
@@ -273,7 +274,7 @@ def attempt_flee(
         )
 
     # Choose random exit and move
-    direction, destination = random.choice(available_exits)
+    direction, destination = accessor_rng(accessor).choice(available_exits)
     accessor.set_entity_where(actor.id, destination)
 
     return FleeResult(
@@ -15,9 +15,10 @@ Usage:
     )
 """
 
-import random
 from typing import List, Optional
 
+from src.state_accessor import accessor_rng
+
 
 def wander_step(accessor, actor) -> Optional[str]:
     """
@@ -35,8 +36,9 @@ def wander_step(accessor, actor) -> Optional[str]:
         return None
 
     # Check wander chance
+    rng = accessor_rng(accessor)
     chance = actor.properties.get('wander_chance', 0.5)
-    if random.random() > chance:
+    if rng.random() > chance:
         return None  # Stayed in place
 
     # Pick random location (can be same as current)
@@ -45,7 +47,7 @@ def wander_step(accessor, actor) -> Optional[str]:
     if not available:
         return None  # Nowhere else to go
 
-    next_location = random.choice(available)
+    next_location = rng.choice(available)
 
     # Move actor
     accessor.set_entity_where(actor.id, next_location)
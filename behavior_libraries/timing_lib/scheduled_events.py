@@ -21,12 +21,12 @@ Usage:
     )
 """
 
-import uuid
 from typing import Any, Dict, List, Optional
 
 from src.behavior_manager import EventResult
 from src.infrastructure_types import ScheduledEvent, ScheduledEventId, TurnNumber
 from src.infrastructure_utils import get_scheduled_events as _get_state_scheduled_events
+from src.state_accessor import accessor_rng
 
 
 def schedule_event(
@@ -51,7 +51,8 @@ def schedule_event(
     Returns:
         Unique ID for the scheduled event
     """
-    event_id = ScheduledEventId(str(uuid.uuid4())[:8])
+    # Drawn from the session generator so seeded replays save identical ids
+    event_id = ScheduledEventId(f"{accessor_rng(accessor).getrandbits(32):08x}")
 
     event: ScheduledEvent = {
         'id': event_id,
@@ -1,4 +1,4 @@
-"""Meta/system commands - quit, save, load.
+"""Meta/system commands - quit, save, load, undo, redo.
 
 These commands control the game session rather than game state.
 They return signals that the game loop processes for session-level operations
@@ -34,6 +34,22 @@ vocabulary = {
             "llm_context": {
                 "traits": ["restores saved game", "meta-command"]
             }
+        },
+        {
+            "word": "undo",
+            "synonyms": [],
+            "object_required": False,
+            "llm_context": {
+                "traits": ["takes back the last turn", "meta-command"]
+            }
+        },
+        {
+            "word": "redo",
+            "synonyms": [],
+            "object_required": False,
+            "llm_context": {
+                "traits": ["replays an undone turn", "meta-command"]
+            }
         }
     ],
     "nouns": [],
@@ -134,3 +150,45 @@ def handle_load(accessor, action):
             "raw_input": action.get("raw_input", "")
         }
     )
+
+
+def handle_undo(accessor, action):
+    """
+    Handle undo command - signals the last turn should be taken back.
+
+    The game loop rolls the state back with GameEngine.undo_history.
+
+    Args:
+        accessor: StateAccessor instance (not used)
+        action: Action dict (not used)
+
+    Returns:
+        HandlerResult with undo signal in data field
+    """
+    return HandlerResult(
+        success=True,
+        primary="Undoing...",
+        data={
+            "signal": "undo"
+        }
+    )
+
+
+def handle_redo(accessor, action):
+    """
+    Handle redo command - signals the last undone turn should be replayed.
+
+    Args:
+        accessor: StateAccessor instance (not used)
+        action: Action dict (not used)
+
+    Returns:
+        HandlerResult with redo signal in data field
+    """
+    return HandlerResult(
+        success=True,
+        primary="Redoing...",
+        data={
+            "signal": "redo"
+        }
+    )
@@ -12,6 +12,7 @@ from src.infrastructure_utils import (
     transition_state,
 )
 from src.narrator_helpers import select_state_fragments
+from src.state_accessor import accessor_rng
 from behavior_libraries.companion_lib.activation import make_companion
 
 # Wire on_receive_item so give handler's invoke_behavior can find it
@@ -132,7 +133,7 @@ def on_receive_item(
             # Pack will mirror via on_wolf_state_change
 
             # Select fragments for the new state
-            fragments = select_state_fragments(alpha, new_state, max_count=2)
+            fragments = select_state_fragments(alpha, new_state, max_count=2, rng=accessor_rng(accessor))
 
             # Check if we should give the alpha_fang_fragment (at allied state)
             extra_feedback = ""
@@ -173,7 +174,7 @@ def on_receive_item(
 
     # No state change, but still accepted food
     current_state = get_current_state(sm) if sm else "hostile"
-    fragments = select_state_fragments(alpha, current_state, max_count=2)
+    fragments = select_state_fragments(alpha, current_state, max_count=2, rng=accessor_rng(accessor))
 
     return EventResult(
         allow=True,
@@ -62,7 +62,7 @@ def on_use_component_on_telescope(
         return EventResult(allow=True, feedback=None)
 
     state = accessor.game_state
-    telescope = next((item for item in state.items if item.id == "frozen_telescope"), None)
+    telescope = state.lookup("item", "frozen_telescope")
     if not telescope:
         return EventResult(allow=True, feedback=None)
 
@@ -105,7 +105,7 @@ def on_use_component_on_telescope(
         telescope.properties["repaired"] = True
 
         # Mark synced telescope as enhanced
-        ancient_telescope = next((item for item in state.items if item.id == "ancient_telescope"), None)
+        ancient_telescope = state.lookup("item", "ancient_telescope")
         if ancient_telescope:
             ancient_telescope.properties["synced_repaired"] = True
 
@@ -143,7 +143,7 @@ def on_use(
         return EventResult(allow=True, feedback=None)
 
     state = accessor.game_state
-    telescope = next((item for item in state.items if item.id == "frozen_telescope"), None)
+    telescope = state.lookup("item", "frozen_telescope")
     if not telescope:
         return EventResult(allow=True, feedback=None)
 
@@ -208,7 +208,7 @@ def on_examine(
         return EventResult(allow=True, feedback=None)
 
     state = accessor.game_state
-    telescope = next((item for item in state.items if item.id == "frozen_telescope"), None)
+    telescope = state.lookup("item", "frozen_telescope")
     if not telescope:
         return EventResult(allow=True, feedback=None)
 
@@ -303,7 +303,7 @@ def _generate_telescope_view(state: Any) -> str:
             views.append("• Beast Wilds: Sira lies injured near the overlook.")
 
     # Waystone progress
-    waystone = next((item for item in state.items if item.id == "damaged_waystone"), None)
+    waystone = state.lookup("item", "damaged_waystone")
     if waystone:
         fragments_count = len(waystone.properties.get("installed_fragments", []))
         views.append(f"• Meridian Nexus: The waystone has {fragments_count} of 5 fragments installed.")
@@ -14,6 +14,7 @@ from src.infrastructure_utils import (
     transition_state,
 )
 from src.narrator_helpers import select_state_fragments
+from src.state_accessor import accessor_rng
 
 # Vocabulary: wire hooks to events
 # Note: Dialog reactions are handled by infrastructure/dialog_reactions.py
@@ -181,7 +182,7 @@ def on_aldric_heal(
             # Severity 40 = tier 40+ = 4 damage/turn, net +1 HP/turn with 5 HP regen
 
         # Select fragments for the new state
-        fragments = select_state_fragments(aldric, "stabilized", max_count=2)
+        fragments = select_state_fragments(aldric, "stabilized", max_count=2, rng=accessor_rng(accessor))
 
         return EventResult(
             allow=True,
@@ -217,7 +218,7 @@ def on_aldric_heal(
         apply_trust_change(entity=aldric, delta=2)
 
         # Select fragments for the new state
-        fragments = select_state_fragments(aldric, "recovering", max_count=2)
+        fragments = select_state_fragments(aldric, "recovering", max_count=2, rng=accessor_rng(accessor))
 
         return EventResult(
             allow=True,
@@ -54,7 +54,7 @@ def _has_breathing_item(state: Any, actor_id: str) -> bool:
 
 def _get_location_breathable(state: Any, location_id: str) -> bool:
     """Check if a location is breathable. Defaults to True if not specified."""
-    location = next((loc for loc in state.locations if loc.id == location_id), None)
+    location = state.lookup("location", location_id)
     if not location:
         return True
     return location.properties.get("breathable", True)
@@ -141,10 +141,11 @@ def on_spread_milestone_check(
             if not prop_name:
                 continue
 
-            # Apply to matching locations
-            for loc in state.locations:
-                if _location_matches_patterns(loc.id, location_patterns):
-                    loc.properties[prop_name] = prop_value
+            # Apply to matching locations, wherever they are in the world
+            for loc in state.all_entities(
+                "location", lambda location_id: _location_matches_patterns(location_id, location_patterns)
+            ):
+                loc.properties[prop_name] = prop_value
 
         # Mark milestone as reached
         if "reached_milestones" not in entity.properties:
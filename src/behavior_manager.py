@@ -1,6 +1,6 @@
 """Behavior management system for entity events."""
 
-from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING, Tuple, Protocol, Literal
+from typing import Optional, Dict, Any, Iterable, List, Callable, TYPE_CHECKING, Tuple, Protocol, Literal
 from dataclasses import dataclass, field
 import importlib
 import logging
@@ -17,12 +17,13 @@ from src.action_types import ActionDict, HandlerCallable
 if TYPE_CHECKING:
     from src.state_accessor import StateAccessor
     from src.state_manager import Entity, GameState
+    from src.turn_profiler import TurnProfiler
 
 
 class EventCallable(Protocol):
-    """Signature for entity behavior callbacks."""
+    """Signature for behavior callbacks (entity is None for global turn-phase handlers)."""
 
-    def __call__(self, entity: "Entity", accessor: "StateAccessor", context: Dict[str, Any]) -> EventResult:
+    def __call__(self, entity: Optional["Entity"], accessor: "StateAccessor", context: Dict[str, Any]) -> EventResult:
         ...
 
 
@@ -73,6 +74,13 @@ class BehaviorManager:
         self._fallback_events: Dict[str, str] = {}
         # Hook definitions: hook_name -> HookDefinition (Phase 1: Hook System Redesign)
         self._hook_definitions: Dict[str, HookDefinition] = {}
+        # Optional timing of handler/behavior calls (set by LLMProtocolHandler.enable_profiling)
+        self.profiler: Optional["TurnProfiler"] = None
+        # Compiled dispatch: (entity behaviors, event) -> ((label, handler), ...) in behaviors order.
+        # Keyed by the behaviors' contents, so an entity whose list changes gets a new entry.
+        self._dispatch: Dict[Tuple[Tuple[str, ...], str], Tuple[Tuple[str, EventCallable], ...]] = {}
+        # Compiled dispatch for global events: event -> ((label, handler), ...)
+        self._global_dispatch: Dict[str, Tuple[Tuple[str, EventCallable], ...]] = {}
 
     def _calculate_tier(self, behavior_file_path: str, base_behavior_dir: str) -> int:
         """
@@ -459,6 +467,7 @@ class BehaviorManager:
 
         # Store module for entity behavior invocation
         self._modules[module_name] = module
+        self._invalidate_dispatch()
 
         # Validate and register vocabulary
         if hasattr(module, 'vocabulary') and module.vocabulary:
@@ -831,18 +840,22 @@ class BehaviorManager:
         """
         # For global events (turn phases, etc.), invoke all modules that register this event
         if entity is None:
-            event_info = self._event_registry.get(event_name)
-            if not event_info or not event_info.registered_by:
-                return NO_HANDLER
+            global_handlers = self._global_dispatch.get(event_name)
+            if global_handlers is None:
+                event_info = self._event_registry.get(event_name)
+                if not event_info or not event_info.registered_by:
+                    return NO_HANDLER
+                global_handlers = self._compile_handlers(event_info.registered_by, event_name)
+                self._global_dispatch[event_name] = global_handlers
 
             results = []
-            for module_name in event_info.registered_by:
-                module = self._modules.get(module_name)
-                if module and hasattr(module, event_name):
-                    handler = getattr(module, event_name)
+            for label, handler in global_handlers:
+                if self.profiler is None:
                     event_result = handler(None, accessor, context)
-                    if isinstance(event_result, EventResult):
-                        results.append(event_result)
+                else:
+                    event_result = self.profiler.call("behavior", label, handler, None, accessor, context)
+                if isinstance(event_result, EventResult):
+                    results.append(event_result)
 
             if not results:
                 return NO_HANDLER
@@ -901,26 +914,20 @@ class BehaviorManager:
         if not isinstance(entity.behaviors, list):
             return NO_HANDLER
 
-        results = []
-
-        for behavior_module_name in entity.behaviors:
-            # Look up loaded module
-            module = self._modules.get(behavior_module_name)
-            if not module:
-                # Module not loaded, skip
-                continue
-
-            # Check if module has event handler function
-            if not hasattr(module, event_name):
-                # This module doesn't handle this event, skip
-                continue
+        key = (tuple(entity.behaviors), event_name)
+        handlers = self._dispatch.get(key)
+        if handlers is None:
+            handlers = self._dispatch[key] = self._compile_handlers(key[0], event_name)
 
-            # Get handler function
-            handler = getattr(module, event_name)
+        results = []
 
+        for label, handler in handlers:
             # Call handler with entity, accessor, context
             # Errors here indicate bugs in behavior code and should fail loudly during development
-            event_result = handler(entity, accessor, context)
+            if self.profiler is None:
+                event_result = handler(entity, accessor, context)
+            else:
+                event_result = self.profiler.call("behavior", label, handler, entity, accessor, context)
 
             if isinstance(event_result, EventResult):
                 results.append(event_result)
@@ -947,6 +954,58 @@ class BehaviorManager:
 
         return EventResult(allow=combined_allow, feedback=combined_message)
 
+    def _compile_handlers(
+        self, module_names: Iterable[str], event_name: str
+    ) -> Tuple[Tuple[str, EventCallable], ...]:
+        """
+        Resolve the handlers for event_name in module_names, in order.
+
+        Modules that are not loaded or do not define the event are skipped.
+
+        Returns:
+            Tuple of (profiler label, handler) pairs
+        """
+        handlers = []
+        for module_name in module_names:
+            module = self._modules.get(module_name)
+            if module and hasattr(module, event_name):
+                handlers.append((f"{module_name}.{event_name}", getattr(module, event_name)))
+        return tuple(handlers)
+
+    def compile_dispatch(self, game_state: "GameState") -> None:
+        """
+        Precompile handler lists for every event on every entity behaviors list.
+
+        Entities whose behaviors change later, and events first seen later,
+        are compiled on first invocation.
+
+        Args:
+            game_state: Loaded game state whose entities will receive events
+        """
+        from src.state_manager import ENTITY_COLLECTIONS
+
+        events = set(self._event_registry) | set(self._fallback_events.values())
+        behavior_lists = set()
+        for attr, _ in ENTITY_COLLECTIONS:
+            collection = getattr(game_state, attr, None) or []
+            entities = collection.values() if isinstance(collection, dict) else collection
+            for entity in entities:
+                behaviors = getattr(entity, 'behaviors', None)
+                if isinstance(behaviors, list) and behaviors:
+                    behavior_lists.add(tuple(behaviors))
+
+        for behaviors in behavior_lists:
+            for event_name in events:
+                self._dispatch[(behaviors, event_name)] = self._compile_handlers(behaviors, event_name)
+        for event_name, event_info in self._event_registry.items():
+            if event_info.registered_by:
+                self._global_dispatch[event_name] = self._compile_handlers(event_info.registered_by, event_name)
+
+    def _invalidate_dispatch(self) -> None:
+        """Drop compiled dispatch tables (modules changed)."""
+        self._dispatch.clear()
+        self._global_dispatch.clear()
+
     def invoke_handler(self, verb: str, accessor: "StateAccessor", action: ActionDict) -> Optional[HandlerResult]:
         """
         Invoke protocol handlers in tier order until one succeeds.
@@ -970,7 +1029,10 @@ class BehaviorManager:
         result = None
         last_message_result = None  # Track last result with a non-empty primary text
         for tier, handler, module in handlers:
-            result = handler(accessor, action)
+            if self.profiler is None:
+                result = handler(accessor, action)
+            else:
+                result = self.profiler.call("handler", f"{verb} ({module})", handler, accessor, action)
             if result and result.success:
                 return result  # Success, stop trying deeper tiers
             # Track last failure with a message for better error reporting
@@ -1215,7 +1277,8 @@ class BehaviorManager:
 
     def finalize_loading(self, game_state: "GameState") -> None:
         """
-        Call after all vocabularies loaded to run validations.
+        Call after all vocabularies loaded to run validations and compile
+        the event dispatch tables.
 
         Args:
             game_state: Loaded game state (for entity behavior validation)
@@ -1229,18 +1292,11 @@ class BehaviorManager:
         self.validate_hook_invocation_consistency()
         self.validate_turn_phase_not_in_entity_behaviors(game_state)
         self.validate_entity_behaviors(game_state)
+        self.compile_dispatch(game_state)
 
     # ========== End Phase 2 Validation Methods ==========
 
     def clear_cache(self) -> None:
         """Clear behavior cache (useful for hot reload)."""
         self._behavior_cache.clear()
-
-
-# Global instance
-_behavior_manager = BehaviorManager()
-
-
-def get_behavior_manager() -> BehaviorManager:
-    """Get the global behavior manager instance."""
-    return _behavior_manager
+        self._invalidate_dispatch()
@@ -6,16 +6,22 @@ text-based (parser-only) and LLM-augmented game modes.
 
 import sys
 import json
+import random
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, TYPE_CHECKING
 
 from src.state_manager import load_game_state, GameState
 from src.behavior_manager import BehaviorManager
 from src.llm_protocol import LLMProtocolHandler
-from src.vocabulary_service import build_merged_vocabulary
+from src.turn_executor import TurnScheduler
+from src.undo_history import UndoHistory
+from src.vocabulary_service import VocabularyService
 from src.parser import Parser
 from src.types import ActorId
 
+if TYPE_CHECKING:
+    from src.world_template import WorldTemplate
+
 
 class GameEngine:
     """Game engine that manages state, behaviors, and vocabulary.
@@ -24,11 +30,19 @@ class GameEngine:
     LLM-augmented game modes.
     """
 
-    def __init__(self, game_dir: Union[str, Path]):
+    def __init__(self, game_dir: Union[str, Path], template: Optional["WorldTemplate"] = None,
+                 seed: Optional[int] = None):
         """Initialize the game engine.
 
         Args:
             game_dir: Path to game directory containing game_state.json
+            template: Optional WorldTemplate for this game; when given, the
+                session state comes from template.new_state() instead of
+                re-parsing game_state.json, and behavior module discovery
+                is done once per template
+            seed: Seed for the session's random number generator (wandering,
+                fleeing, narration fragment choice); None draws from the
+                random module's shared generator, so runs differ
 
         Raises:
             FileNotFoundError: If game directory, game_state.json, or behaviors/ doesn't exist
@@ -48,7 +62,10 @@ class GameEngine:
 
         # Load game state
         # JSONDecodeError or ValueError here indicates invalid game_state.json (authoring error)
-        self.game_state = load_game_state(str(game_state_path))
+        if template is not None:
+            self.game_state = template.new_state()
+        else:
+            self.game_state = load_game_state(str(game_state_path))
 
         # Validate behaviors directory
         behaviors_dir = self.game_dir / "behaviors"
@@ -75,33 +92,72 @@ class GameEngine:
             sys.path.insert(0, game_dir_str)
 
         # Load all behaviors from game directory (includes core via symlink)
-        modules = self.behavior_manager.discover_modules(str(behaviors_dir))
+        if template is not None and template.behavior_modules is not None:
+            modules = template.behavior_modules
+        else:
+            modules = self.behavior_manager.discover_modules(str(behaviors_dir))
+            if template is not None:
+                template.behavior_modules = modules
         self.behavior_manager.load_modules(modules)
 
         # Validate all loaded modules and game state
         # Catches authoring errors early (hook typos, invalid behaviors, etc.)
         self.behavior_manager.finalize_loading(self.game_state)
 
-        # Initialize turn executor with hook definitions
-        from src import turn_executor
-        turn_executor.initialize(self.behavior_manager._hook_definitions)
+        # Sort turn phases once for this engine's behavior set
+        self.turn_scheduler = TurnScheduler.for_behavior_manager(self.behavior_manager)
 
-        # Load and merge vocabulary
-        self.merged_vocabulary = build_merged_vocabulary(
-            game_state=self.game_state,
-            behavior_manager=self.behavior_manager
-        )
+        # Load and merge vocabulary; kept current as entities are added,
+        # removed and renamed (merged_vocabulary is the service's live dict)
+        self.vocabulary_service = VocabularyService(self.game_state, self.behavior_manager)
+        self.merged_vocabulary = self.vocabulary_service.vocabulary
+
+        # Session random number generator, shared by every handler of this engine
+        self.rng: Optional[random.Random] = random.Random(seed) if seed is not None else None
 
         # Create JSON protocol handler
-        self.json_handler = LLMProtocolHandler(self.game_state, behavior_manager=self.behavior_manager)
+        self.json_handler = LLMProtocolHandler(
+            self.game_state,
+            behavior_manager=self.behavior_manager,
+            turn_scheduler=self.turn_scheduler,
+            vocabulary_service=self.vocabulary_service,
+            rng=self.rng
+        )
+
+        # In-memory undo/redo of turns (see enable_undo)
+        self.undo_history: Optional[UndoHistory] = None
+
+    def enable_undo(self, depth: int = 100, memory_limit: int = 32 * 1024 * 1024) -> UndoHistory:
+        """Start recording turns for undo and redo.
+
+        The session's visit tracking is rolled back with the state, and the
+        history follows the state through reload_state. Call
+        undo_history.checkpoint() once per turn.
+
+        Args:
+            depth: Most turns kept for undo
+            memory_limit: Approximate bytes of turn records and entity images kept
+
+        Returns:
+            The engine's UndoHistory
+        """
+        if self.undo_history is None:
+            self.undo_history = UndoHistory(self.game_state, self.json_handler,
+                                            depth=depth, memory_limit=memory_limit)
+        else:
+            self.undo_history.depth = depth
+            self.undo_history.memory_limit = memory_limit
+        return self.undo_history
 
     def create_parser(self) -> Parser:
         """Create a Parser with merged vocabulary.
 
+        The parser's words follow entities added, removed and renamed later.
+
         Returns:
             Parser instance ready for command parsing
         """
-        return Parser.from_vocab(self.merged_vocabulary)
+        return self.vocabulary_service.create_parser()
 
     def create_llm_parser(self, shared_backend):
         """Create an LLM parser with adapter.
@@ -162,7 +218,7 @@ class GameEngine:
             return {"location_objects": [], "inventory": [], "exits": []}
 
         # Create temporary accessor for queries
-        accessor = StateAccessor(self.game_state, self.behavior_manager)
+        accessor = StateAccessor(self.game_state, self.behavior_manager, self.rng)
 
         # Get location objects using index (fixes Myconid Sanctuary bug)
         location_objects: List[str] = []
@@ -211,7 +267,10 @@ class GameEngine:
 
     def create_narrator(self, api_key: str,
                        model: str = "claude-3-5-haiku-20241022",
-                       show_traits: bool = False):
+                       show_traits: bool = False,
+                       narration_cache=None,
+                       phrase_cache=None,
+                       abbreviate_fields: bool = False):
         """Create an LLMNarrator with game-specific configuration.
 
         Automatically loads narrator_style.txt from game directory and combines
@@ -221,6 +280,9 @@ class GameEngine:
             api_key: Anthropic API key
             model: Model to use for generation
             show_traits: If True, print llm_context traits before narration
+            narration_cache: Optional NarrationCache reused for repeated narration plans
+            phrase_cache: Optional PhraseCache of LLM parses for input the local parser rejects
+            abbreviate_fields: If True, narration inputs use abbreviated field names
 
         Returns:
             LLMNarrator instance ready for natural language interaction
@@ -248,7 +310,11 @@ class GameEngine:
             prompt_file=style_path,
             behavior_manager=self.behavior_manager,
             vocabulary=self.merged_vocabulary,
-            show_traits=show_traits
+            vocabulary_service=self.vocabulary_service,
+            show_traits=show_traits,
+            narration_cache=narration_cache,
+            phrase_cache=phrase_cache,
+            abbreviate_fields=abbreviate_fields
         )
 
     def create_mlx_narrator(self,
@@ -256,7 +322,11 @@ class GameEngine:
                             show_traits: bool = False,
                             temperature: float = 0.8,
                             max_tokens: int = 300,
-                            shared_backend=None):
+                            shared_backend=None,
+                            narration_cache=None,
+                            phrase_cache=None,
+                            abbreviate_fields: bool = False,
+                            prompt_kv_store=None):
         """Create an MLXNarrator with game-specific configuration.
 
         Uses Apple's MLX framework for native Metal GPU acceleration.
@@ -268,6 +338,10 @@ class GameEngine:
             temperature: Temperature for generation (0.0-2.0)
             max_tokens: Max tokens to generate
             shared_backend: Optional SharedMLXBackend instance (saves ~4-6GB memory)
+            narration_cache: Optional NarrationCache reused for repeated narration plans
+            phrase_cache: Optional PhraseCache of LLM parses for input the local parser rejects
+            abbreviate_fields: If True, narration inputs use abbreviated field names
+            prompt_kv_store: Optional PromptKVStore for the warmed system prompt cache
 
         Returns:
             MLXNarrator instance ready for natural language interaction
@@ -294,20 +368,36 @@ class GameEngine:
             prompt_file=style_path,
             behavior_manager=self.behavior_manager,
             vocabulary=self.merged_vocabulary,
+            vocabulary_service=self.vocabulary_service,
             show_traits=show_traits,
             temperature=temperature,
             max_tokens=max_tokens,
-            shared_backend=shared_backend
+            shared_backend=shared_backend,
+            narration_cache=narration_cache,
+            phrase_cache=phrase_cache,
+            abbreviate_fields=abbreviate_fields,
+            prompt_kv_store=prompt_kv_store
         )
 
     def reload_state(self, new_state: GameState) -> None:
         """Reload the game state (e.g., after loading a save file).
 
         Recreates the JSON handler with the new state while preserving
-        behavior manager and vocabulary.
+        behavior manager and turn scheduler. The vocabulary service switches
+        to the new state's entity nouns, and an undo history (see
+        enable_undo) starts over from the new state.
 
         Args:
             new_state: The new game state to use
         """
         self.game_state = new_state
-        self.json_handler = LLMProtocolHandler(self.game_state, behavior_manager=self.behavior_manager)
+        self.vocabulary_service.attach(new_state)
+        self.json_handler = LLMProtocolHandler(
+            self.game_state,
+            behavior_manager=self.behavior_manager,
+            turn_scheduler=self.turn_scheduler,
+            vocabulary_service=self.vocabulary_service,
+            rng=self.rng
+        )
+        if self.undo_history is not None:
+            self.undo_history.attach(new_state, self.json_handler)
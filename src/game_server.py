@@ -0,0 +1,265 @@
+"""Asyncio server hosting many game sessions in one process.
+
+Clients speak the existing JSON protocol (LLMProtocolHandler.handle_message)
+as line-delimited JSON over TCP or a Unix socket. Each connection is one
+session with its own GameEngine; all sessions of the server share one
+WorldTemplate of the game.
+
+- Engine work runs on a bounded thread pool, so a slow turn never blocks
+  the event loop or other sessions.
+- Commands of one session run strictly one at a time, in the order they
+  were sent; every request line gets exactly one response line, in order.
+- Each session buffers at most max_pending requests. When the buffer is
+  full the server stops reading that connection, so a client that sends
+  faster than its turns complete is slowed by TCP flow control instead of
+  growing server memory. {"type": "session"} reports the session's id and
+  current backlog without touching the game.
+
+Usage:
+    python -m src.game_server examples/big_game --port 7777
+    python -m src.game_server examples/big_game --unix /tmp/text-game.sock --workers 8
+
+    $ echo '{"type": "command", "action": {"verb": "look"}}' | nc localhost 7777
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Add project root to path when run as script (not when imported as module)
+if __name__ == '__main__':
+    project_root = Path(__file__).parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+
+from src.game_engine import GameEngine
+from src.world_template import WorldTemplate
+
+logger = logging.getLogger(__name__)
+
+# Longest request line accepted, in bytes
+MAX_LINE_BYTES = 1024 * 1024
+
+# Pending connections the listener queues; asyncio's default of 100 resets
+# clients when many players connect at once
+LISTEN_BACKLOG = 1024
+
+
+def error_response(message: str) -> Dict[str, Any]:
+    """Build an error response in the protocol's format."""
+    return {
+        "type": "error",
+        "success": False,
+        "verbosity": "brief",
+        "narration": {"primary_text": message}
+    }
+
+
+def encode_line(message: Dict[str, Any]) -> bytes:
+    """Encode a message as one line of JSON."""
+    return json.dumps(message, default=str).encode() + b"\n"
+
+
+class GameSession:
+    """
+    One client's game: an engine plus its request backlog.
+
+    Requests are queued by the connection reader and executed in order
+    by a single worker task, so the engine is never used by two threads
+    at once.
+    """
+
+    def __init__(self, session_id: int, engine: GameEngine, max_pending: int):
+        self.session_id = session_id
+        self.engine = engine
+        self.max_pending = max_pending
+        # (message, None) to execute, (None, response) for a rejected line, None at end
+        self.requests: "asyncio.Queue[Optional[Tuple[Any, Any]]]" = asyncio.Queue(maxsize=max_pending)
+        self.commands_handled = 0
+
+    def status(self) -> Dict[str, Any]:
+        """Session metadata returned for {"type": "session"}."""
+        return {
+            "type": "session",
+            "success": True,
+            "session_id": self.session_id,
+            "pending": self.requests.qsize(),
+            "max_pending": self.max_pending,
+            "commands_handled": self.commands_handled,
+            "turn": self.engine.game_state.turn_count,
+        }
+
+
+class GameServer:
+    """
+    Multiplexes game sessions over line-delimited JSON connections.
+
+    Args:
+        game_dir: Game directory (containing game_state.json and behaviors/)
+        workers: Threads available for engine work across all sessions
+        max_pending: Requests buffered per session before reading pauses
+    """
+
+    def __init__(self, game_dir: Union[str, Path], workers: int = 4, max_pending: int = 8):
+        self.game_dir = Path(game_dir)
+        self.max_pending = max_pending
+        self.template = WorldTemplate(self.game_dir / "game_state.json")
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="game-engine")
+        self.sessions: Dict[int, GameSession] = {}
+        self._session_ids = itertools.count(1)
+        # GameEngine setup touches sys.path and imports behavior modules
+        self._engine_lock = threading.Lock()
+        self._server: Optional[asyncio.Server] = None
+        self._connections: Dict[int, Tuple["asyncio.Task[None]", asyncio.StreamWriter]] = {}
+
+    def _create_engine(self) -> GameEngine:
+        with self._engine_lock:
+            return GameEngine(self.game_dir, template=self.template)
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, unix_path: Optional[str] = None
+    ) -> asyncio.Server:
+        """Start listening on a Unix socket (if unix_path) or TCP host/port."""
+        if unix_path:
+            self._server = await asyncio.start_unix_server(
+                self.handle_connection, path=unix_path, limit=MAX_LINE_BYTES, backlog=LISTEN_BACKLOG
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self.handle_connection, host=host, port=port, limit=MAX_LINE_BYTES, backlog=LISTEN_BACKLOG
+            )
+        return self._server
+
+    async def close(self) -> None:
+        """Stop accepting connections, end open sessions and release the worker threads."""
+        if self._server is not None:
+            self._server.close()
+        # Closing a connection ends its session the same way a client disconnect does
+        connections = list(self._connections.values())
+        for _, writer in connections:
+            writer.close()
+        await asyncio.gather(*(task for task, _ in connections), return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection as one game session."""
+        loop = asyncio.get_running_loop()
+        try:
+            engine = await loop.run_in_executor(self.executor, self._create_engine)
+        except Exception as e:
+            logger.exception("Failed to create game session")
+            writer.write(encode_line(error_response(f"Could not start session: {e}")))
+            await writer.drain()
+            writer.close()
+            return
+
+        session = GameSession(next(self._session_ids), engine, self.max_pending)
+        self.sessions[session.session_id] = session
+        self._connections[session.session_id] = (asyncio.current_task(), writer)  # type: ignore[assignment]
+        worker = asyncio.create_task(self._run_session(session, writer))
+        try:
+            await self._read_requests(session, reader)
+            # Client is done sending; answer everything it already sent
+            await session.requests.put(None)
+            await worker
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+            del self._connections[session.session_id]
+            del self.sessions[session.session_id]
+            writer.close()
+
+    async def _read_requests(self, session: GameSession, reader: asyncio.StreamReader) -> None:
+        """Queue request lines; blocks (and stops reading) while the backlog is full."""
+        while True:
+            try:
+                line = await reader.readline()
+            except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                return
+            if not line:
+                return
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError as e:
+                await session.requests.put((None, error_response(f"Invalid JSON: {e}")))
+                continue
+            if not isinstance(message, dict):
+                await session.requests.put((None, error_response("Message must be a JSON object")))
+                continue
+            await session.requests.put((message, None))
+
+    async def _run_session(self, session: GameSession, writer: asyncio.StreamWriter) -> None:
+        """Execute one session's requests in order and write the responses."""
+        loop = asyncio.get_running_loop()
+        while True:
+            request = await session.requests.get()
+            if request is None:
+                return
+            message, response = request
+            if response is None and message.get("type") == "session":
+                response = session.status()
+            elif response is None:
+                try:
+                    response = await loop.run_in_executor(
+                        self.executor, session.engine.json_handler.handle_message, message
+                    )
+                except Exception as e:
+                    logger.exception("Session %d failed handling %r", session.session_id, message)
+                    response = error_response(f"Internal error: {e}")
+                session.commands_handled += 1
+            try:
+                writer.write(encode_line(response))
+                await writer.drain()
+            except ConnectionError:
+                # Client went away; keep draining the queue so the reader can finish
+                continue
+
+
+async def serve(
+    game_dir: str, host: str, port: int, unix_path: Optional[str], workers: int, max_pending: int
+) -> None:
+    """Run a GameServer until cancelled."""
+    server = GameServer(game_dir, workers=workers, max_pending=max_pending)
+    listener = await server.start(host=host, port=port, unix_path=unix_path)
+    where = unix_path or ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"Serving {game_dir} on {where}", flush=True)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main() -> int:
+    """Entry point for the game server."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", help="Game directory")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=7777, help="TCP port (default: 7777)")
+    parser.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=4, help="Engine worker threads (default: 4)")
+    parser.add_argument("--max-pending", type=int, default=8,
+                        help="Requests buffered per session before reading pauses (default: 8)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(args.game_dir, args.host, args.port, args.unix, args.workers, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,15 +6,25 @@ producing structured JSON for the game engine.
 
 import json
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import mlx.core as mx
 from mlx_lm import stream_generate
 from mlx_lm.sample_utils import make_sampler
-from mlx_lm.models.cache import trim_prompt_cache
+from mlx_lm.models.cache import make_prompt_cache, trim_prompt_cache
+
+# Batched generation arrived in later mlx-lm releases
+try:
+    from mlx_lm import batch_generate
+    HAS_BATCH_GENERATE = True
+except ImportError:
+    HAS_BATCH_GENERATE = False
 
 from src.shared_mlx import SharedMLXBackend
 
+# Parser output is one short JSON object
+MAX_PARSE_TOKENS = 150
+
 
 class LLMCommandParser:
     """LLM-based command parser that normalizes natural language to action dicts.
@@ -78,6 +88,28 @@ class LLMCommandParser:
         # Call LLM with cached system prompt
         response = self._call_llm(user_prompt)
 
+        return self._command_from_response(response, player_input)
+
+    def parse_batch(self,
+                    requests: List[Tuple[str, Dict[str, List[str]]]]) -> List[Optional[Dict[str, Any]]]:
+        """Parse several players' commands in one batched generation.
+
+        Used by ParseBatcher to serve many sessions from one model.
+
+        Args:
+            requests: (player_input, context) pairs, as parse_command takes them
+
+        Returns:
+            One parse_command result per request, in request order
+        """
+        user_prompts = [self._build_user_prompt(context, player_input)
+                        for player_input, context in requests]
+        responses = self._call_llm_batch(user_prompts)
+        return [self._command_from_response(response, player_input)
+                for response, (player_input, _) in zip(responses, requests)]
+
+    def _command_from_response(self, response: str, player_input: str) -> Optional[Dict[str, Any]]:
+        """Turn an LLM response into a command dict, or None if it is not one."""
         # Parse JSON response
         parsed = self._parse_response(response)
 
@@ -174,22 +206,30 @@ Command: "{command}"
 
 Output JSON:"""
 
-    def _call_llm(self, user_prompt: str) -> str:
-        """Call LLM with cached system prompt."""
-        # Trim cache back to system prompt length
+    def _trim_cache(self) -> None:
+        """Trim the prompt cache back to the cached system prompt."""
         cache_len = self.cache[0].offset if (self.cache and len(self.cache) > 0) else 0
         tokens_to_trim = cache_len - self.system_prompt_length
         if tokens_to_trim > 0:
             trim_prompt_cache(self.cache, tokens_to_trim)
 
-        # Build user message portion
+    def _user_portion(self, user_prompt: str) -> str:
+        """Chat-formatted user message with generation prompt (follows the cached system prompt)."""
         user_messages = [{"role": "user", "content": user_prompt}]
-        user_portion = self.tokenizer.apply_chat_template(
+        return self.tokenizer.apply_chat_template(
             user_messages,
             add_generation_prompt=True,
             tokenize=False
         )
 
+    def _call_llm(self, user_prompt: str) -> str:
+        """Call LLM with cached system prompt."""
+        # Trim cache back to system prompt length
+        self._trim_cache()
+
+        # Build user message portion
+        user_portion = self._user_portion(user_prompt)
+
         # Generate with temperature=0.0 for deterministic parsing
         sampler = make_sampler(temp=0.0)
 
@@ -198,7 +238,7 @@ Output JSON:"""
             self.model,
             self.tokenizer,
             prompt=user_portion,
-            max_tokens=150,  # Shorter than narration
+            max_tokens=MAX_PARSE_TOKENS,  # Shorter than narration
             sampler=sampler,
             prompt_cache=self.cache,
         ):
@@ -206,6 +246,43 @@ Output JSON:"""
 
         return response.strip()
 
+    def _call_llm_batch(self, user_prompts: List[str]) -> List[str]:
+        """Call LLM for several prompts at once, sharing the cached system prompt.
+
+        Every prompt starts from its own view of the system prompt KV cache
+        (the cached arrays are shared, not recomputed), and all prompts are
+        prefilled and decoded together by mlx_lm's batch_generate. Without
+        batch support in the installed mlx-lm, prompts run one at a time.
+        """
+        if not HAS_BATCH_GENERATE or len(user_prompts) == 1:
+            return [self._call_llm(user_prompt) for user_prompt in user_prompts]
+
+        self._trim_cache()
+        prompts = []
+        for user_prompt in user_prompts:
+            user_portion = self._user_portion(user_prompt)
+            # Tokenize as stream_generate does for a string prompt
+            bos_token = self.tokenizer.bos_token
+            add_special_tokens = bos_token is None or not user_portion.startswith(bos_token)
+            prompts.append(self.tokenizer.encode(user_portion, add_special_tokens=add_special_tokens))
+
+        response = batch_generate(
+            self.model,
+            self.tokenizer,
+            prompts,
+            prompt_caches=[self._system_prompt_cache() for _ in prompts],
+            max_tokens=MAX_PARSE_TOKENS,
+            sampler=make_sampler(temp=0.0),
+        )
+        return [text.strip() for text in response.texts]
+
+    def _system_prompt_cache(self) -> List[Any]:
+        """A new prompt cache holding the (trimmed) system prompt KV state."""
+        cache = make_prompt_cache(self.model)
+        for layer, system_layer in zip(cache, self.cache):
+            layer.state = system_layer.state
+        return cache
+
     def _parse_response(self, response: str) -> Optional[Dict[str, Any]]:
         """Parse LLM response to dict.
 
@@ -19,15 +19,20 @@ if __name__ == '__main__':
         sys.path.insert(0, str(project_root))
 
 from src.game_engine import GameEngine
+from src.narration_cache import NarrationCache
+from src.phrase_cache import PhraseCache
 
 
-def main(game_dir: Optional[str] = None, debug: bool = False, show_traits: bool = False):
+def main(game_dir: Optional[str] = None, debug: bool = False, show_traits: bool = False,
+         narration_cache_path: Optional[str] = None, phrase_cache_path: Optional[str] = None):
     """Run the LLM-powered text adventure.
 
     Args:
         game_dir: Path to game directory containing game_state.json (required)
         debug: If True, enable debug logging (shows cache statistics)
         show_traits: If True, print llm_context traits before each LLM narration
+        narration_cache_path: Optional file to load and save the narration cache
+        phrase_cache_path: Optional file to load and save the cache of LLM command parses
     """
     # Configure logging
     if debug:
@@ -56,7 +61,10 @@ def main(game_dir: Optional[str] = None, debug: bool = False, show_traits: bool
 
     # Create narrator with game-specific prompt
     # Missing narrator protocol or files indicate authoring errors and should fail loudly
-    narrator = engine.create_narrator(api_key, show_traits=show_traits)
+    narration_cache = NarrationCache(path=Path(narration_cache_path)) if narration_cache_path else None
+    phrase_cache = PhraseCache(path=Path(phrase_cache_path) if phrase_cache_path else None)
+    narrator = engine.create_narrator(api_key, show_traits=show_traits, narration_cache=narration_cache,
+                                      phrase_cache=phrase_cache)
 
     # Show title and opening
     print(f"\n{engine.game_state.metadata.title}")
@@ -82,13 +90,22 @@ def main(game_dir: Optional[str] = None, debug: bool = False, show_traits: bool
                 break
 
             # Errors processing turns indicate bugs in behaviors/handlers and should fail loudly
-            response = narrator.process_turn(player_input)
-            print(f"\n{response}")
+            print()
+            for chunk in narrator.process_turn_stream(player_input):
+                print(chunk, end="", flush=True)
+            print()
 
         except KeyboardInterrupt:
             print("\n\nGoodbye!")
             break
 
+    if narration_cache is not None:
+        narration_cache.save()
+        logging.debug(f"Narration cache: {narration_cache.stats()}")
+    if phrase_cache.path is not None:
+        phrase_cache.save()
+    logging.debug(f"Phrase cache: {phrase_cache.stats()}")
+
     return 0
 
 
@@ -100,6 +117,10 @@ def cli_main():
                         help='Enable debug logging (shows API cache statistics)')
     parser.add_argument('--show-traits', '-t', action='store_true',
                         help='Print llm_context traits before each LLM narration')
+    parser.add_argument('--narration-cache', metavar='PATH',
+                        help='Reuse narrations of repeated results, persisted in PATH')
+    parser.add_argument('--phrase-cache', metavar='PATH',
+                        help='Persist LLM parses of rephrased commands in PATH')
     args = parser.parse_args()
 
     # If it's just a name (no path separators), prefix with examples/
@@ -108,7 +129,8 @@ def cli_main():
     else:
         game_path = Path(args.game_dir)
 
-    sys.exit(main(game_dir=str(game_path), debug=args.debug, show_traits=args.show_traits))
+    sys.exit(main(game_dir=str(game_path), debug=args.debug, show_traits=args.show_traits,
+                  narration_cache_path=args.narration_cache, phrase_cache_path=args.phrase_cache))
 
 
 if __name__ == "__main__":
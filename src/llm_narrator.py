@@ -13,7 +13,7 @@ import re
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -26,22 +26,36 @@ except ImportError:
 from src.llm_protocol import LLMProtocolHandler
 from src.behavior_manager import BehaviorManager
 from src.command_utils import parsed_to_json
+from src.narration_cache import NarrationCache
+from src.narration_encoder import abbreviation_legend, encode_narration, encode_payload
 from src.parser import Parser
-from src.vocabulary_service import load_base_vocabulary
+from src.phrase_cache import PhraseCache, scene_context
+from src.vocabulary_service import VocabularyService, load_base_vocabulary
 
 
 # Default vocabulary file location
 DEFAULT_VOCABULARY_FILE = Path(__file__).parent / "vocabulary.json"
 
+# Refresh the cached system prompt when it is this old; the ephemeral cache
+# lives 5 minutes from its last use
+PROMPT_CACHE_REFRESH_SECONDS = 240.0
+
 class LLMNarrator:
     """Translates between natural language and the JSON protocol."""
 
+    # time.monotonic() of the last request that used the cached system prompt
+    _last_request = float("-inf")
+
     def __init__(self, api_key: str, json_handler: LLMProtocolHandler,
                  model: str = "claude-3-5-haiku-20241022",
                  prompt_file: Optional[Path] = None,
                  behavior_manager: Optional[BehaviorManager] = None,
                  vocabulary: Optional[Dict[str, Any]] = None,
-                 show_traits: bool = False):
+                 vocabulary_service: Optional[VocabularyService] = None,
+                 show_traits: bool = False,
+                 narration_cache: Optional[NarrationCache] = None,
+                 phrase_cache: Optional[PhraseCache] = None,
+                 abbreviate_fields: bool = False):
         """Initialize the narrator.
 
         Args:
@@ -51,7 +65,14 @@ class LLMNarrator:
             prompt_file: Path to system prompt file (required, must exist)
             behavior_manager: Optional BehaviorManager to get merged vocabulary
             vocabulary: Optional merged vocabulary dict (if not provided, loads default)
+            vocabulary_service: Optional VocabularyService of the session; when given,
+                its live vocabulary and a parser it keeps current are used
             show_traits: If True, print llm_context traits before each LLM narration
+            narration_cache: Optional NarrationCache reused for repeated narration plans
+            phrase_cache: Optional PhraseCache of LLM parses for input the local
+                parser rejects
+            abbreviate_fields: If True, send narration inputs with abbreviated field
+                names (explained in the system prompt) to save input tokens
 
         Raises:
             FileNotFoundError: If prompt_file does not exist
@@ -64,12 +85,26 @@ class LLMNarrator:
         self.model = model
         self.behavior_manager = behavior_manager
         self.show_traits = show_traits
+        self.narration_cache = narration_cache
+        self.phrase_cache = phrase_cache
+        self.abbreviate_fields = abbreviate_fields
 
         # Store merged vocabulary for parser (must be before _load_system_prompt)
-        self.merged_vocabulary = self._get_merged_vocabulary(vocabulary)
-        self.parser = self._create_parser(self.merged_vocabulary)
+        if vocabulary_service is not None:
+            self.merged_vocabulary = vocabulary_service.vocabulary
+            self.parser = vocabulary_service.create_parser()
+        else:
+            self.merged_vocabulary = self._get_merged_vocabulary(vocabulary)
+            self.parser = self._create_parser(self.merged_vocabulary)
+        if phrase_cache is not None:
+            if vocabulary_service is not None:
+                vocabulary_service.add_phrase_cache(phrase_cache)
+            else:
+                phrase_cache.set_vocabulary(self.merged_vocabulary)
         assert prompt_file is not None, "prompt_file is required"
         self.system_prompt = self._load_system_prompt(prompt_file)
+        if abbreviate_fields:
+            self.system_prompt += "\n\n" + abbreviation_legend()
 
     def _print_traits(self, result: Dict[str, Any]) -> None:
         """Print llm_context traits from a result if show_traits is enabled.
@@ -157,9 +192,69 @@ class LLMNarrator:
         Returns:
             Narrative description of what happened
         """
-        # 1. Try fast local parsing first
+        return "".join(self.process_turn_stream(player_input))
+
+    def process_turn_stream(self, player_input: str) -> Iterator[str]:
+        """Process one turn, streaming the narrative as it is generated.
+
+        The command and the turn phases it triggers have completed when this
+        returns; only the narration is left to the returned iterator, so the
+        first words can be shown as soon as the model produces them.
+
+        Args:
+            player_input: Natural language input from player
+
+        Returns:
+            Iterator over chunks of the narrative text
+        """
+        json_cmd = self._command_for_input(player_input)
+        if isinstance(json_cmd, str):
+            return iter([json_cmd])
+
+        # Execute command via game engine (result includes verbosity from NarrationResult)
+        result = self.handler.handle_message(json_cmd)
+        return self.narrate_result_stream(result)
+
+    def narrate_result_stream(self, result: Dict[str, Any]) -> Iterator[str]:
+        """Stream the narrative for a command result.
+
+        Serves repeated narration plans from the narration cache, if any.
+
+        Args:
+            result: JSON result from game engine
+
+        Returns:
+            Iterator over chunks of the narrative text
+        """
+        # Print traits if enabled
+        self._print_traits(result)
+
+        narration_dict = self._narration_dict(result)
+        if self.narration_cache is not None:
+            cached = self.narration_cache.get(narration_dict)
+            if cached is not None:
+                logger.debug("Narration cache hit")
+                return iter([cached])
+
+        narration_input = f"Narrate this result:\n{encode_narration(narration_dict, self.abbreviate_fields)}"
+        logger.debug(f"Narration input ({len(narration_input)} chars): {narration_input[:500]}...")
+        stream = self._stream_llm(narration_input)
+        if self.narration_cache is not None:
+            return self.narration_cache.record(narration_dict, stream)
+        return stream
+
+    def _command_for_input(self, player_input: str) -> Union[Dict[str, Any], str]:
+        """Translate player input to a JSON command.
+
+        Args:
+            player_input: Natural language input from player
+
+        Returns:
+            The JSON command, or the text to show the player if the input
+            could not be turned into a command
+        """
+        # Try fast local parsing first
         parsed = self.parser.parse_command(player_input)
-        json_cmd: Dict[str, Any]
 
         if parsed is not None:
             # Convert ParsedCommand to JSON protocol format
@@ -170,42 +265,52 @@ class LLMNarrator:
             else:
                 json_cmd = parsed_to_json(parsed)
             logger.debug(f"Local parse: {player_input!r} -> {json_cmd}")
-        else:
-            # Fall back to LLM for complex input
-            logger.debug(f"LLM parse needed for: {player_input!r}")
-            command_response = self._call_llm(
-                f"Player says: {player_input}\n\nRespond with a JSON command."
+            return json_cmd
+
+        # Fall back to LLM for complex input, unless it was parsed before
+        context: Dict[str, Any] = {}
+        if self.phrase_cache is not None:
+            context = scene_context(self.handler.state, self.handler.behavior_manager)
+            cached = self.phrase_cache.get(player_input, context)
+            logger.debug(
+                f"Phrase cache {'hit' if cached is not None else 'miss'} for {player_input!r} "
+                f"(session hit rate {self.phrase_cache.stats()['hit_rate']:.0%})"
             )
-            extracted = self._extract_json(command_response)
+            if cached is not None:
+                return cached
+
+        logger.debug(f"LLM parse needed for: {player_input!r}")
+        command_response = self._call_llm(
+            f"Player says: {player_input}\n\nRespond with a JSON command."
+        )
+        extracted = self._extract_json(command_response)
 
-            if extracted is None:
-                return "I don't understand what you want to do."
-            json_cmd = extracted
+        if extracted is None:
+            return "I don't understand what you want to do."
+        if self.phrase_cache is not None and extracted.get("type") == "command":
+            self.phrase_cache.put(player_input, context, extracted)
+        return extracted
 
-        # 2. Execute command via game engine (result includes verbosity from NarrationResult)
-        result = self.handler.handle_message(json_cmd)
+    def _narration_dict(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Select the fields of a command result that are sent for narration.
 
-        # 3. Print traits if enabled
-        self._print_traits(result)
+        The 'data' field contains raw engine data (including state_fragments) that
+        would confuse the LLM. Only send 'narration' (the NarrationPlan), 'success',
+        and 'verbosity' fields.
 
-        # 4. Build narration input - only include fields needed for narration
-        # The 'data' field contains raw engine data (including state_fragments) that
-        # would confuse the LLM. Only send 'narration' (the NarrationPlan), 'success',
-        # and 'verbosity' fields.
+        Args:
+            result: JSON result from game engine
+
+        Returns:
+            success and verbosity plus the NarrationPlan fields
+        """
         narration_dict = {
             "success": result.get("success", True),
             "verbosity": result.get("verbosity", "full"),
         }
         if "narration" in result:
             narration_dict.update(result["narration"])
-
-        # 5. Get narrative from LLM
-        narration_input = f"Narrate this result:\n{json.dumps(narration_dict, indent=2)}"
-        logger.debug(f"Narration input ({len(narration_input)} chars): {narration_input[:500]}...")
-        narrative = self._call_llm(narration_input)
-        logger.debug(f"Narration output ({len(narrative)} chars): {narrative[:200]}...")
-
-        return narrative
+        return narration_dict
 
     def get_opening(self) -> str:
         """Get opening narrative for game start.
@@ -228,9 +333,41 @@ class LLMNarrator:
         result_with_verbosity["verbosity"] = "full"
 
         return self._call_llm(
-            f"Narrate the opening scene:\n{json.dumps(result_with_verbosity, indent=2)}"
+            f"Narrate the opening scene:\n{encode_payload(result_with_verbosity)}"
         )
 
+    def prepare_narration(self) -> None:
+        """Get the narrator ready while the next command is still being parsed.
+
+        If the cached system prompt may have expired, re-creates it with a
+        one-token request so the narration that follows reads the prompt from
+        cache instead of paying for its prefill. Meant to run concurrently with
+        a slow (LLM) parse; errors are logged and otherwise ignored.
+        """
+        if time.monotonic() - self._last_request < PROMPT_CACHE_REFRESH_SECONDS:
+            return
+        self._last_request = time.monotonic()
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=1,
+                system=[
+                    {
+                        "type": "text",
+                        "text": self.system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
+                messages=[{"role": "user", "content": "Ready?"}]
+            )
+            usage = response.usage
+            logger.debug(
+                f"Prompt cache warm - cache_read: {getattr(usage, 'cache_read_input_tokens', 0)}, "
+                f"cache_creation: {getattr(usage, 'cache_creation_input_tokens', 0)}"
+            )
+        except anthropic.APIError as e:
+            logger.debug(f"Prompt cache warm failed: {e}")
+
     def _call_llm(self, user_message: str) -> str:
         """Make an API call to the LLM.
 
@@ -244,6 +381,7 @@ class LLMNarrator:
         Returns:
             The LLM's response text
         """
+        self._last_request = time.monotonic()
         try:
             response = self.client.messages.create(
                 model=self.model,
@@ -276,6 +414,51 @@ class LLMNarrator:
         except anthropic.APIError as e:
             return f"[Narrator unavailable: {e}]"
 
+    def _stream_llm(self, user_message: str) -> Iterator[str]:
+        """Stream an API call to the LLM, yielding text as it arrives.
+
+        Same request as _call_llm (including the cached system prompt), sent
+        with the streaming API. A rate-limited request is retried only if
+        nothing has been yielded yet.
+
+        Args:
+            user_message: The message to send
+
+        Yields:
+            Chunks of the LLM's response text
+        """
+        yielded = False
+        self._last_request = time.monotonic()
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=512,
+                system=[
+                    {
+                        "type": "text",
+                        "text": self.system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
+                messages=[{"role": "user", "content": user_message}]
+            ) as stream:
+                for text in stream.text_stream:
+                    yielded = True
+                    yield text
+                usage = stream.get_final_message().usage
+            logger.debug(
+                f"API stream - input: {usage.input_tokens}, output: {usage.output_tokens}, "
+                f"cache_read: {getattr(usage, 'cache_read_input_tokens', 0)}, "
+                f"cache_creation: {getattr(usage, 'cache_creation_input_tokens', 0)}"
+            )
+        except anthropic.RateLimitError:
+            if yielded:
+                raise
+            time.sleep(1)
+            yield from self._stream_llm(user_message)  # Simple retry
+        except anthropic.APIError as e:
+            yield f"[Narrator unavailable: {e}]"
+
     def _extract_json(self, response: str) -> Optional[dict]:
         """Extract JSON from LLM response.
 
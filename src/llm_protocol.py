@@ -20,9 +20,12 @@ from .types import ActorId, EventName, HookName, ItemId, LocationId
 if TYPE_CHECKING:
     from src.state_manager import Location, Item, Actor
     from src.state_accessor import StateAccessor
+    from src.vocabulary_service import VocabularyService
 from .state_manager import GameState
 from .behavior_manager import BehaviorManager
 from .word_entry import WordEntry, WordType
+from .turn_profiler import TurnProfiler
+from .turn_executor import TurnScheduler
 
 
 class LLMProtocolHandler:
@@ -38,8 +41,20 @@ class LLMProtocolHandler:
     # even when game state is corrupted
     META_COMMANDS = {"save", "quit", "help", "load"}
 
-    def __init__(self, state: GameState, behavior_manager: Optional[BehaviorManager] = None):
+    def __init__(
+        self,
+        state: GameState,
+        behavior_manager: Optional[BehaviorManager] = None,
+        turn_scheduler: Optional[TurnScheduler] = None,
+        vocabulary_service: Optional["VocabularyService"] = None,
+        rng: Optional[random.Random] = None
+    ):
         self.state = state
+
+        # Source of randomness for this session's behaviors and narration,
+        # handed to every StateAccessor; seed it for reproducible replays
+        # (None: the random module's shared generator)
+        self.rng = rng
         self.state_corrupted = False
 
         # Visit tracking for verbosity/familiarity determination
@@ -58,6 +73,42 @@ class LLMProtocolHandler:
 
         self.behavior_manager = behavior_manager
 
+        # Turn phase order for this session; built from the behavior
+        # manager's hooks on first use when not supplied (see GameEngine)
+        self.turn_scheduler = turn_scheduler
+
+        # Session vocabulary kept current by the engine (see GameEngine);
+        # without one, vocabulary queries merge it from scratch
+        self.vocabulary_service = vocabulary_service
+
+        # Optional turn latency profiler (see enable_profiling)
+        self.profiler: Optional[TurnProfiler] = None
+
+    def enable_profiling(self, profiler: Optional[TurnProfiler] = None) -> TurnProfiler:
+        """
+        Start profiling command turns.
+
+        Attaches the profiler to this handler and its BehaviorManager. Every
+        command response then carries a per-turn timing report in
+        data["profile"]; profiler.summary() aggregates the session.
+
+        Args:
+            profiler: Profiler to use (a new TurnProfiler if None)
+
+        Returns:
+            The attached profiler
+        """
+        if profiler is None:
+            profiler = TurnProfiler()
+        self.profiler = profiler
+        self.behavior_manager.profiler = profiler
+        return profiler
+
+    def disable_profiling(self) -> None:
+        """Stop profiling command turns."""
+        self.profiler = None
+        self.behavior_manager.profiler = None
+
     def is_json_input(self, text: str) -> bool:
         """Check if input is JSON (starts with '{' after stripping whitespace)."""
         return text.strip().startswith("{")
@@ -133,8 +184,27 @@ class LLMProtocolHandler:
         - success: Whether the action succeeded
         - verbosity: "brief" or "full" based on verb and tracking
         - narration: NarrationPlan with all info needed for LLM narration
-        - data: Raw engine data for debugging/UI
+        - data: Raw engine data for debugging/UI (includes "profile" when
+          profiling is enabled)
         """
+        profiler = self.profiler
+        if profiler is None:
+            return self._handle_command(message)
+
+        profiler.begin_turn()
+        try:
+            response = self._handle_command(message)
+        except BaseException:
+            profiler.end_turn("<error>")
+            raise
+        report = profiler.end_turn(str(response.get("action") or response.get("type")))
+        data = dict(response.get("data") or {})
+        data["profile"] = report
+        response["data"] = data
+        return response
+
+    def _handle_command(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a command message (see handle_command)."""
         import sys
 
         action: ActionDict = message.get("action", {})
@@ -214,7 +284,7 @@ class LLMProtocolHandler:
                 single_action = self._convert_action_strings_to_wordentry(single_action)
 
                 # Execute command
-                accessor_single = StateAccessor(self.state, self.behavior_manager)
+                accessor_single = StateAccessor(self.state, self.behavior_manager, self.rng)
                 result = self.behavior_manager.invoke_handler(handler_verb, accessor_single, single_action)
                 results.append((obj, result))
 
@@ -243,7 +313,7 @@ class LLMProtocolHandler:
                     if result and result.beats:
                         beats.extend(result.beats)
 
-                accessor = StateAccessor(self.state, self.behavior_manager)
+                accessor = StateAccessor(self.state, self.behavior_manager, self.rng)
                 combined_result = HandlerResult(
                     success=True,
                     primary=primary_text,
@@ -278,7 +348,7 @@ class LLMProtocolHandler:
                             item_name = obj.word if hasattr(obj, 'word') else str(obj)
                             messages.append(f"Failed to {verb} the {item_name}.")
 
-                accessor = StateAccessor(self.state, self.behavior_manager)
+                accessor = StateAccessor(self.state, self.behavior_manager, self.rng)
                 combined_result = HandlerResult(
                     success=all_succeeded,
                     primary=" ".join(messages)
@@ -314,7 +384,7 @@ class LLMProtocolHandler:
             }
 
         # StateAccessor already imported above
-        accessor = StateAccessor(self.state, self.behavior_manager)
+        accessor = StateAccessor(self.state, self.behavior_manager, self.rng)
 
         result = self.behavior_manager.invoke_handler(verb, accessor, action)
 
@@ -366,8 +436,9 @@ class LLMProtocolHandler:
 
         # Fire turn phase hooks after successful command
         if result.success:
-            from src import turn_executor
-            turn_messages = turn_executor.execute_turn_phases(
+            if self.turn_scheduler is None:
+                self.turn_scheduler = TurnScheduler.for_behavior_manager(self.behavior_manager)
+            turn_messages = self.turn_scheduler.execute_turn_phases(
                 self.state, self.behavior_manager, accessor, action
             )
             if turn_messages:
@@ -388,13 +459,16 @@ class LLMProtocolHandler:
         if not self.behavior_manager:
             return "tracking"
 
-        from src.vocabulary_service import build_merged_vocabulary
+        if self.vocabulary_service is not None:
+            verb_entry = self.vocabulary_service.verb_entry(verb)
+        else:
+            from src.vocabulary_service import build_merged_vocabulary
 
-        vocab = build_merged_vocabulary(self.state, self.behavior_manager)
-        for verb_entry in vocab.get("verbs", []):
-            if verb_entry.get("word") == verb:
-                mode = verb_entry.get("narration_mode", "tracking")
-                return str(mode) if mode else "tracking"
+            vocab = build_merged_vocabulary(self.state, self.behavior_manager)
+            verb_entry = next((v for v in vocab.get("verbs", []) if v.get("word") == verb), None)
+        if verb_entry is not None:
+            mode = verb_entry.get("narration_mode", "tracking")
+            return str(mode) if mode else "tracking"
 
         return "tracking"
 
@@ -552,7 +626,7 @@ class LLMProtocolHandler:
         include = message.get("include", [])
         actor_id = cast(ActorId, message.get("actor_id") or ActorId("player"))
 
-        accessor = StateAccessor(self.state, self.behavior_manager)
+        accessor = StateAccessor(self.state, self.behavior_manager, self.rng)
         full_data = serialize_location_for_llm(accessor, loc, actor_id)
 
         # Filter to only included sections (empty include means all)
@@ -660,7 +734,9 @@ class LLMProtocolHandler:
         """
         from src.vocabulary_service import build_merged_vocabulary, load_base_vocabulary
 
-        if self.behavior_manager:
+        if self.vocabulary_service is not None:
+            vocab = self.vocabulary_service.vocabulary
+        elif self.behavior_manager:
             vocab = build_merged_vocabulary(self.state, self.behavior_manager)
         else:
             vocab = load_base_vocabulary()
@@ -800,7 +876,7 @@ class LLMProtocolHandler:
         """
         from utilities.entity_serializer import entity_to_dict
 
-        result = entity_to_dict(item)
+        result = entity_to_dict(item, rng=self.rng or random)
 
         # Add container location info if item is on a surface or in a container
         # This is query-specific context, not needed for command results
@@ -817,14 +893,14 @@ class LLMProtocolHandler:
     def _door_to_dict(self, door: "Item") -> Dict[str, Any]:
         """Convert door item to dict with llm_context."""
         from utilities.entity_serializer import entity_to_dict
-        return entity_to_dict(door)
+        return entity_to_dict(door, rng=self.rng or random)
 
     def _location_to_dict(self, loc: "Location") -> Dict[str, Any]:
         """Convert location to dict with llm_context."""
         from utilities.entity_serializer import entity_to_dict
-        return entity_to_dict(loc)
+        return entity_to_dict(loc, rng=self.rng or random)
 
     def _actor_to_dict(self, actor: "Actor") -> Dict[str, Any]:
         """Convert Actor to dict with llm_context."""
         from utilities.entity_serializer import entity_to_dict
-        return entity_to_dict(actor)
+        return entity_to_dict(actor, rng=self.rng or random)
@@ -41,6 +41,9 @@ if __name__ == '__main__':
         sys.path.insert(0, str(project_root))
 
 from src.game_engine import GameEngine
+from src.narration_cache import NarrationCache
+from src.phrase_cache import PhraseCache
+from src.prompt_kv_store import PromptKVStore
 
 
 def resolve_model(model: str) -> str:
@@ -72,7 +75,10 @@ def main(game_dir: str | None = None,
          show_traits: bool = False,
          model: str = DEFAULT_MODEL_PRESET,
          temperature: float = 0.8,
-         max_tokens: int = 300) -> int:
+         max_tokens: int = 300,
+         narration_cache_path: str | None = None,
+         phrase_cache_path: str | None = None,
+         prompt_kv_cache: bool = True) -> int:
     """Run the MLX-powered text adventure.
 
     Args:
@@ -82,6 +88,9 @@ def main(game_dir: str | None = None,
         model: Model preset name or full MLX model path
         temperature: Temperature for generation (0.0-2.0)
         max_tokens: Max tokens to generate
+        narration_cache_path: Optional file to load and save the narration cache
+        phrase_cache_path: Optional file to load and save the cache of LLM command parses
+        prompt_kv_cache: If True, reuse the warmed system prompt cache saved by earlier runs
 
     Returns:
         Exit code (0 for success, non-zero for error)
@@ -110,11 +119,16 @@ def main(game_dir: str | None = None,
     # Missing narrator protocol or files indicate authoring errors and should fail loudly
     print(f"Loading MLX model: {model}")
     print("(This may take a moment on first run as the model downloads...)")
+    narration_cache = NarrationCache(path=Path(narration_cache_path)) if narration_cache_path else None
+    phrase_cache = PhraseCache(path=Path(phrase_cache_path) if phrase_cache_path else None)
     narrator = engine.create_mlx_narrator(
         model=model,
         show_traits=show_traits,
         temperature=temperature,
-        max_tokens=max_tokens
+        max_tokens=max_tokens,
+        narration_cache=narration_cache,
+        phrase_cache=phrase_cache,
+        prompt_kv_store=PromptKVStore() if prompt_kv_cache else None
     )
 
     # Show title and opening
@@ -142,13 +156,22 @@ def main(game_dir: str | None = None,
                 break
 
             # Errors processing turns indicate bugs in behaviors/handlers and should fail loudly
-            response = narrator.process_turn(player_input)
-            print(f"\n{response}")
+            print()
+            for chunk in narrator.process_turn_stream(player_input):
+                print(chunk, end="", flush=True)
+            print()
 
         except KeyboardInterrupt:
             print("\n\nGoodbye!")
             break
 
+    if narration_cache is not None:
+        narration_cache.save()
+        logging.debug(f"Narration cache: {narration_cache.stats()}")
+    if phrase_cache.path is not None:
+        phrase_cache.save()
+    logging.debug(f"Phrase cache: {phrase_cache.stats()}")
+
     return 0
 
 
@@ -176,6 +199,12 @@ def cli_main() -> None:
                         help='Temperature for generation (default: 0.8)')
     parser.add_argument('--max-tokens', type=int, default=300,
                         help='Max tokens to generate (default: 300)')
+    parser.add_argument('--narration-cache', metavar='PATH',
+                        help='Reuse narrations of repeated results, persisted in PATH')
+    parser.add_argument('--phrase-cache', metavar='PATH',
+                        help='Persist LLM parses of rephrased commands in PATH')
+    parser.add_argument('--no-prompt-kv-cache', action='store_true',
+                        help='Always prefill the system prompt instead of loading it from disk')
     args = parser.parse_args()
 
     # Handle --list-models
@@ -199,7 +228,10 @@ def cli_main() -> None:
         show_traits=args.show_traits,
         model=args.model,
         temperature=args.temperature,
-        max_tokens=args.max_tokens
+        max_tokens=args.max_tokens,
+        narration_cache_path=args.narration_cache,
+        phrase_cache_path=args.phrase_cache,
+        prompt_kv_cache=not args.no_prompt_kv_cache
     ))
 
 
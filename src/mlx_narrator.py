@@ -12,7 +12,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,7 @@ logger = logging.getLogger(__name__)
 try:
     from mlx_lm import load, generate, stream_generate
     from mlx_lm.sample_utils import make_sampler
-    from mlx_lm.models.cache import make_prompt_cache, trim_prompt_cache
-    import mlx.core as mx
+    from mlx_lm.models.cache import trim_prompt_cache
     HAS_MLX = True
 except ImportError:
     HAS_MLX = False
@@ -29,8 +28,12 @@ except ImportError:
 from src.llm_protocol import LLMProtocolHandler
 from src.behavior_manager import BehaviorManager
 from src.command_utils import parsed_to_json
+from src.narration_cache import NarrationCache
+from src.narration_encoder import abbreviation_legend, encode_narration, encode_payload
 from src.parser import Parser
-from src.vocabulary_service import load_base_vocabulary
+from src.phrase_cache import PhraseCache, scene_context
+from src.prompt_kv_store import PromptKVStore, warm_prompt_cache
+from src.vocabulary_service import VocabularyService, load_base_vocabulary
 
 
 # Default vocabulary file location
@@ -41,6 +44,39 @@ DEFAULT_MODEL = "mlx-community/Llama-3.2-3B-Instruct-4bit"
 DEFAULT_MAX_TOKENS = 300
 
 
+def strip_stream(chunks: Iterable[str], empty: str = "") -> Iterator[str]:
+    """Strip leading and trailing whitespace from streamed text.
+
+    Equivalent to "".join(chunks).strip(), without waiting for the end:
+    trailing whitespace of a chunk is held back until more text follows.
+
+    Args:
+        chunks: Text chunks in order
+        empty: Yielded instead if no chunks arrive at all
+
+    Yields:
+        The stripped text in chunks
+    """
+    received = False
+    started = False
+    pending = ""
+    for chunk in chunks:
+        received = received or bool(chunk)
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        text = chunk.rstrip()
+        if text:
+            yield pending + text
+            pending = chunk[len(text):]
+        else:
+            pending += chunk
+    if not received and empty:
+        yield empty
+
+
 class MLXNarrator:
     """Translates between natural language and the JSON protocol using MLX-LM."""
 
@@ -49,10 +85,15 @@ class MLXNarrator:
                  prompt_file: Optional[Path] = None,
                  behavior_manager: Optional[BehaviorManager] = None,
                  vocabulary: Optional[Dict[str, Any]] = None,
+                 vocabulary_service: Optional[VocabularyService] = None,
                  show_traits: bool = False,
                  temperature: float = 0.8,
                  max_tokens: int = DEFAULT_MAX_TOKENS,
-                 shared_backend: Optional[Any] = None):
+                 shared_backend: Optional[Any] = None,
+                 narration_cache: Optional[NarrationCache] = None,
+                 phrase_cache: Optional[PhraseCache] = None,
+                 abbreviate_fields: bool = False,
+                 prompt_kv_store: Optional[PromptKVStore] = None):
         """Initialize the narrator.
 
         Args:
@@ -61,10 +102,19 @@ class MLXNarrator:
             prompt_file: Path to system prompt file (required, must exist)
             behavior_manager: Optional BehaviorManager to get merged vocabulary
             vocabulary: Optional merged vocabulary dict (if not provided, loads default)
+            vocabulary_service: Optional VocabularyService of the session; when given,
+                its live vocabulary and a parser it keeps current are used
             show_traits: If True, print llm_context traits before each LLM narration
             temperature: Temperature for generation (0.0-2.0)
             max_tokens: Max tokens to generate
             shared_backend: Optional SharedMLXBackend instance (saves ~4-6GB memory)
+            narration_cache: Optional NarrationCache reused for repeated narration plans
+            phrase_cache: Optional PhraseCache of LLM parses for input the local
+                parser rejects
+            abbreviate_fields: If True, send narration inputs with abbreviated field
+                names (explained in the system prompt) to save input tokens
+            prompt_kv_store: Optional PromptKVStore for the warmed system prompt cache
+                (default: the shared backend's store, if any)
 
         Raises:
             ImportError: If mlx-lm is not installed
@@ -83,6 +133,12 @@ class MLXNarrator:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.shared_backend = shared_backend
+        self.narration_cache = narration_cache
+        self.phrase_cache = phrase_cache
+        self.abbreviate_fields = abbreviate_fields
+        if prompt_kv_store is None and shared_backend is not None:
+            prompt_kv_store = shared_backend.kv_store
+        self.prompt_kv_store = prompt_kv_store
 
         # Load model and tokenizer (or use shared backend)
         if shared_backend is not None:
@@ -97,10 +153,21 @@ class MLXNarrator:
             self._owns_model = True
 
         # Store merged vocabulary for parser (must be before _load_system_prompt)
-        self.merged_vocabulary = self._get_merged_vocabulary(vocabulary)
-        self.parser = self._create_parser(self.merged_vocabulary)
+        if vocabulary_service is not None:
+            self.merged_vocabulary = vocabulary_service.vocabulary
+            self.parser = vocabulary_service.create_parser()
+        else:
+            self.merged_vocabulary = self._get_merged_vocabulary(vocabulary)
+            self.parser = self._create_parser(self.merged_vocabulary)
+        if phrase_cache is not None:
+            if vocabulary_service is not None:
+                vocabulary_service.add_phrase_cache(phrase_cache)
+            else:
+                phrase_cache.set_vocabulary(self.merged_vocabulary)
         assert prompt_file is not None, "prompt_file is required"
         self.system_prompt = self._load_system_prompt(prompt_file)
+        if abbreviate_fields:
+            self.system_prompt += "\n\n" + abbreviation_legend()
 
         # Initialize prompt cache for faster generation
         self._init_prompt_cache()
@@ -191,7 +258,68 @@ class MLXNarrator:
         Returns:
             Narrative description of what happened
         """
-        # 1. Try fast local parsing first
+        return "".join(self.process_turn_stream(player_input))
+
+    def process_turn_stream(self, player_input: str) -> Iterator[str]:
+        """Process one turn, streaming the narrative as it is generated.
+
+        The command and the turn phases it triggers have completed when this
+        returns; only the narration is left to the returned iterator, so the
+        first words can be shown as soon as the model produces them.
+
+        Args:
+            player_input: Natural language input from player
+
+        Returns:
+            Iterator over chunks of the narrative text
+        """
+        json_cmd = self._command_for_input(player_input)
+        if isinstance(json_cmd, str):
+            return iter([json_cmd])
+
+        # Execute command via game engine (result includes verbosity from NarrationResult)
+        result = self.handler.handle_message(json_cmd)
+        return self.narrate_result_stream(result)
+
+    def narrate_result_stream(self, result: Dict[str, Any]) -> Iterator[str]:
+        """Stream the narrative for a command result.
+
+        Serves repeated narration plans from the narration cache, if any.
+
+        Args:
+            result: JSON result from game engine
+
+        Returns:
+            Iterator over chunks of the narrative text
+        """
+        # Print traits if enabled
+        self._print_traits(result)
+
+        narration_dict = self._narration_dict(result)
+        if self.narration_cache is not None:
+            cached = self.narration_cache.get(narration_dict)
+            if cached is not None:
+                logger.debug("Narration cache hit")
+                return iter([cached])
+
+        narration_input = f"Narrate this result:\n{encode_narration(narration_dict, self.abbreviate_fields)}"
+        logger.debug(f"Narration input ({len(narration_input)} chars): {narration_input[:500]}...")
+        stream = self._stream_llm(narration_input)
+        if self.narration_cache is not None:
+            return self.narration_cache.record(narration_dict, stream)
+        return stream
+
+    def _command_for_input(self, player_input: str) -> Union[Dict[str, Any], str]:
+        """Translate player input to a JSON command.
+
+        Args:
+            player_input: Natural language input from player
+
+        Returns:
+            The JSON command, or the text to show the player if the input
+            could not be turned into a command
+        """
+        # Try fast local parsing first
         parsed = self.parser.parse_command(player_input)
         json_cmd: Dict[str, Any]
 
@@ -204,52 +332,62 @@ class MLXNarrator:
             else:
                 json_cmd = parsed_to_json(parsed)
             logger.debug(f"Local parse: {player_input!r} -> {json_cmd}")
-        else:
-            # Fall back to LLM for complex input
-            logger.debug(f"LLM parse needed for: {player_input!r}")
-            command_response = self._call_llm(
-                f"Player says: {player_input}\n\nRespond with a JSON command."
+            return json_cmd
+
+        # Fall back to LLM for complex input, unless it was parsed before
+        context: Dict[str, Any] = {}
+        if self.phrase_cache is not None:
+            context = scene_context(self.handler.state, self.handler.behavior_manager)
+            cached = self.phrase_cache.get(player_input, context)
+            logger.debug(
+                f"Phrase cache {'hit' if cached is not None else 'miss'} for {player_input!r} "
+                f"(session hit rate {self.phrase_cache.stats()['hit_rate']:.0%})"
             )
-            extracted = self._extract_json(command_response)
+            if cached is not None:
+                return cached
+
+        logger.debug(f"LLM parse needed for: {player_input!r}")
+        command_response = self._call_llm(
+            f"Player says: {player_input}\n\nRespond with a JSON command."
+        )
+        extracted = self._extract_json(command_response)
 
-            if extracted is None:
-                return "I don't understand what you want to do."
+        if extracted is None:
+            return "I don't understand what you want to do."
 
-            # Check for error or query responses from LLM - don't send to engine
-            msg_type = extracted.get("type")
-            if msg_type == "error":
-                return extracted.get("message", "I don't understand what you want to do.")
-            if msg_type == "query":
-                # LLM should not send queries when parsing - return error
-                logger.warning(f"LLM sent query instead of command: {extracted}")
-                return "I don't understand what you want to do."
+        # Check for error or query responses from LLM - don't send to engine
+        msg_type = extracted.get("type")
+        if msg_type == "error":
+            return extracted.get("message", "I don't understand what you want to do.")
+        if msg_type == "query":
+            # LLM should not send queries when parsing - return error
+            logger.warning(f"LLM sent query instead of command: {extracted}")
+            return "I don't understand what you want to do."
 
-            json_cmd = extracted
+        if self.phrase_cache is not None and msg_type == "command":
+            self.phrase_cache.put(player_input, context, extracted)
+        return extracted
 
-        # 2. Execute command via game engine (result includes verbosity from NarrationResult)
-        result = self.handler.handle_message(json_cmd)
+    def _narration_dict(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Select the fields of a command result that are sent for narration.
 
-        # 3. Print traits if enabled
-        self._print_traits(result)
+        The 'data' field contains raw engine data (including state_fragments) that
+        would confuse the LLM. Only send 'narration' (the NarrationPlan), 'success',
+        and 'verbosity' fields.
+
+        Args:
+            result: JSON result from game engine
 
-        # 4. Build narration input - only include fields needed for narration
-        # The 'data' field contains raw engine data (including state_fragments) that
-        # would confuse the LLM. Only send 'narration' (the NarrationPlan), 'success',
-        # and 'verbosity' fields.
+        Returns:
+            success and verbosity plus the NarrationPlan fields
+        """
         narration_dict: Dict[str, Any] = {
             "success": result.get("success", True),
             "verbosity": result.get("verbosity", "full"),
         }
         if "narration" in result:
             narration_dict.update(result["narration"])
-
-        # 5. Get narrative from LLM
-        narration_input = f"Narrate this result:\n{json.dumps(narration_dict, indent=2)}"
-        logger.debug(f"Narration input ({len(narration_input)} chars): {narration_input[:500]}...")
-        narrative = self._call_llm(narration_input)
-        logger.debug(f"Narration output ({len(narrative)} chars): {narrative[:200]}...")
-
-        return narrative
+        return narration_dict
 
     def get_opening(self) -> str:
         """Get opening narrative for game start.
@@ -273,7 +411,7 @@ class MLXNarrator:
 
         # Opening scene needs more tokens than regular commands
         return self._call_llm(
-            f"Narrate the opening scene:\n{json.dumps(result_with_verbosity, indent=2)}",
+            f"Narrate the opening scene:\n{encode_payload(result_with_verbosity)}",
             max_tokens=500
         )
 
@@ -282,39 +420,30 @@ class MLXNarrator:
 
         This pre-computes the KV cache for the system prompt so that subsequent
         generation calls only need to process the user message, significantly
-        reducing latency.
+        reducing latency. With a prompt_kv_store, a cache saved by an earlier
+        run for the same model and prompt is loaded instead.
         """
-        # Create the prompt cache
-        self.prompt_cache = make_prompt_cache(self.model)
-
-        # Build the system prompt prefix in chat format
-        # We use just the system message to establish the cached prefix
-        system_messages = [
-            {"role": "system", "content": self.system_prompt}
-        ]
-
-        # Get the tokenized system prompt prefix
-        # Note: We don't add_generation_prompt here since user message comes next
-        system_prefix = self.tokenizer.apply_chat_template(
-            system_messages,
-            add_generation_prompt=False,
-            tokenize=False
+        model_id = self.shared_backend.model_path if self.shared_backend is not None else self.model_path
+        self.prompt_cache, self.system_prompt_length = warm_prompt_cache(
+            self.model, self.tokenizer, model_id, self.system_prompt, "narrator", self.prompt_kv_store
         )
+        logger.info("Prompt cache initialized")
 
-        # Tokenize and convert to MLX array
-        system_tokens = self.tokenizer.encode(system_prefix)
-        self.system_prompt_length = len(system_tokens)
-
-        # Warm the cache by running the model on the system prompt
-        logger.info(f"Warming prompt cache with {self.system_prompt_length} tokens...")
-        prompt_array = mx.array(system_tokens)
+    def _trim_prompt_cache(self) -> None:
+        """Trim the prompt cache back to the cached system prompt."""
+        cache_len = self.prompt_cache[0].offset if self.prompt_cache else 0
+        tokens_to_trim = cache_len - self.system_prompt_length
+        if tokens_to_trim > 0:
+            trim_prompt_cache(self.prompt_cache, tokens_to_trim)
 
-        # Process the system prompt through the model to fill the cache
-        # We process in one go since system prompts are typically not huge
-        self.model(prompt_array[None], cache=self.prompt_cache)
-        mx.eval([c.state for c in self.prompt_cache])
+    def prepare_narration(self) -> None:
+        """Get the narrator ready while the next command is still being parsed.
 
-        logger.info("Prompt cache initialized")
+        The system prompt stays prefilled in the prompt cache for the life of
+        the narrator, so all that is left to do ahead of time is dropping the
+        previous turn's tokens from the cache.
+        """
+        self._trim_prompt_cache()
 
     def _call_llm(self, user_message: str, max_tokens: Optional[int] = None) -> str:
         """Make a call to the MLX model using cached system prompt.
@@ -329,15 +458,27 @@ class MLXNarrator:
         Returns:
             The LLM's response text
         """
+        return "".join(self._stream_llm(user_message, max_tokens))
+
+    def _stream_llm(self, user_message: str, max_tokens: Optional[int] = None) -> Iterator[str]:
+        """Stream a call to the MLX model, yielding text as it is generated.
+
+        Output is stripped of leading and trailing whitespace, as _call_llm
+        returns it.
+
+        Args:
+            user_message: The message to send
+            max_tokens: Optional override for max tokens (uses self.max_tokens if not specified)
+
+        Yields:
+            Chunks of the LLM's response text
+        """
         if max_tokens is None:
             max_tokens = self.max_tokens
         logger.debug(f"User message: {user_message[:200]}...")
 
         # Trim cache back to system prompt length for fresh generation
-        cache_len = self.prompt_cache[0].offset if self.prompt_cache else 0
-        tokens_to_trim = cache_len - self.system_prompt_length
-        if tokens_to_trim > 0:
-            trim_prompt_cache(self.prompt_cache, tokens_to_trim)
+        self._trim_prompt_cache()
 
         # Build just the user message portion (system prompt is cached)
         # We need the continuation after the system prompt
@@ -358,18 +499,17 @@ class MLXNarrator:
         # Generate response using the cached system prompt
         # Any errors here indicate bugs in MLX library usage or model issues
         # and should fail loudly during development
-        response = ""
-        for chunk in stream_generate(
-            self.model,
-            self.tokenizer,
-            prompt=user_portion,
-            max_tokens=max_tokens,
-            sampler=sampler,
-            prompt_cache=self.prompt_cache,
-        ):
-            response += chunk.text
-
-        return response.strip() if response else "[No response from model]"
+        chunks = (
+            chunk.text for chunk in stream_generate(
+                self.model,
+                self.tokenizer,
+                prompt=user_portion,
+                max_tokens=max_tokens,
+                sampler=sampler,
+                prompt_cache=self.prompt_cache,
+            )
+        )
+        yield from strip_stream(chunks, empty="[No response from model]")
 
     def _extract_json(self, response: str) -> Optional[Dict[str, Any]]:
         """Extract JSON from LLM response.
@@ -14,8 +14,7 @@ The assembler is responsible for:
 
 See docs/game_engine_narration_api_design.md for full specification.
 """
-import random
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, cast
+from typing import Any, Callable, Dict, List, Literal, Optional, TYPE_CHECKING, TypeVar, cast
 
 from src.narration_types import (
     NarrationPlan,
@@ -25,7 +24,8 @@ from src.narration_types import (
     EntityState,
     MustMention,
 )
-from src.state_accessor import HandlerResult
+from src.state_accessor import HandlerResult, accessor_rng
+from src.turn_profiler import TurnProfiler
 from src.types import ActorId
 
 if TYPE_CHECKING:
@@ -33,6 +33,8 @@ if TYPE_CHECKING:
     from src.state_manager import Location, Item, Actor
 
 
+T = TypeVar("T")
+
 # Verbs that trigger location_entry scene_kind
 LOCATION_ENTRY_VERBS = {"go", "north", "south", "east", "west", "up", "down",
                         "northeast", "northwest", "southeast", "southwest",
@@ -64,6 +66,15 @@ class NarrationAssembler:
         """
         self.accessor = accessor
         self.actor_id = actor_id
+        # Build steps are timed when the behavior manager has a profiler attached
+        profiler = getattr(getattr(accessor, "behavior_manager", None), "profiler", None)
+        self.profiler = profiler if isinstance(profiler, TurnProfiler) else None
+
+    def _step(self, name: str, build: Callable[..., T], *args: Any) -> T:
+        """Run one build step, timing it when profiling is enabled."""
+        if self.profiler is None:
+            return build(*args)
+        return self.profiler.call("narration", name, build, *args)
 
     def assemble(
         self,
@@ -93,30 +104,30 @@ class NarrationAssembler:
         plan["primary_text"] = handler_result.primary
 
         # 2. Build secondary_beats
-        plan["secondary_beats"] = self._build_secondary_beats(
-            handler_result, verbosity
+        plan["secondary_beats"] = self._step(
+            "secondary_beats", self._build_secondary_beats, handler_result, verbosity
         )
 
         # 3. Build viewpoint
-        plan["viewpoint"] = self._build_viewpoint()
+        plan["viewpoint"] = self._step("viewpoint", self._build_viewpoint)
 
         # 4. Build scope
-        plan["scope"] = self._build_scope(verb, handler_result.success, familiarity)
+        plan["scope"] = self._step("scope", self._build_scope, verb, handler_result.success, familiarity)
 
         # 5. Build entity_refs (for full verbosity or location scenes)
         scene_kind = plan["scope"]["scene_kind"]
         if verbosity == "full" or scene_kind in ("location_entry", "look"):
-            plan["entity_refs"] = self._build_entity_refs(handler_result)
+            plan["entity_refs"] = self._step("entity_refs", self._build_entity_refs, handler_result)
         else:
             plan["entity_refs"] = {}
 
         # 6. Build must_mention (exits_text for location scenes, available_topics for dialog)
-        must_mention = self._build_must_mention(scene_kind, handler_result)
+        must_mention = self._step("must_mention", self._build_must_mention, scene_kind, handler_result)
         if must_mention:
             plan["must_mention"] = must_mention
 
         # 7. Build target_state for door/container actions (top-level for visibility)
-        target_state = self._build_target_state(handler_result)
+        target_state = self._step("target_state", self._build_target_state, handler_result)
         if target_state:
             plan["target_state"] = target_state
 
@@ -190,7 +201,7 @@ class NarrationAssembler:
                 if isinstance(entity_traits, list):
                     # Shuffle and limit
                     selected = list(entity_traits)
-                    random.shuffle(selected)
+                    accessor_rng(self.accessor).shuffle(selected)
                     traits.extend(selected[:max_traits])
 
         return traits
@@ -0,0 +1,256 @@
+"""
+Narration Cache - Reuse narratives for identical narration plans.
+
+The narrator's output depends only on what it is sent: success, verbosity
+and the NarrationPlan (whose scope carries familiarity). Re-looking at an
+unchanged room or repeating a failed action produces the same plan, so the
+narrative generated for it earlier can be shown again instead of calling
+the LLM.
+
+Entries are keyed by a digest of the canonicalized plan and hold up to
+`variants` different narratives. A key is treated as a miss until it has
+that many variants, so a repeated plan is narrated several ways before the
+cache answers it; hits then pick a variant not shown recently, using a
+RepetitionBuffer as fragment selection does.
+
+Entries are evicted least-recently-used beyond max_entries, and expire
+after ttl seconds. A cache can be saved to and loaded from a JSON file, and
+shared between narrators (it is thread-safe).
+
+Usage:
+    from src.narration_cache import NarrationCache
+
+    cache = NarrationCache(path=Path("narration_cache.json"))
+    narrator = engine.create_narrator(api_key, narration_cache=cache)
+    ...
+    cache.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.narrator_helpers import RepetitionBuffer
+
+logger = logging.getLogger(__name__)
+
+# Version of the on-disk format
+CACHE_FILE_VERSION = 1
+
+
+def canonical_plan(narration: Dict[str, Any]) -> str:
+    """
+    Canonical JSON for a narration dict, used as the cache key material.
+
+    Keys are sorted and trait lists are order-normalized: the assembler
+    shuffles traits, but the same traits in another order are narrated the
+    same way.
+
+    Args:
+        narration: success/verbosity plus the NarrationPlan fields
+
+    Returns:
+        Compact JSON string, equal for equivalent plans
+    """
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: sorted(item) if key == "traits" and isinstance(item, list) else normalize(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [normalize(item) for item in value]
+        return value
+
+    return json.dumps(normalize(narration), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def plan_key(narration: Dict[str, Any]) -> str:
+    """Cache key (hex digest) for a narration dict."""
+    return hashlib.sha256(canonical_plan(narration).encode()).hexdigest()
+
+
+def is_placeholder(narrative: str) -> bool:
+    """True for narrator status texts like "[Narrator unavailable: ...]", which are never cached."""
+    text = narrative.strip()
+    return not text or (text.startswith("[") and text.endswith("]"))
+
+
+@dataclass
+class _Entry:
+    """Narrative variants for one plan."""
+    created: float
+    variants: List[str] = field(default_factory=list)
+
+
+class NarrationCache:
+    """
+    Content-addressed cache of narratives, several variants per plan.
+
+    Args:
+        max_entries: Plans kept before least-recently-used ones are evicted
+        ttl: Seconds an entry stays valid after its first narrative (None = forever)
+        variants: Narratives collected per plan before it is served from cache
+        path: Optional JSON file to load from now and save() to later
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 24 * 3600,
+                 variants: int = 3, path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.variants = variants
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._recent = RepetitionBuffer(size=max(1, variants - 1))
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, narration: Dict[str, Any]) -> Optional[str]:
+        """
+        Return a cached narrative for this plan, or None if it must be generated.
+
+        Args:
+            narration: success/verbosity plus the NarrationPlan fields
+
+        Returns:
+            A narrative variant, or None (cache miss)
+        """
+        key = plan_key(narration)
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None or len(entry.variants) < self.variants:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            fresh = self._recent.filter_pool(entry.variants)
+            narrative = random.choice(fresh or entry.variants)
+            self._recent.add(narrative)
+            return narrative
+
+    def put(self, narration: Dict[str, Any], narrative: str) -> None:
+        """
+        Store a generated narrative as a variant for this plan.
+
+        Args:
+            narration: success/verbosity plus the NarrationPlan fields
+            narrative: The narrative the LLM produced for it
+        """
+        if is_placeholder(narrative):
+            return
+        key = plan_key(narration)
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(created=time.time())
+            self._entries.move_to_end(key)
+            if narrative not in entry.variants and len(entry.variants) < self.variants:
+                entry.variants.append(narrative)
+            self._recent.add(narrative)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, narration: Dict[str, Any], chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Pass a narrative stream through, storing the narrative once it completes.
+
+        A stream that is abandoned before the end is not stored.
+
+        Args:
+            narration: success/verbosity plus the NarrationPlan fields
+            chunks: The narrator's streamed narrative
+
+        Yields:
+            The chunks unchanged
+        """
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self.put(narration, "".join(parts))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts and size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _live_entry(self, key: str) -> Optional[_Entry]:
+        """Entry for key, dropping it if expired. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and time.time() - entry.created > self.ttl:
+            del self._entries[key]
+            return None
+        return entry
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """
+        Write the cache to a JSON file (atomically).
+
+        Args:
+            path: File to write (default: the path given at construction)
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("No path given to save the narration cache to")
+        with self._lock:
+            data = {
+                "version": CACHE_FILE_VERSION,
+                "entries": [[key, entry.created, entry.variants] for key, entry in self._entries.items()],
+            }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_name, target)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def load(self, path: Path) -> None:
+        """
+        Add the entries of a saved cache file; expired entries are skipped.
+
+        An unreadable or incompatible file is logged and ignored - the cache
+        only saves work, so losing it is not an error.
+
+        Args:
+            path: File written by save()
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring narration cache {path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_FILE_VERSION:
+            logger.warning(f"Ignoring narration cache {path}: unsupported format")
+            return
+        now = time.time()
+        with self._lock:
+            for key, created, variants in data.get("entries", []):
+                if self.ttl is not None and now - created > self.ttl:
+                    continue
+                self._entries[key] = _Entry(created=created, variants=list(variants)[:self.variants])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,147 @@
+"""
+Narration Encoder - Compact serialization of narrator input.
+
+The narrator LLM pays for every input token, and prefill time grows with
+them. json.dumps(..., indent=2) spends a large share of the payload on
+indentation, and NarrationPlans carry empty fields (no secondary beats,
+empty must_mention) that say nothing.
+
+encode_narration() writes a narration dict (success/verbosity plus the
+NarrationPlan fields) as compact JSON:
+- fields in a fixed reading order (what happened before scene details),
+  unknown fields after them alphabetically, so equal plans encode equally
+- empty values (None, "", [], {}) dropped; False and 0 are kept
+- optionally, schema field names replaced by the short names in
+  ABBREVIATIONS; abbreviation_legend() is the prompt text that explains
+  them to the model
+
+Entity ids (keys of entity_refs) and author-defined context/fragments are
+data, not schema: they are never abbreviated.
+"""
+
+import json
+from typing import Any, Dict, Tuple
+
+# Reading order for NarrationPlan and nested EntityRef/ScopeInfo/ViewpointInfo/MustMention fields
+FIELD_ORDER: Tuple[str, ...] = (
+    # Outcome
+    "success", "verbosity", "action_verb", "primary_text", "secondary_beats", "must_mention",
+    "exits_text", "dialog_topics", "target_state",
+    # Framing
+    "scope", "scene_kind", "outcome", "familiarity",
+    "viewpoint", "mode", "posture", "focus_name",
+    # Entities
+    "entity_refs", "name", "type", "state", "open", "locked", "lit",
+    "traits", "spatial_relation", "salience",
+    # Author-provided
+    "fragments", "reactions", "entity", "entity_name", "response", "hints", "context",
+)
+
+_FIELD_RANK = {name: rank for rank, name in enumerate(FIELD_ORDER)}
+
+# Short names for schema fields (abbreviated encoding)
+ABBREVIATIONS: Dict[str, str] = {
+    "success": "ok",
+    "verbosity": "vb",
+    "action_verb": "verb",
+    "primary_text": "pt",
+    "secondary_beats": "sb",
+    "must_mention": "mm",
+    "exits_text": "exits",
+    "dialog_topics": "topics",
+    "target_state": "ts",
+    "scope": "sc",
+    "scene_kind": "kind",
+    "familiarity": "fam",
+    "viewpoint": "vp",
+    "focus_name": "focus",
+    "entity_refs": "ents",
+    "spatial_relation": "rel",
+    "salience": "sal",
+    "fragments": "frag",
+    "reactions": "rx",
+    "entity_name": "ename",
+}
+
+# Fields whose values are keyed by data (entity ids) rather than schema names
+_DATA_KEYED = frozenset({"entity_refs"})
+
+# Author-defined fields passed through as written
+_OPAQUE = frozenset({"context", "fragments"})
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or (isinstance(value, (list, dict)) and not value)
+
+
+def _field_sort_key(key: str) -> Tuple[int, str]:
+    return (_FIELD_RANK.get(key, len(FIELD_ORDER)), key)
+
+
+def compact_payload(value: Any, abbreviate: bool = False, _data_keys: bool = False) -> Any:
+    """
+    Prune and order a JSON-compatible value for compact encoding.
+
+    Args:
+        value: Dict/list/scalar to prepare
+        abbreviate: Replace schema field names with ABBREVIATIONS
+
+    Returns:
+        A new value with empty fields dropped and dict keys in FIELD_ORDER
+    """
+    if isinstance(value, dict):
+        result: Dict[str, Any] = {}
+        keys = list(value) if _data_keys else sorted(value, key=_field_sort_key)
+        for key in keys:
+            item = value[key]
+            if key in _OPAQUE and not _data_keys:
+                packed = item
+            else:
+                packed = compact_payload(item, abbreviate, _data_keys=key in _DATA_KEYED and not _data_keys)
+            if _is_empty(packed):
+                continue
+            name = key if _data_keys or not abbreviate else ABBREVIATIONS.get(key, key)
+            result[name] = packed
+        return result
+    if isinstance(value, list):
+        items = [compact_payload(item, abbreviate) for item in value]
+        return [item for item in items if not _is_empty(item)]
+    return value
+
+
+def encode_payload(value: Any, abbreviate: bool = False) -> str:
+    """
+    Encode any narrator input (e.g. a location query result) as compact JSON.
+
+    Args:
+        value: JSON-compatible value
+        abbreviate: Replace schema field names with ABBREVIATIONS
+
+    Returns:
+        Compact JSON text
+    """
+    return json.dumps(compact_payload(value, abbreviate), ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_narration(narration: Dict[str, Any], abbreviate: bool = False) -> str:
+    """
+    Encode a narration dict (success/verbosity plus NarrationPlan fields) for the narrator.
+
+    Args:
+        narration: The narration input
+        abbreviate: Replace schema field names with ABBREVIATIONS
+
+    Returns:
+        Compact JSON text
+    """
+    return encode_payload(narration, abbreviate)
+
+
+def abbreviation_legend() -> str:
+    """Prompt section explaining the abbreviated field names."""
+    pairs = ", ".join(f"{short}={name}" for name, short in ABBREVIATIONS.items())
+    return (
+        "### ABBREVIATED FIELD NAMES\n\n"
+        "Narration inputs use short field names. Read them as the full names "
+        f"described above: {pairs}."
+    )
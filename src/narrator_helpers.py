@@ -102,7 +102,8 @@ def select_state_fragments(
     entity: Any,
     state: str,
     max_count: int = 2,
-    repetition_buffer: Optional[RepetitionBuffer] = None
+    repetition_buffer: Optional[RepetitionBuffer] = None,
+    rng: Any = random
 ) -> List[str]:
     """
     Select fragments from entity's llm_context.state_fragments[state].
@@ -112,6 +113,7 @@ def select_state_fragments(
         state: Current state name (e.g., 'hostile', 'friendly')
         max_count: Maximum fragments to select
         repetition_buffer: Recently used fragments to avoid
+        rng: Random number generator to draw from (default: the random module)
 
     Returns:
         List of selected fragment strings (may be empty)
@@ -135,7 +137,7 @@ def select_state_fragments(
 
     # Random selection
     selected = list(pool)
-    random.shuffle(selected)
+    rng.shuffle(selected)
     result = selected[:max_count]
 
     # Add selected to buffer
@@ -150,7 +152,8 @@ def select_action_fragments(
     entity: Any,
     verb: str,
     verbosity: str = "full",
-    repetition_buffer: Optional[RepetitionBuffer] = None
+    repetition_buffer: Optional[RepetitionBuffer] = None,
+    rng: Any = random
 ) -> Dict[str, Any]:
     """
     Select fragments from entity's llm_context.action_fragments[verb].
@@ -160,6 +163,7 @@ def select_action_fragments(
         verb: Action verb (e.g., 'unlock', 'open', 'give')
         verbosity: 'brief' or 'full'
         repetition_buffer: Recently used fragments to avoid
+        rng: Random number generator to draw from (default: the random module)
 
     Returns:
         Dict with 'action_core' (str) and 'action_color' (list[str])
@@ -183,7 +187,7 @@ def select_action_fragments(
         if repetition_buffer:
             core_pool = repetition_buffer.filter_pool(core_pool)
         if core_pool:
-            selected_core = random.choice(core_pool)
+            selected_core = rng.choice(core_pool)
             result["action_core"] = selected_core
             if repetition_buffer:
                 repetition_buffer.add(selected_core)
@@ -196,7 +200,7 @@ def select_action_fragments(
                 color_pool = repetition_buffer.filter_pool(color_pool)
             if color_pool:
                 shuffled = list(color_pool)
-                random.shuffle(shuffled)
+                rng.shuffle(shuffled)
                 # Select 1-2 color fragments
                 count = min(2, len(shuffled))
                 result["action_color"] = shuffled[:count]
@@ -220,7 +224,8 @@ def select_action_fragments(
 def select_traits(
     entity: Any,
     max_count: int = 2,
-    repetition_buffer: Optional[RepetitionBuffer] = None
+    repetition_buffer: Optional[RepetitionBuffer] = None,
+    rng: Any = random
 ) -> List[str]:
     """
     Select traits from entity's llm_context.traits pool.
@@ -229,6 +234,7 @@ def select_traits(
         entity: Entity with properties.llm_context.traits
         max_count: Maximum traits to select
         repetition_buffer: Recently used fragments to avoid
+        rng: Random number generator to draw from (default: the random module)
 
     Returns:
         List of selected trait strings (may be empty)
@@ -249,7 +255,7 @@ def select_traits(
         return []
 
     # Random selection
-    random.shuffle(pool)
+    rng.shuffle(pool)
     result = pool[:max_count]
 
     # Add selected to buffer
@@ -264,7 +270,8 @@ def build_reaction(
     entity: Any,
     state: str,
     response: str,
-    max_fragments: int = 2
+    max_fragments: int = 2,
+    rng: Any = random
 ) -> Dict[str, Any]:
     """
     Build a reaction dict for multi-entity scenes.
@@ -277,6 +284,7 @@ def build_reaction(
         state: Current state (e.g., "hostile", "nervous")
         response: Response type (e.g., "confrontation", "avoidance")
         max_fragments: Maximum fragments to include
+        rng: Random number generator to draw from (default: the random module)
 
     Returns:
         Dict suitable for EventResult.context["reaction"]
@@ -286,7 +294,7 @@ def build_reaction(
     entity_name = getattr(entity, "name", "Unknown")
 
     # Select fragments for this state
-    fragments = select_state_fragments(entity, state, max_count=max_fragments)
+    fragments = select_state_fragments(entity, state, max_count=max_fragments, rng=rng)
 
     return {
         "entity": entity_id,
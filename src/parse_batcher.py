@@ -0,0 +1,159 @@
+"""
+Parse Batcher - Batch LLM command parsing across sessions.
+
+SharedMLXBackend holds one model, and an LLMCommandParser generates one
+command at a time from its single prompt cache, so players sharing a parser
+queue up behind each other's generations. Decoding a batch of sequences
+costs little more per step than decoding one, so serving parses in batches
+multiplies throughput.
+
+ParseBatcher sits in front of a parser and has the same parse_command()
+interface (it can be passed to TurnPipeline as llm_parser). Calls from any
+number of threads are queued; a scheduler thread takes up to max_batch of
+them and runs them as one parser.parse_batch() call, then hands each caller
+its own result. A batch is dispatched when it is full or when the oldest
+queued request has waited its max_wait, so a lone player pays at most
+max_wait of extra latency.
+
+Usage:
+    batcher = ParseBatcher(engine.create_llm_parser(backend)[0], max_batch=8, max_wait=0.02)
+    parser_output = batcher.parse_command("put the lamp on the table", context)  # any thread
+    batcher.close()
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Request:
+    """A queued parse request."""
+    player_input: str
+    context: Dict[str, List[str]]
+    deadline: float
+    future: "Future[Optional[Dict[str, Any]]]"
+
+
+class ParseBatcher:
+    """Collects parse requests from many sessions and runs them in batches."""
+
+    def __init__(self, parser: Any, max_batch: int = 8, max_wait: float = 0.02):
+        """Initialize the batcher and start its scheduler thread.
+
+        Args:
+            parser: LLMCommandParser (anything with parse_batch(requests))
+            max_batch: Most requests generated together
+            max_wait: Default seconds a request may wait for others to join its batch
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.parser = parser
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: List[_Request] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._batches = 0
+        self._parsed = 0
+        self._thread = threading.Thread(target=self._run, name="parse-batcher", daemon=True)
+        self._thread.start()
+
+    def parse_command(self, player_input: str, context: Dict[str, List[str]],
+                      max_wait: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Parse player input to an action dict, batched with other callers.
+
+        Args:
+            player_input: Natural language command from player
+            context: Current game context (see LLMCommandParser.parse_command)
+            max_wait: Seconds this request may wait for a batch (default: self.max_wait)
+
+        Returns:
+            The parser's result for this input
+        """
+        return self.submit(player_input, context, max_wait).result()
+
+    def submit(self, player_input: str, context: Dict[str, List[str]],
+               max_wait: Optional[float] = None) -> "Future[Optional[Dict[str, Any]]]":
+        """Queue a parse request without waiting for it.
+
+        Args:
+            player_input: Natural language command from player
+            context: Current game context (see LLMCommandParser.parse_command)
+            max_wait: Seconds this request may wait for a batch (default: self.max_wait)
+
+        Returns:
+            Future resolving to the parser's result
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        future: "Future[Optional[Dict[str, Any]]]" = Future()
+        wait = self.max_wait if max_wait is None else max_wait
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ParseBatcher is closed")
+            self._pending.append(_Request(player_input, context, time.monotonic() + wait, future))
+            self._condition.notify()
+        return future
+
+    def stats(self) -> Dict[str, float]:
+        """Batches run, requests parsed and mean batch size."""
+        with self._condition:
+            return {
+                "batches": self._batches,
+                "parsed": self._parsed,
+                "mean_batch": self._parsed / self._batches if self._batches else 0.0,
+            }
+
+    def close(self) -> None:
+        """Parse the requests already queued, then stop the scheduler thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _next_batch(self) -> List[_Request]:
+        """Wait for a batch to be due; an empty list means the batcher is closed."""
+        with self._condition:
+            while True:
+                if self._pending:
+                    if len(self._pending) >= self.max_batch or self._closed:
+                        break
+                    remaining = min(request.deadline for request in self._pending) - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                elif self._closed:
+                    return []
+                else:
+                    self._condition.wait()
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            try:
+                results = self.parser.parse_batch(
+                    [(request.player_input, request.context) for request in batch]
+                )
+            except Exception as e:
+                logger.exception(f"Batched parse of {len(batch)} commands failed")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            with self._condition:
+                self._batches += 1
+                self._parsed += len(batch)
+            logger.debug(f"Parsed batch of {len(batch)}")
+            for request, result in zip(batch, results):
+                request.future.set_result(result)
@@ -1,6 +1,6 @@
 """Main parser implementation."""
 
-from typing import List, Optional, Dict, Any, Union, cast, Type, TypeVar
+from typing import List, Optional, Dict, Any, Iterable, NamedTuple, Sequence, Tuple, Union, cast, Type, TypeVar, FrozenSet
 import json
 
 from src.word_entry import WordEntry, WordType, WordTypeLike
@@ -9,6 +9,137 @@ from src.parsed_command import ParsedCommand
 
 ParserType = TypeVar("ParserType", bound="Parser")
 
+# Vocabulary sections in word table order (later entries win lookup collisions)
+VOCABULARY_SECTIONS: Tuple[str, ...] = ('verbs', 'nouns', 'adjectives', 'prepositions', 'articles')
+
+
+class _Slot(NamedTuple):
+    """One position of a command pattern."""
+    word_type: WordType
+    field: str  # ParsedCommand field the entry fills
+    as_adjective: bool = False  # Entry matched by word_type fills an adjective field
+
+
+_V, _N, _A, _P = WordType.VERB, WordType.NOUN, WordType.ADJECTIVE, WordType.PREPOSITION
+
+# Accepted command grammar (after adjective collapsing), in priority order:
+# when an entry sequence matches several patterns, the first one wins.
+COMMAND_PATTERNS: Tuple[Tuple[_Slot, ...], ...] = (
+    # VERB (only if object not required or optional)
+    (_Slot(_V, "verb"),),
+    # VERB + NOUN
+    (_Slot(_V, "verb"), _Slot(_N, "direct_object")),
+    # VERB + ADJECTIVE + NOUN (includes directions as adjectives)
+    (_Slot(_V, "verb"), _Slot(_A, "direct_adjective"), _Slot(_N, "direct_object")),
+    # VERB + NOUN + NOUN (implicit preposition)
+    (_Slot(_V, "verb"), _Slot(_N, "direct_object"), _Slot(_N, "indirect_object")),
+    # VERB + PREPOSITION + NOUN
+    (_Slot(_V, "verb"), _Slot(_P, "preposition"), _Slot(_N, "direct_object")),
+    # VERB + ADJECTIVE + NOUN + NOUN
+    (_Slot(_V, "verb"), _Slot(_A, "direct_adjective"), _Slot(_N, "direct_object"),
+     _Slot(_N, "indirect_object")),
+    # VERB + NOUN + PREPOSITION + NOUN
+    (_Slot(_V, "verb"), _Slot(_N, "direct_object"), _Slot(_P, "preposition"),
+     _Slot(_N, "indirect_object")),
+    # VERB + PREPOSITION + ADJECTIVE + NOUN
+    (_Slot(_V, "verb"), _Slot(_P, "preposition"), _Slot(_A, "direct_adjective"),
+     _Slot(_N, "direct_object")),
+    # VERB + ADJECTIVE + NOUN + PREPOSITION + NOUN
+    (_Slot(_V, "verb"), _Slot(_A, "direct_adjective"), _Slot(_N, "direct_object"),
+     _Slot(_P, "preposition"), _Slot(_N, "indirect_object")),
+    # VERB + NOUN + PREPOSITION + ADJECTIVE + NOUN
+    (_Slot(_V, "verb"), _Slot(_N, "direct_object"), _Slot(_P, "preposition"),
+     _Slot(_A, "indirect_adjective"), _Slot(_N, "indirect_object")),
+    # VERB + NOUN + PREPOSITION + NOUN + NOUN
+    # Handle pattern like "pour water on gold mushroom" where vocabulary
+    # extracts color words as nouns from item names. First NOUN after PREP
+    # acts as adjective to second NOUN.
+    (_Slot(_V, "verb"), _Slot(_N, "direct_object"), _Slot(_P, "preposition"),
+     _Slot(_N, "indirect_adjective", as_adjective=True), _Slot(_N, "indirect_object")),
+    # VERB + ADJECTIVE + NOUN + PREPOSITION + ADJECTIVE + NOUN
+    (_Slot(_V, "verb"), _Slot(_A, "direct_adjective"), _Slot(_N, "direct_object"),
+     _Slot(_P, "preposition"), _Slot(_A, "indirect_adjective"), _Slot(_N, "indirect_object")),
+)
+
+
+class _PatternAutomaton:
+    """
+    COMMAND_PATTERNS compiled into a deterministic automaton over word types.
+
+    The patterns form a trie keyed by WordType. A multi-typed entry can
+    follow several trie edges at once, so automaton states are sets of trie
+    nodes (subset construction); transitions are computed on first use for
+    each (state, entry types) pair and memoized, after which matching is one
+    dictionary lookup per entry. Each state accepts the highest-priority
+    pattern ending at one of its nodes.
+    """
+
+    def __init__(self, patterns: Tuple[Tuple[_Slot, ...], ...]):
+        self.patterns = patterns
+        # Trie: node -> {WordType: child node}; node -> index of pattern ending there
+        self._trie: List[Dict[WordType, int]] = [{}]
+        self._trie_accept: Dict[int, int] = {}
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for slot in pattern:
+                child = self._trie[node].get(slot.word_type)
+                if child is None:
+                    child = len(self._trie)
+                    self._trie.append({})
+                    self._trie[node][slot.word_type] = child
+                node = child
+            self._trie_accept.setdefault(node, index)
+
+        # DFA states are frozensets of trie nodes; state 0 is {root}, state 1 is dead
+        self._state_ids: Dict[FrozenSet[int], int] = {}
+        self._state_nodes: List[FrozenSet[int]] = []
+        self.accept: List[Optional[int]] = []
+        self._transitions: Dict[Tuple[int, FrozenSet[WordType]], int] = {}
+        self.start = self._state(frozenset({0}))
+        self.dead = self._state(frozenset())
+
+    def _state(self, nodes: FrozenSet[int]) -> int:
+        state = self._state_ids.get(nodes)
+        if state is None:
+            state = self._state_ids[nodes] = len(self._state_nodes)
+            self._state_nodes.append(nodes)
+            accepted = [self._trie_accept[node] for node in nodes if node in self._trie_accept]
+            self.accept.append(min(accepted) if accepted else None)
+        return state
+
+    def step(self, state: int, types: FrozenSet[WordType]) -> int:
+        """Next state after an entry that can act as any of types."""
+        key = (state, types)
+        next_state = self._transitions.get(key)
+        if next_state is None:
+            nodes = frozenset(
+                child
+                for node in self._state_nodes[state]
+                for word_type in types
+                if (child := self._trie[node].get(word_type)) is not None
+            )
+            next_state = self._transitions[key] = self._state(nodes)
+        return next_state
+
+
+_ENTRY_TYPES_CACHE: Dict[Any, FrozenSet[WordType]] = {}
+
+
+def _entry_types(entry: WordEntry) -> FrozenSet[WordType]:
+    """Word types an entry can match in a pattern (see Parser._matches_type)."""
+    word_type = entry.word_type
+    if isinstance(word_type, set):
+        return frozenset(word_type)
+    types = _ENTRY_TYPES_CACHE.get(word_type)
+    if types is None:
+        # QUOTED_LITERAL acts as a NOUN in pattern matching
+        types = frozenset({word_type, WordType.NOUN} if word_type == WordType.QUOTED_LITERAL else {word_type})
+        _ENTRY_TYPES_CACHE[word_type] = types
+    return types
+
+
+_AUTOMATON = _PatternAutomaton(COMMAND_PATTERNS)
+
 class Parser:
     """
     Parser for text adventure game commands.
@@ -74,75 +205,61 @@ class Parser:
 
     def _populate_word_entries(self, vocab: Dict[str, Any]) -> None:
         """Populate word entries from a vocabulary dict."""
+        for section in VOCABULARY_SECTIONS:
+            for data in vocab.get(section, []):
+                self.word_table.append(self.word_entry_from_data(section, data))
+
+    def word_entry_from_data(self, section: str, data: Union[str, Dict[str, Any]]) -> WordEntry:
+        """
+        Create the WordEntry for one vocabulary entry.
+
+        Args:
+            section: Vocabulary section the entry is in ("verbs", "nouns", ...)
+            data: Entry dict (prepositions and articles may be plain strings)
+
+        Returns:
+            WordEntry for the entry
+        """
+        if isinstance(data, str):
+            data = {'word': data}
 
-        # Process verbs
-        for verb_data in vocab.get('verbs', []):
+        if section == 'verbs':
             # Handle multi-valued word_type if specified (like "open" as verb+adjective)
-            word_type_raw = verb_data.get('word_type', 'verb')
-            word_type = self._parse_word_type(word_type_raw)
-
-            entry = WordEntry(
-                word=verb_data['word'],
-                word_type=word_type,
-                synonyms=verb_data.get('synonyms', []),
-                value=verb_data.get('value'),
-                object_required=verb_data.get('object_required', True)
+            return WordEntry(
+                word=data['word'],
+                word_type=self._parse_word_type(data.get('word_type', 'verb')),
+                synonyms=data.get('synonyms', []),
+                value=data.get('value'),
+                object_required=data.get('object_required', True)
             )
-            self.word_table.append(entry)
 
-        # Process nouns
-        for noun_data in vocab.get('nouns', []):
+        if section == 'nouns':
             # Handle multi-valued word_type if specified
-            word_type_raw = noun_data.get('word_type', 'noun')
-            word_type = self._parse_word_type(word_type_raw)
-
             # If noun has VERB type (like directions), also get object_required
-            object_required = noun_data.get('object_required', True)
-
-            entry = WordEntry(
-                word=noun_data['word'],
-                word_type=word_type,
-                synonyms=noun_data.get('synonyms', []),
-                value=noun_data.get('value'),
-                object_required=object_required
+            return WordEntry(
+                word=data['word'],
+                word_type=self._parse_word_type(data.get('word_type', 'noun')),
+                synonyms=data.get('synonyms', []),
+                value=data.get('value'),
+                object_required=data.get('object_required', True)
             )
-            self.word_table.append(entry)
 
-        # Process adjectives
-        for adj_data in vocab.get('adjectives', []):
-            entry = WordEntry(
-                word=adj_data['word'],
+        if section == 'adjectives':
+            return WordEntry(
+                word=data['word'],
                 word_type=WordType.ADJECTIVE,
-                synonyms=adj_data.get('synonyms', []),
-                value=adj_data.get('value')
+                synonyms=data.get('synonyms', []),
+                value=data.get('value')
             )
-            self.word_table.append(entry)
 
-        # Process prepositions (can be simple strings or dicts)
-        for prep in vocab.get('prepositions', []):
-            if isinstance(prep, str):
-                entry = WordEntry(word=prep, word_type=WordType.PREPOSITION)
-            else:
-                entry = WordEntry(
-                    word=prep['word'],
-                    word_type=WordType.PREPOSITION,
-                    synonyms=prep.get('synonyms', []),
-                    value=prep.get('value')
-                )
-            self.word_table.append(entry)
-
-        # Process articles (can be simple strings or dicts)
-        for article in vocab.get('articles', []):
-            if isinstance(article, str):
-                entry = WordEntry(word=article, word_type=WordType.ARTICLE)
-            else:
-                entry = WordEntry(
-                    word=article['word'],
-                    word_type=WordType.ARTICLE,
-                    synonyms=article.get('synonyms', []),
-                    value=article.get('value')
-                )
-            self.word_table.append(entry)
+        # Prepositions and articles
+        word_type = WordType.PREPOSITION if section == 'prepositions' else WordType.ARTICLE
+        return WordEntry(
+            word=data['word'],
+            word_type=word_type,
+            synonyms=data.get('synonyms', []),
+            value=data.get('value')
+        )
 
     def _build_lookup_table(self) -> None:
         """
@@ -158,6 +275,47 @@ class Parser:
             for synonym in entry.synonyms:
                 self.word_lookup[synonym] = entry
 
+    def update_entries(self, removed_words: Iterable[str],
+                       added: Sequence[Tuple[int, WordEntry]]) -> None:
+        """
+        Replace word entries after the parser was built.
+
+        Removes the entries for removed_words, then inserts each added entry
+        at its word table position. Lookup keys the changed entries claim
+        are resolved as in _build_lookup_table (the last claimant in the
+        word table wins), so the result matches a parser built from the
+        updated vocabulary.
+
+        Args:
+            removed_words: Entry words (not synonyms) whose entries are removed
+            added: (position, WordEntry) pairs in ascending position order,
+                positions counted in the updated word table
+        """
+        removed_words = set(removed_words)
+        stale = set()
+        if removed_words:
+            kept = []
+            for entry in self.word_table:
+                if entry.word in removed_words:
+                    stale.add(entry.word)
+                    stale.update(entry.synonyms)
+                else:
+                    kept.append(entry)
+            self.word_table = kept
+        for position, entry in added:
+            self.word_table.insert(position, entry)
+            stale.add(entry.word)
+            stale.update(entry.synonyms)
+
+        for key in stale:
+            self.word_lookup.pop(key, None)
+        for entry in self.word_table:
+            if entry.word in stale:
+                self.word_lookup[entry.word] = entry
+            for synonym in entry.synonyms:
+                if synonym in stale:
+                    self.word_lookup[synonym] = entry
+
     def _lookup_word(self, word: str) -> Optional[WordEntry]:
         """
         Look up a word in the word table, checking synonyms.
@@ -190,21 +348,6 @@ class Parser:
         else:
             return entry.word_type == target_type
 
-    def _types_match(self, entries: List[WordEntry], pattern: List[WordType]) -> bool:
-        """
-        Check if entries match a type pattern.
-
-        Args:
-            entries: List of WordEntry objects
-            pattern: List of WordType values to match
-
-        Returns:
-            True if all entries match their corresponding pattern types
-        """
-        if len(entries) != len(pattern):
-            return False
-        return all(self._matches_type(e, p) for e, p in zip(entries, pattern))
-
     def _extract_quoted_strings(self, text: str) -> tuple[str, List[str]]:
         """
         Extract quoted strings from text and replace with placeholders.
@@ -258,6 +401,9 @@ class Parser:
         if not tokens:
             return None
 
+        # Look every token up once; unknown-word typing peeks at the next lookup
+        lookups = [self.word_lookup.get(token) for token in tokens]
+
         entries: List[WordEntry] = []
         for i, token in enumerate(tokens):
             entry: Optional[WordEntry] = None
@@ -277,13 +423,13 @@ class Parser:
                     continue
 
             if entry is None:
-                entry = self._lookup_word(token)
+                entry = lookups[i]
             if entry is None:
                 # Unknown word - determine type based on context
                 # If followed by another unknown word or known noun, treat as adjective
                 # Otherwise treat as noun (handler will resolve against game state)
                 next_token = tokens[i + 1] if i + 1 < len(tokens) else None
-                next_entry = self._lookup_word(next_token) if next_token else None
+                next_entry = lookups[i + 1] if next_token else None
 
                 if next_token and (next_entry is None or next_entry.word_type == WordType.NOUN):
                     # Unknown word before another potential noun -> adjective
@@ -315,6 +461,9 @@ class Parser:
         """
         Match a list of WordEntry objects to a command pattern.
 
+        Runs the entries through the compiled COMMAND_PATTERNS automaton in
+        one left-to-right pass.
+
         Args:
             entries: List of WordEntry objects (no articles)
 
@@ -327,145 +476,44 @@ class Parser:
         # Collapse consecutive adjectives into single entries
         entries = self._collapse_adjectives(entries)
 
-        length = len(entries)
-
-        # Single word patterns
-        if length == 1:
-            # VERB (only if object not required or optional)
-            if self._matches_type(entries[0], WordType.VERB):
-                verb = entries[0]
-                if verb.object_required == False:
-                    return ParsedCommand(verb=verb)
-                elif verb.object_required == "optional":
-                    return ParsedCommand(verb=verb, object_missing=True)
-                # If object_required == True, fall through to return None
-
+        automaton = _AUTOMATON
+        state = automaton.start
+        for entry in entries:
+            state = automaton.step(state, _entry_types(entry))
+            if state == automaton.dead:
+                return None
+        index = automaton.accept[state]
+        if index is None:
             return None
 
-        # Two word patterns
-        if length == 2:
-            # VERB + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_object=entries[1]
-                )
-
-        # Three word patterns
-        if length == 3:
-            # VERB + ADJECTIVE + NOUN (includes directions as adjectives)
-            if self._types_match(entries, [WordType.VERB, WordType.ADJECTIVE, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_adjective=entries[1],
-                    direct_object=entries[2]
-                )
-
-            # VERB + NOUN + NOUN (implicit preposition)
-            if self._types_match(entries, [WordType.VERB, WordType.NOUN, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_object=entries[1],
-                    indirect_object=entries[2]
-                )
-
-            # VERB + PREPOSITION + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.PREPOSITION, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    preposition=entries[1],
-                    direct_object=entries[2]
-                )
-
-        # Four word patterns
-        if length == 4:
-            # VERB + ADJECTIVE + NOUN + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.ADJECTIVE, WordType.NOUN, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_adjective=entries[1],
-                    direct_object=entries[2],
-                    indirect_object=entries[3]
-                )
-
-            # VERB + NOUN + PREPOSITION + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.NOUN, WordType.PREPOSITION, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_object=entries[1],
-                    preposition=entries[2],
-                    indirect_object=entries[3]
-                )
-
-            # VERB + PREPOSITION + ADJECTIVE + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.PREPOSITION, WordType.ADJECTIVE, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    preposition=entries[1],
-                    direct_adjective=entries[2],
-                    direct_object=entries[3]
-                )
-
-        # Five word patterns
-        if length == 5:
-            # VERB + ADJECTIVE + NOUN + PREPOSITION + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.ADJECTIVE, WordType.NOUN,
-                                           WordType.PREPOSITION, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_adjective=entries[1],
-                    direct_object=entries[2],
-                    preposition=entries[3],
-                    indirect_object=entries[4]
-                )
-
-            # VERB + NOUN + PREPOSITION + ADJECTIVE + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.NOUN, WordType.PREPOSITION,
-                                           WordType.ADJECTIVE, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_object=entries[1],
-                    preposition=entries[2],
-                    indirect_adjective=entries[3],
-                    indirect_object=entries[4]
-                )
+        pattern = automaton.patterns[index]
+        if len(pattern) == 1:
+            # Bare verb: only if its object is not required or optional
+            verb = entries[0]
+            if verb.object_required == False:
+                return ParsedCommand(verb=verb)
+            elif verb.object_required == "optional":
+                return ParsedCommand(verb=verb, object_missing=True)
+            return None
 
-            # VERB + NOUN + PREPOSITION + NOUN + NOUN
-            # Handle pattern like "pour water on gold mushroom" where vocabulary
-            # extracts color words as nouns from item names. First NOUN after PREP
-            # acts as adjective to second NOUN.
-            if self._types_match(entries, [WordType.VERB, WordType.NOUN, WordType.PREPOSITION,
-                                           WordType.NOUN, WordType.NOUN]):
-                # Convert first NOUN after prep to adjective role
-                adj_entry = WordEntry(
-                    word=entries[3].word,
+        fields: Dict[str, WordEntry] = {}
+        for slot, entry in zip(pattern, entries):
+            if slot.as_adjective:
+                entry = WordEntry(
+                    word=entry.word,
                     word_type=WordType.ADJECTIVE,
-                    synonyms=entries[3].synonyms,
-                    value=entries[3].value
+                    synonyms=entry.synonyms,
+                    value=entry.value
                 )
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_object=entries[1],
-                    preposition=entries[2],
-                    indirect_adjective=adj_entry,
-                    indirect_object=entries[4]
-                )
-
-        # Six word patterns
-        if length == 6:
-            # VERB + ADJECTIVE + NOUN + PREPOSITION + ADJECTIVE + NOUN
-            if self._types_match(entries, [WordType.VERB, WordType.ADJECTIVE, WordType.NOUN,
-                                           WordType.PREPOSITION, WordType.ADJECTIVE, WordType.NOUN]):
-                return ParsedCommand(
-                    verb=entries[0],
-                    direct_adjective=entries[1],
-                    direct_object=entries[2],
-                    preposition=entries[3],
-                    indirect_adjective=entries[4],
-                    indirect_object=entries[5]
-                )
-
-        return None
+            fields[slot.field] = entry
+        return ParsedCommand(
+            verb=fields.get('verb'),
+            direct_object=fields.get('direct_object'),
+            direct_adjective=fields.get('direct_adjective'),
+            preposition=fields.get('preposition'),
+            indirect_object=fields.get('indirect_object'),
+            indirect_adjective=fields.get('indirect_adjective'),
+        )
 
     def _collapse_adjectives(self, entries: List[WordEntry]) -> List[WordEntry]:
         """
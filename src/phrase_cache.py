@@ -0,0 +1,282 @@
+"""
+Phrase Cache - Remember LLM parses of inputs the local parser rejects.
+
+Narrators try the local Parser first and call the LLM only for input it
+cannot parse ("could you pick up the lantern?"). Players repeat such
+phrasings, and each repeat used to cost another LLM call.
+
+PhraseCache records successful LLM parses keyed by:
+- the normalized input: lowercased, punctuation and articles dropped, and
+  polite wrappers ("please", "could you", "I want to") removed, so
+  near-identical phrasings share an entry
+- a signature of the scene context (location, what is there, what the
+  player carries), since the same words can mean different entities
+  elsewhere
+
+Entries are evicted least-recently-used beyond max_entries. The cache
+belongs to one merged vocabulary: set_vocabulary() with a different
+vocabulary clears it, and a saved file written for another vocabulary is
+ignored on load. discard_words() drops only the parses naming given words
+(VocabularyService calls it as entity names change). A cache can be shared
+between narrators (it is thread-safe).
+
+Usage:
+    from src.phrase_cache import PhraseCache, scene_context
+
+    cache = PhraseCache(vocabulary=engine.merged_vocabulary)
+    command = cache.get(player_input, context)
+    if command is None:
+        command = ...  # ask the LLM
+        cache.put(player_input, context, command)
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.state_accessor import StateAccessor
+from src.types import ActorId
+
+logger = logging.getLogger(__name__)
+
+# Version of the on-disk format
+CACHE_FILE_VERSION = 1
+
+# Wrappers that do not change what a command means
+_POLITE_PREFIX = re.compile(
+    r"^(?:(?:please|kindly|now|then|ok|okay)\s+"
+    r"|(?:could|can|would|will)\s+(?:you|i)\s+"
+    r"|i\s+(?:want|wanna|would\s+like|'d\s+like|d\s+like|need)\s+(?:to\s+)?"
+    r"|let\s+me\s+|let's\s+|lets\s+|try\s+to\s+)+"
+)
+_POLITE_SUFFIX = re.compile(r"(?:\s+(?:please|now|for\s+me))+$")
+_ARTICLES = frozenset({"a", "an", "the"})
+
+
+def normalize_phrase(player_input: str) -> str:
+    """
+    Reduce player input to the words that carry its meaning.
+
+    Args:
+        player_input: Raw player input
+
+    Returns:
+        Lowercase words separated by single spaces
+    """
+    text = player_input.lower().replace("’", "'")
+    text = re.sub(r"[^\w\s']+", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    text = _POLITE_SUFFIX.sub("", _POLITE_PREFIX.sub("", text))
+    return " ".join(word for word in text.split() if word not in _ARTICLES)
+
+
+def context_signature(context: Dict[str, Any]) -> str:
+    """Short digest of a scene context dict (order of list items ignored)."""
+    canonical = {key: sorted(value) if isinstance(value, list) else value for key, value in context.items()}
+    data = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def vocabulary_signature(vocabulary: Dict[str, Any]) -> str:
+    """Digest of a merged vocabulary."""
+    data = json.dumps(vocabulary, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def scene_context(game_state: Any, behavior_manager: Any = None,
+                  actor_id: ActorId = ActorId("player")) -> Dict[str, Any]:
+    """
+    What an LLM parse of the actor's input can refer to.
+
+    Args:
+        game_state: Current GameState
+        behavior_manager: Its BehaviorManager
+        actor_id: Actor whose input is parsed
+
+    Returns:
+        Dict with the location id and sorted ids of entities there and carried
+    """
+    actor = game_state.actors.get(actor_id)
+    location_id = actor.location if actor else None
+    if not location_id:
+        return {"location": None, "here": [], "inventory": []}
+    accessor = StateAccessor(game_state, behavior_manager)
+    return {
+        "location": location_id,
+        "here": sorted(e.id for e in accessor.get_entities_at(location_id) if e.id != actor_id),
+        "inventory": sorted(e.id for e in accessor.get_entities_at(actor_id, entity_type="item")),
+    }
+
+
+class PhraseCache:
+    """
+    Bounded cache of LLM command parses keyed by normalized input and scene.
+
+    Args:
+        max_entries: Parses kept before least-recently-used ones are evicted
+        vocabulary: Merged vocabulary the parses were made with
+        path: Optional JSON file to load from now and save() to later
+    """
+
+    def __init__(self, max_entries: int = 2048, vocabulary: Optional[Dict[str, Any]] = None,
+                 path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.vocabulary_signature = vocabulary_signature(vocabulary) if vocabulary is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_vocabulary(self, vocabulary: Dict[str, Any]) -> None:
+        """
+        Bind the cache to a merged vocabulary, clearing it if the vocabulary changed.
+
+        Args:
+            vocabulary: The merged vocabulary now in use
+        """
+        signature = vocabulary_signature(vocabulary)
+        with self._lock:
+            if signature != self.vocabulary_signature:
+                if self._entries:
+                    logger.debug(f"Vocabulary changed; dropping {len(self._entries)} cached parses")
+                self._entries.clear()
+                self.vocabulary_signature = signature
+
+    def discard_words(self, words: Iterable[str]) -> None:
+        """
+        Drop the parses of phrases that mention any of words.
+
+        Args:
+            words: Words (possibly several tokens, e.g. "rusty key") whose
+                meaning changed, such as the old and new names of an entity
+        """
+        padded = [f" {word.lower()} " for word in words if word]
+        if not padded:
+            return
+        with self._lock:
+            stale = [key for key in self._entries
+                     if any(word in f" {key[0]} " for word in padded)]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logger.debug(f"Dropped {len(stale)} cached parses naming changed words")
+
+    def get(self, player_input: str, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached command for this input in this scene, or None.
+
+        Args:
+            player_input: Raw player input
+            context: Scene context (see scene_context)
+
+        Returns:
+            A copy of the cached JSON command, or None (cache miss)
+        """
+        key = (normalize_phrase(player_input), context_signature(context))
+        with self._lock:
+            command = self._entries.get(key)
+            if command is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(command)
+
+    def put(self, player_input: str, context: Dict[str, Any], command: Dict[str, Any]) -> None:
+        """
+        Store the LLM's parse of this input in this scene.
+
+        Args:
+            player_input: Raw player input
+            context: Scene context (see scene_context)
+            command: JSON command the LLM produced
+        """
+        phrase = normalize_phrase(player_input)
+        if not phrase:
+            return
+        key = (phrase, context_signature(context))
+        with self._lock:
+            self._entries[key] = copy.deepcopy(command)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts and size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """
+        Write the cache to a JSON file (atomically).
+
+        Args:
+            path: File to write (default: the path given at construction)
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("No path given to save the phrase cache to")
+        with self._lock:
+            data = {
+                "version": CACHE_FILE_VERSION,
+                "vocabulary": self.vocabulary_signature,
+                "entries": [[phrase, scene, command] for (phrase, scene), command in self._entries.items()],
+            }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_name, target)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def load(self, path: Path) -> None:
+        """
+        Add the entries of a saved cache file made with the same vocabulary.
+
+        An unreadable, incompatible or other-vocabulary file is logged and
+        ignored - the cache only saves work, so losing it is not an error.
+
+        Args:
+            path: File written by save()
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring phrase cache {path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_FILE_VERSION:
+            logger.warning(f"Ignoring phrase cache {path}: unsupported format")
+            return
+        with self._lock:
+            if self.vocabulary_signature is None:
+                self.vocabulary_signature = data.get("vocabulary")
+            elif data.get("vocabulary") != self.vocabulary_signature:
+                logger.info(f"Ignoring phrase cache {path}: made for another vocabulary")
+                return
+            for phrase, scene, command in data.get("entries", []):
+                self._entries[(phrase, scene)] = command
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,198 @@
+"""
+Prompt KV Store - Persist warmed system-prompt KV caches across runs.
+
+The narrator and the LLM parser keep their system prompts prefilled in MLX
+prompt caches. Prefilling a long prompt (narrator protocol + game style +
+vocabulary) dominates startup, and the result is the same every run until
+the prompt, model or tokenizer changes.
+
+warm_prompt_cache() tokenizes a system prompt and looks for a saved cache
+in a PromptKVStore before running the model:
+- Saved caches are safetensors files (mlx_lm's save_prompt_cache), loaded
+  lazily with load_prompt_cache.
+- File names include a key hashing the model id, the tokenizer version and
+  the full prompt text, so any edit to a prompt (including its vocabulary
+  section) misses and re-warms.
+- The store is shared by every game: each role and model keeps its
+  max_caches most recently used caches (one per game or prompt version),
+  and saving a new one removes the least recently used beyond that.
+
+Usage:
+    store = PromptKVStore()  # ~/.cache/text-game/prompt_kv
+    cache, token_count = warm_prompt_cache(model, tokenizer, model_id, system_prompt, "narrator", store)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import mlx.core as mx
+    import mlx_lm
+    from mlx_lm.models.cache import load_prompt_cache, make_prompt_cache, save_prompt_cache
+    HAS_MLX = True
+except ImportError:
+    HAS_MLX = False
+
+DEFAULT_STORE_DIR = Path.home() / ".cache" / "text-game" / "prompt_kv"
+
+# Bump when the saved layout changes
+FORMAT_VERSION = 1
+
+# Saved caches kept per role and model
+DEFAULT_MAX_CACHES = 8
+
+
+def tokenizer_version(tokenizer: Any) -> str:
+    """Identify a tokenizer well enough to notice when it (or mlx-lm) changes."""
+    vocab_size = getattr(tokenizer, "vocab_size", None)
+    name = getattr(tokenizer, "name_or_path", type(tokenizer).__name__)
+    mlx_lm_version = getattr(mlx_lm, "__version__", "unknown") if HAS_MLX else "none"
+    return f"{name}:{vocab_size}:mlx-lm {mlx_lm_version}"
+
+
+def prompt_cache_key(model_id: str, tokenizer_id: str, prompt: str) -> str:
+    """Hash of everything a prefilled system prompt depends on."""
+    payload = json.dumps([FORMAT_VERSION, model_id, tokenizer_id, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PromptKVStore:
+    """Directory of saved system-prompt KV caches."""
+
+    def __init__(self, directory: Optional[Path] = None, max_caches: int = DEFAULT_MAX_CACHES):
+        """Initialize the store.
+
+        Args:
+            directory: Where caches are kept (default: DEFAULT_STORE_DIR)
+            max_caches: Caches kept per role and model, least recently used removed first
+        """
+        self.directory = Path(directory) if directory is not None else DEFAULT_STORE_DIR
+        self.max_caches = max_caches
+
+    def _prefix(self, role: str, model_id: str) -> str:
+        return f"{role}-{re.sub(r'[^A-Za-z0-9.]+', '_', model_id)}-"
+
+    def path_for(self, role: str, model_id: str, key: str) -> Path:
+        """File holding the cache for a role ("narrator", "parser"), model and key."""
+        return self.directory / f"{self._prefix(role, model_id)}{key[:32]}.safetensors"
+
+    def load(self, role: str, model_id: str, key: str, token_count: int) -> Optional[List[Any]]:
+        """Load a saved cache, or None if there is none (or it is unusable).
+
+        Args:
+            role: What the prompt is for ("narrator", "parser")
+            model_id: Model the cache was computed with
+            key: prompt_cache_key() of the prompt
+            token_count: Tokens in the prompt, checked against the saved cache
+
+        Returns:
+            The prompt cache, or None
+        """
+        path = self.path_for(role, model_id, key)
+        if not path.exists():
+            return None
+        try:
+            cache, metadata = load_prompt_cache(str(path), return_metadata=True)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable prompt cache {path}: {e}")
+            return None
+        if metadata.get("key") != key or int(metadata.get("token_count", -1)) != token_count:
+            logger.warning(f"Ignoring mismatched prompt cache {path}")
+            return None
+        try:
+            # Modification time orders caches for pruning
+            os.utime(path)
+        except OSError:
+            pass
+        return cache
+
+    def save(self, role: str, model_id: str, key: str, cache: List[Any], token_count: int) -> None:
+        """Save a warmed cache and prune the least recently used caches of its role and model.
+
+        Failures are logged; the store is an optimization, never required.
+        """
+        path = self.path_for(role, model_id, key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(suffix=".safetensors", dir=self.directory)
+            os.close(fd)
+            try:
+                save_prompt_cache(tmp_name, cache,
+                                  metadata={"key": key, "token_count": str(token_count), "model": model_id})
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not save prompt cache {path}: {e}")
+            return
+        self.prune(role, model_id, keep=path)
+
+    def prune(self, role: str, model_id: str, keep: Path) -> None:
+        """Remove the least recently used caches of a role and model beyond max_caches.
+
+        Args:
+            role: What the prompts are for ("narrator", "parser")
+            model_id: Model the caches were computed with
+            keep: Cache just saved; never removed and counted as most recent
+        """
+        used = []
+        for path in self.directory.glob(f"{self._prefix(role, model_id)}*.safetensors"):
+            if path == keep:
+                continue
+            try:
+                used.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        used.sort(reverse=True)
+        for _, stale in used[max(0, self.max_caches - 1):]:
+            logger.info(f"Removing least recently used prompt cache {stale}")
+            stale.unlink(missing_ok=True)
+
+
+def warm_prompt_cache(model: Any, tokenizer: Any, model_id: str, system_prompt: str,
+                      role: str, store: Optional[PromptKVStore] = None) -> Tuple[List[Any], int]:
+    """Create a prompt cache holding a prefilled system prompt.
+
+    Args:
+        model: MLX model
+        tokenizer: Its tokenizer
+        model_id: Model path/name (part of the store key)
+        system_prompt: System prompt text
+        role: What the prompt is for ("narrator", "parser")
+        store: Optional PromptKVStore to load from and save to
+
+    Returns:
+        Tuple of (cache, token_count)
+    """
+    # Build system message in chat format (user message comes next, so no generation prompt)
+    prefix = tokenizer.apply_chat_template(
+        [{"role": "system", "content": system_prompt}],
+        add_generation_prompt=False,
+        tokenize=False
+    )
+    tokens = tokenizer.encode(prefix)
+
+    key = prompt_cache_key(model_id, tokenizer_version(tokenizer), prefix)
+    if store is not None:
+        cache = store.load(role, model_id, key, len(tokens))
+        if cache is not None:
+            logger.info(f"Loaded {role} prompt cache ({len(tokens)} tokens) from {store.directory}")
+            return cache, len(tokens)
+
+    logger.info(f"Warming {role} prompt cache with {len(tokens)} tokens...")
+    cache = make_prompt_cache(model)
+    model(mx.array(tokens)[None], cache=cache)
+    mx.eval([c.state for c in cache])
+
+    if store is not None:
+        store.save(role, model_id, key, cache, len(tokens))
+    return cache, len(tokens)
@@ -0,0 +1,106 @@
+"""
+Property Reads - Hand out the entities whose properties were accessed.
+
+Behaviors change entities by writing into entity.properties in place,
+which no GameState change listener sees. While any tracker is registered
+here, state_manager collects every entity whose properties dict is handed
+out (see state_manager.record_property_reads); distribute() drains that
+process-wide collection and passes it to every tracker, each keeping the
+entities of its own GameState. TurnJournal and UndoHistory are trackers.
+
+A tracker that must see an entity before it is written to (UndoHistory
+keeps the entity's fields as they were) also implements
+note_property_access, which is called synchronously on the first access
+to each entity since the last rearm(), before the caller gets the
+properties dict (or Actor.inventory).
+
+Usage:
+    class Tracker:
+        def note_property_reads(self, entities): ...
+
+    tracker = Tracker()
+    unregister = property_reads.register(tracker)
+    ...
+    property_reads.distribute()   # e.g. once per turn
+    unregister()                  # also runs when tracker is collected
+"""
+
+import threading
+import weakref
+from typing import Any, Callable, List, Optional, Protocol, Tuple
+
+from src.state_manager import (
+    drain_property_reads, rearm_property_read_hook, record_property_reads, set_property_read_hook,
+)
+
+# Held while distributing; trackers also hold it to update what they were handed
+lock = threading.Lock()
+
+
+class PropertyReadTracker(Protocol):
+    """Receives the entities whose properties were accessed."""
+
+    def note_property_reads(self, entities: List[Any]) -> None:
+        """Called by distribute() with lock held; entities may belong to any GameState."""
+
+
+_trackers: "weakref.WeakSet[PropertyReadTracker]" = weakref.WeakSet()
+# note_property_access methods of the trackers that have one (a plain tuple:
+# it is walked from the read hook)
+_access_methods: Tuple["weakref.WeakMethod[Callable[[Any], None]]", ...] = ()
+
+
+def _accessed(entity: Any) -> None:
+    """state_manager read hook: pass an access on to the access trackers."""
+    for ref in _access_methods:
+        method = ref()
+        if method is not None:
+            method(entity)
+
+
+def register(tracker: PropertyReadTracker) -> "weakref.finalize":
+    """
+    Start handing property reads to a tracker.
+
+    Returns:
+        Callable that unregisters the tracker; it also runs when the tracker
+        is garbage collected
+    """
+    global _access_methods
+    record_property_reads(True)
+    _trackers.add(tracker)
+    access = getattr(tracker, "note_property_access", None)
+    method_ref = None
+    if access is not None:
+        method_ref = weakref.WeakMethod(access)
+        _access_methods += (method_ref,)
+        set_property_read_hook(_accessed)
+    return weakref.finalize(tracker, _unregister, weakref.ref(tracker), method_ref)
+
+
+def _unregister(ref: "weakref.ReferenceType[PropertyReadTracker]",
+                method_ref: "Optional[weakref.WeakMethod[Callable[[Any], None]]]") -> None:
+    global _access_methods
+    tracker = ref()
+    if tracker is not None:
+        _trackers.discard(tracker)
+    if method_ref is not None:
+        _access_methods = tuple(other for other in _access_methods if other is not method_ref)
+        if not _access_methods:
+            set_property_read_hook(None)
+    record_property_reads(False)
+
+
+def distribute() -> None:
+    """Hand the entities accessed since the last call to every tracker."""
+    with lock:
+        reads = drain_property_reads()
+        if not reads:
+            return
+        for tracker in list(_trackers):
+            tracker.note_property_reads(reads)
+
+
+def rearm() -> None:
+    """Report the next access to every entity to note_property_access again (e.g. at a checkpoint)."""
+    rearm_property_read_hook()
@@ -7,22 +7,20 @@ separate prompt caches for each use case.
 
 import logging
 import os
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional
+
+from src.prompt_kv_store import PromptKVStore, warm_prompt_cache
 
 logger = logging.getLogger(__name__)
 
 # Check for MLX-LM availability
 try:
-    import mlx.core as mx
     from mlx_lm import load
-    from mlx_lm.models.cache import make_prompt_cache
     HAS_MLX = True
 except ImportError:
     HAS_MLX = False
     # Define dummy types for type checking when MLX not available
-    mx = None  # type: ignore
     load = None  # type: ignore
-    make_prompt_cache = None  # type: ignore
 
 
 class SharedMLXBackend:
@@ -41,11 +39,13 @@ class SharedMLXBackend:
         # Both caches use the same model, saving ~4-6GB memory
     """
 
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, kv_store: Optional[PromptKVStore] = None):
         """Load model and tokenizer once.
 
         Args:
             model_path: HuggingFace model path (e.g., "mlx-community/Qwen2.5-7B-Instruct-4bit")
+            kv_store: Optional PromptKVStore that warmed system prompt caches are
+                loaded from and saved to
 
         Raises:
             ImportError: If mlx-lm is not installed
@@ -58,6 +58,7 @@ class SharedMLXBackend:
             )
 
         self.model_path = model_path
+        self.kv_store = kv_store
 
         logger.info(f"Loading shared MLX model: {model_path}")
 
@@ -85,8 +86,7 @@ class SharedMLXBackend:
             and token_count is the number of tokens in the cached system prompt
         """
         logger.info("Creating narrator prompt cache")
-        cache = make_prompt_cache(self.model)
-        token_count = self._warm_cache(cache, system_prompt)
+        cache, token_count = self._warm_cache(system_prompt, "narrator")
         logger.info(f"Narrator cache warmed with {token_count} tokens")
         return cache, token_count
 
@@ -104,43 +104,23 @@ class SharedMLXBackend:
             and token_count is the number of tokens in the cached system prompt
         """
         logger.info("Creating parser prompt cache")
-        cache = make_prompt_cache(self.model)
-        token_count = self._warm_cache(cache, system_prompt)
+        cache, token_count = self._warm_cache(system_prompt, "parser")
         logger.info(f"Parser cache warmed with {token_count} tokens")
         return cache, token_count
 
-    def _warm_cache(self, cache: Any, system_prompt: str) -> int:
-        """Warm a cache with system prompt and return token count.
+    def _warm_cache(self, system_prompt: str, role: str) -> Tuple[Any, int]:
+        """Create a cache warmed with a system prompt.
 
-        Processes the system prompt through the model to fill the cache's KV state.
+        Processes the system prompt through the model to fill the cache's KV state
+        (or loads that state from kv_store, if it was saved by an earlier run).
         Subsequent generations using this cache will only need to process new tokens.
 
         Args:
-            cache: The prompt cache to warm
             system_prompt: System prompt text to cache
+            role: What the prompt is for ("narrator" or "parser")
 
         Returns:
-            Number of tokens in the cached system prompt
+            Tuple of (cache, token_count)
         """
-        # Build system message in chat format
-        messages = [{"role": "system", "content": system_prompt}]
-
-        # Apply chat template (don't add generation prompt - user message comes next)
-        prompt = self.tokenizer.apply_chat_template(
-            messages,
-            add_generation_prompt=False,
-            tokenize=False
-        )
-
-        # Tokenize
-        tokens = self.tokenizer.encode(prompt)
-        token_count = len(tokens)
-
-        # Process through model to warm cache
-        prompt_array = mx.array(tokens)
-        self.model(prompt_array[None], cache=cache)
-
-        # Evaluate to ensure cache state is computed
-        mx.eval([c.state for c in cache])
-
-        return token_count
+        return warm_prompt_cache(self.model, self.tokenizer, self.model_path,
+                                 system_prompt, role, self.kv_store)
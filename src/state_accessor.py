@@ -3,12 +3,14 @@ StateAccessor - Clean API for state queries and mutations with automatic behavio
 
 This module provides the core abstraction for accessing and modifying game state.
 """
+import random
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union, cast, TYPE_CHECKING
 
 from src.types import LocationId, ActorId, ItemId, LockId, PartId, EntityId, EventName
 from src.state_manager import (
-    GameState, Location, Item, Actor, Lock, Part, ExitDescriptor, Exit, Entity
+    GameState, Location, Item, Actor, Lock, Part, ExitDescriptor, Exit, Entity, LOCATED_KINDS,
+    CoreFieldProtectingDict
 )
 from src.narration_types import ReactionRef
 
@@ -107,6 +109,23 @@ class HandlerResult:
     reactions: Optional[List[ReactionRef]] = None
 
 
+def _core_field_error(key: str) -> str:
+    """Error for a path that would set a core field through the properties dict."""
+    return (
+        f"Cannot set core field '{key}' via properties dict. "
+        f"Use the '{key}' path instead"
+    )
+
+
+def accessor_rng(accessor: Any) -> Any:
+    """The session random number generator of accessor.
+
+    Falls back to the random module for accessor-like objects (test doubles)
+    that do not carry one.
+    """
+    return getattr(accessor, "rng", random)
+
+
 class StateAccessor:
     """
     Clean API for state queries and mutations.
@@ -116,16 +135,22 @@ class StateAccessor:
     are properly invoked.
     """
 
-    def __init__(self, game_state: GameState, behavior_manager: "BehaviorManager"):
+    def __init__(self, game_state: GameState, behavior_manager: "BehaviorManager",
+                 rng: Optional[random.Random] = None):
         """
         Initialize StateAccessor.
 
         Args:
             game_state: The GameState instance to operate on
             behavior_manager: The BehaviorManager instance for invoking behaviors
+            rng: The session's source of randomness (see LLMProtocolHandler.rng);
+                None uses the random module's shared generator
         """
         self.game_state = game_state
         self.behavior_manager = behavior_manager
+        # Behaviors draw random numbers from accessor.rng (see accessor_rng) so a seeded
+        # session replays the same way
+        self.rng: Union[random.Random, Any] = rng if rng is not None else random
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -150,10 +175,7 @@ class StateAccessor:
         Returns:
             Item or None if not found
         """
-        for item in self.game_state.items:
-            if item.id == item_id:
-                return item
-        return None
+        return cast(Optional[Item], self.game_state.lookup("item", item_id))
 
     def get_actor(self, actor_id: ActorId) -> Actor:
         """
@@ -182,10 +204,7 @@ class StateAccessor:
         Returns:
             Location or None if not found
         """
-        for location in self.game_state.locations:
-            if location.id == location_id:
-                return location
-        return None
+        return cast(Optional[Location], self.game_state.lookup("location", location_id))
 
 
     def get_lock(self, lock_id: LockId) -> Optional[Lock]:
@@ -198,10 +217,7 @@ class StateAccessor:
         Returns:
             Lock or None if not found
         """
-        for lock in self.game_state.locks:
-            if lock.id == lock_id:
-                return lock
-        return None
+        return cast(Optional[Lock], self.game_state.lookup("lock", lock_id))
 
     def get_door_item(self, door_id: ItemId) -> Optional[Item]:
         """
@@ -259,10 +275,7 @@ class StateAccessor:
         Returns:
             Part or None if not found
         """
-        for part in self.game_state.parts:
-            if part.id == part_id:
-                return part
-        return None
+        return cast(Optional[Part], self.game_state.lookup("part", part_id))
 
     def get_parts_of(self, entity_id: EntityId) -> List[Part]:
         """
@@ -286,13 +299,14 @@ class StateAccessor:
         Returns:
             List of Item objects at this part
         """
-        return [i for i in self.game_state.items if i.location == part_id]
+        return cast(List[Item], self.get_entities_at(part_id, entity_type="item"))
 
     def get_entity(self, entity_id: EntityId) -> Optional[Entity]:
         """
         Get any entity by ID regardless of type.
 
-        Searches all entity collections: locations, items, actors, locks, parts.
+        Searches the id registry for locations, items, actors, locks and parts
+        (in that precedence order when ids collide).
 
         Args:
             entity_id: The entity ID to look up
@@ -300,35 +314,13 @@ class StateAccessor:
         Returns:
             Entity or None if not found
         """
-        # Cast entity_id to each specific type for lookup
-        # At runtime these are all strings, but NewType requires explicit casts
-
-        # Check locations
-        result: Optional[Entity] = self.get_location(cast(LocationId, entity_id))
-        if result:
-            return result
-
-        # Check items
-        result = self.get_item(cast(ItemId, entity_id))
-        if result:
-            return result
-
-        # Check actors (use .get() since None is valid when searching all types)
-        result = self.game_state.actors.get(cast(ActorId, entity_id))
-        if result:
-            return result
-
-        # Check locks
-        result = self.get_lock(cast(LockId, entity_id))
-        if result:
-            return result
-
-        # Check parts
-        result = self.get_part(cast(PartId, entity_id))
-        if result:
-            return result
-
-        return None
+        entry = self.game_state.find_entity(entity_id)
+        if entry is None:
+            return None
+        kind, entity = entry
+        if kind not in ("location", "item", "actor", "lock", "part"):
+            return None
+        return cast(Entity, entity)
 
     def get_focused_entity(self, actor_id: ActorId) -> Optional[Entity]:
         """
@@ -448,11 +440,7 @@ class StateAccessor:
         Returns:
             List of Items in the location
         """
-        items = []
-        for item in self.game_state.items:
-            if item.location == location_id:
-                items.append(item)
-        return items
+        return cast(List[Item], self.get_entities_at(location_id, entity_type="item"))
 
     def get_actors_in_location(self, location_id: LocationId) -> List[Actor]:
         """
@@ -464,18 +452,15 @@ class StateAccessor:
         Returns:
             List of Actors in the location (including player if present)
         """
-        actors = []
-
-        # Check all actors (including player)
-        for actor in self.game_state.actors.values():
-            if actor.location == location_id:
-                actors.append(actor)
-
-        return actors
+        return cast(List[Actor], self.get_entities_at(location_id, entity_type="actor"))
 
     def get_entities_at(self, where_id: str, entity_type: Optional[str] = None) -> List[Union[Item, Actor, Exit]]:
         """Get all entities at a location/container.
 
+        Resolves ids from the per-kind buckets of the containment index, so
+        the cost is proportional to what is at where_id, not world size.
+        Within each kind, results are in collection (game file) order.
+
         Args:
             where_id: Location/container ID
             entity_type: Optional filter: "item", "actor", "exit"
@@ -483,30 +468,17 @@ class StateAccessor:
         Returns:
             List of entity objects (Item, Actor, Exit, etc.)
         """
-        entity_ids = self.game_state._entities_at.get(where_id, set())
+        buckets = self.game_state._entities_at_by_kind.get(where_id)
+        if not buckets:
+            return []
+        kinds = LOCATED_KINDS if entity_type is None else (entity_type,)
+        registry = self.game_state._entity_registry
         entities: List[Union[Item, Actor, Exit]] = []
 
-        for entity_id in entity_ids:
-            # Try to get as item
-            if entity_type is None or entity_type == "item":
-                item = next((i for i in self.game_state.items if i.id == entity_id), None)
-                if item:
-                    entities.append(item)
-                    continue
-
-            # Try to get as actor
-            if entity_type is None or entity_type == "actor":
-                actor = self.game_state.actors.get(ActorId(entity_id))
-                if actor:
-                    entities.append(actor)
-                    continue
-
-            # Try to get as exit
-            if entity_type is None or entity_type == "exit":
-                exit_entity = next((e for e in self.game_state.exits if e.id == entity_id), None)
-                if exit_entity:
-                    entities.append(exit_entity)
-                    continue
+        for kind in kinds:
+            ids = buckets.get(kind)
+            if ids:
+                entities.extend(registry.ordered(kind, ids))
 
         return entities
 
@@ -520,11 +492,12 @@ class StateAccessor:
             List of connected Exit entities
         """
         connected_ids = self.game_state._connected_to.get(exit_id, set())
+        registry = self.game_state._entity_registry
         exits: List[Exit] = []
 
         for connected_id in connected_ids:
-            exit_entity = next((e for e in self.game_state.exits if e.id == connected_id), None)
-            if exit_entity:
+            exit_entity = registry.get("exit", connected_id)
+            if exit_entity is not None:
                 exits.append(exit_entity)
 
         return exits
@@ -538,16 +511,8 @@ class StateAccessor:
         Returns:
             List of Exit entities at this location
         """
-        # Use containment index to find exits at location
-        entity_ids = self.game_state._entities_at.get(location_id, set())
-        exits: List[Exit] = []
-
-        for entity_id in entity_ids:
-            exit_entity = next((e for e in self.game_state.exits if e.id == entity_id), None)
-            if exit_entity:
-                exits.append(exit_entity)
-
-        return exits
+        # Use the exit bucket of the containment index
+        return cast(List[Exit], self.get_entities_at(location_id, entity_type="exit"))
 
     # Mutation methods
 
@@ -562,11 +527,8 @@ class StateAccessor:
             ValueError: If entity not found or new_where doesn't exist
         """
         # Find the entity
-        entity: Optional[Union[Item, Actor]] = None
-        item = next((i for i in self.game_state.items if i.id == entity_id), None)
-        if item:
-            entity = item
-        else:
+        entity: Optional[Union[Item, Actor]] = self.get_item(ItemId(entity_id))
+        if not entity:
             entity = self.game_state.actors.get(ActorId(entity_id))
 
         if not entity:
@@ -575,34 +537,20 @@ class StateAccessor:
         # Validate new_where exists (unless it's a removal state like "__consumed__")
         if not new_where.startswith("__"):
             # Check if new_where is a valid location
-            location_exists = any(loc.id == new_where for loc in self.game_state.locations)
+            location_exists = self.get_location(LocationId(new_where)) is not None
             # Check if new_where is a valid actor (for inventory)
             actor_exists = new_where in self.game_state.actors
             # Check if new_where is a valid item (for container items)
-            item_exists = any(i.id == new_where for i in self.game_state.items)
+            item_exists = self.get_item(ItemId(new_where)) is not None
 
             if not (location_exists or actor_exists or item_exists):
                 raise ValueError(f"Container not found: {new_where}")
 
-        # Update reverse index (remove old entry)
-        old_where = self.game_state._entity_where.get(entity_id)
-        if old_where and old_where in self.game_state._entities_at:
-            self.game_state._entities_at[old_where].discard(entity_id)
-
-        # Update entity.location
+        # Update entity.location; the containment index follows the assignment
         entity.location = new_where
-
-        # Update indices (skip if removed)
-        if new_where.startswith("__"):
-            # Removed entity - remove from index
-            self.game_state._entity_where.pop(entity_id, None)
-        else:
-            # Add to forward index
-            if new_where not in self.game_state._entities_at:
-                self.game_state._entities_at[new_where] = set()
-            self.game_state._entities_at[new_where].add(entity_id)
-            # Update reverse index
-            self.game_state._entity_where[entity_id] = new_where
+        kind = "item" if isinstance(entity, Item) else "actor"
+        self.game_state._place_entity(kind, entity_id, new_where)
+        self.game_state.note_changed(kind, entity_id)
 
     def connect_exits(self, exit_id_a: str, exit_id_b: str) -> None:
         """Create bidirectional connection between exits.
@@ -620,6 +568,8 @@ class StateAccessor:
         exit_a = self.game_state.get_exit(exit_id_a)
         exit_b = self.game_state.get_exit(exit_id_b)
 
+        self.game_state.note_changing(exit_a)
+        self.game_state.note_changing(exit_b)
         # Add connections to Exit entities
         if exit_id_b not in exit_a.connections:
             exit_a.connections.append(exit_id_b)
@@ -629,6 +579,8 @@ class StateAccessor:
         # Update connection index
         self.game_state._connected_to.setdefault(exit_id_a, set()).add(exit_id_b)
         self.game_state._connected_to.setdefault(exit_id_b, set()).add(exit_id_a)
+        self.game_state.note_changed("exit", exit_id_a)
+        self.game_state.note_changed("exit", exit_id_b)
 
     def disconnect_exits(self, exit_id_a: str, exit_id_b: str) -> None:
         """Remove bidirectional connection between exits.
@@ -646,6 +598,8 @@ class StateAccessor:
         exit_a = self.game_state.get_exit(exit_id_a)
         exit_b = self.game_state.get_exit(exit_id_b)
 
+        self.game_state.note_changing(exit_a)
+        self.game_state.note_changing(exit_b)
         # Remove connections from Exit entities
         if exit_id_b in exit_a.connections:
             exit_a.connections.remove(exit_id_b)
@@ -657,6 +611,8 @@ class StateAccessor:
             self.game_state._connected_to[exit_id_a].discard(exit_id_b)
         if exit_id_b in self.game_state._connected_to:
             self.game_state._connected_to[exit_id_b].discard(exit_id_a)
+        self.game_state.note_changed("exit", exit_id_a)
+        self.game_state.note_changed("exit", exit_id_b)
 
     def _set_path(self, entity: Any, path: str, value: Any) -> Optional[str]:
         """
@@ -676,16 +632,23 @@ class StateAccessor:
         Returns:
             None on success, error string on failure
         """
+        self.game_state.note_changing(entity)
         # Check for list operations
         if path.startswith('+'):
             # Append operation
-            return self._append_to_list(entity, path[1:], value)
+            error = self._append_to_list(entity, path[1:], value)
         elif path.startswith('-'):
             # Remove operation
-            return self._remove_from_list(entity, path[1:], value)
+            error = self._remove_from_list(entity, path[1:], value)
         else:
             # Set operation
-            return self._set_field(entity, path, value)
+            error = self._set_field(entity, path, value)
+
+        # Report the change (e.g. to a TurnJournal)
+        entity_id = getattr(entity, 'id', None)
+        if error is None and isinstance(entity_id, str):
+            self.game_state.note_changed(None, entity_id)
+        return error
 
     def _set_field(self, entity: Any, path: str, value: Any) -> Optional[str]:
         """Set a field value, handling nested paths with dots."""
@@ -694,6 +657,8 @@ class StateAccessor:
         # Navigate to the parent container
         current = entity
         for i, part in enumerate(parts[:-1]):
+            if isinstance(current, CoreFieldProtectingDict) and current.is_core_field(part):
+                return _core_field_error(part)
             # Check if it's a dataclass field or dict key
             if hasattr(current, part):
                 current = getattr(current, part)
@@ -714,6 +679,8 @@ class StateAccessor:
             return None
         elif isinstance(current, dict):
             # Dict key
+            if isinstance(current, CoreFieldProtectingDict) and current.is_core_field(final_field):
+                return _core_field_error(final_field)
             current[final_field] = value
             return None
         else:
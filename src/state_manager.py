@@ -4,8 +4,11 @@ Simplified property-based state manager.
 All non-structural fields go into the properties dict.
 """
 import json
+import os
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, SupportsIndex, Tuple, Union, cast
 from pathlib import Path
 
 from src.types import LocationId, ActorId, ItemId, LockId, PartId, ExitId, CommitmentId, ScheduledEventId, GossipId, SpreadId
@@ -33,10 +36,19 @@ class CoreFieldProtectingDict(dict):
 
     This protection catches bugs where code accidentally modifies core fields
     through the properties dict instead of the proper attribute interface.
+
+    Properties are written many times per turn, so the write checks
+    (__setitem__, setdefault, update) are a debug mode: enabled with
+    TEXT_GAME_CHECK_PROPERTIES=1 or set_core_field_checking(True), and on
+    for the test suite. Without them writes run at plain dict speed, and
+    StateAccessor.update still rejects core-field paths such as
+    "properties.location".
     """
-    _core_fields: set[str]
+    __slots__ = ('_core_fields', '_packed')
+    _core_fields: AbstractSet[str]
+    _packed: Optional[str]
 
-    def __init__(self, core_fields: set[str], *args: Any, **kwargs: Any):
+    def __init__(self, core_fields: AbstractSet[str], *args: Any, **kwargs: Any):
         """
         Create a protecting dict.
 
@@ -47,6 +59,15 @@ class CoreFieldProtectingDict(dict):
         super().__init__(*args, **kwargs)
         # Use object.__setattr__ to bypass our own __setattr__ protection
         object.__setattr__(self, '_core_fields', core_fields)
+        object.__setattr__(self, '_packed', None)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__ so _core_fields exists before items are set
+        return (self.__class__, (self._core_fields, dict(self)))
+
+    def is_core_field(self, key: str) -> bool:
+        """Return True if key may only be set via entity attribute access."""
+        return key in self._core_fields
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Prevent setting core fields."""
@@ -105,6 +126,125 @@ class CoreFieldProtectingDict(dict):
         super().update(updates)
 
 
+# Checked write methods, installed on CoreFieldProtectingDict only in checking mode
+_CHECKED_WRITES: Dict[str, Any] = {
+    name: CoreFieldProtectingDict.__dict__[name] for name in ('__setitem__', 'setdefault', 'update')
+}
+
+
+def set_core_field_checking(enabled: bool) -> None:
+    """Turn write-time core field checks on every CoreFieldProtectingDict on or off."""
+    for name, method in _CHECKED_WRITES.items():
+        if enabled:
+            setattr(CoreFieldProtectingDict, name, method)
+        elif name in CoreFieldProtectingDict.__dict__:
+            delattr(CoreFieldProtectingDict, name)
+
+
+set_core_field_checking(os.environ.get("TEXT_GAME_CHECK_PROPERTIES") == "1")
+
+
+class _PackedPropertiesDict(CoreFieldProtectingDict):
+    """
+    CoreFieldProtectingDict whose llm_context is still compact JSON text.
+
+    Authored llm_context (traits, state/action fragments, perspective
+    variants) is most of an entity's memory but is only read when the entity
+    is narrated. It is kept packed until the first read that could observe
+    it; that read decodes it into the dict and turns the instance back into
+    a plain CoreFieldProtectingDict, so later access pays nothing extra.
+    """
+    __slots__ = ()
+
+    def __init__(self, core_fields: AbstractSet[str], data: Dict[str, Any], packed: str):
+        super().__init__(core_fields, data)
+        object.__setattr__(self, '_packed', packed)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Copies and pickles stay packed
+        return (self.__class__, (self._core_fields, dict(dict.items(self)), self._packed))
+
+    def _unpack(self) -> None:
+        packed = self._packed
+        object.__setattr__(self, '_packed', None)
+        object.__setattr__(self, '__class__', CoreFieldProtectingDict)
+        if packed is not None:
+            dict.__setitem__(self, _LLM_CONTEXT, json.loads(packed))
+
+    def __missing__(self, key: str) -> Any:
+        if key != _LLM_CONTEXT:
+            raise KeyError(key)
+        self._unpack()
+        return dict.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == _LLM_CONTEXT:
+            self._unpack()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key == _LLM_CONTEXT or dict.__contains__(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == _LLM_CONTEXT:
+            # Replaced wholesale: the packed value is never needed
+            object.__setattr__(self, '_packed', None)
+            object.__setattr__(self, '__class__', CoreFieldProtectingDict)
+        CoreFieldProtectingDict.__setitem__(self, key, value)
+
+    def __eq__(self, other: object) -> bool:
+        self._unpack()
+        if isinstance(other, _PackedPropertiesDict):
+            other._unpack()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+
+def _unpacking(name: str) -> Callable[..., Any]:
+    def method(self: _PackedPropertiesDict, *args: Any, **kwargs: Any) -> Any:
+        self._unpack()
+        return getattr(self, name)(*args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+# Every other operation that can see llm_context unpacks first
+for _name in (
+    '__iter__', '__reversed__', '__len__', '__repr__',
+    '__or__', '__ror__', '__ior__', '__delitem__', 'keys', 'values', 'items',
+    'copy', 'pop', 'popitem', 'setdefault', 'update', 'clear',
+):
+    setattr(_PackedPropertiesDict, _name, _unpacking(_name))
+del _name
+
+
+_LLM_CONTEXT = 'llm_context'
+_pack_json = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+# Core fields of each entity type, shared by every instance's properties dict
+_LOCATION_CORE_FIELDS = frozenset({'id', 'name', 'description', 'exits', 'items', 'npcs', 'behaviors'})
+_EXIT_DESCRIPTOR_CORE_FIELDS = frozenset(
+    {'type', 'to', 'door_id', 'name', 'description', 'passage', 'door_at', 'behaviors'}
+)
+_ITEM_CORE_FIELDS = frozenset({'id', 'name', 'description', 'location', 'behaviors'})
+_ACTOR_CORE_FIELDS = frozenset({'id', 'name', 'description', 'location', 'inventory', 'behaviors'})
+_PART_CORE_FIELDS = frozenset({'id', 'name', 'part_of', 'behaviors'})
+# Locks and virtual entities (commitments, scheduled events, gossip, spreads)
+_NAMED_CORE_FIELDS = frozenset({'id', 'name', 'description', 'properties', 'behaviors'})
+
+
+def _protected_properties(core_fields: AbstractSet[str], properties: Dict[str, Any]) -> CoreFieldProtectingDict:
+    """Wrap parsed properties, packing an authored llm_context dict until first read."""
+    properties = {sys.intern(key): value for key, value in properties.items()}
+    llm_context = properties.get(_LLM_CONTEXT)
+    if isinstance(llm_context, dict):
+        del properties[_LLM_CONTEXT]
+        return _PackedPropertiesDict(core_fields, properties, _pack_json(llm_context))
+    return CoreFieldProtectingDict(core_fields, properties)
+
+
 class ContainerInfo:
     """Wrapper for container dict to provide attribute access."""
 
@@ -156,7 +296,7 @@ def _parse_behaviors(raw_behaviors: Any, entity_label: str) -> List[str]:
             raise ValueError(
                 f"Behaviors for {entity_label} must be module paths only, not 'module:function'."
             )
-        ref = ref.strip()
+        ref = sys.intern(ref.strip())
         if not ref:
             continue
         if ref not in modules:
@@ -165,6 +305,120 @@ def _parse_behaviors(raw_behaviors: Any, entity_label: str) -> List[str]:
     return modules
 
 
+class _LocatedEntity:
+    """
+    Mixin for entities with a .location tracked by the containment index.
+
+    GameState registers itself as the entity's whereabouts owner when the
+    entity is added to one of its collections; any later assignment to
+    .location (directly, via StateAccessor.update or set_entity_where)
+    is reported back so _entities_at/_entity_where never go stale.
+    Assignments to .name likewise keep the name token index current.
+    """
+    __slots__ = ("_whereabouts_owner",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "location" or name == "name":
+            owner = getattr(self, "_whereabouts_owner", None)
+            old = getattr(self, name, None)
+            if owner is not None and old != value and owner._pre_change_listeners:
+                owner.note_changing(self)
+            object.__setattr__(self, name, value)
+            if owner is not None and old != value:
+                if name == "location":
+                    owner._entity_relocated(self)
+                else:
+                    owner._entity_renamed(self)
+        else:
+            object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and pickles are detached from the owning GameState
+        return {
+            name: getattr(self, name)
+            for name in self.__dataclass_fields__  # type: ignore[attr-defined]
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+class _HookedReads(Dict[int, Any]):
+    """_property_reads that passes an entity to _property_read_hook on its first read since rearm_property_read_hook()."""
+    __slots__ = ("hooked",)
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.hooked: Dict[int, Any] = {}
+
+    def __setitem__(self, key: int, entity: Any) -> None:
+        dict.__setitem__(self, key, entity)
+        if key not in self.hooked:
+            self.hooked[key] = entity
+            hook = _property_read_hook
+            if hook is not None:
+                hook(entity)
+
+
+# Entities whose properties dict was handed out since the last
+# drain_property_reads() (by id(), as entities are unhashable); None unless
+# record_property_reads() is on. Properties are mutated in place, so a read
+# is the earliest sign that an entity may have changed (TurnJournal uses
+# this to find what to save; see property_reads).
+_property_reads: Optional[Dict[int, Any]] = None
+_property_read_recorders = 0
+# Called with the entity on its first recorded read since the last
+# rearm_property_read_hook(), before the properties dict is returned
+_property_read_hook: Optional[Callable[[Any], None]] = None
+
+
+def record_property_reads(enabled: bool) -> None:
+    """Start (True) or stop (False) collecting entities whose properties are accessed.
+
+    Calls nest: entities are collected until every True has been matched
+    by a False.
+    """
+    global _property_reads, _property_read_recorders
+    _property_read_recorders = max(0, _property_read_recorders + (1 if enabled else -1))
+    if _property_read_recorders and _property_reads is None:
+        _property_reads = _HookedReads() if _property_read_hook is not None else {}
+    elif not _property_read_recorders:
+        _property_reads = None
+
+
+def set_property_read_hook(hook: Optional[Callable[[Any], None]]) -> None:
+    """Call hook(entity) when an entity's properties are read.
+
+    The hook runs before the reader gets the properties dict, so it sees the
+    entity as it was, and only for the first read of each entity until
+    rearm_property_read_hook() is called. Only recorded reads are hooked
+    (see record_property_reads); None removes the hook.
+    """
+    global _property_reads, _property_read_hook
+    _property_read_hook = hook
+    if _property_reads is not None:
+        _property_reads = (_HookedReads if hook is not None else dict)(_property_reads)
+
+
+def rearm_property_read_hook() -> None:
+    """Make the next read of every entity call the property read hook again."""
+    if isinstance(_property_reads, _HookedReads):
+        _property_reads.hooked.clear()
+
+
+def drain_property_reads() -> List[Any]:
+    """Return the entities collected since the last call and forget them."""
+    reads = _property_reads
+    drained: List[Any] = []
+    # popitem() is atomic, so reads recorded meanwhile by other threads are
+    # either returned now or kept for the next call
+    while reads:
+        drained.append(reads.popitem()[1])
+    return drained
+
+
 # Dataclasses
 @dataclass
 class Metadata:
@@ -177,7 +431,7 @@ class Metadata:
     extra_turn_phases: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExitDescriptor:
     """Exit descriptor for location connections.
 
@@ -198,9 +452,7 @@ class ExitDescriptor:
     description: str = ""  # Prose description for examine
     passage: Optional[str] = None  # Traversal structure beyond door (e.g., "narrow stairs")
     door_at: Optional[LocationId] = None  # Which end the door is at
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'type', 'to', 'door_id', 'name', 'description', 'passage', 'door_at', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_EXIT_DESCRIPTOR_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
     # Internal fields for id synthesis - set by parser
     _direction: str = field(default="", repr=False)
@@ -209,6 +461,8 @@ class ExitDescriptor:
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -241,8 +495,8 @@ class ExitDescriptor:
         self.properties["llm_context"] = value
 
 
-@dataclass
-class Exit:
+@dataclass(slots=True)
+class Exit(_LocatedEntity):
     """An exit entity that connects locations.
 
     Exits are first-class entities with dual participation:
@@ -269,7 +523,7 @@ class Exit:
     traits: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Location in the game world."""
     id: LocationId
@@ -277,14 +531,14 @@ class Location:
     description: str
     exits: Dict[str, ExitDescriptor] = field(default_factory=dict)
     items: List[ItemId] = field(default_factory=list)
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'exits', 'items', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_LOCATION_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -310,21 +564,21 @@ class Location:
         self.properties["llm_context"] = value
 
 
-@dataclass
-class Item:
+@dataclass(slots=True)
+class Item(_LocatedEntity):
     """Item in the game world."""
     id: ItemId
     name: str
     description: str
     location: str  # Can be LocationId, ActorId, ItemId (container), or exit string
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'location', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_ITEM_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -430,20 +684,20 @@ class Item:
         return cast(Optional[str], lock_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class Lock:
     """Lock mechanism."""
     id: LockId
     name: str
     description: str
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_NAMED_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -489,20 +743,20 @@ class Lock:
         self.properties["states"] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     """A spatial component of another entity (room, item, container, actor)."""
     id: PartId
     name: str
     part_of: str  # Parent entity ID (can be LocationId, ItemId, or ActorId)
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'part_of', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_PART_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -528,22 +782,22 @@ class Part:
         self.properties["llm_context"] = value
 
 
-@dataclass
-class Actor:
+@dataclass(slots=True)
+class Actor(_LocatedEntity):
     """Unified actor (player or NPC)."""
     id: ActorId
     name: str
     description: str
     location: LocationId
     inventory: List[ItemId] = field(default_factory=list)
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'location', 'inventory', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_ACTOR_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -593,20 +847,46 @@ class Actor:
         self.properties["llm_context"] = value
 
 
-@dataclass
+class _RecordedSlot:
+    """
+    Slot of a list field that behaviors edit in place (Actor.inventory).
+
+    Reading it is recorded like a properties read (see record_property_reads),
+    so trackers learn of the entity before it can change.
+    """
+    __slots__ = ("slot",)
+
+    def __init__(self, slot: Any) -> None:
+        self.slot = slot
+
+    def __get__(self, entity: Any, owner: Optional[type] = None) -> Any:
+        if entity is None:
+            return self
+        if _property_reads is not None:
+            _property_reads[id(entity)] = entity
+        return self.slot.__get__(entity, owner)
+
+    def __set__(self, entity: Any, value: Any) -> None:
+        self.slot.__set__(entity, value)
+
+
+setattr(Actor, "inventory", _RecordedSlot(Actor.__dict__["inventory"]))
+
+
+@dataclass(slots=True)
 class Commitment:
     """Player promise to an NPC with deadline tracking."""
     id: CommitmentId
     name: str
     description: str
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_NAMED_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -632,20 +912,20 @@ class Commitment:
         self.properties["llm_context"] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledEvent:
     """Timed event that fires when trigger turn is reached."""
     id: ScheduledEventId
     name: str
     description: str
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_NAMED_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -671,20 +951,20 @@ class ScheduledEvent:
         self.properties["llm_context"] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Gossip:
     """Information propagating between NPCs over time."""
     id: GossipId
     name: str
     description: str
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_NAMED_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -710,20 +990,20 @@ class Gossip:
         self.properties["llm_context"] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Spread:
     """Environmental effect spreading across locations over time."""
     id: SpreadId
     name: str
     description: str
-    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(
-        {'id', 'name', 'description', 'behaviors'}
-    ))
+    _properties: Dict[str, Any] = field(default_factory=lambda: CoreFieldProtectingDict(_NAMED_CORE_FIELDS))
     behaviors: List[str] = field(default_factory=list)
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Access properties dict with core field protection."""
+        if _property_reads is not None:
+            _property_reads[id(self)] = self
         return self._properties
 
     @property
@@ -764,6 +1044,446 @@ Use this type when a function can accept any entity type.
 """
 
 
+# Indexed entity collections on GameState: (attribute name, registry kind).
+# Order is lookup precedence for ids that collide across kinds, matching
+# the historical search order of StateAccessor.get_entity().
+ENTITY_COLLECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("locations", "location"),
+    ("items", "item"),
+    ("actors", "actor"),
+    ("locks", "lock"),
+    ("parts", "part"),
+    ("exits", "exit"),
+    ("commitments", "commitment"),
+    ("scheduled_events", "scheduled_event"),
+    ("gossip", "gossip"),
+    ("spreads", "spread"),
+)
+
+_KIND_RANK: Dict[str, int] = {kind: rank for rank, (_, kind) in enumerate(ENTITY_COLLECTIONS)}
+_COLLECTION_KIND: Dict[str, str] = dict(ENTITY_COLLECTIONS)
+
+# Kinds that occupy a place in the containment index
+LOCATED_KINDS: Tuple[str, ...] = ("item", "actor", "exit")
+
+# Pseudo-kind bucket for entities located at an exit of a location
+AT_EXIT = "at_exit"
+
+
+def name_tokens(name: Any) -> Tuple[str, ...]:
+    """Return the lowercased tokens a name is indexed under.
+
+    A search word matches a name (see utilities.utils.name_matches) when it
+    equals the whole name or one of its whitespace-separated words, so the
+    tokens are the full name plus each word.
+    """
+    if not isinstance(name, str) or not name:
+        return ()
+    name_lower = name.lower()
+    words = name_lower.split()
+    if len(words) == 1 and words[0] == name_lower:
+        return (name_lower,)
+    return (name_lower, *words)
+
+
+def _exit_reference_location(where: str) -> Optional[str]:
+    """Return the location id of an "exit:{location_id}:{direction}" reference."""
+    if where.startswith("exit:"):
+        parts = where.split(":")
+        if len(parts) >= 2 and parts[1]:
+            return parts[1]
+    return None
+
+
+class EntityList(list):
+    """
+    List of entities that maintains an id -> entity index.
+
+    Behaves exactly like a list; every mutating operation also updates
+    the per-kind index and notifies the owning EntityRegistry so the
+    unified id map stays coherent. When the list holds duplicate ids the
+    first occurrence wins, matching the old linear-scan semantics.
+
+    ``ordinal`` maps each indexed id to a number that increases with list
+    position, so index-backed queries can return results in list order.
+    """
+
+    def __init__(self, kind: str, registry: "EntityRegistry", iterable: Any = ()):
+        super().__init__()
+        self.kind = kind
+        self.by_id: Dict[str, Any] = {}
+        self.ordinal: Dict[str, int] = {}
+        self._registry = registry
+        self._counts: Dict[str, int] = {}
+        self._next_ordinal = 0
+        self.extend(iterable)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain lists; GameState re-wraps them.
+        return (list, (list(self),))
+
+    def _added(self, entity: Any) -> None:
+        entity_id = getattr(entity, 'id', None)
+        if entity_id is None:
+            return
+        self._counts[entity_id] = self._counts.get(entity_id, 0) + 1
+        if entity_id not in self.by_id:
+            self.by_id[entity_id] = entity
+            self.ordinal[entity_id] = self._next_ordinal
+            self._next_ordinal += 1
+            self._registry._added(self, entity_id, entity)
+
+    def _removed(self, entity: Any) -> None:
+        entity_id = getattr(entity, 'id', None)
+        if entity_id is None:
+            return
+        remaining = self._counts.get(entity_id, 0) - 1
+        if remaining > 0:
+            self._counts[entity_id] = remaining
+            if self.by_id.get(entity_id) is entity:
+                # Duplicate id: promote the next occurrence
+                self._reindex()
+            return
+        self._counts.pop(entity_id, None)
+        self.ordinal.pop(entity_id, None)
+        if self.by_id.pop(entity_id, None) is not None:
+            self._registry._removed(self, entity_id)
+
+    def _reindex(self) -> None:
+        stale = list(self.by_id)
+        self.by_id.clear()
+        self.ordinal.clear()
+        self._counts.clear()
+        self._next_ordinal = 0
+        for entity_id in stale:
+            self._registry._removed(self, entity_id)
+        for entity in self:
+            self._added(entity)
+
+    def append(self, entity: Any) -> None:
+        super().append(entity)
+        self._added(entity)
+
+    def extend(self, entities: Any) -> None:
+        for entity in entities:
+            super().append(entity)
+            self._added(entity)
+
+    def insert(self, index: Any, entity: Any) -> None:
+        super().insert(index, entity)
+        self._reindex()
+
+    def remove(self, entity: Any) -> None:
+        super().remove(entity)
+        self._removed(entity)
+
+    def pop(self, index: Any = -1) -> Any:
+        entity = super().pop(index)
+        self._removed(entity)
+        return entity
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindex()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    # list.__add__ is overloaded on the element type, which mypy cannot line
+    # up with an in-place add on a list subclass; this one is list.__iadd__'s
+    def __iadd__(self, entities: Iterable[Any]) -> "EntityList":  # type: ignore[misc]
+        self.extend(entities)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "EntityList":
+        super().__imul__(count)
+        self._reindex()
+        return self
+
+
+class EntityDict(dict):
+    """
+    Dict of entities keyed by id that notifies an EntityRegistry on change.
+
+    Used for GameState.actors, which is already keyed by id; the dict
+    itself serves as the per-kind index.
+    """
+
+    def __init__(self, kind: str, registry: "EntityRegistry", mapping: Any = ()):
+        super().__init__()
+        self.kind = kind
+        self.ordinal: Dict[str, int] = {}
+        self._registry = registry
+        self._next_ordinal = 0
+        self.update(mapping)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (dict, (dict(self),))
+
+    @property
+    def by_id(self) -> Dict[str, Any]:
+        return self
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self:
+            self.ordinal[key] = self._next_ordinal
+            self._next_ordinal += 1
+        super().__setitem__(key, value)
+        self._registry._added(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.ordinal.pop(key, None)
+        self._registry._removed(self, key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        present = key in self
+        value = super().pop(key, *default)
+        if present:
+            self.ordinal.pop(key, None)
+            self._registry._removed(self, key)
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key, value = super().popitem()
+        self.ordinal.pop(key, None)
+        self._registry._removed(self, key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        keys = list(self)
+        super().clear()
+        self.ordinal.clear()
+        for key in keys:
+            self._registry._removed(self, key)
+
+
+class _LazyEntityDict(EntityDict):
+    """
+    EntityDict of a lazily loaded world: key lookups that miss ask the
+    registry's loader to materialize the entity first.
+    """
+
+    def __missing__(self, key: str) -> Any:
+        loader = self._registry.loader
+        if loader is not None and loader(self.kind, (key,)) and dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        try:
+            return self.__missing__(key)
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        if dict.__contains__(self, key):
+            return True
+        loader = self._registry.loader
+        return isinstance(key, str) and loader is not None and loader(self.kind, (key,)) and dict.__contains__(self, key)
+
+
+class EntityRegistry:
+    """
+    O(1) id-keyed lookup over all GameState entity collections.
+
+    Each collection is an EntityList/EntityDict holding its own per-kind
+    ``by_id`` index; the registry additionally maintains a unified
+    id -> (kind, entity) map. Collections report every add/remove, so the
+    indexes never need rebuilding after load.
+
+    Set ``checked`` to True (or TEXT_GAME_CHECK_REGISTRY=1 in the
+    environment) to cross-check every lookup against a linear scan of the
+    underlying collection; intended for test runs.
+    """
+
+    def __init__(self) -> None:
+        self.collections: Dict[str, Any] = {}
+        self.entries: Dict[str, Tuple[str, Any]] = {}
+        self.checked = os.environ.get("TEXT_GAME_CHECK_REGISTRY") == "1"
+        # GameState notified of located entities entering/leaving collections
+        self.owner: Optional["GameState"] = None
+        # Called as loader(kind, entity_ids) for ids not found in the
+        # collections (kind None: any kind); returns True if it added
+        # entities. Set by set_loader for lazily loaded worlds.
+        self.loader: Optional[Callable[[Optional[str], Iterable[str]], bool]] = None
+        # Count of entities added to and removed from each kind's collection;
+        # unchanged means the collection still has the same members in order
+        self.membership_changes: Dict[str, int] = defaultdict(int)
+
+    def set_loader(self, loader: Optional[Callable[[Optional[str], Iterable[str]], bool]]) -> None:
+        """Install the callback that materializes entities missing from the collections."""
+        self.loader = loader
+        actors = self.collections.get("actor")
+        if actors is not None:
+            # Only lazy worlds pay for the misses-aware actor dict
+            object.__setattr__(actors, "__class__", _LazyEntityDict if loader is not None else EntityDict)
+
+    def attach(self, kind: str, entities: Any) -> Any:
+        """Wrap a collection for kind, replacing any previously attached one."""
+        previous = self.collections.get(kind)
+        if previous is entities:
+            return entities
+        if kind == "actor":
+            wrapped: Any = (EntityDict if self.loader is None else _LazyEntityDict)(kind, self)
+        else:
+            wrapped = EntityList(kind, self)
+        self.collections[kind] = wrapped
+        if previous is not None:
+            self.membership_changes[kind] += 1
+            for entity_id in list(previous.by_id):
+                self._unmap(kind, entity_id)
+                if self.owner is not None and kind in LOCATED_KINDS:
+                    self.owner._untrack_whereabouts(kind, entity_id)
+                if self.owner is not None and self.owner._change_listeners:
+                    self.owner.note_changed(kind, entity_id)
+        if kind == "actor":
+            wrapped.update(entities)
+        else:
+            wrapped.extend(entities)
+        return wrapped
+
+    def _added(self, collection: Any, entity_id: str, entity: Any) -> None:
+        kind = collection.kind
+        if self.collections.get(kind) is not collection:
+            return  # Detached collection (replaced by assignment)
+        current = self.entries.get(entity_id)
+        if current is None or current[0] == kind or _KIND_RANK[kind] < _KIND_RANK[current[0]]:
+            self.entries[entity_id] = (kind, entity)
+        self.membership_changes[kind] += 1
+        if self.owner is not None and kind in LOCATED_KINDS:
+            self.owner._track_whereabouts(kind, entity_id, entity)
+        if self.owner is not None and self.owner._change_listeners:
+            self.owner.note_changed(kind, entity_id)
+
+    def _removed(self, collection: Any, entity_id: str) -> None:
+        kind = collection.kind
+        if self.collections.get(kind) is collection:
+            self.membership_changes[kind] += 1
+            self._unmap(kind, entity_id)
+            if self.owner is not None and kind in LOCATED_KINDS:
+                self.owner._untrack_whereabouts(kind, entity_id)
+            if self.owner is not None and self.owner._change_listeners:
+                self.owner.note_changed(kind, entity_id)
+
+    def _unmap(self, kind: str, entity_id: str) -> None:
+        current = self.entries.get(entity_id)
+        if current is None or current[0] != kind:
+            return
+        del self.entries[entity_id]
+        # Fall back to a lower-precedence kind holding the same id
+        for _, other_kind in ENTITY_COLLECTIONS:
+            collection = self.collections.get(other_kind)
+            if collection is not None and entity_id in collection.by_id:
+                self.entries[entity_id] = (other_kind, collection.by_id[entity_id])
+                return
+
+    def get(self, kind: str, entity_id: str) -> Any:
+        """Return the entity of the given kind with entity_id, or None."""
+        entity = self.collections[kind].by_id.get(entity_id)
+        if entity is None and self.loader is not None and self.loader(kind, (entity_id,)):
+            entity = self.collections[kind].by_id.get(entity_id)
+        if self.checked:
+            self._check_lookup(kind, entity_id, entity)
+        return entity
+
+    def ordered(self, kind: str, entity_ids: Any) -> List[Any]:
+        """Resolve ids of one kind to entities, in collection order.
+
+        Unknown ids are skipped.
+        """
+        collection = self.collections[kind]
+        order = collection.ordinal
+        if self.loader is not None:
+            entity_ids = list(entity_ids)
+            missing = [entity_id for entity_id in entity_ids if entity_id not in order]
+            if missing:
+                self.loader(kind, missing)
+        found = [entity_id for entity_id in entity_ids if entity_id in order]
+        found.sort(key=order.__getitem__)
+        by_id = collection.by_id
+        return [by_id[entity_id] for entity_id in found]
+
+    def find(self, entity_id: str) -> Optional[Tuple[str, Any]]:
+        """Return (kind, entity) for entity_id across all kinds, or None."""
+        entry = self.entries.get(entity_id)
+        if entry is None and self.loader is not None and self.loader(None, (entity_id,)):
+            entry = self.entries.get(entity_id)
+        if self.checked:
+            expected = None
+            for _, kind in ENTITY_COLLECTIONS:
+                found = self._scan(kind, entity_id)
+                if found is not None:
+                    expected = (kind, found)
+                    break
+            if (entry is None) != (expected is None) or (
+                entry is not None and expected is not None
+                and (entry[0] != expected[0] or entry[1] is not expected[1])
+            ):
+                raise ValidationError(
+                    f"Entity registry out of sync for '{entity_id}': "
+                    f"index has {entry!r}, collections have {expected!r}"
+                )
+        return entry
+
+    def _scan(self, kind: str, entity_id: str) -> Any:
+        collection = self.collections[kind]
+        if kind == "actor":
+            return dict.get(collection, entity_id)
+        return next((e for e in collection if getattr(e, 'id', None) == entity_id), None)
+
+    def _check_lookup(self, kind: str, entity_id: str, entity: Any) -> None:
+        expected = self._scan(kind, entity_id)
+        if expected is not entity:
+            raise ValidationError(
+                f"Entity registry out of sync for {kind} '{entity_id}': "
+                f"index has {entity!r}, collection has {expected!r}"
+            )
+
+    def verify(self) -> List[str]:
+        """Compare every index against its collection; return problems found."""
+        problems: List[str] = []
+        expected_entries: Dict[str, Tuple[str, Any]] = {}
+        for _, kind in ENTITY_COLLECTIONS:
+            collection = self.collections.get(kind)
+            if collection is None:
+                continue
+            if kind == "actor":
+                pairs = list(dict.items(collection))
+            else:
+                pairs = [(e.id, e) for e in collection if getattr(e, 'id', None) is not None]
+            expected: Dict[str, Any] = {}
+            for entity_id, entity in pairs:
+                expected.setdefault(entity_id, entity)
+                expected_entries.setdefault(entity_id, (kind, expected[entity_id]))
+            if kind != "actor":
+                for entity_id in set(expected) | set(collection.by_id):
+                    if collection.by_id.get(entity_id) is not expected.get(entity_id):
+                        problems.append(f"{kind} index mismatch for '{entity_id}'")
+        for entity_id in set(expected_entries) | set(self.entries):
+            have = self.entries.get(entity_id)
+            want = expected_entries.get(entity_id)
+            if have is None or want is None or have[0] != want[0] or have[1] is not want[1]:
+                problems.append(f"unified index mismatch for '{entity_id}'")
+        return problems
+
+
 @dataclass
 class GameState:
     """Complete game state."""
@@ -784,10 +1504,345 @@ class GameState:
     # Bidirectional containment index (whereabouts)
     _entities_at: Dict[str, set[str]] = field(default_factory=dict)  # where_id → set(entity_ids)
     _entity_where: Dict[str, str] = field(default_factory=dict)      # entity_id → where_id
+    # Per-kind buckets of _entities_at: where_id → kind → entity_ids
+    # (dict used as an insertion-ordered set so query results are stable)
+    _entities_at_by_kind: Dict[str, Dict[str, Dict[str, None]]] = field(default_factory=dict)
+
+    # Name token index: kind → token → entity_ids (see name_tokens)
+    _ids_by_name_token: Dict[str, Dict[str, Dict[str, None]]] = field(default_factory=dict)
+    _indexed_name: Dict[Tuple[str, str], str] = field(default_factory=dict)  # (kind, entity_id) → name
 
     # Connection index (exits)
     _connected_to: Dict[str, set[str]] = field(default_factory=dict)  # exit_id → set(connected_exit_ids)
 
+    # Id registry over all entity collections (see EntityRegistry)
+    _entity_registry: EntityRegistry = field(
+        default_factory=EntityRegistry, init=False, repr=False, compare=False
+    )
+
+    # Callbacks (kind, entity_id, old_name, new_name) run when the name token
+    # index changes: an entity is added (old_name None), removed (new_name
+    # None) or renamed. Not carried over to copies.
+    _name_listeners: List[Callable[[str, str, Optional[str], Optional[str]], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Callbacks (kind, entity_id) run when an entity may have changed: it
+    # entered or left a collection, moved, was renamed or was updated through
+    # StateAccessor. kind is None when only the id is known (e.g. the
+    # container an entity moved out of). Not carried over to copies.
+    _change_listeners: List[Callable[[Optional[str], str], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Callbacks (entity) run just before StateAccessor or an assignment to
+    # .location/.name changes an entity of this state. Not carried over to copies.
+    _pre_change_listeners: List[Callable[[Any], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Regions of a sharded world not loaded yet (a world_shards.ShardedWorld);
+    # None once every entity is loaded. Copies keep their own pending regions.
+    _shards: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._entity_registry.owner = self
+        if self._shards is not None:
+            self._entity_registry.set_loader(self._load_from_shards)
+        for attr, kind in ENTITY_COLLECTIONS:
+            object.__setattr__(self, attr, self._entity_registry.attach(kind, getattr(self, attr)))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Re-wrap collections assigned wholesale (state.items = [...])
+        kind = _COLLECTION_KIND.get(name)
+        if kind is not None and '_entity_registry' in self.__dict__:
+            value = self._entity_registry.attach(kind, value)
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        del state['_entity_registry']
+        state.pop('_name_listeners', None)
+        state.pop('_change_listeners', None)
+        state.pop('_pre_change_listeners', None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Copies/pickles carry plain collections; rebuild the registry
+        self.__dict__.update(state)
+        self.__dict__['_entity_registry'] = EntityRegistry()
+        self.__dict__['_name_listeners'] = []
+        self.__dict__['_change_listeners'] = []
+        self.__dict__['_pre_change_listeners'] = []
+        self.__post_init__()
+
+    @classmethod
+    def _with_indexes(cls, metadata: Metadata, collections: Dict[str, Any], indexes: Dict[str, Any],
+                      extra: Dict[str, Any], turn_count: int) -> "GameState":
+        """Assemble a GameState whose containment, name and connection indexes are already built.
+
+        Used by state_snapshot: the collections are registered without
+        re-deriving the indexes, which must match them exactly.
+
+        Args:
+            metadata: Game metadata
+            collections: Collection attribute (see ENTITY_COLLECTIONS) -> entities
+            indexes: Index field name (e.g. "_entities_at") -> prebuilt index
+            extra: Extra top-level data
+            turn_count: Current turn count
+        """
+        state = cls.__new__(cls)
+        registry = EntityRegistry()
+        values = state.__dict__
+        values.update(metadata=metadata, extra=extra, turn_count=turn_count,
+                      _entity_registry=registry, _name_listeners=[], _change_listeners=[], _pre_change_listeners=[])
+        values.update(indexes)
+        # No owner while attaching, so entities are registered but not re-indexed
+        for attr, kind in ENTITY_COLLECTIONS:
+            values[attr] = registry.attach(kind, collections.get(attr, ()))
+        registry.owner = state
+        for kind in LOCATED_KINDS:
+            for entity in registry.collections[kind].by_id.values():
+                object.__setattr__(entity, "_whereabouts_owner", state)
+        return state
+
+    def _place_entity(self, kind: str, entity_id: str, where: Any) -> None:
+        """Record entity_id at where in the containment index (None removes it).
+
+        Removal-state locations starting with "__" are not indexed. Entities
+        placed at an exit reference ("exit:{location_id}:{direction}", used
+        for door items) are also bucketed under that location as AT_EXIT.
+        """
+        old_where = self._entity_where.pop(entity_id, None)
+        if old_where is not None:
+            self._entities_at.get(old_where, set()).discard(entity_id)
+            for ids in self._entities_at_by_kind.get(old_where, {}).values():
+                ids.pop(entity_id, None)
+            exit_location = _exit_reference_location(old_where)
+            if exit_location:
+                self._entities_at_by_kind.get(exit_location, {}).get(AT_EXIT, {}).pop(entity_id, None)
+        if isinstance(where, str) and where and not where.startswith("__"):
+            self._entities_at.setdefault(where, set()).add(entity_id)
+            self._entities_at_by_kind.setdefault(where, {}).setdefault(kind, {})[entity_id] = None
+            self._entity_where[entity_id] = where
+            exit_location = _exit_reference_location(where)
+            if exit_location:
+                self._entities_at_by_kind.setdefault(exit_location, {}).setdefault(AT_EXIT, {})[entity_id] = None
+
+    def _index_name(self, kind: str, entity_id: str, name: Any) -> None:
+        """Record entity_id under the tokens of name (None removes it)."""
+        by_token = self._ids_by_name_token.setdefault(kind, {})
+        old_name = self._indexed_name.pop((kind, entity_id), None)
+        for token in name_tokens(old_name):
+            ids = by_token.get(token)
+            if ids is not None:
+                ids.pop(entity_id, None)
+                if not ids:
+                    del by_token[token]
+        if isinstance(name, str) and name:
+            self._indexed_name[(kind, entity_id)] = name
+            for token in name_tokens(name):
+                by_token.setdefault(token, {})[entity_id] = None
+        else:
+            name = None
+        if old_name != name:
+            for listener in self._name_listeners:
+                listener(kind, entity_id, old_name, name)
+
+    def add_name_listener(self, listener: Callable[[str, str, Optional[str], Optional[str]], None]) -> None:
+        """Call listener(kind, entity_id, old_name, new_name) whenever an indexed name changes.
+
+        Covers the located kinds (items, actors, exits): an entity entering
+        a collection reports old_name None, one leaving reports new_name None.
+        """
+        self._name_listeners.append(listener)
+
+    def remove_name_listener(self, listener: Callable[[str, str, Optional[str], Optional[str]], None]) -> None:
+        """Stop calling a listener added with add_name_listener."""
+        if listener in self._name_listeners:
+            self._name_listeners.remove(listener)
+
+    def add_change_listener(self, listener: Callable[[Optional[str], str], None]) -> None:
+        """Call listener(kind, entity_id) whenever an entity may have changed.
+
+        Reported: entities entering or leaving a collection, located entities
+        moving or being renamed (and the containers they moved between), and
+        entities changed through StateAccessor. Writes straight into an
+        entity's properties are not reported; see record_property_reads.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[Optional[str], str], None]) -> None:
+        """Stop calling a listener added with add_change_listener."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def note_changed(self, kind: Optional[str], entity_id: str) -> None:
+        """Report a possibly changed entity to the change listeners.
+
+        Args:
+            kind: Registry kind of the entity, or None for any entity with the id
+            entity_id: Id of the entity
+        """
+        for listener in self._change_listeners:
+            listener(kind, entity_id)
+
+    def add_pre_change_listener(self, listener: Callable[[Any], None]) -> None:
+        """Call listener(entity) just before an entity is changed.
+
+        Reported: located entities about to move or be renamed, and entities
+        about to be changed through StateAccessor. Entities entering or
+        leaving collections are not; see add_change_listener.
+        """
+        self._pre_change_listeners.append(listener)
+
+    def remove_pre_change_listener(self, listener: Callable[[Any], None]) -> None:
+        """Stop calling a listener added with add_pre_change_listener."""
+        if listener in self._pre_change_listeners:
+            self._pre_change_listeners.remove(listener)
+
+    def note_changing(self, entity: Any) -> None:
+        """Report an entity about to be changed to the pre-change listeners."""
+        for listener in self._pre_change_listeners:
+            listener(entity)
+
+    def load_regions(self, regions: Optional[Iterable[str]] = None) -> None:
+        """Materialize the entities of regions that are not loaded yet.
+
+        Only worlds loaded from shards (see world_shards) load lazily; for
+        any other GameState this does nothing.
+
+        Args:
+            regions: Region names (location "region" property), or None for all
+        """
+        if self._shards is not None:
+            self._shards.load_regions(self, regions)
+
+    def unloaded_ids(self, kind: str) -> List[str]:
+        """Ids of entities of a registry kind in regions not loaded yet.
+
+        Looking one of them up loads its region. Empty unless the world was
+        loaded from shards.
+        """
+        if self._shards is None:
+            return []
+        return cast(List[str], self._shards.unloaded_ids(kind))
+
+    def all_entities(self, kind: str, matching: Optional[Callable[[str], bool]] = None) -> List[Any]:
+        """Get every entity of a registry kind, loading regions not loaded yet.
+
+        The collections (state.items, state.locations, ...) of a world loaded
+        from shards hold the loaded entities only; use this when a behavior
+        must reach entities anywhere in the world.
+
+        Args:
+            kind: Registry kind name ("location", "item", "actor", ...)
+            matching: Optional predicate on entity ids; only the regions holding
+                matching entities are loaded, and only those are returned
+
+        Returns:
+            The entities, in collection order
+        """
+        if self._shards is not None:
+            wanted = [entity_id for entity_id in self._shards.unloaded_ids(kind)
+                      if matching is None or matching(entity_id)]
+            if wanted:
+                self._load_from_shards(kind, wanted)
+        collection = self._entity_registry.collections[kind]
+        entities = collection.values() if isinstance(collection, dict) else collection
+        return [entity for entity in entities if matching is None or matching(entity.id)]
+
+    def _load_from_shards(self, kind: Optional[str], entity_ids: Iterable[str]) -> bool:
+        """Registry loader: load the regions holding entity_ids (of kind, if given)."""
+        shards = self._shards
+        return shards is not None and shards.load_entities(self, kind, entity_ids)
+
+    def _track_whereabouts(self, kind: str, entity_id: str, entity: Any) -> None:
+        """Start maintaining the containment and name indexes for a newly added entity."""
+        if isinstance(entity, _LocatedEntity):
+            object.__setattr__(entity, "_whereabouts_owner", self)
+        self._place_entity(kind, entity_id, getattr(entity, "location", None))
+        self._index_name(kind, entity_id, getattr(entity, "name", None))
+
+    def _untrack_whereabouts(self, kind: str, entity_id: str) -> None:
+        """Drop an entity that left its collection from the containment and name indexes."""
+        self._place_entity("", entity_id, None)
+        self._index_name(kind, entity_id, None)
+
+    def _entity_relocated(self, entity: Any) -> None:
+        """Called by _LocatedEntity when .location is assigned."""
+        kind = "item" if isinstance(entity, Item) else "actor" if isinstance(entity, Actor) else "exit"
+        if self._entity_registry.collections[kind].by_id.get(entity.id) is entity:
+            old_where = self._entity_where.get(entity.id)
+            self._place_entity(kind, entity.id, entity.location)
+            if self._shards is not None and isinstance(entity.location, str):
+                # Entering a region that is not loaded yet loads it
+                self._load_from_shards(None, (entity.location,))
+            if self._change_listeners:
+                self.note_changed(kind, entity.id)
+                for where in (old_where, entity.location):
+                    if isinstance(where, str) and where:
+                        self.note_changed(None, where)
+
+    def _entity_renamed(self, entity: Any) -> None:
+        """Called by _LocatedEntity when .name is assigned."""
+        kind = "item" if isinstance(entity, Item) else "actor" if isinstance(entity, Actor) else "exit"
+        if self._entity_registry.collections[kind].by_id.get(entity.id) is entity:
+            self._index_name(kind, entity.id, entity.name)
+            if self._change_listeners:
+                self.note_changed(kind, entity.id)
+
+    def ids_with_name_token(self, kind: str, words: Iterable[str]) -> Dict[str, None]:
+        """Get ids of entities of kind whose name matches any of words.
+
+        A word matches when it equals the whole name or one of its words,
+        case-insensitively (the same rule as utilities.utils.name_matches).
+
+        Returns:
+            Insertion-ordered set (dict) of matching entity ids
+        """
+        by_token = self._ids_by_name_token.get(kind, {})
+        matched: Dict[str, None] = {}
+        for word in words:
+            ids = by_token.get(word.lower())
+            if ids:
+                matched.update(ids)
+        return matched
+
+    def find_entity(self, entity_id: str) -> Optional[Tuple[str, Any]]:
+        """Get (kind, entity) for any entity ID, or None if not found.
+
+        Kinds are the registry kind names from ENTITY_COLLECTIONS
+        ("location", "item", "actor", "lock", "part", "exit", ...).
+        """
+        return self._entity_registry.find(entity_id)
+
+    def lookup(self, kind: str, entity_id: str) -> Any:
+        """Get entity of the given registry kind by ID, or None if not found."""
+        return self._entity_registry.get(kind, entity_id)
+
+    def check_registry(self) -> None:
+        """Verify the id registry and containment index match the entity collections.
+
+        Raises:
+            ValidationError: If any index entry is stale or missing
+        """
+        problems = self._entity_registry.verify()
+        for kind in LOCATED_KINDS:
+            for entity_id, entity in self._entity_registry.collections[kind].by_id.items():
+                where = getattr(entity, "location", None)
+                if not isinstance(where, str) or not where or where.startswith("__"):
+                    where = None
+                if self._entity_where.get(entity_id) != where:
+                    problems.append(f"whereabouts of {kind} '{entity_id}' stale")
+                elif where is not None and entity_id not in self._entities_at_by_kind[where].get(kind, {}):
+                    problems.append(f"{kind} '{entity_id}' missing from bucket '{where}'")
+                name = getattr(entity, "name", None)
+                if self._indexed_name.get((kind, entity_id)) != (name or None):
+                    problems.append(f"name of {kind} '{entity_id}' stale")
+        if problems:
+            raise ValidationError("Entity registry inconsistent: " + "; ".join(problems))
+
     def get_actor(self, actor_id: ActorId) -> Actor:
         """Get actor by ID."""
         actor = self.actors.get(actor_id)
@@ -797,59 +1852,66 @@ class GameState:
 
     def get_item(self, item_id: ItemId) -> Item:
         """Get item by ID."""
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        raise KeyError(f"Item not found: {item_id}")
+        item = self._entity_registry.get("item", item_id)
+        if item is None:
+            raise KeyError(f"Item not found: {item_id}")
+        return cast(Item, item)
 
     def get_location(self, location_id: LocationId) -> Location:
         """Get location by ID."""
-        for loc in self.locations:
-            if loc.id == location_id:
-                return loc
-        raise KeyError(f"Location not found: {location_id}")
+        loc = self._entity_registry.get("location", location_id)
+        if loc is None:
+            raise KeyError(f"Location not found: {location_id}")
+        return cast(Location, loc)
 
     def get_exit(self, exit_id: str) -> Exit:
         """Get exit by ID. Raises KeyError if not found (fail-fast pattern)."""
-        exit_entity = next((e for e in self.exits if e.id == exit_id), None)
+        exit_entity = self._entity_registry.get("exit", exit_id)
         if exit_entity is None:
             raise KeyError(f"Exit not found: {exit_id}")
-        return exit_entity
+        return cast(Exit, exit_entity)
 
     def get_lock(self, lock_id: LockId) -> Lock:
         """Get lock by ID."""
-        for lock in self.locks:
-            if lock.id == lock_id:
-                return lock
-        raise KeyError(f"Lock not found: {lock_id}")
+        lock = self._entity_registry.get("lock", lock_id)
+        if lock is None:
+            raise KeyError(f"Lock not found: {lock_id}")
+        return cast(Lock, lock)
+
+    def get_part(self, part_id: PartId) -> Part:
+        """Get part by ID."""
+        part = self._entity_registry.get("part", part_id)
+        if part is None:
+            raise KeyError(f"Part not found: {part_id}")
+        return cast(Part, part)
 
     def get_commitment(self, commitment_id: CommitmentId) -> Commitment:
         """Get commitment by ID."""
-        for commitment in self.commitments:
-            if commitment.id == commitment_id:
-                return commitment
-        raise KeyError(f"Commitment not found: {commitment_id}")
+        commitment = self._entity_registry.get("commitment", commitment_id)
+        if commitment is None:
+            raise KeyError(f"Commitment not found: {commitment_id}")
+        return cast(Commitment, commitment)
 
     def get_scheduled_event(self, event_id: ScheduledEventId) -> ScheduledEvent:
         """Get scheduled event by ID."""
-        for event in self.scheduled_events:
-            if event.id == event_id:
-                return event
-        raise KeyError(f"Scheduled event not found: {event_id}")
+        event = self._entity_registry.get("scheduled_event", event_id)
+        if event is None:
+            raise KeyError(f"Scheduled event not found: {event_id}")
+        return cast(ScheduledEvent, event)
 
     def get_gossip(self, gossip_id: GossipId) -> Gossip:
         """Get gossip by ID."""
-        for gossip_item in self.gossip:
-            if gossip_item.id == gossip_id:
-                return gossip_item
-        raise KeyError(f"Gossip not found: {gossip_id}")
+        gossip_item = self._entity_registry.get("gossip", gossip_id)
+        if gossip_item is None:
+            raise KeyError(f"Gossip not found: {gossip_id}")
+        return cast(Gossip, gossip_item)
 
     def get_spread(self, spread_id: SpreadId) -> Spread:
         """Get spread by ID."""
-        for spread in self.spreads:
-            if spread.id == spread_id:
-                return spread
-        raise KeyError(f"Spread not found: {spread_id}")
+        spread = self._entity_registry.get("spread", spread_id)
+        if spread is None:
+            raise KeyError(f"Spread not found: {spread_id}")
+        return cast(Spread, spread)
 
     def set_actor_flag(self, flag_name: str, value: Any, actor_id: ActorId = ActorId("player")) -> None:
         """Set a flag on an actor.
@@ -916,6 +1978,11 @@ class GameState:
 
 
 # Parsers
+def _intern_id(value: Any) -> Any:
+    """Intern entity id strings, which recur in many references across the world."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _parse_exit(direction: str, raw: Dict[str, Any], location_id: str = "") -> ExitDescriptor:
     """Parse exit descriptor from JSON dict.
 
@@ -924,7 +1991,7 @@ def _parse_exit(direction: str, raw: Dict[str, Any], location_id: str = "") -> E
         raw: The exit data dict
         location_id: The parent location's ID (for synthesized exit id)
     """
-    core_fields = {'type', 'to', 'door_id', 'name', 'description', 'passage', 'door_at', 'behaviors'}
+    core_fields = _EXIT_DESCRIPTOR_CORE_FIELDS
 
     to_loc = raw.get('to')
     door = raw.get('door_id')
@@ -938,7 +2005,7 @@ def _parse_exit(direction: str, raw: Dict[str, Any], location_id: str = "") -> E
         description=raw.get('description', ''),
         passage=raw.get('passage'),
         door_at=LocationId(door_at) if door_at else None,
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"exit:{location_id}:{direction}"),
         _direction=direction,
         _location_id=LocationId(location_id) if location_id else LocationId("")
@@ -949,9 +2016,9 @@ def _parse_location(raw: Dict[str, Any]) -> Location:
     """Parse location from JSON dict."""
     # Note: 'npcs' is included in core_fields to filter it from properties
     # but it's no longer stored on Location (actors track their own location)
-    core_fields = {'id', 'name', 'description', 'exits', 'items', 'npcs', 'behaviors'}
+    core_fields = _LOCATION_CORE_FIELDS
 
-    location_id = raw['id']
+    location_id = _intern_id(raw['id'])
 
     # Parse exits - pass location_id for synthesized exit ids
     exits = {}
@@ -966,13 +2033,13 @@ def _parse_location(raw: Dict[str, Any]) -> Location:
         name=raw.get('name', ''),
         description=raw.get('description', ''),
         exits=exits,
-        items=[ItemId(i) for i in items],
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        items=[ItemId(_intern_id(i)) for i in items],
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=behaviors
     )
 
 
-def _parse_properties(raw: Dict[str, Any], core_fields: set) -> Dict[str, Any]:
+def _parse_properties(raw: Dict[str, Any], core_fields: AbstractSet[str]) -> Dict[str, Any]:
     """Parse properties from JSON dict.
 
     Supports both formats:
@@ -996,30 +2063,30 @@ def _parse_properties(raw: Dict[str, Any], core_fields: set) -> Dict[str, Any]:
 
 def _parse_item(raw: Dict[str, Any]) -> Item:
     """Parse item from JSON dict."""
-    core_fields = {'id', 'name', 'description', 'location', 'behaviors'}
+    core_fields = _ITEM_CORE_FIELDS
 
     behaviors = _parse_behaviors(raw.get('behaviors', []), f"item:{raw.get('id', '')}")
 
     return Item(
-        id=ItemId(raw['id']),
+        id=ItemId(_intern_id(raw['id'])),
         name=raw.get('name', ''),
         description=raw.get('description', ''),
-        location=raw.get('location', ''),  # Keep as str - can be various ID types
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        location=_intern_id(raw.get('location', '')),  # Keep as str - can be various ID types
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=behaviors
     )
 
 
 def _parse_lock(raw: Dict[str, Any]) -> Lock:
     """Parse lock from JSON dict."""
-    core_fields = {'id', 'name', 'description', 'properties', 'behaviors'}
+    core_fields = _NAMED_CORE_FIELDS
 
     lock_id = raw['id']
     return Lock(
         id=LockId(lock_id),
         name=raw.get('name', lock_id),  # Default to id if no name
         description=raw.get('description', ''),
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"lock:{lock_id}")
     )
 
@@ -1031,10 +2098,10 @@ def _parse_actor(raw: Dict[str, Any], actor_id: Optional[str] = None) -> Actor:
         raw: Actor data from JSON
         actor_id: Optional ID override (used when parsing from actors dict where key is the ID)
     """
-    core_fields = {'id', 'name', 'description', 'location', 'inventory', 'behaviors'}
+    core_fields = _ACTOR_CORE_FIELDS
 
     # Use actor_id if provided (from dict key), otherwise require id in raw data
-    effective_id = actor_id or raw['id']
+    effective_id = _intern_id(actor_id or raw['id'])
 
     # Default name: use provided name, or "Adventurer" for player, or ID for others
     # "player" is a prohibited name, so we must use a different default
@@ -1045,65 +2112,97 @@ def _parse_actor(raw: Dict[str, Any], actor_id: Optional[str] = None) -> Actor:
         id=ActorId(effective_id),
         name=raw.get('name', default_name),
         description=raw.get('description', ''),
-        location=LocationId(location) if location else LocationId(""),
-        inventory=[ItemId(i) for i in inventory],
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        location=LocationId(_intern_id(location)) if location else LocationId(""),
+        inventory=[ItemId(_intern_id(i)) for i in inventory],
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"actor:{effective_id}")
     )
 
 
+def _parse_exit_entity(raw: Dict[str, Any]) -> Exit:
+    """Parse exit entity from JSON dict."""
+    return Exit(
+        id=_intern_id(raw['id']),
+        name=raw['name'],
+        location=_intern_id(raw['location']),
+        connections=[_intern_id(c) for c in raw.get('connections', [])],
+        direction=raw.get('direction'),
+        description=raw.get('description', ''),
+        door_id=raw.get('door_id'),  # Direct attribute
+        passage=raw.get('passage'),  # Direct attribute
+        door_at=raw.get('door_at'),  # Direct attribute
+        adjectives=raw.get('adjectives', []),
+        synonyms=raw.get('synonyms', []),
+        properties=raw.get('properties', {}),
+        behaviors=_parse_behaviors(raw.get('behaviors', []), f"exit:{raw.get('id', '')}"),
+        traits=raw.get('traits', {})
+    )
+
+
+def _parse_part(raw: Dict[str, Any]) -> Part:
+    """Parse part from JSON dict."""
+    core_fields = _PART_CORE_FIELDS
+    return Part(
+        id=PartId(_intern_id(raw['id'])),
+        name=raw['name'],
+        part_of=_intern_id(raw['part_of']),  # Keep as str - can be various ID types
+        _properties=_protected_properties(core_fields, raw.get('properties', {})),
+        behaviors=_parse_behaviors(raw.get('behaviors', []), f"part:{raw.get('id', '')}")
+    )
+
+
 def _parse_commitment(raw: Dict[str, Any]) -> Commitment:
     """Parse commitment from JSON dict."""
-    core_fields = {'id', 'name', 'description', 'properties', 'behaviors'}
+    core_fields = _NAMED_CORE_FIELDS
 
     commitment_id = raw['id']
     return Commitment(
         id=CommitmentId(commitment_id),
         name=raw.get('name', commitment_id),  # Default to id if no name
         description=raw.get('description', ''),
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"commitment:{commitment_id}")
     )
 
 
 def _parse_scheduled_event(raw: Dict[str, Any]) -> ScheduledEvent:
     """Parse scheduled event from JSON dict."""
-    core_fields = {'id', 'name', 'description', 'properties', 'behaviors'}
+    core_fields = _NAMED_CORE_FIELDS
 
     event_id = raw['id']
     return ScheduledEvent(
         id=ScheduledEventId(event_id),
         name=raw.get('name', event_id),  # Default to id if no name
         description=raw.get('description', ''),
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"scheduled_event:{event_id}")
     )
 
 
 def _parse_gossip(raw: Dict[str, Any]) -> Gossip:
     """Parse gossip from JSON dict."""
-    core_fields = {'id', 'name', 'description', 'properties', 'behaviors'}
+    core_fields = _NAMED_CORE_FIELDS
 
     gossip_id = raw['id']
     return Gossip(
         id=GossipId(gossip_id),
         name=raw.get('name', gossip_id),  # Default to id if no name
         description=raw.get('description', ''),
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"gossip:{gossip_id}")
     )
 
 
 def _parse_spread(raw: Dict[str, Any]) -> Spread:
     """Parse spread from JSON dict."""
-    core_fields = {'id', 'name', 'description', 'properties', 'behaviors'}
+    core_fields = _NAMED_CORE_FIELDS
 
     spread_id = raw['id']
     return Spread(
         id=SpreadId(spread_id),
         name=raw.get('name', spread_id),  # Default to id if no name
         description=raw.get('description', ''),
-        _properties=CoreFieldProtectingDict(core_fields, _parse_properties(raw, core_fields)),
+        _properties=_protected_properties(core_fields, _parse_properties(raw, core_fields)),
         behaviors=_parse_behaviors(raw.get('behaviors', []), f"spread:{spread_id}")
     )
 
@@ -1121,9 +2220,13 @@ def _parse_metadata(raw: Dict[str, Any]) -> Metadata:
 
 
 def _build_whereabouts_index(game_state: GameState) -> None:
-    """Build containment index from entity .location properties.
+    """Rebuild containment index from entity .location properties.
+
+    The index is maintained incrementally as entities are added, removed
+    and moved, so this is only needed to recover from out-of-band edits.
 
-    Populates _entities_at and _entity_where from:
+    Populates _entities_at, _entities_at_by_kind, _entity_where and the
+    name token index from:
     - Items with .location
     - Actors with .location
     - Exits with .location
@@ -1132,33 +2235,17 @@ def _build_whereabouts_index(game_state: GameState) -> None:
     """
     # Clear indices
     game_state._entities_at.clear()
+    game_state._entities_at_by_kind.clear()
     game_state._entity_where.clear()
+    for kind, entity_id in list(game_state._indexed_name):
+        game_state._index_name(kind, entity_id, None)
+    game_state._ids_by_name_token.clear()
+    game_state._indexed_name.clear()
 
-    # Index all items
-    for item in game_state.items:
-        if hasattr(item, 'location') and item.location and not item.location.startswith("__"):
-            # Add to forward index
-            if item.location not in game_state._entities_at:
-                game_state._entities_at[item.location] = set()
-            game_state._entities_at[item.location].add(item.id)
-            # Add to reverse index
-            game_state._entity_where[item.id] = item.location
-
-    # Index all actors
-    for actor_id, actor in game_state.actors.items():
-        if hasattr(actor, 'location') and actor.location and not actor.location.startswith("__"):
-            if actor.location not in game_state._entities_at:
-                game_state._entities_at[actor.location] = set()
-            game_state._entities_at[actor.location].add(actor_id)
-            game_state._entity_where[actor_id] = actor.location
-
-    # Index all exits
-    for exit_entity in game_state.exits:
-        if hasattr(exit_entity, 'location') and exit_entity.location:
-            if exit_entity.location not in game_state._entities_at:
-                game_state._entities_at[exit_entity.location] = set()
-            game_state._entities_at[exit_entity.location].add(exit_entity.id)
-            game_state._entity_where[exit_entity.id] = exit_entity.location
+    registry = game_state._entity_registry
+    for kind in LOCATED_KINDS:
+        for entity_id, entity in registry.collections[kind].by_id.items():
+            game_state._track_whereabouts(kind, entity_id, entity)
 
 
 def _build_connection_index(game_state: GameState) -> None:
@@ -1197,14 +2284,41 @@ def load_game_state(source: Union[str, Path, Dict[str, Any]]) -> GameState:
 
     Supports both old format (player/npcs fields) and new format (actors dict).
     Doors are represented as Items with a 'door' property.
+
+    A file path is loaded from its region shards (game_state.json ->
+    game_state.shards/, see world_shards) or else its compiled snapshot
+    (game_state.snapshot, see state_snapshot) instead when that exists and
+    is current: shards at least as new as the file, a snapshot compiled
+    from the file's current contents.
     """
     if isinstance(source, dict):
         data = source
     else:
         path = Path(source)
+        from src.world_shards import load_fresh_shards
+        from src.state_snapshot import load_fresh_snapshot
+        compiled = load_fresh_shards(path)
+        if compiled is None:
+            compiled = load_fresh_snapshot(path)
+        if compiled is not None:
+            return compiled
         with open(path, 'r') as f:
             data = json.load(f)
 
+    state = _build_game_state(data)
+
+    # Build connection index
+    _build_connection_index(state)
+
+    # Validate after loading
+    from src.validators import validate_game_state
+    validate_game_state(state)
+
+    return state
+
+
+def _build_game_state(data: Dict[str, Any]) -> GameState:
+    """Parse game state data into a GameState (connection index and validation left to the caller)."""
     # Parse metadata and enforce minimum version
     metadata = _parse_metadata(data.get('metadata', {}))
     if metadata.version and metadata.version < "0.05":
@@ -1224,38 +2338,10 @@ def load_game_state(source: Union[str, Path, Dict[str, Any]]) -> GameState:
     locks = [_parse_lock(lock) for lock in data.get('locks', [])]
 
     # Parse exits (new entity type - optional during migration)
-    exits = []
-    for exit_data in data.get('exits', []):
-        exit_entity = Exit(
-            id=exit_data['id'],
-            name=exit_data['name'],
-            location=exit_data['location'],
-            connections=exit_data.get('connections', []),
-            direction=exit_data.get('direction'),
-            description=exit_data.get('description', ''),
-            door_id=exit_data.get('door_id'),  # Direct attribute
-            passage=exit_data.get('passage'),  # Direct attribute
-            door_at=exit_data.get('door_at'),  # Direct attribute
-            adjectives=exit_data.get('adjectives', []),
-            synonyms=exit_data.get('synonyms', []),
-            properties=exit_data.get('properties', {}),
-            behaviors=_parse_behaviors(exit_data.get('behaviors', []), f"exit:{exit_data.get('id', '')}"),
-            traits=exit_data.get('traits', {})
-        )
-        exits.append(exit_entity)
+    exits = [_parse_exit_entity(exit_data) for exit_data in data.get('exits', [])]
 
     # Parse parts
-    parts = []
-    for part_data in data.get('parts', []):
-        core_fields = {'id', 'name', 'part_of', 'behaviors'}
-        part = Part(
-            id=PartId(part_data['id']),
-            name=part_data['name'],
-            part_of=part_data['part_of'],  # Keep as str - can be various ID types
-            _properties=CoreFieldProtectingDict(core_fields, part_data.get('properties', {})),
-            behaviors=_parse_behaviors(part_data.get('behaviors', []), f"part:{part_data.get('id', '')}")
-        )
-        parts.append(part)
+    parts = [_parse_part(part_data) for part_data in data.get('parts', [])]
 
     # Parse actors from actors dict (required format - no legacy support)
     actors: Dict[ActorId, Actor] = {}
@@ -1291,15 +2377,7 @@ def load_game_state(source: Union[str, Path, Dict[str, Any]]) -> GameState:
         extra=data.get('extra', {})
     )
 
-    # Build containment index
-    _build_whereabouts_index(state)
-
-    # Build connection index
-    _build_connection_index(state)
-
-    # Validate after loading
-    from src.validators import validate_game_state
-    validate_game_state(state)
+    # Containment index is built as collections are attached
 
     return state
 
@@ -1332,8 +2410,9 @@ def _serialize_entity(
         if value:
             result[field] = value
 
-    # Merge properties
-    result.update(entity.properties)
+    # Merge properties (read past the properties getter: saving does not
+    # change an entity, so it must not count as a read for TurnJournal)
+    result.update(getattr(entity, '_properties', None) or entity.properties)
 
     # Add behaviors if present
     if entity.behaviors:
@@ -1438,6 +2517,10 @@ def game_state_to_dict(state: GameState) -> Dict[str, Any]:
     if state.turn_count > 0:
         result['turn_count'] = state.turn_count
 
+    # Entities of regions not loaded yet are unchanged from their shards
+    if state._shards is not None:
+        state._shards.add_unloaded(result)
+
     return result
 
 
@@ -0,0 +1,308 @@
+"""
+State Snapshot - Compiled game state files that load without parsing.
+
+load_game_state() on game_state.json decodes JSON, normalizes every entity
+(_parse_properties, CoreFieldProtectingDict wrapping), validates the world
+and rebuilds the containment, name and connection indexes. A snapshot
+stores the result of all that: entities as field tuples in dataclass field
+order with their properties already normalized, plus the prebuilt indexes,
+encoded with marshal. Loading one only allocates the objects.
+
+- write_snapshot(state, path) compiles a loaded (validated) GameState;
+  tools/compile_game_state.py does this for a game directory.
+- load_game_state(path) uses path's sibling snapshot (game_state.json ->
+  game_state.snapshot) automatically when it was compiled from the JSON
+  file as it is now - same size, mtime and SHA-256, recorded in the
+  snapshot header - and the JSON otherwise.
+- The marshal format is specific to the Python version, and entities are
+  stored in dataclass field order, so the header also records the
+  interpreter and a fingerprint of the entity fields; a snapshot written
+  by another interpreter or another version of the entity classes is
+  ignored (logged) and the JSON is loaded instead.
+
+Snapshots are trusted build artifacts of the game directory, like its
+behavior modules; they are not a format for untrusted input.
+
+Usage:
+    state = load_game_state("examples/big_game/game_state.json")
+    write_snapshot(state, snapshot_path("examples/big_game/game_state.json"),
+                   "examples/big_game/game_state.json")
+"""
+
+import dataclasses
+import gc
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.state_manager import (
+    GameState, Metadata, ExitDescriptor, Location, Item, Lock, Part, Actor, Exit,
+    Commitment, ScheduledEvent, Gossip, Spread, CoreFieldProtectingDict, _PackedPropertiesDict,
+    ENTITY_COLLECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snapshot"
+
+SNAPSHOT_MAGIC = b"TGSNAP"
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Entity class of each GameState collection
+_COLLECTION_CLASSES: Dict[str, type] = {
+    "locations": Location, "items": Item, "locks": Lock, "actors": Actor, "exits": Exit,
+    "parts": Part, "commitments": Commitment, "scheduled_events": ScheduledEvent,
+    "gossip": Gossip, "spreads": Spread,
+}
+
+# Indexes saved with the entities
+_INDEX_FIELDS = (
+    "_entities_at", "_entity_where", "_entities_at_by_kind",
+    "_ids_by_name_token", "_indexed_name", "_connected_to",
+)
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(f.name for f in dataclasses.fields(cls))
+    for cls in (ExitDescriptor, *_COLLECTION_CLASSES.values())
+}
+
+# Entities are stored as tuples in field order: a snapshot is only readable
+# by entity classes with the same fields in the same order
+_SCHEMA_FINGERPRINT = hashlib.sha256(repr(sorted(
+    [(cls.__name__, names) for cls, names in _FIELD_NAMES.items()]
+    + [("Metadata", tuple(f.name for f in dataclasses.fields(Metadata)))]
+)).encode()).hexdigest()[:16]
+
+# File header: magic, format version, interpreter tag (marshal compatibility),
+# schema fingerprint. The next line identifies the source JSON file.
+_HEADER = (SNAPSHOT_MAGIC + bytes([SNAPSHOT_FORMAT_VERSION]) + (sys.implementation.cache_tag or "").encode()
+           + b" " + _SCHEMA_FINGERPRINT.encode() + b"\n")
+
+
+# Entity classes are slotted: fields are set through their slot descriptors
+_FIELD_SETTERS: Dict[type, List[Any]] = {
+    cls: [getattr(cls, name).__set__ for name in names] for cls, names in _FIELD_NAMES.items()
+}
+
+
+class SnapshotError(Exception):
+    """Snapshot file is not a usable snapshot for this interpreter."""
+    pass
+
+
+def snapshot_path(json_path: Union[str, Path]) -> Path:
+    """Path of the snapshot compiled from a game state JSON file."""
+    return Path(json_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _source_stamp(json_path: Union[str, Path], digest: bool = True) -> bytes:
+    """Size, mtime and (if digest) SHA-256 of a JSON file, as a snapshot header line."""
+    with open(json_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        sha256 = hashlib.sha256(f.read()).hexdigest() if digest else ""
+    return f"{stat.st_size} {stat.st_mtime_ns} {sha256}".encode()
+
+
+def fresh_snapshot(json_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Return the snapshot of a JSON file if one was compiled from it as it is now.
+
+    The snapshot header records the size, mtime and SHA-256 of the JSON file
+    it was compiled from; all three must match the file. The hash catches
+    edits whose mtime was restored (cp -p, rsync, tar extraction).
+
+    Args:
+        json_path: Path of a game_state.json (or save) file
+
+    Returns:
+        The snapshot path, or None to load the JSON file
+    """
+    path = snapshot_path(json_path)
+    try:
+        with open(path, "rb") as f:
+            if f.readline() != _HEADER:
+                logger.warning(f"Ignoring snapshot {path}: not a snapshot for {sys.implementation.cache_tag} "
+                               f"(format {SNAPSHOT_FORMAT_VERSION}, schema {_SCHEMA_FINGERPRINT})")
+                return None
+            recorded = f.readline().rstrip(b"\n")
+        # Compare size and mtime before hashing the file
+        if not recorded.startswith(_source_stamp(json_path, digest=False)):
+            return None
+        if recorded == _source_stamp(json_path):
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def load_fresh_snapshot(json_path: Union[str, Path]) -> Optional[GameState]:
+    """
+    Load a JSON file's snapshot in its place, if it is fresh and usable.
+
+    Args:
+        json_path: Path of a game_state.json (or save) file
+
+    Returns:
+        The GameState, or None if the JSON file should be loaded
+    """
+    path = fresh_snapshot(json_path)
+    if path is None:
+        return None
+    try:
+        return read_snapshot(path)
+    except (SnapshotError, OSError, ValueError, EOFError, TypeError) as e:
+        logger.warning(f"Ignoring snapshot {path}: {e}")
+        return None
+
+
+def _plain(value: Any) -> Any:
+    """Copy of a property value with dict/list subclasses (e.g. frozen template content) made plain."""
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_plain(item) for item in value]
+        return items if isinstance(value, list) else tuple(items)
+    return value
+
+
+def _encode_properties(properties: Any) -> Tuple[Dict[str, Any], Any, Optional[str]]:
+    # dict.items() does not unpack a packed llm_context
+    return (
+        {key: _plain(value) for key, value in dict.items(properties)},
+        properties._core_fields,
+        properties._packed,
+    )
+
+
+def _encode_entity(entity: Any) -> Tuple[Any, ...]:
+    fields = []
+    for name in _FIELD_NAMES[type(entity)]:
+        value = getattr(entity, name)
+        if name == "_properties":
+            value = _encode_properties(value)
+        elif name == "exits" and isinstance(entity, Location):
+            value = {direction: _encode_entity(exit_desc) for direction, exit_desc in value.items()}
+        else:
+            value = _plain(value)
+        fields.append(value)
+    return tuple(fields)
+
+
+def write_snapshot(state: GameState, path: Union[str, Path], source: Union[str, Path]) -> None:
+    """
+    Compile a GameState into a snapshot file (written atomically).
+
+    The state should come straight from load_game_state, which validated it;
+    snapshots are not validated again when loaded.
+
+    Args:
+        state: The state to store
+        path: Snapshot file to write
+        source: The JSON file the state was loaded from; the snapshot is
+            only used in its place while that file is unchanged
+    """
+    payload = {
+        "metadata": tuple(getattr(state.metadata, f.name) for f in dataclasses.fields(Metadata)),
+        "collections": {
+            attr: [_encode_entity(entity) for entity in
+                   (getattr(state, attr).values() if attr == "actors" else getattr(state, attr))]
+            for attr, _ in ENTITY_COLLECTIONS
+        },
+        "indexes": {name: getattr(state, name) for name in _INDEX_FIELDS},
+        "extra": _plain(state.extra),
+        "turn_count": state.turn_count,
+    }
+    data = _HEADER + _source_stamp(source) + b"\n" + marshal.dumps(payload)
+
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+_set_core_fields = CoreFieldProtectingDict.__dict__["_core_fields"].__set__
+_set_packed = CoreFieldProtectingDict.__dict__["_packed"].__set__
+
+
+def _decode_properties(encoded: Tuple[Dict[str, Any], Any, Optional[str]]) -> CoreFieldProtectingDict:
+    data, core_fields, packed = encoded
+    properties = dict.__new__(CoreFieldProtectingDict if packed is None else _PackedPropertiesDict)
+    dict.update(properties, data)
+    _set_core_fields(properties, core_fields)
+    _set_packed(properties, packed)
+    return properties
+
+
+def _decode_entities(cls: type, rows: Iterable[Tuple[Any, ...]]) -> List[Any]:
+    """Allocate entities from field tuples without running __init__ or __setattr__."""
+    names = _FIELD_NAMES[cls]
+    setters = _FIELD_SETTERS[cls]
+    properties_at = names.index("_properties") if "_properties" in names else -1
+    exits_at = names.index("exits") if cls is Location else -1
+    new = object.__new__
+    entities = []
+    for row in rows:
+        entity: Any = new(cls)
+        for setter, value in zip(setters, row):
+            setter(entity, value)
+        if properties_at >= 0:
+            setters[properties_at](entity, _decode_properties(row[properties_at]))
+        if exits_at >= 0:
+            exit_rows = row[exits_at]
+            setters[exits_at](entity, dict(zip(exit_rows, _decode_entities(ExitDescriptor, exit_rows.values()))))
+        entities.append(entity)
+    return entities
+
+
+def read_snapshot(path: Union[str, Path]) -> GameState:
+    """
+    Load a GameState from a snapshot file.
+
+    Args:
+        path: File written by write_snapshot
+
+    Returns:
+        The GameState, equal to the one the snapshot was written from
+
+    Raises:
+        SnapshotError: If the file is not a snapshot of this format, Python
+            version and entity schema
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(_HEADER):
+        raise SnapshotError(f"{path} is not a snapshot for {sys.implementation.cache_tag} "
+                            f"(format {SNAPSHOT_FORMAT_VERSION}, schema {_SCHEMA_FINGERPRINT})")
+    # Skip the source file line
+    start = data.index(b"\n", len(_HEADER)) + 1
+
+    # Loading allocates many containers and frees none; collecting
+    # meanwhile only re-traverses them
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        payload = marshal.loads(memoryview(data)[start:])
+        collections: Dict[str, Any] = {}
+        for attr, rows in payload["collections"].items():
+            entities = _decode_entities(_COLLECTION_CLASSES[attr], rows)
+            collections[attr] = {entity.id: entity for entity in entities} if attr == "actors" else entities
+        return GameState._with_indexes(
+            metadata=Metadata(*payload["metadata"]),
+            collections=collections,
+            indexes=payload["indexes"],
+            extra=payload["extra"],
+            turn_count=payload["turn_count"],
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
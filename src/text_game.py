@@ -20,6 +20,7 @@ from src.command_utils import parsed_to_json
 from src.state_manager import load_game_state, save_game_state, GameState
 from src.file_dialogs import get_save_filename, get_load_filename
 from src.game_engine import GameEngine
+from src.turn_journal import TurnJournal, restore_game_state, SNAPSHOT_FILE
 
 
 def format_item_query(response: Dict[str, Any]) -> str:
@@ -100,11 +101,13 @@ def load_game(filename: str) -> Optional[GameState]:
         return None
 
 
-def main(game_dir: Optional[str] = None):
+def main(game_dir: Optional[str] = None, journal_dir: Optional[str] = None):
     """Run the game.
 
     Args:
         game_dir: Path to game directory containing game_state.json (required)
+        journal_dir: Optional directory to autosave every turn to (see
+            TurnJournal); a session journaled there before is resumed
     """
     if not game_dir:
         print("Error: game_dir is required")
@@ -115,6 +118,17 @@ def main(game_dir: Optional[str] = None):
     # Missing/invalid game files indicate authoring errors and should fail loudly
     engine = GameEngine(Path(game_dir))
 
+    # Resume an autosaved session, then keep autosaving it
+    journal = None
+    if journal_dir:
+        if (Path(journal_dir) / SNAPSHOT_FILE).exists():
+            engine.reload_state(restore_game_state(journal_dir))
+            print(f"Resumed autosaved game from {journal_dir}")
+        journal = TurnJournal(engine.game_state, journal_dir)
+
+    # Keep recent turns for undo/redo
+    undo_history = engine.enable_undo()
+
     # Use the game directory for save/load dialogs
     save_load_dir = str(engine.game_dir)
 
@@ -134,6 +148,9 @@ def main(game_dir: Optional[str] = None):
     print()
 
     while True:
+        if journal is not None:
+            journal.commit()
+        undo_history.checkpoint()
         command_text = input("> ").strip()
         if not command_text:
             continue
@@ -173,7 +190,7 @@ def main(game_dir: Optional[str] = None):
         # Execute via JSON protocol
         response = engine.json_handler.handle_message(json_cmd)
 
-        # Check for meta command signals (quit, save, load)
+        # Check for meta command signals (quit, save, load, undo, redo)
         if response.get("success") and response.get("data", {}).get("signal"):
             signal = response["data"]["signal"]
 
@@ -204,6 +221,8 @@ def main(game_dir: Optional[str] = None):
                     if loaded_state:
                         # Reload state in engine
                         engine.reload_state(loaded_state)
+                        if journal is not None:
+                            journal.attach(loaded_state)
                         # Show new location
                         response = engine.json_handler.handle_message({
                             "type": "command",
@@ -216,6 +235,14 @@ def main(game_dir: Optional[str] = None):
                     print("Load canceled.")
                 continue
 
+            elif signal == "undo":
+                print("Undone." if undo_history.undo() else "Nothing to undo.")
+                continue
+
+            elif signal == "redo":
+                print("Redone." if undo_history.redo() else "Nothing to redo.")
+                continue
+
         # Normal command result
         print(format_command_result(response))
 
@@ -228,11 +255,16 @@ def main(game_dir: Optional[str] = None):
             "treasure" in primary_text):
             break
 
+    if journal is not None:
+        journal.close()
+
 
 def cli_main():
     """Entry point for console script."""
     parser = argparse.ArgumentParser(description='Text adventure game')
     parser.add_argument('game_dir', help='Game name (from examples/) or full path to game directory')
+    parser.add_argument('--journal', metavar='DIR',
+                        help='Autosave every turn to DIR, resuming the game saved there')
     args = parser.parse_args()
 
     # If it's just a name (no path separators), prefix with examples/
@@ -241,7 +273,7 @@ def cli_main():
     else:
         game_path = Path(args.game_dir)
 
-    sys.exit(main(game_dir=str(game_path)) or 0)
+    sys.exit(main(game_dir=str(game_path), journal_dir=args.journal) or 0)
 
 
 if __name__ == '__main__':
@@ -8,12 +8,17 @@ Key features:
 - Topological sort using Kahn's algorithm
 - Circular dependency detection with clear error messages
 - Cached execution order (computed once at load time)
+
+The execution order lives on a TurnScheduler owned by each GameEngine (and
+its LLMProtocolHandler), so one process can host many sessions with
+different behavior sets.
 """
 
 from typing import Dict, List, Set, Tuple
 from src.behavior_manager import HookDefinition
 from src.state_manager import GameState
-from src.types import TurnHookId, EventName, ActorId
+from src.turn_profiler import TurnProfiler
+from src.types import TurnHookId, EventName, ActorId, HookName
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,15 +26,11 @@ if TYPE_CHECKING:
     from src.behavior_manager import BehaviorManager
     from src.action_types import ActionDict
 
-# Global cached turn phase execution order
-_ordered_turn_phases: List[str] = []
-
-
-def initialize(hook_definitions: Dict[str, HookDefinition]) -> None:
-    """Sort and cache turn phases once at game load.
+class TurnScheduler:
+    """Turn phase execution order for one game configuration.
 
-    Filters to turn_phase hooks only, builds dependency graph from both
-    'after' and 'before' constraints, and performs topological sort.
+    Sorts the turn_phase hooks once at construction; execute_turn_phases()
+    then runs them in that order on every successful command.
 
     Args:
         hook_definitions: All hook definitions from BehaviorManager
@@ -38,17 +39,85 @@ def initialize(hook_definitions: Dict[str, HookDefinition]) -> None:
         ValueError: If circular dependencies detected
         ValueError: If dependencies reference undefined hooks
     """
-    global _ordered_turn_phases
 
-    # Filter to turn phases only
-    turn_phases = {
-        name: defn for name, defn in hook_definitions.items()
-        if defn.invocation == "turn_phase"
-    }
+    def __init__(self, hook_definitions: Dict[str, HookDefinition]) -> None:
+        # Filter to turn phases only
+        turn_phases = {
+            name: defn for name, defn in hook_definitions.items()
+            if defn.invocation == "turn_phase"
+        }
+
+        # Topological sort by dependencies
+        self.ordered_turn_phases: List[str] = _topological_sort(turn_phases)
+
+    @classmethod
+    def for_behavior_manager(cls, behavior_manager: "BehaviorManager") -> "TurnScheduler":
+        """Build the scheduler for the hooks registered on behavior_manager."""
+        return cls(behavior_manager._hook_definitions)
+
+    def execute_turn_phases(
+        self,
+        state: GameState,
+        behavior_manager: "BehaviorManager",
+        accessor: "StateAccessor",
+        action: "ActionDict"
+    ) -> List[str]:
+        """Execute all turn phases in dependency order.
+
+        Invokes each turn phase hook via behavior_manager, collecting narration
+        messages from each phase.
+
+        Args:
+            state: Current game state
+            behavior_manager: BehaviorManager for invoking hooks
+            accessor: StateAccessor for state queries
+            action: The action dict from the command
+
+        Returns:
+            List of narration strings from each phase
+        """
+        messages: List[str] = []
+
+        # Increment turn counter before processing phases
+        state.increment_turn()
+
+        # Build context for turn phases
+        actor_id: ActorId = action.get("actor_id") or ActorId("player")
+
+        # Time each phase when profiling is enabled
+        profiler = getattr(behavior_manager, "profiler", None)
+        if not isinstance(profiler, TurnProfiler):
+            profiler = None
+
+        for hook_name in self.ordered_turn_phases:
+            # Get event for this hook
+            event_name = behavior_manager.get_event_for_hook(HookName(hook_name))
+            if not event_name:
+                # No event registered for this hook - skip
+                continue
+
+            # Build context
+            context = {
+                "hook": hook_name,
+                "actor_id": actor_id,
+                "current_turn": state.turn_count,
+            }
+
+            # Invoke turn phase behavior (entity=None for turn phases)
+            if profiler is None:
+                result = behavior_manager.invoke_behavior(
+                    None, event_name, accessor, context
+                )
+            else:
+                result = profiler.call(
+                    "turn_phase", hook_name, behavior_manager.invoke_behavior,
+                    None, event_name, accessor, context
+                )
+
+            if result and result.feedback:
+                messages.append(result.feedback)
 
-    # Topological sort by dependencies
-    sorted_phases = _topological_sort(turn_phases)
-    _ordered_turn_phases = sorted_phases
+        return messages
 
 
 def _topological_sort(phases: Dict[str, HookDefinition]) -> List[str]:
@@ -188,56 +257,3 @@ def _find_cycle(graph: Dict[str, List[str]], nodes: List[str]) -> str:
 
     return " → ".join(nodes) + " (cycle)"
 
-
-def execute_turn_phases(
-    state: GameState,
-    behavior_manager: "BehaviorManager",
-    accessor: "StateAccessor",
-    action: "ActionDict"
-) -> List[str]:
-    """Execute all turn phases in dependency order.
-
-    Invokes each turn phase hook via behavior_manager, collecting narration
-    messages from each phase.
-
-    Args:
-        state: Current game state
-        behavior_manager: BehaviorManager for invoking hooks
-        accessor: StateAccessor for state queries
-        action: The action dict from the command
-
-    Returns:
-        List of narration strings from each phase
-    """
-    messages: List[str] = []
-
-    # Increment turn counter before processing phases
-    state.increment_turn()
-
-    # Build context for turn phases
-    actor_id: ActorId = action.get("actor_id") or ActorId("player")
-
-    for hook_name in _ordered_turn_phases:
-        # Get event for this hook
-        from src.types import HookName
-        event_name = behavior_manager.get_event_for_hook(HookName(hook_name))
-        if not event_name:
-            # No event registered for this hook - skip
-            continue
-
-        # Build context
-        context = {
-            "hook": hook_name,
-            "actor_id": actor_id,
-            "current_turn": state.turn_count,
-        }
-
-        # Invoke turn phase behavior (entity=None for turn phases)
-        result = behavior_manager.invoke_behavior(
-            None, event_name, accessor, context
-        )
-
-        if result and result.feedback:
-            messages.append(result.feedback)
-
-    return messages
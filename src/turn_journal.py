@@ -0,0 +1,398 @@
+"""
+Turn Journal - Append-only autosave of a session, one delta per turn.
+
+save_game_state() serializes the whole GameState and writes it as indented
+JSON, so its cost grows with the world, not with what a turn changed.
+TurnJournal keeps a session saved at the cost of the turn's changes:
+
+- snapshot.json holds a full save (game_state_to_dict) and the sequence
+  number of the last journal entry it includes.
+- journal.jsonl gets one line per commit() with the save records of the
+  entities that changed since the previous commit (and deletions,
+  collection order when membership changed, turn_count and metadata).
+  Each line is flushed (and by default fsynced) before commit() returns,
+  so a crash loses at most the turn in progress.
+- Every snapshot_every entries the journal is compacted: a new snapshot
+  is written atomically and the journal is truncated.
+
+read_journal() rebuilds the save dict as snapshot + replay, and
+restore_game_state() loads it, giving the same GameState save_game_state
+followed by load_game_state would.
+
+Finding what changed without comparing the whole world:
+- GameState reports entities entering and leaving collections, moving,
+  being renamed, and changed through StateAccessor (update, _set_path,
+  set_entity_where, connect_exits/disconnect_exits); see
+  GameState.add_change_listener.
+- Behaviors also write entity.properties[...] directly, in place. While a
+  journal is open, every entity whose properties dict is accessed is
+  collected (see property_reads) and treated as possibly changed.
+Each candidate is serialized and compared with a private copy of its last
+journaled record; only records that differ are encoded and written. A
+change that bypasses both (e.g. actor.inventory edited without moving the
+item) is picked up by the next compaction.
+
+Usage:
+    journal = TurnJournal(engine.game_state, Path("saves/session1"))
+    while playing:
+        ...  # run a turn
+        journal.commit()
+    journal.close()
+
+    state = restore_game_state(Path("saves/session1"))
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from src.state_manager import (
+    GameState, Location, Item, Lock, Actor, Commitment, ScheduledEvent, Gossip, Spread,
+    game_state_to_dict, load_game_state,
+    _serialize_location, _serialize_item, _serialize_lock, _serialize_actor,
+    _serialize_commitment, _serialize_scheduled_event, _serialize_gossip, _serialize_spread,
+    _serialize_metadata,
+)
+from src import property_reads
+from src.world_template import FrozenDict, FrozenList
+
+logger = logging.getLogger(__name__)
+
+# Version of the snapshot/journal format
+JOURNAL_FORMAT_VERSION = 1
+
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+
+# Saved collections: (section of the save dict, registry kind, serializer)
+_SECTIONS: Tuple[Tuple[str, str, Callable[[Any], Dict[str, Any]]], ...] = (
+    ("locations", "location", _serialize_location),
+    ("items", "item", _serialize_item),
+    ("locks", "lock", _serialize_lock),
+    ("actors", "actor", _serialize_actor),
+    ("commitments", "commitment", _serialize_commitment),
+    ("scheduled_events", "scheduled_event", _serialize_scheduled_event),
+    ("gossip", "gossip", _serialize_gossip),
+    ("spreads", "spread", _serialize_spread),
+)
+
+_SECTIONS_BY_KIND = {kind: ((section, kind, serialize),) for section, kind, serialize in _SECTIONS}
+
+# Sections game_state_to_dict leaves out when empty
+_OPTIONAL_SECTIONS = ("commitments", "scheduled_events", "gossip", "spreads")
+
+_KIND_BY_TYPE: Dict[type, str] = {
+    Location: "location", Item: "item", Lock: "lock", Actor: "actor",
+    Commitment: "commitment", ScheduledEvent: "scheduled_event", Gossip: "gossip", Spread: "spread",
+}
+
+def _dumps(record: Any) -> str:
+    return json.dumps(record, separators=(",", ":"))
+
+
+def _detached(value: Any) -> Any:
+    """Copy the dicts and lists of a record, sharing immutable values (including frozen template content)."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return {key: _detached(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detached(item) for item in value]
+    return value
+
+
+class TurnJournal:
+    """
+    Write-ahead journal of one GameState in a directory.
+
+    Args:
+        game_state: State to journal
+        directory: Directory for snapshot.json and journal.jsonl (created
+            if needed; an earlier journal there is replaced)
+        snapshot_every: Journal entries written before compacting into a new snapshot
+        fsync: Force each entry to disk before commit() returns
+    """
+
+    def __init__(self, game_state: GameState, directory: Union[str, Path],
+                 snapshot_every: int = 200, fsync: bool = True):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.sequence = 0
+        self.entries_since_snapshot = 0
+        self.game_state: Optional[GameState] = None
+
+        # Last journaled form of each saved entity: section -> id -> (ordinal, record copy)
+        self._records: Dict[str, Dict[str, Tuple[int, Dict[str, Any]]]] = {}
+        self._metadata: Dict[str, Any] = {}
+        self._turn_count = 0
+        self._pending: Set[Tuple[Optional[str], str]] = set()
+        self._file: Optional[Any] = None
+
+        self._stop_reads = property_reads.register(self)
+        self.attach(game_state)
+
+    def attach(self, game_state: GameState) -> None:
+        """
+        Journal a different GameState (e.g. after loading a save).
+
+        Starts over with a snapshot of the new state.
+
+        Args:
+            game_state: The state to journal from now on
+        """
+        if self.game_state is not None:
+            self.game_state.remove_change_listener(self._changed)
+        self.game_state = game_state
+        game_state.add_change_listener(self._changed)
+        self.snapshot()
+
+    def _changed(self, kind: Optional[str], entity_id: str) -> None:
+        """GameState change listener."""
+        with property_reads.lock:
+            self._pending.add((kind, entity_id))
+
+    def note_property_reads(self, entities: List[Any]) -> None:
+        """Mark entities of this journal's state whose properties were read (see property_reads)."""
+        assert self.game_state is not None
+        collections = self.game_state._entity_registry.collections
+        for entity in entities:
+            kind = _KIND_BY_TYPE.get(type(entity))
+            if kind is not None and collections[kind].by_id.get(entity.id) is entity:
+                self._pending.add((kind, entity.id))
+
+    def commit(self) -> int:
+        """
+        Append the changes since the last commit to the journal.
+
+        Call once per turn. Compacts the journal when it has grown to
+        snapshot_every entries.
+
+        Returns:
+            Number of entity records written (0 when nothing changed)
+        """
+        assert self.game_state is not None and self._file is not None
+        property_reads.distribute()
+        with property_reads.lock:
+            pending, self._pending = self._pending, set()
+
+        state = self.game_state
+        collections = state._entity_registry.collections
+        shards = state._shards
+        changed: Dict[str, Dict[str, Any]] = {}
+        deleted: Dict[str, List[str]] = {}
+        reordered: Set[str] = set()
+        for kind, entity_id in pending:
+            sections = _SECTIONS if kind is None else _SECTIONS_BY_KIND.get(kind, ())
+            for section, section_kind, serialize in sections:
+                collection = collections[section_kind]
+                known = self._records[section]
+                entity = collection.by_id.get(entity_id)
+                if entity is None:
+                    if shards is not None and shards.is_unloaded(section_kind, entity_id):
+                        continue  # In a region not loaded yet, so unchanged
+                    if known.pop(entity_id, None) is not None:
+                        deleted.setdefault(section, []).append(entity_id)
+                        reordered.add(section)
+                    continue
+                record = serialize(entity)
+                ordinal = collection.ordinal[entity_id]
+                previous = known.get(entity_id)
+                if previous is not None and previous[0] == ordinal and previous[1] == record:
+                    continue
+                if previous is None or previous[0] != ordinal:
+                    reordered.add(section)
+                if previous is None or previous[1] != record:
+                    changed.setdefault(section, {})[entity_id] = record
+                known[entity_id] = (ordinal, _detached(record))
+
+        entry: Dict[str, Any] = {}
+        if changed:
+            entry["set"] = changed
+        if deleted:
+            entry["deleted"] = deleted
+        if reordered:
+            entry["order"] = {section: self._order(section) for section in sorted(reordered)}
+        if state.turn_count != self._turn_count:
+            self._turn_count = state.turn_count
+            entry["turn_count"] = state.turn_count
+        metadata = _serialize_metadata(state.metadata)
+        if metadata != self._metadata:
+            self._metadata = metadata
+            entry["metadata"] = metadata
+        if not entry:
+            return 0
+
+        self.sequence += 1
+        entry = {"seq": self.sequence, **entry}
+        self._file.write(_dumps(entry) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.entries_since_snapshot += 1
+        records = sum(len(records) for records in changed.values())
+        logger.debug(f"Journal entry {self.sequence}: {records} records, {sum(map(len, deleted.values()))} deleted")
+        if self.entries_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+        return records
+
+    def _order(self, section: str) -> List[str]:
+        """Ids of a section in save order."""
+        assert self.game_state is not None
+        collection = getattr(self.game_state, section)
+        if section == "actors":
+            order = list(collection)
+        else:
+            order = [entity.id for entity in collection]
+        if self.game_state._shards is not None:
+            # Unloaded entities follow the loaded ones, as in game_state_to_dict
+            order.extend(self.game_state._shards.unloaded_ids(collection.kind))
+        return order
+
+    def snapshot(self) -> None:
+        """Write a full snapshot of the state and start an empty journal."""
+        assert self.game_state is not None
+        state = self.game_state
+        property_reads.distribute()
+        with property_reads.lock:
+            self._pending.clear()
+
+        data = game_state_to_dict(state)
+        collections = state._entity_registry.collections
+        for section, kind, _ in _SECTIONS:
+            records = data.get(section, {} if section == "actors" else [])
+            pairs = records.items() if section == "actors" else ((r["id"], r) for r in records)
+            ordinal = collections[kind].ordinal
+            self._records[section] = {
+                entity_id: (ordinal.get(entity_id, -1), _detached(record)) for entity_id, record in pairs
+            }
+        self._metadata = _detached(data["metadata"])
+        self._turn_count = state.turn_count
+
+        _write_atomic(self.directory / SNAPSHOT_FILE, _dumps({
+            "version": JOURNAL_FORMAT_VERSION,
+            "seq": self.sequence,
+            "state": data,
+        }))
+        # Entries up to seq are in the snapshot, so a crash before the
+        # truncation below only leaves entries that replay skips
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.directory / JOURNAL_FILE, "w", encoding="utf-8")
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.entries_since_snapshot = 0
+        logger.debug(f"Journal snapshot at entry {self.sequence}")
+
+    def close(self) -> None:
+        """Commit pending changes and stop journaling."""
+        if self._file is None:
+            return
+        self.commit()
+        self._file.close()
+        self._file = None
+        if self.game_state is not None:
+            self.game_state.remove_change_listener(self._changed)
+        self._stop_reads()
+
+    def __enter__(self) -> "TurnJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Replace path with text, never leaving a partly written file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def read_journal(directory: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Rebuild the save dict of a journaled session: snapshot plus replayed entries.
+
+    A truncated last line (a crash while writing it) is ignored.
+
+    Args:
+        directory: Directory a TurnJournal wrote to
+
+    Returns:
+        Dict in the format of game_state_to_dict, for load_game_state
+
+    Raises:
+        FileNotFoundError: If the directory has no snapshot
+        ValueError: If the snapshot has an unsupported format
+    """
+    directory = Path(directory)
+    with open(directory / SNAPSHOT_FILE, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != JOURNAL_FORMAT_VERSION:
+        raise ValueError(f"Unsupported journal format in {directory}: {snapshot.get('version')}")
+    data = snapshot["state"]
+    sections: Dict[str, Dict[str, Any]] = {
+        section: dict(data.get(section, {})) if section == "actors"
+        else {record["id"]: record for record in data.get(section, [])}
+        for section, _, _ in _SECTIONS
+    }
+
+    journal_path = directory / JOURNAL_FILE
+    lines = journal_path.read_text(encoding="utf-8").splitlines() if journal_path.exists() else []
+    for number, line in enumerate(lines, 1):
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            if number == len(lines):
+                logger.warning(f"Ignoring incomplete last journal entry in {journal_path}")
+                break
+            raise ValueError(f"Corrupt journal entry at {journal_path}:{number}")
+        if entry["seq"] <= snapshot["seq"]:
+            continue
+        for section, records in entry.get("set", {}).items():
+            sections[section].update(records)
+        for section, entity_ids in entry.get("deleted", {}).items():
+            for entity_id in entity_ids:
+                sections[section].pop(entity_id, None)
+        for section, order in entry.get("order", {}).items():
+            records = sections[section]
+            sections[section] = {entity_id: records[entity_id] for entity_id in order if entity_id in records}
+        if "turn_count" in entry:
+            data["turn_count"] = entry["turn_count"]
+        if "metadata" in entry:
+            data["metadata"] = entry["metadata"]
+
+    for section, records in sections.items():
+        if section == "actors":
+            data[section] = records
+        elif records or section not in _OPTIONAL_SECTIONS:
+            data[section] = list(records.values())
+        else:
+            data.pop(section, None)
+    if not data.get("turn_count"):
+        data.pop("turn_count", None)
+    return data
+
+
+def restore_game_state(directory: Union[str, Path]) -> GameState:
+    """
+    Load the GameState a TurnJournal last committed.
+
+    Args:
+        directory: Directory a TurnJournal wrote to
+
+    Returns:
+        The restored GameState
+    """
+    return load_game_state(read_journal(directory))
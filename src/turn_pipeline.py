@@ -0,0 +1,158 @@
+"""
+Turn Pipeline - Overlap command parsing with narrator preparation.
+
+A turn in the LLM-parsing front end runs parse -> execute -> narrate. Done
+strictly in sequence (as xplm_game used to), every command waits for the
+parser LLM to generate its JSON, then for the narrator to prefill its prompt,
+before the first word of narration appears.
+
+TurnPipeline shortens that critical path:
+- The local Parser runs first. It answers in microseconds for most commands,
+  and when it succeeds the parser LLM is never started.
+- Input the LLM parsed before in the same scene is answered from an
+  optional PhraseCache.
+- Only when both fail is the LLM parse submitted to a worker
+  thread. While it generates, the narrator prepares for the narration that
+  will follow (narrator.prepare_narration(): re-creating an expired API
+  prompt cache, resetting the local prompt cache to the system prompt).
+- Narration is streamed (narrator.narrate_result_stream()), so the caller
+  prints the first chunk as soon as it exists.
+
+Usage:
+    pipeline = TurnPipeline(engine, narrator, llm_parser, adapter)
+    stream = pipeline.run_turn_stream("take the brass lamp")
+    if stream is None:
+        print("I couldn't understand that command.")
+    else:
+        for chunk in stream:
+            print(chunk, end="", flush=True)
+"""
+
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional
+
+from src.command_utils import parsed_to_json
+from src.parsed_command import ParsedCommand
+from src.phrase_cache import PhraseCache
+
+logger = logging.getLogger(__name__)
+
+
+def command_for_parse(parsed: ParsedCommand) -> Dict[str, Any]:
+    """Convert a ParsedCommand to a JSON command, treating a bare direction as "go".
+
+    Args:
+        parsed: Result of Parser.parse_command or LLMParserAdapter.to_parsed_command
+
+    Returns:
+        JSON protocol command
+    """
+    if parsed.direct_object and not parsed.verb:
+        return {"type": "command", "action": {"verb": "go", "object": parsed.direct_object}}
+    return parsed_to_json(parsed)
+
+
+class TurnPipeline:
+    """Runs player turns, overlapping the LLM parse with narrator preparation."""
+
+    def __init__(self, engine: Any, narrator: Any,
+                 llm_parser: Optional[Any] = None,
+                 adapter: Optional[Any] = None,
+                 executor: Optional[Executor] = None,
+                 phrase_cache: Optional[PhraseCache] = None):
+        """Initialize the pipeline.
+
+        Args:
+            engine: GameEngine the turns run against
+            narrator: LLMNarrator or MLXNarrator (anything with prepare_narration()
+                and narrate_result_stream())
+            llm_parser: Optional LLMCommandParser (or ParseBatcher) used when the
+                local parse fails
+            adapter: LLMParserAdapter for llm_parser output (required with llm_parser)
+            executor: Executor for the LLM parse (default: a private single thread)
+            phrase_cache: Optional PhraseCache of earlier LLM parses
+        """
+        if llm_parser is not None and adapter is None:
+            raise ValueError("adapter is required with llm_parser")
+        self.engine = engine
+        self.narrator = narrator
+        self.local_parser = engine.create_parser()
+        self.llm_parser = llm_parser
+        self.adapter = adapter
+        self.phrase_cache = phrase_cache
+        if phrase_cache is not None:
+            engine.vocabulary_service.add_phrase_cache(phrase_cache)
+        self._owns_executor = executor is None and llm_parser is not None
+        self._executor = executor
+        if self._owns_executor:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="turn-pipeline")
+        self.stats = {"local": 0, "cached": 0, "llm": 0, "unparsed": 0}
+
+    def parse(self, player_input: str) -> Optional[Dict[str, Any]]:
+        """Translate player input to a JSON command.
+
+        Args:
+            player_input: Natural language input from player
+
+        Returns:
+            The JSON command, or None if neither parser understood the input
+        """
+        parsed = self.local_parser.parse_command(player_input)
+        if parsed is not None and (parsed.verb or parsed.direct_object):
+            self.stats["local"] += 1
+            logger.debug(f"Local parse: {player_input!r}")
+            return command_for_parse(parsed)
+
+        if self.llm_parser is None:
+            self.stats["unparsed"] += 1
+            return None
+
+        assert self._executor is not None and self.adapter is not None
+        context = self.engine.build_parser_context()
+        if self.phrase_cache is not None:
+            parser_output = self.phrase_cache.get(player_input, context)
+            if parser_output is not None:
+                parsed = self.adapter.to_parsed_command(parser_output, player_input)
+                if parsed is not None:
+                    self.stats["cached"] += 1
+                    return command_for_parse(parsed)
+
+        future = self._executor.submit(self.llm_parser.parse_command, player_input, context)
+        try:
+            self.narrator.prepare_narration()
+        finally:
+            parser_output = future.result()
+        logger.debug(f"Parser output: {parser_output}")
+
+        parsed = self.adapter.to_parsed_command(parser_output, player_input)
+        if parsed is None or not (parsed.verb or parsed.direct_object):
+            self.stats["unparsed"] += 1
+            return None
+        self.stats["llm"] += 1
+        if self.phrase_cache is not None and parser_output is not None:
+            self.phrase_cache.put(player_input, context, parser_output)
+        return command_for_parse(parsed)
+
+    def run_turn_stream(self, player_input: str) -> Optional[Iterator[str]]:
+        """Parse and execute a command, then stream its narration.
+
+        Args:
+            player_input: Natural language input from player
+
+        Returns:
+            Iterator over chunks of the narrative text, or None if the input
+            could not be turned into a command
+        """
+        json_cmd = self.parse(player_input)
+        if json_cmd is None:
+            return None
+        logger.debug(f"JSON command: {json_cmd}")
+        result = self.engine.json_handler.handle_message(json_cmd)
+        return self.narrator.narrate_result_stream(result)
+
+    def close(self) -> None:
+        """Shut down the pipeline's own worker thread."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
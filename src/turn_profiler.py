@@ -0,0 +1,149 @@
+"""Opt-in wall-clock profiling of command turns.
+
+A TurnProfiler attached to an LLMProtocolHandler (see
+LLMProtocolHandler.enable_profiling) records time and call counts for:
+
+- "handler": verb handlers invoked by BehaviorManager.invoke_handler
+- "behavior": behavior module event functions ("module.on_event")
+- "turn_phase": turn phase hooks run by TurnScheduler.execute_turn_phases
+- "narration": NarrationAssembler build steps
+- "turn": whole handle_command calls, keyed by verb
+
+Each command response gets a per-turn report in data["profile"]; summary()
+aggregates every recorded call across the session into p50/p95/p99.
+Times are inclusive, so a behavior invoked from a handler is counted in
+both categories.
+
+When no profiler is attached, instrumented call sites skip all timing.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+CATEGORIES = ("turn", "handler", "behavior", "turn_phase", "narration")
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples (0.0 if empty)."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, min(len(sorted_samples), math.ceil(pct / 100.0 * len(sorted_samples))))
+    return sorted_samples[rank - 1]
+
+
+class TurnProfiler:
+    """
+    Collects per-turn and per-session timings.
+
+    Args:
+        max_samples: Per-key cap on retained samples for session percentiles
+            (oldest dropped first); call counts and totals are never capped.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        # (category, name) -> recent durations in seconds
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        # (category, name) -> [calls, total seconds] over the whole session
+        self._totals: Dict[Tuple[str, str], List[float]] = {}
+        # Current turn: (category, name) -> [calls, seconds]; None outside a turn
+        self._turn: Optional[Dict[Tuple[str, str], List[float]]] = None
+        self._turn_start = 0.0
+        self.turns = 0
+
+    def record(self, category: str, name: str, seconds: float) -> None:
+        """Record one call of duration seconds."""
+        key = (category, name)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.max_samples)
+            self._totals[key] = [0, 0.0]
+        samples.append(seconds)
+        totals = self._totals[key]
+        totals[0] += 1
+        totals[1] += seconds
+        if self._turn is not None:
+            entry = self._turn.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def call(self, category: str, name: str, fn: Callable[..., T], *args: Any) -> T:
+        """Call fn(*args), recording its duration under (category, name)."""
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def begin_turn(self) -> None:
+        """Start collecting a per-turn report."""
+        self._turn = {}
+        self._turn_start = time.perf_counter()
+
+    def end_turn(self, label: str) -> Dict[str, Any]:
+        """Finish the current turn, record it under ("turn", label) and return its report.
+
+        Returns:
+            Dict with total_ms plus, per category, {name: {"calls", "ms"}}
+        """
+        elapsed = time.perf_counter() - self._turn_start
+        turn = self._turn or {}
+        self._turn = None
+        self.turns += 1
+        self.record("turn", label, elapsed)
+
+        report: Dict[str, Any] = {"total_ms": round(elapsed * 1000, 3)}
+        for (category, name), (calls, seconds) in turn.items():
+            report.setdefault(category, {})[name] = {
+                "calls": int(calls), "ms": round(seconds * 1000, 3)
+            }
+        return report
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Aggregate all recorded calls.
+
+        Returns:
+            {category: {name: {"calls", "total_ms", "p50_ms", "p95_ms", "p99_ms"}}}
+        """
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for key, samples in self._samples.items():
+            category, name = key
+            calls, total = self._totals[key]
+            ordered = sorted(samples)
+            result.setdefault(category, {})[name] = {
+                "calls": int(calls),
+                "total_ms": round(total * 1000, 3),
+                "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+                "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+                "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+            }
+        return result
+
+    def format_summary(self, top: int = 10) -> str:
+        """Format summary() as a text table, slowest (by total time) first per category."""
+        summary = self.summary()
+        lines = [f"Profile over {self.turns} turns"]
+        for category in CATEGORIES:
+            rows = summary.get(category)
+            if not rows:
+                continue
+            lines.append("")
+            lines.append(f"{category:<60} {'calls':>7} {'total ms':>10} {'p50':>8} {'p95':>8} {'p99':>8}")
+            ranked = sorted(rows.items(), key=lambda row: row[1]["total_ms"], reverse=True)
+            for name, stats in ranked[:top]:
+                lines.append(
+                    f"  {name[:58]:<58} {stats['calls']:>7} {stats['total_ms']:>10.2f} "
+                    f"{stats['p50_ms']:>8.3f} {stats['p95_ms']:>8.3f} {stats['p99_ms']:>8.3f}"
+                )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Discard all recorded data."""
+        self._samples.clear()
+        self._totals.clear()
+        self._turn = None
+        self.turns = 0
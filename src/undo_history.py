@@ -0,0 +1,626 @@
+"""
+Undo History - In-memory undo/redo of whole turns.
+
+Rolling a session back used to mean loading a full save: reparsing the
+file and rebuilding the LLMProtocolHandler through GameEngine.reload_state.
+UndoHistory keeps the last turns in memory instead, as structural
+snapshots of only the entities each turn changed, so checkpointing,
+undoing and redoing a turn all cost O(changes), not O(world).
+
+How it works:
+- At each checkpoint the history keeps only the order of each collection
+  (and turn_count, metadata, extra and the session's visit tracking sets:
+  LLMProtocolHandler.visited_locations and examined_entities).
+- The first time in a turn that an entity may be about to change, it is
+  imaged: its dataclass fields are copied, dicts and lists included, with
+  everything immutable (strings, numbers, frozen template content, packed
+  llm_context text) shared with the live entity. "About to change" means
+  a GameState pre-change notification (moves, renames, StateAccessor
+  updates) or an access to its properties dict or an actor's inventory
+  (see property_reads), since behaviors edit those in place.
+- At checkpoint() each imaged entity is compared with its image; a changed
+  one yields a (before, after) pair of images. The images are then dropped.
+- Collections whose membership changed (see
+  EntityRegistry.membership_changes) are compared with their order at the
+  checkpoint, and the entities added and removed are recorded with their
+  list positions; other reorders fall back to the whole order.
+- undo() writes the before images back onto the same entity objects
+  (assigning .location and .name through their setters so the
+  containment and name indexes follow), redo() the after images.
+
+The history is bounded by a number of turns and an approximate memory
+limit, which also counts the images of the turn in progress; the oldest
+turns are dropped first. Like TurnJournal, a change that bypasses both
+pre-change reporting and properties (e.g. actor.inventory edited in place
+without moving the item) is not seen.
+
+Usage:
+    history = UndoHistory(engine.game_state, engine.json_handler)
+    while playing:
+        history.checkpoint()
+        ...  # run a turn
+    history.undo()   # back to the last checkpoint before the last turn
+    history.redo()
+"""
+
+import copy
+import logging
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from src import property_reads
+from src.state_manager import (
+    GameState, Location, Item, Lock, Part, Actor, Exit, Commitment, ScheduledEvent, Gossip, Spread,
+    CoreFieldProtectingDict, _PackedPropertiesDict, ENTITY_COLLECTIONS,
+)
+from src.world_template import FrozenDict, FrozenList
+
+logger = logging.getLogger(__name__)
+
+# Session attributes rolled back with the state (see LLMProtocolHandler)
+SESSION_SETS = ("visited_locations", "examined_entities")
+
+_KINDS = tuple(kind for _, kind in ENTITY_COLLECTIONS)
+_KIND_OF_TYPE: Dict[type, str] = {
+    Location: "location", Item: "item", Lock: "lock", Part: "part", Actor: "actor", Exit: "exit",
+    Commitment: "commitment", ScheduledEvent: "scheduled_event", Gossip: "gossip", Spread: "spread",
+}
+
+_SHARED_TYPES = (str, int, float, bool, type(None), FrozenDict, FrozenList)
+
+# Entity class -> its dataclass field names
+_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+# An entity image: the entity's field values, in _FIELDS order
+Image = Tuple[Any, ...]
+
+
+def _copied(value: Any) -> Any:
+    """Copy the dicts and lists of a field value, sharing immutable content."""
+    cls = type(value)
+    if cls in _SHARED_TYPES:
+        return value
+    if cls is dict:
+        return {key: _copied(item) for key, item in value.items()}
+    if cls is list:
+        return [_copied(item) for item in value]
+    if cls is CoreFieldProtectingDict:
+        return CoreFieldProtectingDict(value._core_fields, {key: _copied(item) for key, item in dict.items(value)})
+    if cls is _PackedPropertiesDict:
+        # Stays packed: the llm_context text is shared, not decoded
+        data = {key: _copied(item) for key, item in dict.items(value)}
+        return _PackedPropertiesDict(value._core_fields, data, value._packed)
+    if cls is set:
+        return set(value)
+    return copy.deepcopy(value)
+
+
+def _same(kept: Any, live: Any) -> bool:
+    """Whether a kept field value equals the live one (two packed dicts are compared packed)."""
+    if type(kept) is _PackedPropertiesDict and type(live) is _PackedPropertiesDict:
+        return kept._packed == live._packed and dict.__eq__(kept, live)
+    return bool(kept == live)
+
+
+def _footprint(value: Any) -> int:
+    """Approximate bytes held by the containers of a value (shared immutable content is not counted)."""
+    if type(value) in _SHARED_TYPES:
+        return 0
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        items: Any = dict.values(value)
+    elif isinstance(value, (list, tuple, set)):
+        items = value
+    else:
+        return size
+    for item in items:
+        # Most items are strings and numbers: skip the call for them
+        if type(item) not in _SHARED_TYPES:
+            size += _footprint(item)
+    return size
+
+
+def _fields(entity: Any) -> Tuple[str, ...]:
+    cls = type(entity)
+    names = _FIELDS.get(cls)
+    if names is None:
+        names = _FIELDS[cls] = tuple(cls.__dataclass_fields__)
+    return names
+
+
+def _image(entity: Any) -> Image:
+    """Snapshot the fields of an entity."""
+    return tuple(_copied(getattr(entity, name)) for name in _fields(entity))
+
+
+def _matches(image: Image, entity: Any) -> bool:
+    """Whether an entity still has the field values of its image."""
+    return all(_same(kept, getattr(entity, name)) for kept, name in zip(image, _fields(entity)))
+
+
+class _Members:
+    """Changes to the membership (or order) of one collection during a turn."""
+    __slots__ = ("added", "removed", "before", "after")
+
+    def __init__(self) -> None:
+        # (list position after the turn, entity id, entity)
+        self.added: List[Tuple[int, Optional[str], Any]] = []
+        # (list position before the turn, entity id, entity)
+        self.removed: List[Tuple[int, Optional[str], Any]] = []
+        # Whole (entity id, entity) orders, only when survivors were reordered
+        # (and for any actor change)
+        self.before: Optional[List[Tuple[Optional[str], Any]]] = None
+        self.after: Optional[List[Tuple[Optional[str], Any]]] = None
+
+
+class _Turn:
+    """The changes between two checkpoints."""
+    __slots__ = ("entities", "members", "turn_count", "metadata", "extra", "sessions", "size")
+
+    def __init__(self) -> None:
+        # (kind, entity id, entity, image before or None if added, image after or None if removed)
+        self.entities: List[Tuple[str, Optional[str], Any, Optional[Image], Optional[Image]]] = []
+        self.members: Dict[str, _Members] = {}
+        self.turn_count: Optional[Tuple[int, int]] = None
+        self.metadata: Optional[Tuple[Any, Any]] = None
+        self.extra: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        # Session set name -> (values added, values removed)
+        self.sessions: Dict[str, Tuple[Set[Any], Set[Any]]] = {}
+        self.size = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.entities or self.members or self.turn_count or self.metadata
+                    or self.extra or self.sessions)
+
+
+class UndoHistory:
+    """
+    Undo and redo stacks of the turns of one GameState.
+
+    Args:
+        game_state: State to track
+        session: Object whose SESSION_SETS attributes are rolled back with
+            the state (normally the LLMProtocolHandler), or None
+        depth: Most turns kept for undo
+        memory_limit: Approximate bytes of turn records kept for undo and
+            redo plus entity images; beyond it the oldest turns are dropped
+            (the newest turn is always kept), then the images of entities
+            not accessed since the last checkpoint
+    """
+
+    def __init__(self, game_state: GameState, session: Optional[Any] = None,
+                 depth: int = 100, memory_limit: int = 32 * 1024 * 1024):
+        self.depth = depth
+        self.memory_limit = memory_limit
+        self.game_state: Optional[GameState] = None
+        self.session: Optional[Any] = None
+
+        self._undo: Deque[_Turn] = deque()
+        self._redo: List[_Turn] = []
+        self._size = 0
+        # Images of the entities accessed so far, as they were at the last
+        # checkpoint: kind -> id -> (entity, image, footprint)
+        self._images: Dict[str, Dict[str, Tuple[Any, Image, int]]] = {kind: {} for kind in _KINDS}
+        self._image_size = 0
+        # Entities accessed since the last checkpoint, by id() (holding them
+        # keeps the ids from being reused)
+        self._seen: Dict[int, Any] = {}
+        # (id, entity) order of each collection at the last checkpoint
+        self._orders: Dict[str, List[Tuple[Optional[str], Any]]] = {}
+        # EntityRegistry.membership_changes of each kind at the last checkpoint
+        self._membership: Dict[str, int] = {}
+        self._turn_count = 0
+        self._metadata: Any = None
+        self._extra: Dict[str, Any] = {}
+        self._sessions: Dict[str, Set[Any]] = {}
+        # Ids of a sharded world's entities not loaded at attach (their loading is not a change)
+        self._unloaded: Dict[str, Any] = {}
+        # Set while imaging, checkpointing or writing images back, whose
+        # reads and writes are not accesses to keep
+        self._busy = False
+
+        self._stop_reads = property_reads.register(self)
+        self.attach(game_state, session)
+
+    def attach(self, game_state: GameState, session: Optional[Any] = None) -> None:
+        """
+        Track a different GameState (e.g. after loading a save).
+
+        Clears the undo and redo stacks.
+
+        Args:
+            game_state: The state to track from now on
+            session: Its session (see UndoHistory), or None
+        """
+        if self.game_state is not None:
+            self.game_state.remove_pre_change_listener(self._keep)
+        self.game_state = game_state
+        self.session = session
+        game_state.add_pre_change_listener(self._keep)
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget all recorded turns; the current state becomes the checkpoint."""
+        state = self.game_state
+        assert state is not None
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+        for images in self._images.values():
+            images.clear()
+        self._image_size = 0
+        self._seen.clear()
+        property_reads.rearm()
+
+        membership = state._entity_registry.membership_changes
+        for kind in _KINDS:
+            self._orders[kind] = self._order(kind)
+            self._membership[kind] = membership[kind]
+        self._turn_count = state.turn_count
+        self._metadata = copy.deepcopy(state.metadata)
+        self._extra = _copied(state.extra)
+        self._sessions = {name: set(values) for name, values in self._session_sets().items()}
+        shards = state._shards
+        self._unloaded = dict(shards.entities) if shards is not None else {}
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether a checkpointed turn can be undone."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether an undone turn can be redone."""
+        return bool(self._redo)
+
+    @property
+    def memory_used(self) -> int:
+        """Approximate bytes held by turn records and entity images."""
+        return self._size + self._image_size
+
+    def note_property_reads(self, entities: List[Any]) -> None:
+        """Nothing to do: entities were kept when accessed (see note_property_access)."""
+
+    def note_property_access(self, entity: Any) -> None:
+        """Keep an entity of this history's state before its properties are written (see property_reads)."""
+        if not self._busy and id(entity) not in self._seen:
+            self._keep(entity)
+
+    def _keep(self, entity: Any) -> None:
+        """
+        Note an entity that may be about to change, imaging it on its first access.
+
+        Also the GameState pre-change listener.
+        """
+        state = self.game_state
+        kind = _KIND_OF_TYPE.get(type(entity))
+        if state is None or kind is None or self._busy or id(entity) in self._seen:
+            return
+        entity_id = entity.id
+        if state._entity_registry.collections[kind].by_id.get(entity_id) is not entity:
+            return
+        self._seen[id(entity)] = entity
+        images = self._images[kind]
+        known = images.get(entity_id)
+        if known is not None and known[0] is entity:
+            return
+        self._busy = True
+        try:
+            self._set_image(kind, entity_id, entity, _image(entity))
+        finally:
+            self._busy = False
+        if self.memory_used > self.memory_limit:
+            self._trim()
+
+    def _set_image(self, kind: str, entity_id: str, entity: Any, image: Optional[Image]) -> None:
+        """Replace (or with None, drop) the kept image of an entity."""
+        images = self._images[kind]
+        known = images.pop(entity_id, None)
+        if known is not None:
+            self._image_size -= known[2]
+        if image is not None:
+            size = _footprint(image)
+            images[entity_id] = (entity, image, size)
+            self._image_size += size
+
+    def _session_sets(self) -> Dict[str, Set[Any]]:
+        if self.session is None:
+            return {}
+        return {name: getattr(self.session, name) for name in SESSION_SETS if hasattr(self.session, name)}
+
+    def _order(self, kind: str) -> List[Tuple[Optional[str], Any]]:
+        """Current (id, entity) order of a collection."""
+        assert self.game_state is not None
+        collection = self.game_state._entity_registry.collections[kind]
+        if kind == "actor":
+            return list(collection.items())
+        return [(getattr(entity, "id", None), entity) for entity in collection]
+
+    def checkpoint(self) -> bool:
+        """
+        Record the changes since the last checkpoint as one undoable turn.
+
+        Call once per turn. Clears the redo stack when anything changed.
+
+        Returns:
+            True if a turn was recorded (False when nothing changed)
+        """
+        turn = self._capture()
+        if not turn:
+            return False
+        self._undo.append(turn)
+        self._size += turn.size
+        for undone in self._redo:
+            self._size -= undone.size
+        self._redo.clear()
+        self._trim()
+        logger.debug(f"Undo checkpoint: {len(turn.entities)} entities, {turn.size} bytes")
+        return True
+
+    def undo(self) -> bool:
+        """
+        Return to the checkpoint before the last recorded turn.
+
+        Changes made since the last checkpoint are discarded first (e.g.
+        the turn phases run for the "undo" command itself).
+
+        Returns:
+            True if a turn was undone, False if there was none
+        """
+        self._discard_pending()
+        if not self._undo:
+            return False
+        turn = self._undo.pop()
+        self._apply(turn, forward=False)
+        self._redo.append(turn)
+        logger.debug(f"Undid a turn of {len(turn.entities)} entities")
+        return True
+
+    def redo(self) -> bool:
+        """
+        Replay the last undone turn.
+
+        Changes made since the last checkpoint are discarded first.
+
+        Returns:
+            True if a turn was redone, False if there was none
+        """
+        self._discard_pending()
+        if not self._redo:
+            return False
+        turn = self._redo.pop()
+        self._apply(turn, forward=True)
+        self._undo.append(turn)
+        logger.debug(f"Redid a turn of {len(turn.entities)} entities")
+        return True
+
+    def close(self) -> None:
+        """Stop tracking the state."""
+        if self.game_state is not None:
+            self.game_state.remove_pre_change_listener(self._keep)
+            self.game_state = None
+        self._stop_reads()
+
+    def _discard_pending(self) -> None:
+        turn = self._capture()
+        if turn:
+            self._apply(turn, forward=False)
+
+    def _trim(self) -> None:
+        """Drop the oldest turns beyond depth or memory_limit, then images not needed this turn."""
+        while len(self._undo) > self.depth or (self.memory_used > self.memory_limit and len(self._undo) > 1):
+            self._size -= self._undo.popleft().size
+        if self.memory_used > self.memory_limit:
+            # Re-imaged on their next access
+            for images in self._images.values():
+                for entity_id, (entity, _, size) in list(images.items()):
+                    if id(entity) not in self._seen:
+                        del images[entity_id]
+                        self._image_size -= size
+
+    def _capture(self) -> _Turn:
+        """Compare the accessed entities and changed collections with the checkpoint and advance it."""
+        state = self.game_state
+        assert state is not None
+        # Entities are kept on access; this only empties the collected reads
+        property_reads.distribute()
+        turn = _Turn()
+        self._busy = True
+        try:
+            recorded = self._compare_members(turn)
+            self._compare_entities(turn, recorded)
+        finally:
+            self._busy = False
+        self._seen.clear()
+        property_reads.rearm()
+
+        if state.turn_count != self._turn_count:
+            turn.turn_count = (self._turn_count, state.turn_count)
+            self._turn_count = state.turn_count
+        if state.metadata != self._metadata:
+            metadata = copy.deepcopy(state.metadata)
+            turn.metadata = (self._metadata, metadata)
+            self._metadata = metadata
+        if state.extra != self._extra:
+            extra = _copied(state.extra)
+            turn.extra = (self._extra, extra)
+            turn.size += _footprint(extra)
+            self._extra = extra
+        for name, values in self._session_sets().items():
+            kept = self._sessions.setdefault(name, set())
+            if values != kept:
+                turn.sessions[name] = (values - kept, kept - values)
+                self._sessions[name] = set(values)
+        return turn
+
+    def _compare_members(self, turn: _Turn) -> Set[int]:
+        """
+        Record the collections whose membership changed.
+
+        Returns:
+            id() of the entities recorded as added or removed
+        """
+        assert self.game_state is not None
+        membership = self.game_state._entity_registry.membership_changes
+        recorded: Set[int] = set()
+        for kind in _KINDS:
+            if membership[kind] == self._membership[kind]:
+                continue
+            self._membership[kind] = membership[kind]
+            members = self._members(turn, kind)
+            if members is not None:
+                turn.members[kind] = members
+                recorded.update(id(entity) for _, _, entity in members.added + members.removed)
+        return recorded
+
+    def _compare_entities(self, turn: _Turn, recorded: Set[int]) -> None:
+        """Record the accessed entities whose fields changed."""
+        assert self.game_state is not None
+        collections = self.game_state._entity_registry.collections
+        for key, entity in self._seen.items():
+            if key in recorded:
+                continue
+            kind = _KIND_OF_TYPE[type(entity)]
+            entity_id = entity.id
+            known = self._images[kind].get(entity_id)
+            if (known is None or known[0] is not entity or collections[kind].by_id.get(entity_id) is not entity
+                    or _matches(known[1], entity)):
+                continue
+            after = _image(entity)
+            turn.entities.append((kind, entity_id, entity, known[1], after))
+            turn.size += known[2] + _footprint(after)
+            self._set_image(kind, entity_id, entity, after)
+
+    def _members(self, turn: _Turn, kind: str) -> Optional[_Members]:
+        """
+        Work out the membership change of a collection from its order at the last checkpoint.
+
+        Records the added and removed entities in turn.entities.
+        """
+        before = self._orders[kind]
+        after = self._order(kind)
+        self._orders[kind] = after
+        before_ids = {id(entity) for _, entity in before}
+        after_ids = {id(entity) for _, entity in after}
+        images = self._images[kind]
+
+        members = _Members()
+        for index, (entity_id, entity) in enumerate(before):
+            if id(entity) in after_ids:
+                continue
+            known = images.get(entity_id) if entity_id is not None else None
+            if entity_id is not None and known is not None and known[0] is entity:
+                image = known[1]
+                self._set_image(kind, entity_id, entity, None)
+            else:
+                image = _image(entity)  # Never accessed: as it was at the checkpoint
+            members.removed.append((index, entity_id, entity))
+            turn.entities.append((kind, entity_id, entity, image, None))
+            turn.size += _footprint(image)
+        for index, (entity_id, entity) in enumerate(after):
+            if id(entity) in before_ids:
+                continue
+            if entity_id is not None and self._unloaded.pop(entity_id, None) is not None:
+                continue  # Loaded from a shard: not a change
+            image = _image(entity)
+            members.added.append((index, entity_id, entity))
+            turn.entities.append((kind, entity_id, entity, None, image))
+            turn.size += _footprint(image)
+        turn.size += sys.getsizeof(members.added) + sys.getsizeof(members.removed)
+        # Loaded shard entities are neither, but are not survivors either
+        kept_before = [entity for _, entity in before if id(entity) in after_ids]
+        kept_after = [entity for _, entity in after if id(entity) in before_ids]
+        reordered = len(kept_before) != len(kept_after) or any(a is not b for a, b in zip(kept_before, kept_after))
+        # Actors are a dict, which cannot take an entry back at its old position
+        if reordered or (kind == "actor" and (members.added or members.removed)):
+            members.before, members.after = before, after
+            turn.size += sys.getsizeof(before) + sys.getsizeof(after)
+        if not (members.added or members.removed or members.before):
+            return None
+        return members
+
+    def _apply(self, turn: _Turn, forward: bool) -> None:
+        """Bring the state to the after (forward) or before side of a turn and make it the checkpoint."""
+        state = self.game_state
+        assert state is not None
+        collections = state._entity_registry.collections
+        self._busy = True
+        try:
+            for kind, members in turn.members.items():
+                self._restore_members(kind, collections[kind], members, forward)
+                self._orders[kind] = self._order(kind)
+
+            touched: List[Tuple[str, str]] = []
+            for kind, entity_id, entity, before, after in (turn.entities if forward else reversed(turn.entities)):
+                if entity_id is None:
+                    continue
+                image = after if forward else before
+                touched.append((kind, entity_id))
+                known = self._images[kind].get(entity_id)
+                if image is None:
+                    if known is not None and known[0] is entity:
+                        self._set_image(kind, entity_id, entity, None)
+                    continue
+                for name, value in zip(_fields(entity), image):
+                    setattr(entity, name, _copied(value))
+                if collections[kind].by_id.get(entity_id) is entity:
+                    self._set_image(kind, entity_id, entity, image)
+                    if kind == "exit":
+                        state._connected_to[entity_id] = set(entity.connections)
+        finally:
+            self._busy = False
+        property_reads.rearm()
+        membership = state._entity_registry.membership_changes
+        for kind in turn.members:
+            self._membership[kind] = membership[kind]
+
+        if turn.turn_count is not None:
+            state.turn_count = self._turn_count = turn.turn_count[1 if forward else 0]
+        if turn.metadata is not None:
+            self._metadata = turn.metadata[1 if forward else 0]
+            state.metadata = copy.deepcopy(self._metadata)
+        if turn.extra is not None:
+            self._extra = turn.extra[1 if forward else 0]
+            state.extra.clear()
+            state.extra.update(_copied(self._extra))
+        sessions = self._session_sets()
+        for name, (added, removed) in turn.sessions.items():
+            values = sessions.get(name)
+            if values is None:
+                continue
+            if forward:
+                values.difference_update(removed)
+                values.update(added)
+            else:
+                values.difference_update(added)
+                values.update(removed)
+            self._sessions[name] = set(values)
+
+        # Other listeners (e.g. a TurnJournal) see the restored entities
+        for kind, entity_id in touched:
+            state.note_changed(kind, entity_id)
+
+    def _restore_members(self, kind: str, collection: Any, members: _Members, forward: bool) -> None:
+        """Add and remove the entities a turn removed and added (or the reverse)."""
+        order = members.after if forward else members.before
+        if order is not None:
+            if kind == "actor":
+                collection.clear()
+                collection.update(order)
+            else:
+                collection[:] = [entity for _, entity in order]
+            return
+        drop = members.removed if forward else members.added
+        put = members.added if forward else members.removed
+        for _, entity_id, entity in sorted(drop, key=lambda entry: entry[0], reverse=True):
+            # Added and removed entities are usually near the end
+            for index in range(len(collection) - 1, -1, -1):
+                if collection[index] is entity:
+                    collection.pop(index)
+                    break
+        for index, entity_id, entity in sorted(put, key=lambda entry: entry[0]):
+            if index >= len(collection):
+                collection.append(entity)
+            else:
+                collection.insert(index, entity)
@@ -30,6 +30,20 @@ def _make_plural(word: str) -> str:
         return word + 's'
 
 
+def name_component_words(name: str) -> List[str]:
+    """
+    Words of an item name that get their own noun entry (with a plural synonym).
+
+    Possessives are stripped and words shorter than 3 letters skipped.
+    """
+    words = []
+    for word in name.split():
+        clean_word = word.lower().rstrip("'s").rstrip("'")
+        if len(clean_word) >= 3:
+            words.append(clean_word)
+    return words
+
+
 def extract_nouns_from_state(state: GameState) -> List[Dict[str, Any]]:
     """
     Extract noun entries from game state entities.
@@ -57,11 +71,7 @@ def extract_nouns_from_state(state: GameState) -> List[Dict[str, Any]]:
             nouns.append({"word": name})
             seen_words.add(name)
             # Collect individual words for plural expansion
-            for word in name.split():
-                # Skip possessives and short words
-                clean_word = word.lower().rstrip("'s").rstrip("'")
-                if len(clean_word) >= 3:
-                    component_words.add(clean_word)
+            component_words.update(name_component_words(name))
 
     # Extract NPC names (actors that aren't the player)
     for actor_id, actor in state.actors.items():
@@ -1,12 +1,33 @@
-"""Vocabulary loading and merging helpers shared across entrypoints."""
+"""Vocabulary loading and merging helpers shared across entrypoints.
+
+build_merged_vocabulary() computes a merged vocabulary from scratch.
+VocabularyService keeps one merged vocabulary current for a whole session:
+behavior vocabulary is merged once, and entity nouns (item, NPC and lock
+names) are added and removed as entities enter, leave or are renamed in
+the game state, updating every Parser the service created.
+"""
 
 import json
+import logging
+import weakref
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
 
-from src.vocabulary_generator import extract_nouns_from_state, merge_vocabulary, MergedVocabulary
+from src.vocabulary_generator import (
+    extract_nouns_from_state, merge_vocabulary, MergedVocabulary, name_component_words, _make_plural
+)
 from src.state_manager import GameState
 from src.behavior_manager import BehaviorManager
+from src.parser import Parser, VOCABULARY_SECTIONS
+
+if TYPE_CHECKING:
+    from src.phrase_cache import PhraseCache
+
+logger = logging.getLogger(__name__)
+
+# Sections whose entries can merge with entity nouns
+_WORD_SECTIONS = ("verbs", "nouns", "adjectives")
 
 
 def load_base_vocabulary(path: Optional[Path] = None) -> Dict[str, Any]:
@@ -38,3 +59,271 @@ def build_merged_vocabulary(
     extracted_nouns = extract_nouns_from_state(game_state)
     vocab_with_nouns = merge_vocabulary(vocab, extracted_nouns)
     return behavior_manager.get_merged_vocabulary(vocab_with_nouns)
+
+
+class VocabularyService:
+    """
+    Merged vocabulary for one session, updated incrementally as entities change.
+
+    The vocabulary holds the same words as build_merged_vocabulary() for the
+    current state. Entity nouns are reference-counted by the entities naming
+    them, and the GameState reports every item/actor added, removed or renamed
+    (see GameState.add_name_listener), so an update touches only the words
+    whose entities changed. Locks are counted when a state is attached.
+
+    ``vocabulary`` is a single dict mutated in place, so everything holding
+    it (narrators, LLM parser adapters, phrase caches) sees the current
+    words. Parsers from create_parser() get the changed entries pushed to
+    them; entity nouns added during play take lookup precedence over older
+    entries sharing a synonym. Phrase caches passed to add_phrase_cache()
+    drop the parses of phrases naming words whose entities changed.
+
+    Usage:
+        service = VocabularyService(game_state, behavior_manager)
+        parser = service.create_parser()
+        # ... items spawned or renamed: parser and service.vocabulary follow
+    """
+
+    def __init__(self, game_state: GameState, behavior_manager: BehaviorManager,
+                 base_vocab: Optional[Dict[str, Any]] = None,
+                 base_vocab_path: Optional[Path] = None):
+        """
+        Merge behavior vocabulary and index the entity nouns of game_state.
+
+        Args:
+            game_state: GameState whose entities supply nouns
+            behavior_manager: BehaviorManager providing behavior vocabulary
+            base_vocab: Optional preloaded base vocabulary dict
+            base_vocab_path: Optional path to base vocabulary JSON (used if base_vocab not provided)
+        """
+        base = base_vocab or load_base_vocabulary(base_vocab_path)
+        self._base_nouns = {noun["word"] for noun in base.get("nouns", [])}
+        # Base + behavior vocabulary without entity nouns, merged once
+        self._static = behavior_manager.get_merged_vocabulary(base)
+        self._static_entries: Dict[str, Dict[str, Any]] = {}
+        self._static_sections: Dict[str, str] = {}
+        for section in _WORD_SECTIONS:
+            for entry in self._static[section]:
+                if entry["word"] not in self._static_entries:
+                    self._static_entries[entry["word"]] = entry
+                    self._static_sections[entry["word"]] = section
+        self._merge_types = behavior_manager._merge_types
+
+        # Entity noun sources: full names, lowercase names, name component words
+        self._names: Counter = Counter()
+        self._reserved: Counter = Counter()
+        self._components: Counter = Counter()
+        self._door_items: Set[str] = set()
+
+        # Current entity noun entries (word -> merged entry), in insertion order;
+        # name-component words follow full names, as in extract_nouns_from_state
+        self._entity_entries: Dict[str, Dict[str, Any]] = {}
+        self._component_entries: Set[str] = set()
+        self.vocabulary: MergedVocabulary = {
+            "verbs": [], "nouns": [], "adjectives": [],
+            "prepositions": list(self._static.get("prepositions", [])),
+            "articles": list(self._static.get("articles", [])),
+        }
+        self.version = 0
+        self._parsers: "weakref.WeakSet[Parser]" = weakref.WeakSet()
+        self._phrase_caches: "weakref.WeakSet[PhraseCache]" = weakref.WeakSet()
+        self.game_state: Optional[GameState] = None
+        self.attach(game_state)
+
+    def attach(self, game_state: GameState) -> None:
+        """
+        Follow a different GameState (e.g. after loading a save).
+
+        Recounts entity nouns for the new state and updates the vocabulary
+        and parsers with the words that differ.
+
+        Args:
+            game_state: The state to follow from now on
+        """
+        if self.game_state is not None:
+            self.game_state.remove_name_listener(self._name_changed)
+        self.game_state = game_state
+        previous = set(self._entity_entries)
+        self._names.clear()
+        self._reserved.clear()
+        self._components.clear()
+        self._door_items.clear()
+
+        for item in game_state.items:
+            self._count("item", item.id, item.name, 1, is_door=item.is_door)
+        for actor_id, actor in game_state.actors.items():
+            self._count("actor", actor_id, actor.name, 1)
+        for lock in game_state.locks:
+            self._count("lock", lock.id, getattr(lock, "name", None) or "lock", 1)
+
+        candidates = set(self._names) | set(self._components) | {"door"}
+        self._refresh(previous | candidates, rebuild=True)
+        game_state.add_name_listener(self._name_changed)
+
+    def create_parser(self) -> Parser:
+        """
+        Create a Parser over the current vocabulary that the service keeps current.
+
+        Returns:
+            Parser instance ready for command parsing
+        """
+        parser = Parser.from_vocab(self.vocabulary)
+        self._parsers.add(parser)
+        return parser
+
+    def add_phrase_cache(self, cache: "PhraseCache") -> None:
+        """
+        Keep a PhraseCache current with the vocabulary.
+
+        The cache is signed with the base and behavior vocabulary only: its
+        entries are keyed on the entity ids of the scene, so entities coming
+        and going neither clear it nor invalidate a saved cache file. When
+        entity nouns change, parses of phrases naming the changed words
+        (e.g. the old name of a renamed item) are dropped.
+
+        Args:
+            cache: PhraseCache to keep current
+        """
+        cache.set_vocabulary(self._static)
+        self._phrase_caches.add(cache)
+
+    def verb_entry(self, verb: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the entry of the verbs section for a word.
+
+        Args:
+            verb: The verb to look up
+
+        Returns:
+            The vocabulary entry dict, or None if verb is not in the verbs section
+        """
+        for entry in self.vocabulary["verbs"]:
+            if entry.get("word") == verb:
+                return entry
+        return None
+
+    def _count(self, kind: str, entity_id: str, name: Optional[str], delta: int,
+               is_door: bool = False) -> Set[str]:
+        """Add (delta 1) or remove (delta -1) an entity's noun sources; return words affected."""
+        if not name or kind not in ("item", "actor", "lock") or (kind == "actor" and entity_id == "player"):
+            return set()
+        affected = {name, name.lower()}
+        self._names[name] += delta
+        self._reserved[name.lower()] += delta
+        if kind == "item":
+            components = name_component_words(name)
+            for word in components:
+                self._components[word] += delta
+            affected.update(components)
+            if delta > 0 and is_door:
+                self._door_items.add(entity_id)
+            elif delta < 0 and entity_id in self._door_items:
+                self._door_items.discard(entity_id)
+            affected.add("door")
+        for counter in (self._names, self._reserved, self._components):
+            for word in affected:
+                if counter.get(word, 1) <= 0:
+                    del counter[word]
+        return affected
+
+    def _name_changed(self, kind: str, entity_id: str,
+                      old_name: Optional[str], new_name: Optional[str]) -> None:
+        """GameState name listener: move an entity's nouns from old_name to new_name."""
+        affected = self._count(kind, entity_id, old_name, -1)
+        if new_name is not None:
+            is_door = False
+            if kind == "item" and self.game_state is not None:
+                item = self.game_state.lookup("item", entity_id)
+                is_door = bool(item is not None and item.is_door)
+            affected |= self._count(kind, entity_id, new_name, 1, is_door=is_door)
+        if affected:
+            self._refresh(affected)
+
+    def _is_name(self, word: str) -> bool:
+        """True if word is an entity's full name (or "door" while there are door items)."""
+        return bool(self._names.get(word)) or (word == "door" and bool(self._door_items))
+
+    def _entity_entry(self, word: str) -> Optional[Dict[str, Any]]:
+        """The merged entry the current entities give word, or None (see extract_nouns_from_state)."""
+        if word in self._base_nouns:
+            return None
+        if self._is_name(word):
+            entry: Dict[str, Any] = {"word": word, "word_type": "noun"}
+        elif self._components.get(word) and not self._reserved.get(word) and not self._is_name(word.lower()):
+            entry = {"word": word, "synonyms": [_make_plural(word)], "word_type": "noun"}
+        else:
+            return None
+
+        # Merge with the behavior entry for the same word, as get_merged_vocabulary does
+        static = self._static_entries.get(word)
+        if static is not None:
+            if static.get("word_type") != "noun":
+                entry["word_type"] = self._merge_types("noun", static.get("word_type"))
+            entry["synonyms"] = list(set(entry.get("synonyms", [])) | set(static.get("synonyms", [])))
+            for key, value in static.items():
+                if key not in entry:
+                    entry[key] = value
+        return entry
+
+    def _refresh(self, words: Iterable[str], rebuild: bool = False) -> None:
+        """Recompute the entries of words and push the changes to the vocabulary and parsers.
+
+        Args:
+            words: Words whose entity sources may have changed
+            rebuild: Recompose the vocabulary sections even if no entry changed
+        """
+        changed: List[str] = []
+        # Changed words and the synonyms of their old and new entries
+        mentioned: Set[str] = set()
+        for word in words:
+            entry = self._entity_entry(word)
+            previous = self._entity_entries.get(word)
+            if entry != previous:
+                changed.append(word)
+                mentioned.add(word)
+                for source in (previous, entry):
+                    if source is not None:
+                        mentioned.update(source.get("synonyms", []))
+                self._entity_entries.pop(word, None)
+                self._component_entries.discard(word)
+                if entry is not None:
+                    self._entity_entries[word] = entry
+                    if not self._is_name(word):
+                        self._component_entries.add(word)
+        if not changed and not rebuild:
+            return
+
+        # Entity entries replace behavior entries of the same word and sit
+        # between the base nouns and the behavior nouns
+        absorbed = self._entity_entries
+        for section in _WORD_SECTIONS:
+            entries = [entry for entry in self._static[section] if entry["word"] not in absorbed]
+            if section == "nouns":
+                base_count = sum(1 for entry in entries if entry["word"] in self._base_nouns)
+                entries[base_count:base_count] = (
+                    [entry for word, entry in absorbed.items() if word not in self._component_entries]
+                    + [entry for word, entry in absorbed.items() if word in self._component_entries]
+                )
+            self.vocabulary[section][:] = entries
+        self.version += 1
+        if not changed:
+            return
+        for cache in list(self._phrase_caches):
+            cache.discard_words(mentioned)
+        if not self._parsers:
+            return
+
+        # Word table positions of the new entries (Parser keeps vocabulary order)
+        changed_words = set(changed)
+        added = []
+        position = 0
+        for section in VOCABULARY_SECTIONS:
+            for data in self.vocabulary[section]:
+                word = data if isinstance(data, str) else data["word"]
+                if word in changed_words:
+                    added.append((position, section, data))
+                position += 1
+        for parser in list(self._parsers):
+            parser.update_entries(changed, [(position, parser.word_entry_from_data(section, data))
+                                            for position, section, data in added])
+        logger.debug(f"Vocabulary updated: {', '.join(sorted(changed))}")
@@ -0,0 +1,368 @@
+"""
+World Shards - Region-sharded worlds whose entities load on first access.
+
+A world whose locations carry a "region" property (examples/big_game:
+beast_wilds, fungal_depths, ...) can be split into one shard file per
+region plus a manifest. Loading the manifest materializes only the core
+(metadata, extra, actors and what they carry, locks, virtual entities,
+anything not inside a region) and the region the player stands in; every
+other region's locations, items, exits and parts are read from its shard
+the first time one of them is needed:
+
+- a registry lookup misses (get_location, get_item, lookup, find_entity,
+  state.actors[...] / .get / in),
+- a containment query (StateAccessor.get_entities_at) returns ids of a
+  region not loaded yet,
+- an entity moves into the region (an actor walks in, an item is
+  thrown there), or
+- a turn phase asks for the region (GameState.load_regions, e.g. a
+  broadcast gossip targeting it), or
+- a behavior asks for every entity of a kind (GameState.all_entities,
+  e.g. a spread changing all locations matching a pattern).
+
+The containment index (_entities_at, _entity_where, per-kind buckets) and
+the exit connection index cover the whole world from the start, from the
+manifest's entity directory; entities join the id registry and the name
+index as their region loads, like any other added entity.
+
+Entities of regions not loaded yet are dormant: code that iterates a
+collection (state.items, state.actors.values()) sees the loaded ones only;
+GameState.all_entities covers the whole world.
+Saves are complete: game_state_to_dict adds the unloaded entities from
+their shards, which are unchanged since nothing can touch them unloaded.
+
+Layout (game_state.json -> game_state.shards/):
+    manifest.json    core entities, region -> shard file, entity directory
+    NNN_region.json  a region's locations, items, actors, exits and parts
+
+Shards are written from validated data (tools/shard_game_state.py) and are
+not validated again when loaded.
+
+Usage:
+    write_shards(json.load(open("examples/big_game/game_state.json")),
+                 shards_path("examples/big_game/game_state.json"))
+    state = load_game_state("examples/big_game/game_state.json")
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.state_manager import (
+    GameState, LoadError, LOCATED_KINDS,
+    _build_game_state, _exit_reference_location,
+    _parse_location, _parse_item, _parse_actor, _parse_exit_entity, _parse_part,
+)
+from src.types import ActorId
+
+logger = logging.getLogger(__name__)
+
+# Version of the manifest/shard format
+SHARD_FORMAT_VERSION = 1
+
+SHARDS_SUFFIX = ".shards"
+MANIFEST_FILE = "manifest.json"
+
+# Always in the core, with everything it carries
+_PLAYER_ID = "player"
+
+# Sections split by region: section of game_state.json -> registry kind
+_SHARDED_SECTIONS: Dict[str, str] = {
+    "locations": "location",
+    "items": "item",
+    "actors": "actor",
+    "exits": "exit",
+    "parts": "part",
+}
+_SECTION_OF_KIND = {kind: section for section, kind in _SHARDED_SECTIONS.items()}
+
+
+def shards_path(json_path: Union[str, Path]) -> Path:
+    """Directory of the shards written from a game state JSON file."""
+    return Path(json_path).with_suffix(SHARDS_SUFFIX)
+
+
+def _records(data: Dict[str, Any], section: str) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    """(id, record) pairs of a game_state.json section."""
+    if section == "actors":
+        return data.get("actors", {}).items()
+    return ((record["id"], record) for record in data.get(section, []))
+
+
+def _assign_regions(data: Dict[str, Any], shard_actors: bool) -> Dict[Tuple[str, str], str]:
+    """
+    Region of every sharded entity in game state data.
+
+    A location's region is its "region" property. Items, exits and (with
+    shard_actors) actors belong to the region their location (followed
+    through containers, carriers and exit references) is in; parts to the
+    region of what they are part of. Entities that resolve to no region,
+    or to an actor kept in the core, stay in the core and are not in the
+    result.
+
+    Returns:
+        (section, entity id) -> region
+    """
+    location_region = {
+        location["id"]: location.get("properties", {}).get("region")
+        for location in data.get("locations", [])
+    }
+    parent: Dict[str, Any] = {}
+    for section in ("items", "actors", "exits"):
+        for entity_id, record in _records(data, section):
+            parent.setdefault(entity_id, record.get("location"))
+    core_actors = set(data.get("actors", {})) if not shard_actors else {_PLAYER_ID}
+
+    def region_of(entity_id: Any) -> Optional[str]:
+        seen = set()
+        while isinstance(entity_id, str) and entity_id not in seen:
+            if entity_id in location_region:
+                return location_region[entity_id]
+            if entity_id in core_actors:
+                return None
+            seen.add(entity_id)
+            entity_id = _exit_reference_location(entity_id) or parent.get(entity_id)
+        return None
+
+    regions: Dict[Tuple[str, str], str] = {}
+    for section in _SHARDED_SECTIONS:
+        for entity_id, record in _records(data, section):
+            if section == "locations":
+                region = location_region[entity_id]
+            elif section == "parts":
+                region = region_of(record.get("part_of"))
+            elif section == "actors" and not shard_actors:
+                continue
+            else:
+                region = region_of(entity_id)
+            if region:
+                regions[(section, entity_id)] = region
+    return regions
+
+
+def write_shards(data: Dict[str, Any], directory: Union[str, Path], shard_actors: bool = False) -> Dict[str, int]:
+    """
+    Split game state data into a manifest and one shard per region.
+
+    The data should have passed load_game_state (validation); shards are
+    not validated when loaded. Shard files left from an earlier split are
+    removed.
+
+    Actors, and what they carry, stay in the core by default: turn phases
+    (conditions, schedules, gossip) act on actors wherever they are, and
+    an actor in an unloaded region would not take part.
+
+    Args:
+        data: Game state in game_state.json format
+        directory: Directory to write (created if needed)
+        shard_actors: Also split actors (other than the player) by region,
+            for worlds whose actors only act near the player
+
+    Returns:
+        Number of entities per region
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    regions = _assign_regions(data, shard_actors)
+
+    core = {key: value for key, value in data.items() if key not in _SHARDED_SECTIONS}
+    shards: Dict[str, Dict[str, Any]] = {}
+    entities: Dict[str, List[Any]] = {}
+    connections: Dict[str, List[str]] = {}
+    for section, kind in _SHARDED_SECTIONS.items():
+        if section not in data:
+            continue
+        core_records: Any = {} if section == "actors" else []
+        for entity_id, record in _records(data, section):
+            region = regions.get((section, entity_id))
+            if region is None:
+                target = core_records
+            else:
+                target = shards.setdefault(region, {}).setdefault(section, {} if section == "actors" else [])
+                entities[entity_id] = [kind, region, record.get("location") if kind in LOCATED_KINDS else None]
+                if kind == "exit":
+                    connections[entity_id] = record.get("connections", [])
+            if section == "actors":
+                target[entity_id] = record
+            else:
+                target.append(record)
+        core[section] = core_records
+
+    files: Dict[str, str] = {}
+    for index, (region, shard) in enumerate(shards.items()):
+        files[region] = f"{index:03d}_{re.sub(r'[^A-Za-z0-9_-]', '_', region)}.json"
+        _write_atomic(directory / files[region], json.dumps(shard))
+    for stale in directory.glob("*.json"):
+        if stale.name != MANIFEST_FILE and stale.name not in files.values():
+            stale.unlink()
+    # Written last: its mtime dates the whole split (see load_fresh_shards)
+    _write_atomic(directory / MANIFEST_FILE, json.dumps({
+        "version": SHARD_FORMAT_VERSION,
+        "core": core,
+        "regions": files,
+        "entities": entities,
+        "connections": connections,
+    }))
+    counts = {region: 0 for region in files}
+    for _, region, _ in entities.values():
+        counts[region] += 1
+    return counts
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+class ShardedWorld:
+    """
+    The regions of a sharded world that a GameState has not loaded yet.
+
+    Held as GameState._shards; GameState and its registry call in when an
+    entity is missing. Keeps no reference to the state, so copies of the
+    state carry their own pending regions.
+    """
+
+    def __init__(self, directory: Path, regions: Dict[str, str], entities: Dict[str, List[Any]]):
+        self.directory = directory
+        # Region -> shard file, for regions not loaded yet
+        self.pending: Dict[str, str] = dict(regions)
+        # Entity id -> (kind, region) for entities of pending regions, in save order
+        self.entities: Dict[str, Tuple[str, str]] = {
+            entity_id: (kind, region) for entity_id, (kind, region, _) in entities.items()
+        }
+
+    def is_unloaded(self, kind: Optional[str], entity_id: str) -> bool:
+        """Whether entity_id (of kind, if given) is in a region not loaded yet."""
+        entry = self.entities.get(entity_id)
+        return entry is not None and (kind is None or entry[0] == kind)
+
+    def unloaded_ids(self, kind: str) -> List[str]:
+        """Ids of entities of a registry kind not loaded yet, in save order."""
+        return [entity_id for entity_id, (entity_kind, _) in self.entities.items() if entity_kind == kind]
+
+    def load_entities(self, state: GameState, kind: Optional[str], entity_ids: Iterable[str]) -> bool:
+        """
+        Load the regions holding any of entity_ids.
+
+        Args:
+            state: The GameState to load into
+            kind: Registry kind the ids must have, or None for any
+            entity_ids: Ids that were not found
+
+        Returns:
+            True if a region was loaded
+        """
+        regions = []
+        for entity_id in entity_ids:
+            entry = self.entities.get(entity_id)
+            if entry is not None and (kind is None or entry[0] == kind) and entry[1] not in regions:
+                regions.append(entry[1])
+        if not regions:
+            return False
+        self.load_regions(state, regions)
+        return True
+
+    def load_regions(self, state: GameState, regions: Optional[Iterable[str]] = None) -> None:
+        """Load regions (all pending regions when None) into state."""
+        names = list(self.pending) if regions is None else [r for r in regions if r in self.pending]
+        for region in names:
+            # Popped first, so lookups while its entities are added do not reload it
+            path = self.directory / self.pending.pop(region)
+            data = json.loads(path.read_text(encoding="utf-8"))
+            logger.debug(f"Loading region {region} from {path}")
+            for section in _SHARDED_SECTIONS:
+                for entity_id, _ in _records(data, section):
+                    self.entities.pop(entity_id, None)
+            state.locations.extend(_parse_location(raw) for raw in data.get("locations", []))
+            state.items.extend(_parse_item(raw) for raw in data.get("items", []))
+            for actor_id, raw in data.get("actors", {}).items():
+                state.actors[ActorId(actor_id)] = _parse_actor(raw, actor_id=actor_id)
+            state.exits.extend(_parse_exit_entity(raw) for raw in data.get("exits", []))
+            state.parts.extend(_parse_part(raw) for raw in data.get("parts", []))
+        if not self.pending and state._shards is self:
+            state._shards = None
+            state._entity_registry.set_loader(None)
+
+    def add_unloaded(self, result: Dict[str, Any]) -> None:
+        """Append the unloaded entities to a game_state_to_dict result, in save order."""
+        records: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for file in self.pending.values():
+            data = json.loads((self.directory / file).read_text(encoding="utf-8"))
+            for section in _SHARDED_SECTIONS:
+                if section in result:
+                    for entity_id, record in _records(data, section):
+                        records[(section, entity_id)] = record
+        for entity_id, (kind, _) in self.entities.items():
+            section = _SECTION_OF_KIND[kind]
+            unloaded = records.get((section, entity_id))
+            if unloaded is None:
+                continue
+            if section == "actors":
+                result[section][entity_id] = unloaded
+            else:
+                result[section].append(unloaded)
+
+
+def load_sharded_game_state(directory: Union[str, Path]) -> GameState:
+    """
+    Load a sharded world: the core now, each region on first access.
+
+    Args:
+        directory: Directory written by write_shards
+
+    Returns:
+        GameState with the core and the player's region loaded
+
+    Raises:
+        LoadError: If the manifest has an unsupported format version
+    """
+    directory = Path(directory)
+    manifest = json.loads((directory / MANIFEST_FILE).read_text(encoding="utf-8"))
+    if manifest.get("version") != SHARD_FORMAT_VERSION:
+        raise LoadError(f"{directory} has shard format {manifest.get('version')}, "
+                        f"expected {SHARD_FORMAT_VERSION}")
+
+    state = _build_game_state(manifest["core"])
+    entities = manifest["entities"]
+    world = ShardedWorld(directory, manifest["regions"], entities)
+
+    # The containment and connection indexes cover unloaded regions too
+    for entity_id, (kind, _, where) in entities.items():
+        if kind in LOCATED_KINDS:
+            state._place_entity(kind, entity_id, where)
+    state._connected_to = {exit_entity.id: set(exit_entity.connections) for exit_entity in state.exits}
+    state._connected_to.update((exit_id, set(ids)) for exit_id, ids in manifest["connections"].items())
+
+    if world.pending:
+        state._shards = world
+        state._entity_registry.set_loader(state._load_from_shards)
+        world.load_entities(state, None, (state.actors[ActorId(_PLAYER_ID)].location,))
+    return state
+
+
+def load_fresh_shards(json_path: Union[str, Path]) -> Optional[GameState]:
+    """
+    Load the shards of a JSON file in its place, if they are at least as new.
+
+    Args:
+        json_path: Path of a game_state.json file, or a shards directory
+
+    Returns:
+        The GameState, or None if the JSON file should be loaded
+    """
+    json_path = Path(json_path)
+    if (json_path / MANIFEST_FILE).is_file():
+        return load_sharded_game_state(json_path)
+    directory = shards_path(json_path)
+    try:
+        if (directory / MANIFEST_FILE).stat().st_mtime_ns < json_path.stat().st_mtime_ns:
+            return None
+    except OSError:
+        return None
+    return load_sharded_game_state(directory)
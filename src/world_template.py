@@ -0,0 +1,151 @@
+"""Parse-once world templates shared by many sessions of one game.
+
+load_game_state() parses game_state.json and builds every entity and index
+from scratch. When one process hosts many players of the same game,
+WorldTemplate does that work once:
+
+- The game is parsed a single time and kept only as a pickled snapshot, so
+  the template itself can never be mutated by a session.
+- Authored narration content that play never changes (every entity's
+  llm_context: traits, state/action fragments, perspective variants) is
+  frozen and shared by reference between all sessions instead of being
+  copied per session.
+- new_state() rebuilds a private GameState from the snapshot at C pickle
+  speed; all other entity data is per-session and freely mutable.
+
+Shared content is read-only (FrozenDict/FrozenList raise TypeError on
+mutation); replacing it is copy-on-write per session, e.g.
+``entity.llm_context = {...}`` only affects that session's entity.
+
+Usage:
+    template = WorldTemplate("examples/big_game/game_state.json")
+    engines = [GameEngine("examples/big_game", template=template) for _ in range(100)]
+"""
+
+import io
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
+
+from src.state_manager import GameState, load_game_state
+
+
+class FrozenDict(dict):
+    """Read-only dict for content shared between sessions."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Shared world template content is read-only; assign a new value instead")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list for content shared between sessions."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Shared world template content is read-only; assign a new value instead")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists in value to FrozenDict/FrozenList."""
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def _entities(state: GameState) -> List[Any]:
+    entities: List[Any] = []
+    for collection in (state.locations, state.items, state.locks, state.parts, state.exits):
+        entities.extend(collection)
+    entities.extend(state.actors.values())
+    return entities
+
+
+class _SharingPickler(pickle.Pickler):
+    """Pickler that writes shared objects as references into the template."""
+
+    def __init__(self, file: io.BytesIO, shared_index: Dict[int, int]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared_index = shared_index
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        return self._shared_index.get(id(obj))
+
+
+class _SharingUnpickler(pickle.Unpickler):
+    """Unpickler that resolves shared references to the template's objects."""
+
+    def __init__(self, data: bytes, shared: List[Any]):
+        super().__init__(io.BytesIO(data))
+        self._shared = shared
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._shared[pid]
+
+
+class WorldTemplate:
+    """
+    A game parsed once, from which sessions get private GameStates.
+
+    Args:
+        source: Path to game_state.json (or a dict, as for load_game_state)
+
+    Raises:
+        Same as load_game_state for invalid game files
+    """
+
+    def __init__(self, source: Union[str, Path, Dict[str, Any]]):
+        state = load_game_state(source)
+        self.source = source
+
+        # Freeze authored narration content and share it across sessions
+        shared: List[Any] = []
+        for entity in _entities(state):
+            properties = getattr(entity, "properties", None)
+            if isinstance(properties, dict) and isinstance(properties.get("llm_context"), dict):
+                frozen = freeze(properties["llm_context"])
+                properties["llm_context"] = frozen
+                shared.append(frozen)
+        self._shared = shared
+
+        buffer = io.BytesIO()
+        _SharingPickler(buffer, {id(obj): i for i, obj in enumerate(shared)}).dump(state)
+        self._snapshot = buffer.getvalue()
+
+        # Behavior module list discovered by GameEngine for this game (cached there)
+        self.behavior_modules: Optional[List[Tuple[str, int]]] = None
+
+    @property
+    def snapshot_size(self) -> int:
+        """Size in bytes of the per-session part of the template."""
+        return len(self._snapshot)
+
+    def new_state(self) -> GameState:
+        """Create a private, mutable GameState for one session."""
+        state: GameState = _SharingUnpickler(self._snapshot, self._shared).load()
+        return state
@@ -2,7 +2,8 @@
 """MLX-powered text adventure with LLM command parsing and narration.
 
 This front end (xplm-game = "eXtended Parser + LLM + MLX") uses:
-- LLM parser (via MLX) to parse natural language commands
+- Local parser for commands it recognizes, LLM parser (via MLX) for the rest
+  (see src/turn_pipeline.py)
 - MLX narrator to generate narration
 - Shared MLX backend for both parser and narrator (memory efficient)
 """
@@ -43,9 +44,10 @@ if __name__ == '__main__':
         sys.path.insert(0, str(project_root))
 
 from src.game_engine import GameEngine
+from src.phrase_cache import PhraseCache
+from src.prompt_kv_store import PromptKVStore
 from src.shared_mlx import SharedMLXBackend
-from src.command_utils import parsed_to_json
-import json
+from src.turn_pipeline import TurnPipeline
 
 
 def resolve_model(model: str) -> str:
@@ -77,7 +79,8 @@ def main(game_dir: str | None = None,
          show_traits: bool = False,
          model: str = DEFAULT_MODEL_PRESET,
          temperature: float = 0.8,
-         max_tokens: int = 300) -> int:
+         max_tokens: int = 300,
+         prompt_kv_cache: bool = True) -> int:
     """Run the MLX-powered text adventure with LLM command parsing.
 
     Args:
@@ -87,6 +90,7 @@ def main(game_dir: str | None = None,
         model: Model preset name or full MLX model path
         temperature: Temperature for generation (0.0-2.0)
         max_tokens: Max tokens to generate
+        prompt_kv_cache: If True, reuse warmed system prompt caches saved by earlier runs
 
     Returns:
         Exit code (0 for success, non-zero for error)
@@ -124,7 +128,7 @@ def main(game_dir: str | None = None,
     # Create shared MLX backend (used by both parser and narrator)
     print(f"Loading MLX model: {model}")
     print("(This may take a moment on first run as the model downloads...)")
-    shared_backend = SharedMLXBackend(model)
+    shared_backend = SharedMLXBackend(model, kv_store=PromptKVStore() if prompt_kv_cache else None)
 
     # Create LLM parser and adapter using shared backend
     parser, adapter = engine.create_llm_parser(shared_backend)
@@ -150,6 +154,8 @@ def main(game_dir: str | None = None,
     opening = narrator.get_opening()
     print(opening)
 
+    pipeline = TurnPipeline(engine, narrator, parser, adapter, phrase_cache=PhraseCache())
+
     # Game loop
     print("\n(Type 'quit' to exit)")
 
@@ -164,58 +170,27 @@ def main(game_dir: str | None = None,
                 print("\nThanks for playing!")
                 break
 
-            # Build context for LLM parser
-            context = engine.build_parser_context()
-            logging.debug(f"Context: {context}")
-
-            # Parse command using LLM parser
-            parser_output = parser.parse_command(player_input, context)
-            logging.debug(f"Parser output: {parser_output}")
-
-            # Convert to ParsedCommand
-            parsed_command = adapter.to_parsed_command(parser_output, player_input)
+            # Local parse first; the LLM parse (when needed) overlaps with
+            # narrator preparation
+            stream = pipeline.run_turn_stream(player_input)
 
-            if parsed_command is None:
+            if stream is None:
                 print("\nI couldn't understand that command. Try rephrasing?")
                 continue
 
-            # Convert ParsedCommand to JSON message format
-            json_cmd = parsed_to_json(parsed_command)
-            logging.debug(f"Parsed command: {parsed_command}")
-            logging.debug(f"JSON command: {json_cmd}")
-
-            # Execute command via game engine
-            # Multi-item take is now handled inside the protocol handler
-            result = engine.json_handler.handle_message(json_cmd)
-            logging.debug(f"Result keys: {result.keys()}")
-            logging.debug(f"Result success: {result.get('success')}")
-            logging.debug(f"Result verbosity: {result.get('verbosity')}")
-            if 'narration' in result:
-                logging.debug(f"Narration keys: {result['narration'].keys()}")
-
-            # Print traits if enabled
-            if show_traits:
-                narrator._print_traits(result)
-
-            # Build narration dict from result
-            narration_dict = {
-                "success": result.get("success", True),
-                "verbosity": result.get("verbosity", "full"),
-            }
-            if "narration" in result:
-                narration_dict.update(result["narration"])
-
-            logging.debug(f"Narration dict: {json.dumps(narration_dict, indent=2)}")
-
-            # Get narrative from LLM
-            narration_input = f"Narrate this result:\n{json.dumps(narration_dict, indent=2)}"
-            narrative = narrator._call_llm(narration_input)
-            print(f"\n{narrative}")
+            print()
+            for chunk in stream:
+                print(chunk, end="", flush=True)
+            print()
 
         except KeyboardInterrupt:
             print("\n\nGoodbye!")
             break
 
+    pipeline.close()
+    logging.debug(f"Parses: {pipeline.stats}")
+    if pipeline.phrase_cache is not None:
+        logging.debug(f"Phrase cache: {pipeline.phrase_cache.stats()}")
     return 0
 
 
@@ -243,6 +218,8 @@ def cli_main() -> None:
                         help='Temperature for generation (default: 0.8)')
     parser.add_argument('--max-tokens', type=int, default=300,
                         help='Max tokens to generate (default: 300)')
+    parser.add_argument('--no-prompt-kv-cache', action='store_true',
+                        help='Always prefill system prompts instead of loading them from disk')
     args = parser.parse_args()
 
     # Handle --list-models
@@ -266,7 +243,8 @@ def cli_main() -> None:
         show_traits=args.show_traits,
         model=args.model,
         temperature=args.temperature,
-        max_tokens=args.max_tokens
+        max_tokens=args.max_tokens,
+        prompt_kv_cache=not args.no_prompt_kv_cache
     ))
 
 
@@ -199,6 +199,58 @@ class TestPerformance(unittest.TestCase):
                        f"Synonym lookup ({synonym_time_ms:.3f}ms) and main word lookup "
                        f"({main_time_ms:.3f}ms) have significantly different speeds")
 
+    def test_generated_50k_noun_vocabulary(self):
+        """
+        Test PF-007: Parse speed with 50,000 nouns and 10,000 synonyms.
+
+        Pattern matching is a single pass over the compiled grammar, so
+        per-parse time must not grow with vocabulary size.
+        """
+        vocab = {
+            "verbs": [
+                {"word": "take", "synonyms": ["get", "grab"], "object_required": True},
+                {"word": "put", "synonyms": ["place"], "object_required": True},
+                {"word": "look", "synonyms": [], "object_required": "optional"},
+            ],
+            "nouns": [
+                {"word": f"noun{i}", "synonyms": [f"syn{i}"] if i % 5 == 0 else []}
+                for i in range(50000)
+            ],
+            "adjectives": [{"word": f"adj{i}", "synonyms": []} for i in range(100)],
+            "prepositions": ["in", "on", "with"],
+            "articles": ["the", "a", "an"],
+        }
+
+        start_time = time.perf_counter()
+        parser = Parser.from_vocab(vocab)
+        build_ms = (time.perf_counter() - start_time) * 1000
+        self.assertLess(build_ms, 5000.0, f"Building parser took {build_ms:.1f}ms")
+
+        commands = [
+            "take noun49999",
+            "grab the adj7 syn45000",
+            "put noun12 in the adj3 adj4 noun40000",
+            "place syn5 on noun7 noun8",
+            "look",
+        ]
+        for command in commands:
+            self.assertIsNotNone(parser.parse_command(command), command)
+        result = parser.parse_command("put noun12 in the adj3 adj4 noun40000")
+        self.assertEqual(result.indirect_object.word, "noun40000")
+        self.assertEqual(result.indirect_adjective.word, "adj3 adj4")
+
+        iterations = 2000
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            for command in commands:
+                parser.parse_command(command)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        avg_time_us = elapsed_ms * 1000 / (iterations * len(commands))
+
+        # Relaxed from ~15μs for safety on slow systems
+        self.assertLess(avg_time_us, 200.0,
+                       f"Average parse took {avg_time_us:.3f}μs, should be < 200μs")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,13 +8,17 @@ import sys
 from pathlib import Path
 from dataclasses import field
 from typing import Any, Dict, List, Optional
-from src.state_manager import GameState, Item, Location, Actor, Metadata, load_game_state
+from src.state_manager import GameState, Item, Location, Actor, Metadata, load_game_state, set_core_field_checking
 from src.behavior_manager import BehaviorManager
 from src.state_accessor import StateAccessor
 from src.word_entry import WordEntry, WordType
 from src.types import ActorId, ItemId, LocationId
 
 
+# Tests run with write-time core field checks on properties dicts (a debug mode in play)
+set_core_field_checking(True)
+
+
 # Automatic module cleanup for all test modules
 # This function will be injected into every test module's namespace
 def _cleanup_test_module():
@@ -1,14 +1,19 @@
 """Mock LLM narrator for testing.
 
 This module provides a MockLLMNarrator that bypasses actual LLM API calls,
-returning predetermined responses for testing narrator logic.
+returning predetermined responses for testing narrator logic, and a
+FakeAnthropicClient for exercising LLMNarrator's streaming API code offline.
 """
 
-from typing import Dict, Any, Optional
+import re
+from types import SimpleNamespace
+from typing import Dict, Any, Iterator, List, Optional
 
 from src.llm_narrator import LLMNarrator
 from src.llm_protocol import LLMProtocolHandler
 from src.behavior_manager import BehaviorManager
+from src.narration_cache import NarrationCache
+from src.phrase_cache import PhraseCache
 
 
 class MockLLMNarrator(LLMNarrator):
@@ -25,7 +30,9 @@ class MockLLMNarrator(LLMNarrator):
     def __init__(self, json_handler: LLMProtocolHandler, responses: list,
                  behavior_manager: Optional[BehaviorManager] = None,
                  vocabulary: Optional[Dict[str, Any]] = None,
-                 show_traits: bool = False):
+                 show_traits: bool = False,
+                 narration_cache: Optional[NarrationCache] = None,
+                 phrase_cache: Optional[PhraseCache] = None):
         """Initialize mock narrator.
 
         Args:
@@ -34,18 +41,26 @@ class MockLLMNarrator(LLMNarrator):
             behavior_manager: Optional BehaviorManager to get merged vocabulary
             vocabulary: Optional merged vocabulary dict (if not provided, loads default)
             show_traits: If True, print llm_context traits before each LLM narration
+            narration_cache: Optional NarrationCache reused for repeated narration plans
+            phrase_cache: Optional PhraseCache of LLM parses for input the local parser rejects
         """
         self.handler = json_handler
         self.responses = responses
         self.call_count = 0
         self.system_prompt = ""  # Not used in mock
         self.calls: list[str] = []  # Track calls for testing
+        self.prepare_count = 0
         self.behavior_manager = behavior_manager
         self.show_traits = show_traits
+        self.narration_cache = narration_cache
+        self.phrase_cache = phrase_cache
+        self.abbreviate_fields = False
 
         # Store merged vocabulary for parser
         self.merged_vocabulary = self._get_merged_vocabulary(vocabulary)
         self.parser = self._create_parser(self.merged_vocabulary)
+        if phrase_cache is not None:
+            phrase_cache.set_vocabulary(self.merged_vocabulary)
 
     @property
     def visited_locations(self) -> set:
@@ -70,3 +85,64 @@ class MockLLMNarrator(LLMNarrator):
         response = self.responses[self.call_count % len(self.responses)]
         self.call_count += 1
         return response
+
+    def prepare_narration(self) -> None:
+        """Count preparations instead of warming the API prompt cache."""
+        self.prepare_count += 1
+
+    def _stream_llm(self, user_message: str) -> Iterator[str]:
+        """Return mock response in word-sized chunks, as a streaming API would.
+
+        Args:
+            user_message: The message that would be sent
+
+        Returns:
+            Iterator over chunks of the next response
+        """
+        return iter(split_chunks(self._call_llm(user_message)))
+
+
+def split_chunks(text: str) -> List[str]:
+    """Split text into word-sized chunks that join back to the original."""
+    return re.findall(r'\s*\S+\s*|\s+', text)
+
+
+class FakeAnthropicClient:
+    """Stands in for anthropic.Anthropic with scripted messages.stream()/create().
+
+    Each call answers with the next response (stream() replays it as
+    word-sized text events) and records the request arguments in requests.
+    """
+
+    def __init__(self, responses: list):
+        self.responses = responses
+        self.requests: list[Dict[str, Any]] = []
+        self.messages = self
+
+    def stream(self, **kwargs: Any) -> "_FakeMessageStream":
+        response = self.responses[len(self.requests) % len(self.responses)]
+        self.requests.append(kwargs)
+        return _FakeMessageStream(split_chunks(response))
+
+    def create(self, **kwargs: Any) -> SimpleNamespace:
+        response = self.responses[len(self.requests) % len(self.responses)]
+        self.requests.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=response)],
+                               usage=SimpleNamespace(input_tokens=0, output_tokens=1))
+
+
+class _FakeMessageStream:
+    """Context manager mimicking anthropic's MessageStream."""
+
+    def __init__(self, chunks: List[str]):
+        self.text_stream = iter(chunks)
+        self._output_tokens = len(chunks)
+
+    def __enter__(self) -> "_FakeMessageStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def get_final_message(self) -> SimpleNamespace:
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=0, output_tokens=self._output_tokens))
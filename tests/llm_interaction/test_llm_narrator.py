@@ -18,7 +18,7 @@ from src.llm_protocol import LLMProtocolHandler
 from src.llm_narrator import LLMNarrator
 from src.command_utils import parsed_to_json
 from src.behavior_manager import BehaviorManager
-from tests.llm_interaction.mock_narrator import MockLLMNarrator
+from tests.llm_interaction.mock_narrator import FakeAnthropicClient, MockLLMNarrator
 from src.state_accessor import StateAccessor
 
 
@@ -543,7 +543,7 @@ class TestVerbosityTracking(unittest.TestCase):
 
         # Check that the narration request includes full verbosity
         narrate_call = narrator.calls[-1]  # Last call is narration
-        self.assertIn('"verbosity": "full"', narrate_call)
+        self.assertIn('"verbosity":"full"', narrate_call)
 
     def test_second_room_entry_uses_brief_verbosity(self):
         """Test that returning to a visited room uses brief verbosity."""
@@ -568,7 +568,7 @@ class TestVerbosityTracking(unittest.TestCase):
         narrator.process_turn("go south")
 
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "brief"', narrate_call)
+        self.assertIn('"verbosity":"brief"', narrate_call)
 
     def test_first_examine_uses_full_verbosity(self):
         """Test that first examine of an entity uses full verbosity."""
@@ -583,7 +583,7 @@ class TestVerbosityTracking(unittest.TestCase):
         narrator.process_turn("examine sword")
 
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "full"', narrate_call)
+        self.assertIn('"verbosity":"full"', narrate_call)
 
     def test_second_examine_uses_brief_verbosity(self):
         """Test that re-examining an entity uses brief verbosity."""
@@ -603,7 +603,7 @@ class TestVerbosityTracking(unittest.TestCase):
         narrator.process_turn("examine sword")
 
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "brief"', narrate_call)
+        self.assertIn('"verbosity":"brief"', narrate_call)
 
     def test_take_uses_tracking_verbosity(self):
         """Test that take uses tracking mode - full on first occurrence."""
@@ -624,7 +624,7 @@ class TestVerbosityTracking(unittest.TestCase):
 
         # First take should use full verbosity (tracking mode)
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "full"', narrate_call)
+        self.assertIn('"verbosity":"full"', narrate_call)
 
     def test_drop_always_uses_brief_verbosity(self):
         """Test that drop actions always use brief verbosity."""
@@ -645,7 +645,7 @@ class TestVerbosityTracking(unittest.TestCase):
         narrator.process_turn("drop sword")
 
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "brief"', narrate_call)
+        self.assertIn('"verbosity":"brief"', narrate_call)
 
     def test_open_uses_tracking_close_uses_brief(self):
         """Test that open uses tracking (full on first) and close uses brief."""
@@ -667,12 +667,12 @@ class TestVerbosityTracking(unittest.TestCase):
         # Open should use full verbosity (tracking mode, first occurrence)
         narrator.process_turn("open door")
         open_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "full"', open_call)
+        self.assertIn('"verbosity":"full"', open_call)
 
         # Close should use brief verbosity
         narrator.process_turn("close door")
         close_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "brief"', close_call)
+        self.assertIn('"verbosity":"brief"', close_call)
 
     def test_opening_scene_queries_location(self):
         """Test that get_opening queries the starting location.
@@ -795,7 +795,7 @@ class TestNarrationMode(unittest.TestCase):
 
         # Check narration call includes brief verbosity
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "brief"', narrate_call)
+        self.assertIn('"verbosity":"brief"', narrate_call)
 
     def test_brief_mode_verbs_dont_track(self):
         """Test that brief mode verbs don't add to tracking sets."""
@@ -837,7 +837,7 @@ class TestNarrationMode(unittest.TestCase):
 
         # First take of sword should use full verbosity
         narrate_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "full"', narrate_call)
+        self.assertIn('"verbosity":"full"', narrate_call)
 
     def test_tracking_mode_subsequent_occurrence_brief(self):
         """Test that tracking mode verbs use brief verbosity on subsequent occurrences."""
@@ -862,12 +862,12 @@ class TestNarrationMode(unittest.TestCase):
         # First examine
         narrator.process_turn("examine sword")
         first_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "full"', first_call)
+        self.assertIn('"verbosity":"full"', first_call)
 
         # Second examine
         narrator.process_turn("examine sword")
         second_call = narrator.calls[-1]
-        self.assertIn('"verbosity": "brief"', second_call)
+        self.assertIn('"verbosity":"brief"', second_call)
 
 
 class TestSystemPrompt(unittest.TestCase):
@@ -999,5 +999,88 @@ class TestMergedVocabulary(unittest.TestCase):
                             "Verb 'open' should not be duplicated")
 
 
+class TestProcessTurnStream(unittest.TestCase):
+    """Test streaming narration with process_turn_stream."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        fixture_path = Path(__file__).parent / "fixtures" / "test_game_state.json"
+        self.game_state = load_game_state(str(fixture_path))
+        self.behavior_manager = BehaviorManager()
+        self.accessor = StateAccessor(self.game_state, self.behavior_manager)
+        self.handler = LLMProtocolHandler(self.game_state)
+        self.accessor.set_entity_where("player", "loc_start")
+
+    def test_command_executes_before_narration_is_consumed(self):
+        """Test the engine turn has completed when the stream is returned."""
+        responses = [
+            '{"type": "command", "action": {"verb": "go", "object": "north"}}',
+            "You step through the doorway into the hallway."
+        ]
+        narrator = MockLLMNarrator(self.handler, responses)
+        start_location = self.game_state.get_actor(ActorId("player")).location
+
+        stream = narrator.process_turn_stream("go north")
+
+        self.assertNotEqual(self.game_state.get_actor(ActorId("player")).location, start_location)
+        self.assertEqual(narrator.call_count, 2)
+        chunks = list(stream)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), "You step through the doorway into the hallway.")
+
+    def test_process_turn_joins_stream(self):
+        """Test process_turn returns the whole streamed narrative."""
+        responses = [
+            '{"type": "command", "action": {"verb": "go", "object": "north"}}',
+            "You step through the doorway into the hallway."
+        ]
+        narrator = MockLLMNarrator(self.handler, responses)
+
+        self.assertEqual(narrator.process_turn("go north"),
+                         "You step through the doorway into the hallway.")
+
+    def test_unparseable_input_streams_error_message(self):
+        """Test input the LLM can't turn into a command yields one message."""
+        narrator = MockLLMNarrator(self.handler, ["I'm not sure what you mean by that."])
+
+        chunks = list(narrator.process_turn_stream("xyzzy plugh"))
+
+        self.assertEqual(chunks, ["I don't understand what you want to do."])
+        self.assertEqual(narrator.call_count, 1)
+
+    def test_stream_llm_uses_streaming_api(self):
+        """Test LLMNarrator._stream_llm against a fake streaming client."""
+        narrator = LLMNarrator.__new__(LLMNarrator)
+        narrator.client = FakeAnthropicClient(["The lantern flickers to life."])
+        narrator.model = "fake-model"
+        narrator.system_prompt = "You are a narrator."
+
+        chunks = list(narrator._stream_llm("Narrate this result: {}"))
+
+        self.assertEqual(chunks, ["The ", "lantern ", "flickers ", "to ", "life."])
+        request = narrator.client.requests[0]
+        self.assertEqual(request["system"][0]["text"], "You are a narrator.")
+        self.assertEqual(request["system"][0]["cache_control"], {"type": "ephemeral"})
+        self.assertEqual(request["messages"], [{"role": "user", "content": "Narrate this result: {}"}])
+
+    def test_prepare_narration_refreshes_stale_prompt_cache(self):
+        """Test prepare_narration re-creates the prompt cache only when it may have expired."""
+        narrator = LLMNarrator.__new__(LLMNarrator)
+        narrator.client = FakeAnthropicClient(["OK"])
+        narrator.model = "fake-model"
+        narrator.system_prompt = "You are a narrator."
+
+        narrator.prepare_narration()
+        self.assertEqual(len(narrator.client.requests), 1)
+        request = narrator.client.requests[0]
+        self.assertEqual(request["max_tokens"], 1)
+        self.assertEqual(request["system"][0]["cache_control"], {"type": "ephemeral"})
+
+        # Cache was just used; nothing to refresh
+        list(narrator._stream_llm("Narrate this result: {}"))
+        narrator.prepare_narration()
+        self.assertEqual(len(narrator.client.requests), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -391,5 +391,31 @@ class TestMLXMergedVocabulary(unittest.TestCase):
         self.assertIn("close", vocab_section.lower())
 
 
+class TestMLXStripStream(unittest.TestCase):
+    """Test whitespace stripping of streamed MLX output."""
+
+    def test_matches_stripping_joined_text(self):
+        """Test streamed chunks join to the same text as strip()."""
+        from src.mlx_narrator import strip_stream
+
+        for chunks in (["  You", " see ", "\n", "a door.  "], ["\n", "Dark.", " "], ["a", "b"]):
+            self.assertEqual("".join(strip_stream(chunks)), "".join(chunks).strip())
+
+    def test_text_is_yielded_before_stream_ends(self):
+        """Test stripping doesn't wait for the whole response."""
+        from src.mlx_narrator import strip_stream
+
+        stream = strip_stream(iter([" The", " cave", " is", " dark."]))
+        self.assertEqual(next(stream), "The")
+        self.assertEqual(next(stream), " cave")
+
+    def test_empty_stream_yields_placeholder(self):
+        """Test a response with no output yields the placeholder text."""
+        from src.mlx_narrator import strip_stream
+
+        self.assertEqual(list(strip_stream([], empty="[No response from model]")),
+                         ["[No response from model]"])
+
+
 if __name__ == "__main__":
     unittest.main()
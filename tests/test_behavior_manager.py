@@ -13,8 +13,7 @@ sys.path.insert(0, str(project_root))
 
 from src.behavior_manager import (
     BehaviorManager,
-    EventResult,
-    get_behavior_manager
+    EventResult
 )
 from src.state_accessor import IGNORE_EVENT
 
@@ -336,6 +335,77 @@ class TestBehaviorManagerInvokeBehavior(unittest.TestCase):
         self.assertEqual(result, IGNORE_EVENT)
 
 
+class TestBehaviorManagerDispatch(unittest.TestCase):
+    """Tests for the compiled (behaviors, event) dispatch tables."""
+
+    def _load(self, manager, name, **handlers):
+        module = MagicMock(spec=["vocabulary", *handlers])
+        module.vocabulary = {}
+        for event_name, handler in handlers.items():
+            setattr(module, event_name, handler)
+        with patch('importlib.import_module', return_value=module):
+            manager.load_module(name)
+        return module
+
+    def test_dispatch_compiled_once_per_behaviors(self):
+        """Repeat invocations reuse the compiled handler list."""
+        manager = BehaviorManager()
+        handler = Mock(return_value=EventResult(allow=True, feedback="a"))
+        self._load(manager, "mod_a", on_poke=handler)
+        entity = Mock()
+        entity.behaviors = ["mod_a"]
+
+        manager.invoke_behavior(entity, "on_poke", Mock(), {})
+        compiled = manager._dispatch[(("mod_a",), "on_poke")]
+        manager.invoke_behavior(entity, "on_poke", Mock(), {})
+
+        self.assertIs(manager._dispatch[(("mod_a",), "on_poke")], compiled)
+        self.assertEqual(handler.call_count, 2)
+
+    def test_changed_behaviors_list_uses_new_handlers(self):
+        """Adding a module to an entity's behaviors picks up its handler."""
+        manager = BehaviorManager()
+        handler_a = Mock(return_value=EventResult(allow=True, feedback="a"))
+        handler_b = Mock(return_value=EventResult(allow=True, feedback="b"))
+        self._load(manager, "mod_a", on_poke=handler_a)
+        self._load(manager, "mod_b", on_poke=handler_b)
+        entity = Mock()
+        entity.behaviors = ["mod_a"]
+
+        self.assertEqual(manager.invoke_behavior(entity, "on_poke", Mock(), {}).feedback, "a")
+        entity.behaviors.append("mod_b")
+        self.assertEqual(manager.invoke_behavior(entity, "on_poke", Mock(), {}).feedback, "a\nb")
+
+    def test_load_module_invalidates_dispatch(self):
+        """Loading a module drops compiled entries that may now be stale."""
+        manager = BehaviorManager()
+        entity = Mock()
+        entity.behaviors = ["mod_a"]
+        entity.id = "thing"
+
+        self.assertEqual(manager.invoke_behavior(entity, "on_poke", Mock(), {}), IGNORE_EVENT)
+        handler = Mock(return_value=EventResult(allow=False, feedback="no"))
+        self._load(manager, "mod_a", on_poke=handler)
+
+        self.assertFalse(manager.invoke_behavior(entity, "on_poke", Mock(), {}).allow)
+
+    def test_compile_dispatch_precompiles_entity_behaviors(self):
+        """compile_dispatch fills the table for every entity behaviors list."""
+        from src.state_manager import GameState, Item, Metadata
+        from src.behavior_manager import EventInfo
+        manager = BehaviorManager()
+        handler = Mock(return_value=EventResult(allow=True))
+        self._load(manager, "mod_a", on_poke=handler)
+        manager._event_registry["on_poke"] = EventInfo(event_name="on_poke", registered_by=["mod_a"])
+        item = Item(id="rock", name="rock", description="A rock", location="room", behaviors=["mod_a"])
+        state = GameState(metadata=Metadata(title="Test"), items=[item])
+
+        manager.compile_dispatch(state)
+
+        self.assertEqual(manager._dispatch[(("mod_a",), "on_poke")], (("mod_a.on_poke", handler),))
+        self.assertEqual(manager._global_dispatch["on_poke"], (("mod_a.on_poke", handler),))
+
+
 class TestBehaviorManagerVocabulary(unittest.TestCase):
     """Tests for vocabulary merging."""
 
@@ -581,19 +651,18 @@ class TestBehaviorManagerDiscovery(unittest.TestCase):
         self.assertEqual(modules, [])
 
 
-class TestGetBehaviorManager(unittest.TestCase):
-    """Tests for global behavior manager instance."""
+class TestBehaviorManagerInstances(unittest.TestCase):
+    """BehaviorManager has no process-wide instance; each session owns one."""
 
-    def test_get_behavior_manager_returns_instance(self):
-        """Test that get_behavior_manager returns a BehaviorManager."""
-        manager = get_behavior_manager()
-        self.assertIsInstance(manager, BehaviorManager)
+    def test_no_global_instance(self):
+        import src.behavior_manager as behavior_manager_module
+        self.assertFalse(hasattr(behavior_manager_module, "get_behavior_manager"))
 
-    def test_get_behavior_manager_singleton(self):
-        """Test that get_behavior_manager returns same instance."""
-        manager1 = get_behavior_manager()
-        manager2 = get_behavior_manager()
-        self.assertIs(manager1, manager2)
+    def test_instances_are_independent(self):
+        manager1 = BehaviorManager()
+        manager2 = BehaviorManager()
+        manager1._handlers["take"] = []
+        self.assertNotIn("take", manager2._handlers)
 
 
 class TestBehaviorManagerIntegration(unittest.TestCase):
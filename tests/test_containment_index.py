@@ -275,5 +275,50 @@ class TestContainmentIndex(unittest.TestCase):
         self.assertEqual(self.game_state._entity_where["sword"], "player")
 
 
+    def test_index_maintained_without_rebuild(self):
+        """Index is populated at construction, no explicit build needed."""
+        self.assertIn("sword", self.game_state._entities_at["loc_cave"])
+        self.assertEqual(self.game_state._entity_where["npc_guard"], "loc_forest")
+        self.game_state.check_registry()
+
+    def test_direct_location_assignment_updates_index(self):
+        """Assigning entity.location (as update() does) keeps the index current."""
+        sword = self.game_state.get_item(ItemId("sword"))
+        sword.location = "player"
+        self.assertNotIn("sword", self.game_state._entities_at["loc_cave"])
+        self.assertEqual(self.game_state._entity_where["sword"], "player")
+
+        self.accessor.update(sword, {"location": "loc_forest"})
+        items = self.accessor.get_entities_at("loc_forest", entity_type="item")
+        self.assertEqual([i.id for i in items], ["sword"])
+        self.game_state.check_registry()
+
+    def test_added_and_removed_entities_update_index(self):
+        """Appending/removing items keeps the index in step."""
+        torch = Item(id=ItemId("torch"), name="torch", description="A torch", location="loc_forest")
+        self.game_state.items.append(torch)
+        self.assertIn(torch, self.accessor.get_entities_at("loc_forest"))
+
+        self.game_state.items.remove(torch)
+        self.assertNotIn("torch", self.game_state._entity_where)
+        self.assertEqual(self.accessor.get_entities_at("loc_forest", entity_type="item"), [])
+        # A detached entity no longer affects the index
+        torch.location = "loc_cave"
+        self.assertNotIn("torch", self.game_state._entities_at["loc_cave"])
+        self.game_state.check_registry()
+
+    def test_kind_buckets_separate_entity_types(self):
+        """entity_type filtering reads only the matching bucket."""
+        buckets = self.game_state._entities_at_by_kind["loc_cave"]
+        self.assertEqual(set(buckets["item"]), {"sword", "shield"})
+        self.assertEqual(set(buckets["actor"]), {"player"})
+        self.assertEqual(self.accessor.get_entities_at("loc_cave", entity_type="exit"), [])
+
+    def test_get_entities_at_preserves_insertion_order(self):
+        """Results come back in a stable order."""
+        items = self.accessor.get_entities_at("loc_cave", entity_type="item")
+        self.assertEqual([i.id for i in items], ["sword", "shield"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,11 +6,22 @@ CoreFieldProtectingDict prevents accidental modification of core entity fields
 be modified via direct attribute access.
 """
 
+import copy
+import pickle
 import unittest
-from src.state_manager import Actor, Item, Location, Part, CoreFieldProtectingDict
+from src.state_manager import (
+    Actor, Item, Location, Part, CoreFieldProtectingDict, _PackedPropertiesDict, load_game_state,
+    set_core_field_checking
+)
+from src.state_accessor import StateAccessor
 from src.types import ActorId, ItemId, LocationId, PartId
 
 
+def setUpModule():
+    # Write-time checks are a debug mode; these tests exercise it
+    set_core_field_checking(True)
+
+
 class TestCoreFieldProtectingDict(unittest.TestCase):
     """Test CoreFieldProtectingDict behavior directly."""
 
@@ -144,5 +155,123 @@ class TestPartCoreFieldProtection(unittest.TestCase):
         expected_core_fields = {'id', 'name', 'part_of', 'behaviors'}
 
 
+def _load_with_llm_context():
+    return load_game_state({
+        "metadata": {"title": "Test", "start_location": "room"},
+        "locations": [{"id": "room", "name": "Room", "description": "A room"}],
+        "items": [{
+            "id": "lamp", "name": "lamp", "description": "A lamp", "location": "room",
+            "properties": {"portable": True, "llm_context": {"traits": ["brass", "dented"]}}
+        }],
+        "actors": {"player": {"id": "player", "name": "Adventurer", "description": "You", "location": "room"}}
+    })
+
+
+class TestPackedLlmContext(unittest.TestCase):
+    """Loaded entities keep llm_context packed until it is first read."""
+
+    def setUp(self):
+        self.state = _load_with_llm_context()
+        self.lamp = self.state.get_item("lamp")
+
+    def test_llm_context_packed_after_load(self):
+        """Loading should not decode llm_context."""
+        self.assertIs(type(self.lamp.properties), _PackedPropertiesDict)
+        self.assertIn('llm_context', self.lamp.properties)
+        self.assertTrue(self.lamp.properties['portable'])
+        self.assertIs(type(self.lamp.properties), _PackedPropertiesDict)
+
+    def test_get_unpacks(self):
+        """Reading llm_context should decode it once and drop the packed form."""
+        self.assertEqual(self.lamp.properties.get('llm_context'), {"traits": ["brass", "dented"]})
+        self.assertIs(type(self.lamp.properties), CoreFieldProtectingDict)
+        self.assertIs(self.lamp.llm_context, self.lamp.properties['llm_context'])
+
+    def test_subscript_unpacks(self):
+        """Subscript access should decode llm_context via __missing__."""
+        self.assertEqual(self.lamp.properties['llm_context']['traits'], ["brass", "dented"])
+        with self.assertRaises(KeyError):
+            self.lamp.properties['missing']
+
+    def test_iteration_sees_llm_context(self):
+        """Whole-dict reads should include the decoded llm_context."""
+        self.assertEqual(dict(self.lamp.properties), {
+            'portable': True, 'llm_context': {"traits": ["brass", "dented"]}
+        })
+
+    def test_assignment_replaces_packed_value(self):
+        """Assigning llm_context should discard the packed value."""
+        self.lamp.llm_context = {"traits": ["new"]}
+        self.assertIs(type(self.lamp.properties), CoreFieldProtectingDict)
+        self.assertEqual(self.lamp.properties['llm_context'], {"traits": ["new"]})
+
+    def test_core_fields_still_protected(self):
+        """Packed dicts should keep core field protection."""
+        with self.assertRaises(TypeError):
+            self.lamp.properties['location'] = 'elsewhere'
+        self.lamp.properties['lit'] = True
+        self.assertIs(type(self.lamp.properties), _PackedPropertiesDict)
+
+    def test_copies_stay_packed(self):
+        """Copies and pickles should keep llm_context packed and equal."""
+        for clone in (copy.deepcopy(self.lamp.properties), pickle.loads(pickle.dumps(self.lamp.properties))):
+            self.assertIs(type(clone), _PackedPropertiesDict)
+            self.assertEqual(clone, self.lamp.properties)
+
+
+class TestSlottedEntities(unittest.TestCase):
+    """Entities use __slots__ instead of a per-instance __dict__."""
+
+    def test_no_instance_dict(self):
+        """Entities should reject attributes that are not fields."""
+        item = Item(id=ItemId('sword'), name='Sword', description='Sharp', location='room')
+        self.assertFalse(hasattr(item, '__dict__'))
+        with self.assertRaises(AttributeError):
+            item.not_a_field = 1
+
+    def test_pickled_entity_detached_from_state(self):
+        """Pickled located entities should not carry their owning GameState."""
+        state = _load_with_llm_context()
+        clone = pickle.loads(pickle.dumps(state.get_item("lamp")))
+        self.assertFalse(hasattr(clone, '_whereabouts_owner'))
+        clone.location = 'elsewhere'
+        self.assertEqual(state.get_item("lamp").location, 'room')
+
+
+class TestUncheckedWrites(unittest.TestCase):
+    """Without checking mode, writes are plain dict writes; StateAccessor still guards paths."""
+
+    def setUp(self):
+        set_core_field_checking(False)
+        self.addCleanup(set_core_field_checking, True)
+
+    def test_writes_bypass_checks(self):
+        """Property writes should use dict's own methods."""
+        props = CoreFieldProtectingDict({'id', 'name'})
+        self.assertIs(type(props).__setitem__, dict.__setitem__)
+        props['health'] = 100
+        props.update(mana=50)
+        self.assertEqual(props, {'health': 100, 'mana': 50})
+
+    def test_state_accessor_rejects_core_field_path(self):
+        """StateAccessor.update should refuse properties.<core field> paths."""
+        state = _load_with_llm_context()
+        accessor = StateAccessor(state, None)
+        lamp = state.get_item("lamp")
+        result = accessor.update(lamp, {"properties.location": "elsewhere"})
+        self.assertFalse(result.success)
+        self.assertIn("Cannot set core field 'location'", result.detail)
+        self.assertNotIn('location', lamp.properties)
+        self.assertTrue(accessor.update(lamp, {"properties.lit": True}).success)
+        self.assertTrue(lamp.properties['lit'])
+
+    def test_checking_can_be_reenabled(self):
+        """Turning checking back on should restore the TypeError."""
+        set_core_field_checking(True)
+        props = CoreFieldProtectingDict({'id'})
+        with self.assertRaises(TypeError):
+            props['id'] = 'x'
+
+
 if __name__ == '__main__':
     unittest.main()
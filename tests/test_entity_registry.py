@@ -0,0 +1,147 @@
+"""Tests for the id-keyed entity registry on GameState."""
+
+import copy
+import pickle
+import unittest
+
+from src.state_manager import (
+    GameState, Metadata, Location, Item, Actor, Lock, Part, Exit, Commitment,
+    EntityList, ValidationError
+)
+from src.state_accessor import StateAccessor
+from src.types import LocationId, ItemId, ActorId, LockId, PartId, CommitmentId
+
+
+class TestEntityRegistry(unittest.TestCase):
+    """Registry lookups stay coherent through every add/remove path."""
+
+    def setUp(self):
+        self.game_state = GameState(
+            metadata=Metadata(title="Test", version="1.0", start_location="loc_hall"),
+            locations=[Location(id=LocationId("loc_hall"), name="Hall", description="A hall")],
+            items=[
+                Item(id=ItemId("sword"), name="sword", description="A sword", location="loc_hall"),
+                Item(id=ItemId("shield"), name="shield", description="A shield", location="loc_hall"),
+            ],
+            locks=[Lock(id=LockId("lock_chest"), name="lock", description="A lock")],
+            actors={
+                ActorId("player"): Actor(
+                    id=ActorId("player"), name="Adventurer", description="You",
+                    location=LocationId("loc_hall")
+                )
+            },
+            parts=[Part(id=PartId("part_wall"), part_of="loc_hall", name="wall")],
+        )
+        self.game_state._entity_registry.checked = True
+        self.accessor = StateAccessor(self.game_state, None)
+
+    def test_collections_are_indexed(self):
+        self.assertIsInstance(self.game_state.items, EntityList)
+        self.assertIs(self.game_state.get_item(ItemId("sword")), self.game_state.items[0])
+        self.assertEqual(self.game_state.find_entity("lock_chest")[0], "lock")
+        self.assertEqual(self.game_state.find_entity("player")[0], "actor")
+        self.assertIsNone(self.game_state.find_entity("nothing"))
+
+    def test_append_and_remove(self):
+        lamp = Item(id=ItemId("lamp"), name="lamp", description="A lamp", location="loc_hall")
+        self.game_state.items.append(lamp)
+        self.assertIs(self.accessor.get_item(ItemId("lamp")), lamp)
+        self.assertIs(self.accessor.get_entity("lamp"), lamp)
+
+        self.game_state.items.remove(lamp)
+        self.assertIsNone(self.accessor.get_item(ItemId("lamp")))
+        self.assertIsNone(self.accessor.get_entity("lamp"))
+        with self.assertRaises(KeyError):
+            self.game_state.get_item(ItemId("lamp"))
+        self.game_state.check_registry()
+
+    def test_slice_assignment_and_pop(self):
+        self.game_state.items[0] = Item(id=ItemId("axe"), name="axe", description="An axe", location="loc_hall")
+        self.assertIsNone(self.accessor.get_item(ItemId("sword")))
+        self.assertIsNotNone(self.accessor.get_item(ItemId("axe")))
+        self.game_state.items.pop()
+        self.assertIsNone(self.accessor.get_item(ItemId("shield")))
+        del self.game_state.items[:]
+        self.assertIsNone(self.accessor.get_item(ItemId("axe")))
+        self.game_state.check_registry()
+
+    def test_reassigning_collection_rewraps(self):
+        gem = Item(id=ItemId("gem"), name="gem", description="A gem", location="loc_hall")
+        self.game_state.items = [gem]
+        self.assertIsInstance(self.game_state.items, EntityList)
+        self.assertIs(self.accessor.get_item(ItemId("gem")), gem)
+        self.assertIsNone(self.accessor.get_item(ItemId("sword")))
+        self.assertIsNone(self.game_state.find_entity("sword"))
+        self.game_state.check_registry()
+
+    def test_actor_dict_mutations(self):
+        guard = Actor(id=ActorId("guard"), name="Guard", description="A guard", location=LocationId("loc_hall"))
+        self.game_state.actors[ActorId("guard")] = guard
+        self.assertIs(self.accessor.get_entity("guard"), guard)
+        del self.game_state.actors[ActorId("guard")]
+        self.assertIsNone(self.accessor.get_entity("guard"))
+        self.game_state.check_registry()
+
+    def test_virtual_entities(self):
+        commitment = Commitment(id=CommitmentId("commit_a"), name="A", description="A promise")
+        self.game_state.commitments.append(commitment)
+        self.assertIs(self.game_state.get_commitment(CommitmentId("commit_a")), commitment)
+        exit_entity = Exit(id="exit_a", name="door", location="loc_hall", connections=[])
+        self.game_state.exits.append(exit_entity)
+        self.assertIs(self.game_state.get_exit("exit_a"), exit_entity)
+        # get_entity only covers spatial kinds
+        self.assertIsNone(self.accessor.get_entity("exit_a"))
+
+    def test_duplicate_ids_keep_first_occurrence(self):
+        first = self.game_state.items[0]
+        dup = Item(id=ItemId("sword"), name="other sword", description="Dup", location="loc_hall")
+        self.game_state.items.append(dup)
+        self.assertIs(self.accessor.get_item(ItemId("sword")), first)
+        self.game_state.items.remove(first)
+        self.assertIs(self.accessor.get_item(ItemId("sword")), dup)
+        self.game_state.check_registry()
+
+    def test_cross_kind_collision_uses_precedence(self):
+        shadow = Item(id=ItemId("loc_hall"), name="hall model", description="A model", location="loc_hall")
+        self.game_state.items.append(shadow)
+        self.assertEqual(self.game_state.find_entity("loc_hall")[0], "location")
+        self.game_state.locations = []
+        self.assertIs(self.accessor.get_entity("loc_hall"), shadow)
+        self.game_state.check_registry()
+
+    def test_name_token_index(self):
+        state = self.game_state
+        self.assertEqual(list(state.ids_with_name_token("item", ["SWORD", "blade"])), ["sword"])
+        lamp = Item(id=ItemId("lamp"), name="Brass Lamp", description="A lamp", location="loc_hall")
+        state.items.append(lamp)
+        self.assertEqual(list(state.ids_with_name_token("item", ["brass lamp"])), ["lamp"])
+        self.assertEqual(list(state.ids_with_name_token("item", ["lamp"])), ["lamp"])
+        lamp.name = "lantern"
+        self.assertEqual(state.ids_with_name_token("item", ["lamp"]), {})
+        self.assertEqual(list(state.ids_with_name_token("item", ["lantern"])), ["lamp"])
+        state.items.remove(lamp)
+        self.assertEqual(state.ids_with_name_token("item", ["lantern"]), {})
+        self.assertEqual(list(state.ids_with_name_token("actor", ["adventurer"])), ["player"])
+        state.check_registry()
+
+    def test_check_registry_detects_stale_id(self):
+        self.game_state.items[0].id = ItemId("renamed")
+        with self.assertRaises(ValidationError):
+            self.game_state.check_registry()
+
+    def test_checked_lookup_detects_stale_id(self):
+        self.game_state.items[0].id = ItemId("renamed")
+        with self.assertRaises(ValidationError):
+            self.accessor.get_item(ItemId("sword"))
+
+    def test_copy_and_pickle_rebuild_registry(self):
+        for clone in (copy.deepcopy(self.game_state), pickle.loads(pickle.dumps(self.game_state))):
+            self.assertIsInstance(clone.items, EntityList)
+            sword = clone.get_item(ItemId("sword"))
+            self.assertIsNot(sword, self.game_state.get_item(ItemId("sword")))
+            self.assertIs(sword, clone.items[0])
+            clone.check_registry()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -213,6 +213,27 @@ class TestGameEngineStateReload(unittest.TestCase):
 
         # Verify json_handler was recreated
         self.assertIsNotNone(self.engine.json_handler)
+        self.assertIs(self.engine.json_handler.turn_scheduler, self.engine.turn_scheduler)
+
+
+class TestGameEngineSessions(unittest.TestCase):
+    """Several engines in one process do not share turn state."""
+
+    def test_engines_own_turn_schedulers(self):
+        game_dir = Path(__file__).parent.parent / "examples" / "simple_game"
+        first = GameEngine(game_dir)
+        second = GameEngine(game_dir)
+
+        self.assertIsNot(first.turn_scheduler, second.turn_scheduler)
+        self.assertIs(first.json_handler.turn_scheduler, first.turn_scheduler)
+        self.assertEqual(first.turn_scheduler.ordered_turn_phases, second.turn_scheduler.ordered_turn_phases)
+
+        look = {"type": "command", "action": {"verb": "look"}}
+        first.json_handler.handle_message(look)
+        first.json_handler.handle_message(look)
+        second.json_handler.handle_message(look)
+        self.assertEqual(first.game_state.turn_count, 2)
+        self.assertEqual(second.game_state.turn_count, 1)
 
 
 if __name__ == '__main__':
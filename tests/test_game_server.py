@@ -0,0 +1,117 @@
+"""Tests for the asyncio multi-session game server."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.game_server import GameServer
+
+GAME_DIR = Path("examples/simple_game")
+LOOK = {"type": "command", "action": {"verb": "look"}}
+
+
+class TestGameServer(unittest.TestCase):
+    """Sessions served over a Unix socket."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.socket_path = os.path.join(cls.tmp.name, "game.sock")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def run_server(self, client, max_pending=8):
+        """Start a server, run client(server) against it and return its result."""
+        async def main():
+            server = GameServer(GAME_DIR, workers=2, max_pending=max_pending)
+            await server.start(unix_path=self.socket_path)
+            try:
+                return await client(server)
+            finally:
+                await server.close()
+        return asyncio.run(main())
+
+    async def connect(self):
+        return await asyncio.open_unix_connection(self.socket_path)
+
+    @staticmethod
+    async def request(reader, writer, payload):
+        writer.write(payload if isinstance(payload, bytes) else json.dumps(payload).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    def test_pipelined_requests_answered_in_order(self):
+        async def client(server):
+            reader, writer = await self.connect()
+            writer.write(b"".join(json.dumps(LOOK).encode() + b"\n" for _ in range(5)))
+            writer.write(json.dumps({"type": "session"}).encode() + b"\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(6)]
+            writer.close()
+            return responses
+
+        responses = self.run_server(client, max_pending=2)
+        self.assertTrue(all(r["success"] for r in responses[:5]))
+        status = responses[5]
+        self.assertEqual(status["type"], "session")
+        self.assertEqual(status["commands_handled"], 5)
+        self.assertEqual(status["turn"], 5)
+        self.assertEqual(status["max_pending"], 2)
+
+    def test_invalid_lines_get_error_responses(self):
+        async def client(server):
+            reader, writer = await self.connect()
+            invalid = await self.request(reader, writer, b"{not json\n")
+            not_object = await self.request(reader, writer, b"[1, 2]\n")
+            spoofed = await self.request(reader, writer, {"type": "error"})
+            look = await self.request(reader, writer, LOOK)
+            writer.close()
+            return invalid, not_object, spoofed, look
+
+        invalid, not_object, spoofed, look = self.run_server(client)
+        self.assertFalse(invalid["success"])
+        self.assertIn("Invalid JSON", invalid["narration"]["primary_text"])
+        self.assertFalse(not_object["success"])
+        self.assertFalse(spoofed["success"])
+        self.assertTrue(look["success"])
+
+    def test_sessions_are_isolated(self):
+        async def client(server):
+            first = await self.connect()
+            second = await self.connect()
+            for _ in range(3):
+                await self.request(*first, LOOK)
+            first_status = await self.request(*first, {"type": "session"})
+            second_status = await self.request(*second, {"type": "session"})
+            self.assertEqual(len(server.sessions), 2)
+            for _, writer in (first, second):
+                writer.close()
+            return first_status, second_status
+
+        first_status, second_status = self.run_server(client)
+        self.assertNotEqual(first_status["session_id"], second_status["session_id"])
+        self.assertEqual(first_status["turn"], 3)
+        self.assertEqual(second_status["turn"], 0)
+
+    def test_session_removed_on_disconnect(self):
+        async def client(server):
+            reader, writer = await self.connect()
+            await self.request(reader, writer, LOOK)
+            writer.close()
+            await writer.wait_closed()
+            for _ in range(100):
+                if not server.sessions:
+                    break
+                await asyncio.sleep(0.01)
+            return dict(server.sessions)
+
+        self.assertEqual(self.run_server(client), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
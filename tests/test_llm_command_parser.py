@@ -5,11 +5,13 @@ These tests load real big_game and test parser with actual vocabulary and contex
 
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List
+from unittest.mock import Mock, patch
 
 from src.game_engine import GameEngine
 from src.shared_mlx import SharedMLXBackend, HAS_MLX
-from src.llm_command_parser import LLMCommandParser
+from src.llm_command_parser import LLMCommandParser, MAX_PARSE_TOKENS
 
 
 @unittest.skipIf(not HAS_MLX, "MLX not available (requires Apple Silicon and mlx-lm package)")
@@ -307,6 +309,62 @@ class TestLLMCommandParser(unittest.TestCase):
         self.assertEqual(result['action']['indirect_object'], 'frozen_crystal')
 
 
+@unittest.skipIf(not HAS_MLX, "MLX not available (requires Apple Silicon and mlx-lm package)")
+class TestLLMCommandParserBatchCall(unittest.TestCase):
+    """_call_llm_batch hands batch_generate one system prompt cache per prompt."""
+
+    def setUp(self):
+        self.system_cache = [SimpleNamespace(offset=5, state=(f"keys{n}", f"values{n}")) for n in range(2)]
+        backend = Mock()
+        backend.create_parser_cache.return_value = (self.system_cache, 5)
+        backend.tokenizer.bos_token = None
+        backend.tokenizer.apply_chat_template.side_effect = lambda messages, **kwargs: messages[0]["content"]
+        backend.tokenizer.encode.side_effect = lambda text, add_special_tokens: [ord(c) for c in text]
+        self.parser = LLMCommandParser(backend, ["look", "take"])
+
+    def call_batch(self, prompts):
+        new_caches = []
+
+        def make_prompt_cache(model):
+            self.assertIs(model, self.parser.model)
+            new_caches.append([SimpleNamespace(offset=0, state=None) for _ in self.system_cache])
+            return new_caches[-1]
+
+        with patch("src.llm_command_parser.HAS_BATCH_GENERATE", True), \
+                patch("src.llm_command_parser.make_prompt_cache", side_effect=make_prompt_cache), \
+                patch("src.llm_command_parser.batch_generate", create=True,
+                      return_value=SimpleNamespace(texts=[f" {p} " for p in prompts])) as batch_generate:
+            responses = self.parser._call_llm_batch(prompts)
+        return responses, batch_generate, new_caches
+
+    def test_call_contract(self):
+        responses, batch_generate, new_caches = self.call_batch(["ab", "cd"])
+
+        self.assertEqual(responses, ["ab", "cd"])
+        batch_generate.assert_called_once()
+        args, kwargs = batch_generate.call_args
+        self.assertEqual(args, (self.parser.model, self.parser.tokenizer, [[97, 98], [99, 100]]))
+        self.assertEqual(kwargs["max_tokens"], MAX_PARSE_TOKENS)
+        self.assertEqual(kwargs["prompt_caches"], new_caches)
+
+    def test_prompt_caches_do_not_alias_system_cache(self):
+        _, batch_generate, _ = self.call_batch(["ab", "cd"])
+
+        caches = batch_generate.call_args.kwargs["prompt_caches"]
+        self.assertIsNot(caches[0], caches[1])
+        for cache in caches:
+            self.assertIsNot(cache, self.parser.cache)
+            for layer, system_layer in zip(cache, self.system_cache):
+                self.assertIsNot(layer, system_layer)
+                self.assertEqual(layer.state, system_layer.state)
+
+    def test_single_prompt_skips_batching(self):
+        with patch.object(self.parser, "_call_llm", return_value="x") as call_llm:
+            _, batch_generate, _ = self.call_batch(["ab"])
+        call_llm.assert_called_once_with("ab")
+        batch_generate.assert_not_called()
+
+
 @unittest.skipIf(True, "Integration tests - run manually with --verbose")
 class TestLLMCommandParserIntegration(unittest.TestCase):
     """Integration tests for parser - run manually to see LLM output."""
@@ -0,0 +1,100 @@
+"""Tests for index-driven location visibility (gather_location_contents and friends)."""
+
+import unittest
+
+from src.state_manager import GameState, Metadata, Location, Item, Actor, Exit
+from src.state_accessor import StateAccessor
+from src.behavior_manager import BehaviorManager
+from src.types import LocationId, ItemId, ActorId
+from tests.conftest import make_word_entry
+from utilities.utils import (
+    gather_location_contents, get_doors_in_location, find_accessible_item,
+    _is_item_visible_in_location, _visible_items_in_location
+)
+
+
+class TestLocationVisibility(unittest.TestCase):
+    """Index-driven candidates match a full scan with _is_item_visible_in_location."""
+
+    def setUp(self):
+        door = {"door": {"open": False}}
+        self.game_state = GameState(
+            metadata=Metadata(title="Test", version="1.0", start_location="loc_hall"),
+            locations=[
+                Location(id=LocationId("loc_hall"), name="Hall", description="A hall"),
+                Location(id=LocationId("loc_yard"), name="Yard", description="A yard"),
+            ],
+            items=[
+                Item(id=ItemId("table"), name="table", description="A table", location="loc_hall",
+                     _properties={"container": {"is_surface": True}}),
+                Item(id=ItemId("cup"), name="cup", description="A cup", location="table"),
+                Item(id=ItemId("door_oak"), name="door", description="An oak door",
+                     location="exit:loc_hall:north", _properties=dict(door)),
+                Item(id=ItemId("door_iron"), name="door", description="An iron door",
+                     location="loc_elsewhere", _properties=dict(door)),
+                Item(id=ItemId("gem"), name="gem", description="A gem", location="loc_hall",
+                     _properties={"states": {"hidden": True}}),
+                Item(id=ItemId("rock"), name="rock", description="A rock", location="loc_yard"),
+            ],
+            exits=[
+                Exit(id="exit_hall_east", name="east", location="loc_hall", connections=[],
+                     direction="east", door_id="door_iron"),
+            ],
+            actors={
+                ActorId("player"): Actor(id=ActorId("player"), name="Adventurer", description="You",
+                                         location=LocationId("loc_hall")),
+                ActorId("cat"): Actor(id=ActorId("cat"), name="cat", description="A cat",
+                                      location=LocationId("loc_hall")),
+            },
+        )
+        self.accessor = StateAccessor(self.game_state, BehaviorManager())
+
+    def assert_matches_full_scan(self, location_id):
+        expected = [item for item in self.game_state.items
+                    if _is_item_visible_in_location(item, location_id, self.accessor, ActorId("player"))]
+        self.assertEqual(_visible_items_in_location(self.accessor, location_id, ActorId("player")), expected)
+
+    def test_matches_full_scan(self):
+        self.assert_matches_full_scan("loc_hall")
+        self.assert_matches_full_scan("loc_yard")
+        self.assert_matches_full_scan("loc_nowhere")
+
+    def test_gather_location_contents(self):
+        contents = gather_location_contents(self.accessor, "loc_hall", ActorId("player"))
+        self.assertEqual([i.id for i in contents["items"]], ["table", "door_oak", "door_iron"])
+        self.assertEqual([i.id for i in contents["surface_items"]["table"]], ["cup"])
+        self.assertEqual([a.id for a in contents["actors"]], ["cat"])
+        doors = get_doors_in_location(self.accessor, "loc_hall", ActorId("player"))
+        self.assertEqual([d.id for d in doors], ["door_oak", "door_iron"])
+
+    def test_tracks_moves_and_state_changes(self):
+        gem = self.game_state.get_item(ItemId("gem"))
+        gem.states["hidden"] = False
+        rock = self.game_state.get_item(ItemId("rock"))
+        rock.location = "loc_hall"
+        self.game_state.get_exit("exit_hall_east").door_id = None
+
+        contents = gather_location_contents(self.accessor, "loc_hall", ActorId("player"))
+        self.assertEqual([i.id for i in contents["items"]], ["table", "door_oak", "gem", "rock"])
+        self.assertIs(find_accessible_item(self.accessor, make_word_entry("rock"), ActorId("player")), rock)
+        self.assertIs(find_accessible_item(self.accessor, make_word_entry("cup"), ActorId("player")),
+                      self.game_state.get_item(ItemId("cup")))
+        self.assert_matches_full_scan("loc_hall")
+        self.assert_matches_full_scan("loc_yard")
+
+    def test_find_accessible_item_uses_name_index(self):
+        player = ActorId("player")
+        self.assertIsNone(find_accessible_item(self.accessor, make_word_entry("rock"), player))
+        self.assertIsNone(find_accessible_item(self.accessor, make_word_entry("unicorn"), player))
+        table = self.game_state.get_item(ItemId("table"))
+        self.assertIs(find_accessible_item(self.accessor, make_word_entry("surface", synonyms=["table"]), player),
+                      table)
+        oak = find_accessible_item(self.accessor, make_word_entry("door"), player, "oak")
+        self.assertEqual(oak.id, "door_oak")
+        table.name = "desk"
+        self.assertIsNone(find_accessible_item(self.accessor, make_word_entry("table"), player))
+        self.assertIs(find_accessible_item(self.accessor, make_word_entry("desk"), player), table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for the narration result cache."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.game_engine import GameEngine
+from src.narration_cache import NarrationCache, canonical_plan, plan_key
+from tests.llm_interaction.mock_narrator import MockLLMNarrator
+
+
+def plan(verbosity="full", familiarity="new", traits=("dusty", "old")):
+    return {
+        "success": True,
+        "verbosity": verbosity,
+        "primary_text": "You look around.",
+        "scope": {"scene_kind": "look", "outcome": "success", "familiarity": familiarity},
+        "entity_refs": {"lantern": {"name": "lantern", "traits": list(traits)}},
+    }
+
+
+class TestPlanKey(unittest.TestCase):
+    """Canonicalization of narration plans."""
+
+    def test_key_ignores_key_and_trait_order(self):
+        reordered = dict(reversed(list(plan().items())))
+        self.assertEqual(plan_key(reordered), plan_key(plan()))
+        self.assertEqual(plan_key(plan(traits=("old", "dusty"))), plan_key(plan()))
+
+    def test_key_distinguishes_verbosity_and_familiarity(self):
+        keys = {plan_key(plan()), plan_key(plan(verbosity="brief")), plan_key(plan(familiarity="familiar"))}
+        self.assertEqual(len(keys), 3)
+
+    def test_canonical_plan_is_compact_json(self):
+        self.assertEqual(json.loads(canonical_plan(plan()))["verbosity"], "full")
+        self.assertNotIn(": ", canonical_plan(plan()))
+
+
+class TestNarrationCache(unittest.TestCase):
+    """Lookup, variants and eviction."""
+
+    def test_miss_until_variants_collected(self):
+        cache = NarrationCache(variants=2)
+        self.assertIsNone(cache.get(plan()))
+        cache.put(plan(), "First.")
+        self.assertIsNone(cache.get(plan()))
+        cache.put(plan(), "Second.")
+        self.assertIn(cache.get(plan()), {"First.", "Second."})
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_hits_avoid_recent_variants(self):
+        cache = NarrationCache(variants=2)
+        cache.put(plan(), "First.")
+        cache.put(plan(), "Second.")
+        served = [cache.get(plan()) for _ in range(4)]
+        self.assertEqual(served, ["First.", "Second.", "First.", "Second."])
+
+    def test_placeholders_not_cached(self):
+        cache = NarrationCache(variants=1)
+        cache.put(plan(), "[Narrator unavailable: overloaded]")
+        cache.put(plan(), "   ")
+        self.assertIsNone(cache.get(plan()))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_evicted(self):
+        cache = NarrationCache(max_entries=2, variants=1)
+        cache.put(plan(), "Full.")
+        cache.put(plan(verbosity="brief"), "Brief.")
+        cache.get(plan())
+        cache.put(plan(familiarity="familiar"), "Familiar.")
+        self.assertEqual(cache.get(plan()), "Full.")
+        self.assertIsNone(cache.get(plan(verbosity="brief")))
+
+    def test_entries_expire(self):
+        cache = NarrationCache(ttl=60, variants=1)
+        with patch("src.narration_cache.time.time", return_value=1000.0):
+            cache.put(plan(), "Full.")
+        with patch("src.narration_cache.time.time", return_value=1059.0):
+            self.assertEqual(cache.get(plan()), "Full.")
+        with patch("src.narration_cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get(plan()))
+        self.assertEqual(len(cache), 0)
+
+    def test_record_stores_completed_stream_only(self):
+        cache = NarrationCache(variants=1)
+        stream = cache.record(plan(), iter(["You ", "look."]))
+        next(stream)
+        stream.close()
+        self.assertIsNone(cache.get(plan()))
+
+        self.assertEqual(list(cache.record(plan(), iter(["You ", "look."]))), ["You ", "look."])
+        self.assertEqual(cache.get(plan()), "You look.")
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "narration_cache.json"
+            cache = NarrationCache(path=path, variants=1)
+            cache.put(plan(), "Full.")
+            cache.save()
+
+            restored = NarrationCache(path=path, variants=1)
+            self.assertEqual(restored.get(plan()), "Full.")
+
+            path.write_text("not json")
+            with self.assertLogs("src.narration_cache", level="WARNING"):
+                self.assertEqual(len(NarrationCache(path=path)), 0)
+
+
+class TestNarratorUsesCache(unittest.TestCase):
+    """Narrators skip the LLM for plans already narrated."""
+
+    def test_repeated_look_served_from_cache(self):
+        engine = GameEngine(Path("examples/simple_game"))
+        cache = NarrationCache(variants=1)
+        narrator = MockLLMNarrator(engine.json_handler, ["The room is quiet."],
+                                   vocabulary=engine.merged_vocabulary,
+                                   narration_cache=cache)
+
+        for _ in range(4):
+            self.assertEqual(narrator.process_turn("look"), "The room is quiet.")
+
+        # First look is "new", second "familiar"; later looks repeat the second plan
+        self.assertEqual(narrator.call_count, 2)
+        self.assertEqual(cache.stats()["hits"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
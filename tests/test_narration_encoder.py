@@ -0,0 +1,73 @@
+"""Tests for the compact narration payload encoder."""
+
+import json
+import unittest
+
+from src.narration_encoder import (
+    ABBREVIATIONS, abbreviation_legend, compact_payload, encode_narration, encode_payload
+)
+
+
+def narration():
+    return {
+        "entity_refs": {
+            "door_iron": {"salience": "high", "name": "iron door", "state": {"open": False, "locked": True},
+                          "traits": []},
+        },
+        "primary_text": "You try the door.",
+        "secondary_beats": [],
+        "must_mention": {},
+        "context": {"primary_text_hint": "kept as written", "mood": ""},
+        "verbosity": "brief",
+        "success": False,
+        "hints": None,
+    }
+
+
+class TestEncodeNarration(unittest.TestCase):
+    """Compact encoding of narration plans."""
+
+    def test_empty_fields_dropped_false_kept(self):
+        decoded = json.loads(encode_narration(narration()))
+        self.assertNotIn("secondary_beats", decoded)
+        self.assertNotIn("must_mention", decoded)
+        self.assertNotIn("hints", decoded)
+        self.assertNotIn("traits", decoded["entity_refs"]["door_iron"])
+        self.assertIs(decoded["success"], False)
+        self.assertEqual(decoded["entity_refs"]["door_iron"]["state"], {"open": False, "locked": True})
+
+    def test_fields_in_reading_order(self):
+        encoded = encode_narration(narration())
+        self.assertTrue(encoded.startswith('{"success":false,"verbosity":"brief","primary_text":'))
+        self.assertEqual(encode_narration(dict(reversed(list(narration().items())))), encoded)
+        self.assertNotIn("\n", encoded)
+        self.assertNotIn(": ", encoded)
+
+    def test_context_passed_through(self):
+        decoded = json.loads(encode_narration(narration(), abbreviate=True))
+        self.assertEqual(decoded["context"], {"primary_text_hint": "kept as written", "mood": ""})
+
+    def test_abbreviated_schema_keeps_entity_ids(self):
+        decoded = json.loads(encode_narration(narration(), abbreviate=True))
+        self.assertEqual(decoded["ok"], False)
+        self.assertEqual(decoded["pt"], "You try the door.")
+        self.assertEqual(decoded["ents"]["door_iron"]["sal"], "high")
+        self.assertNotIn("primary_text", decoded)
+
+    def test_legend_explains_every_abbreviation(self):
+        legend = abbreviation_legend()
+        for name, short in ABBREVIATIONS.items():
+            self.assertIn(f"{short}={name}", legend)
+        self.assertEqual(len(set(ABBREVIATIONS.values())), len(ABBREVIATIONS))
+
+    def test_encode_payload_handles_query_results(self):
+        result = {"type": "query_response", "data": {"exits": {"north": {"to": "loc_hall", "name": None}}},
+                  "items": [{}, {"name": "lamp"}]}
+        self.assertEqual(compact_payload(result),
+                         {"type": "query_response", "data": {"exits": {"north": {"to": "loc_hall"}}},
+                          "items": [{"name": "lamp"}]})
+        self.assertEqual(json.loads(encode_payload(result)), compact_payload(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for batched LLM command parsing."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.parse_batcher import ParseBatcher
+
+
+class StubBatchParser:
+    """Answers each request with a look command naming its input; records batch sizes."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batch_sizes: List[int] = []
+
+    def parse_batch(self, requests: List[Tuple[str, Dict[str, List[str]]]]) -> List[Optional[Dict[str, Any]]]:
+        self.batch_sizes.append(len(requests))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model failed")
+        return [{"type": "command", "action": {"verb": "look"}, "raw_input": text} for text, _ in requests]
+
+
+class TestParseBatcher(unittest.TestCase):
+    """Batching, result routing and shutdown."""
+
+    def batcher(self, parser: StubBatchParser, **kwargs: Any) -> ParseBatcher:
+        batcher = ParseBatcher(parser, **kwargs)
+        self.addCleanup(batcher.close)
+        return batcher
+
+    def test_concurrent_requests_share_a_batch(self):
+        parser = StubBatchParser()
+        batcher = self.batcher(parser, max_batch=4, max_wait=1.0)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda i: batcher.parse_command(f"cmd {i}", {}), range(4)))
+
+        self.assertEqual([r["raw_input"] for r in results], [f"cmd {i}" for i in range(4)])
+        self.assertEqual(parser.batch_sizes, [4])
+        self.assertEqual(batcher.stats()["mean_batch"], 4)
+
+    def test_batches_limited_to_max_batch(self):
+        parser = StubBatchParser()
+        batcher = self.batcher(parser, max_batch=3, max_wait=0.05)
+
+        futures = [batcher.submit(f"cmd {i}", {}) for i in range(7)]
+
+        self.assertEqual([f.result()["raw_input"] for f in futures], [f"cmd {i}" for i in range(7)])
+        self.assertTrue(all(size <= 3 for size in parser.batch_sizes))
+        self.assertEqual(sum(parser.batch_sizes), 7)
+
+    def test_lone_request_waits_at_most_max_wait(self):
+        parser = StubBatchParser()
+        batcher = self.batcher(parser, max_batch=8, max_wait=10.0)
+
+        start = time.monotonic()
+        batcher.parse_command("look", {}, max_wait=0.01)
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(parser.batch_sizes, [1])
+
+    def test_requests_queue_while_batch_runs(self):
+        parser = StubBatchParser(delay=0.2)
+        batcher = self.batcher(parser, max_batch=8, max_wait=0.0)
+
+        first = batcher.submit("first", {})
+        while not parser.batch_sizes:
+            time.sleep(0.005)
+        rest = [batcher.submit(f"cmd {i}", {}) for i in range(3)]
+
+        self.assertEqual(first.result()["raw_input"], "first")
+        self.assertEqual([f.result()["raw_input"] for f in rest], ["cmd 0", "cmd 1", "cmd 2"])
+        self.assertEqual(parser.batch_sizes, [1, 3])
+
+    def test_parser_error_reaches_every_caller(self):
+        batcher = self.batcher(StubBatchParser(fail=True), max_batch=2, max_wait=1.0)
+
+        futures = [batcher.submit("a", {}), batcher.submit("b", {})]
+
+        with self.assertLogs("src.parse_batcher", level="ERROR"):
+            for future in futures:
+                with self.assertRaises(RuntimeError):
+                    future.result(timeout=5)
+
+    def test_close_drains_queue_then_rejects(self):
+        parser = StubBatchParser()
+        batcher = ParseBatcher(parser, max_batch=8, max_wait=10.0)
+        future = batcher.submit("look", {})
+
+        batcher.close()
+
+        self.assertEqual(future.result(timeout=0)["raw_input"], "look")
+        self.assertFalse(any(t.name == "parse-batcher" and t.is_alive() for t in threading.enumerate()))
+        with self.assertRaises(RuntimeError):
+            batcher.submit("look", {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Tests for the cache of LLM command parses."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.game_engine import GameEngine
+from src.phrase_cache import PhraseCache, normalize_phrase, scene_context
+from tests.llm_interaction.mock_narrator import MockLLMNarrator
+
+LOOK = {"type": "command", "action": {"verb": "look"}}
+HALL = {"location": "loc_hall", "here": ["item_lamp"], "inventory": []}
+CELLAR = {"location": "loc_cellar", "here": ["item_lamp"], "inventory": []}
+VOCABULARY = {"verbs": [{"word": "look"}]}
+
+
+class TestNormalizePhrase(unittest.TestCase):
+    """Near-identical phrasings normalize alike."""
+
+    def test_polite_wrappers_articles_and_punctuation_dropped(self):
+        for phrasing in ("Could you please pick up the lantern?", "pick up lantern",
+                         "I want to pick up the lantern, please", "Let's pick up a lantern!"):
+            self.assertEqual(normalize_phrase(phrasing), "pick up lantern", phrasing)
+
+    def test_meaningful_words_kept(self):
+        self.assertEqual(normalize_phrase("take the can"), "take can")
+        self.assertNotEqual(normalize_phrase("put key in box"), normalize_phrase("put key on box"))
+
+
+class TestPhraseCache(unittest.TestCase):
+    """Lookup, eviction and invalidation."""
+
+    def test_hit_needs_same_phrase_and_scene(self):
+        cache = PhraseCache(vocabulary=VOCABULARY)
+        cache.put("could you look around?", HALL, LOOK)
+
+        self.assertEqual(cache.get("Look around, please", dict(HALL, here=["item_lamp"])), LOOK)
+        self.assertIsNone(cache.get("look around", CELLAR))
+        self.assertIsNone(cache.get("look under bed", HALL))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_cached_commands_are_copies(self):
+        cache = PhraseCache()
+        cache.put("look around", HALL, LOOK)
+        cache.get("look around", HALL)["action"]["verb"] = "jump"
+        self.assertEqual(cache.get("look around", HALL), LOOK)
+
+    def test_least_recently_used_evicted(self):
+        cache = PhraseCache(max_entries=2)
+        cache.put("look around", HALL, LOOK)
+        cache.put("look around", CELLAR, LOOK)
+        cache.get("look around", HALL)
+        cache.put("glance about", HALL, LOOK)
+
+        self.assertIsNotNone(cache.get("look around", HALL))
+        self.assertIsNone(cache.get("look around", CELLAR))
+
+    def test_vocabulary_change_clears(self):
+        cache = PhraseCache(vocabulary=VOCABULARY)
+        cache.put("look around", HALL, LOOK)
+
+        cache.set_vocabulary({"verbs": [{"word": "look"}]})
+        self.assertEqual(len(cache), 1)
+        cache.set_vocabulary({"verbs": [{"word": "look"}, {"word": "peer"}]})
+        self.assertEqual(len(cache), 0)
+
+    def test_discard_words_drops_matching_phrases(self):
+        cache = PhraseCache()
+        cache.put("take the rusty key", HALL, LOOK)
+        cache.put("take keyring", HALL, LOOK)
+        cache.put("look around", HALL, LOOK)
+
+        cache.discard_words(["rusty key"])
+        self.assertIsNone(cache.get("take rusty key", HALL))
+        self.assertEqual(len(cache), 2)
+        cache.discard_words(["key"])
+        self.assertEqual(len(cache), 2)
+
+    def test_save_and_load_checks_vocabulary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "phrase_cache.json"
+            cache = PhraseCache(vocabulary=VOCABULARY, path=path)
+            cache.put("look around", HALL, LOOK)
+            cache.save()
+
+            self.assertEqual(PhraseCache(vocabulary=VOCABULARY, path=path).get("look around", HALL), LOOK)
+            with self.assertLogs("src.phrase_cache", level="INFO"):
+                self.assertEqual(len(PhraseCache(vocabulary={"verbs": []}, path=path)), 0)
+
+
+class TestNarratorUsesPhraseCache(unittest.TestCase):
+    """Narrators skip the LLM parse for rephrasings parsed before."""
+
+    def test_repeated_rephrasing_parsed_once(self):
+        engine = GameEngine(Path("examples/simple_game"))
+        cache = PhraseCache()
+        narrator = MockLLMNarrator(engine.json_handler,
+                                   ['{"type": "command", "action": {"verb": "look"}}', "The room is quiet."],
+                                   vocabulary=engine.merged_vocabulary,
+                                   phrase_cache=cache)
+
+        narrator.process_turn("could you have a look around?")
+        calls_first_turn = narrator.call_count
+        narrator.process_turn("Have a look around, please")
+
+        self.assertEqual(calls_first_turn, 2)
+        self.assertEqual(narrator.call_count, 3)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_scene_context_lists_ids(self):
+        engine = GameEngine(Path("examples/simple_game"))
+        context = scene_context(engine.game_state, engine.behavior_manager)
+
+        self.assertEqual(context["location"], "loc_start")
+        self.assertIn("item_sword", context["here"])
+        self.assertEqual(context["inventory"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
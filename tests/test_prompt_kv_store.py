@@ -0,0 +1,98 @@
+"""Tests for the persistent system-prompt KV cache store."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.prompt_kv_store import HAS_MLX, PromptKVStore, prompt_cache_key
+
+
+class TestPromptCacheKey(unittest.TestCase):
+    """Keys change with everything a prefilled prompt depends on."""
+
+    def test_key_is_stable(self):
+        self.assertEqual(prompt_cache_key("model", "tok:1", "You narrate."),
+                         prompt_cache_key("model", "tok:1", "You narrate."))
+
+    def test_key_changes_with_model_tokenizer_and_prompt(self):
+        keys = {
+            prompt_cache_key("model", "tok:1", "You narrate."),
+            prompt_cache_key("other-model", "tok:1", "You narrate."),
+            prompt_cache_key("model", "tok:2", "You narrate."),
+            prompt_cache_key("model", "tok:1", "You narrate.\nVerbs: take, drop"),
+        }
+        self.assertEqual(len(keys), 4)
+
+
+class TestPromptKVStore(unittest.TestCase):
+    """File naming, lookup and pruning."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = PromptKVStore(Path(tmp.name))
+
+    def test_path_names_role_and_model(self):
+        path = self.store.path_for("narrator", "mlx-community/Qwen2.5-7B", "ab" * 32)
+        self.assertEqual(path.parent, self.store.directory)
+        self.assertEqual(path.name, f"narrator-mlx_community_Qwen2.5_7B-{'ab' * 16}.safetensors")
+
+    def test_missing_cache_loads_none(self):
+        self.assertIsNone(self.store.load("parser", "model", "0" * 64, 10))
+
+    def test_prune_keeps_other_roles_and_models(self):
+        self.store.max_caches = 1
+        keep = self.store.path_for("parser", "model", "1" * 64)
+        stale = self.store.path_for("parser", "model", "2" * 64)
+        narrator = self.store.path_for("narrator", "model", "2" * 64)
+        other_model = self.store.path_for("parser", "model2", "2" * 64)
+        for path in (keep, stale, narrator, other_model):
+            path.touch()
+
+        self.store.prune("parser", "model", keep=keep)
+
+        self.assertEqual(sorted(p.name for p in self.store.directory.iterdir()),
+                         sorted(p.name for p in (keep, narrator, other_model)))
+
+    def test_prompts_of_two_games_both_kept(self):
+        first_game = self.store.path_for("narrator", "model", "1" * 64)
+        second_game = self.store.path_for("narrator", "model", "2" * 64)
+        first_game.touch()
+        second_game.touch()
+
+        self.store.prune("narrator", "model", keep=second_game)
+        self.store.prune("narrator", "model", keep=first_game)
+
+        self.assertTrue(first_game.exists())
+        self.assertTrue(second_game.exists())
+
+    def test_prune_removes_least_recently_used(self):
+        self.store.max_caches = 2
+        paths = [self.store.path_for("narrator", "model", str(n) * 64) for n in range(4)]
+        for used, path in enumerate(paths):
+            path.touch()
+            os.utime(path, (1000 + used, 1000 + used))
+
+        self.store.prune("narrator", "model", keep=paths[0])
+
+        self.assertEqual([path.exists() for path in paths], [True, False, False, True])
+
+    @unittest.skipIf(not HAS_MLX, "MLX not available (requires Apple Silicon and mlx-lm package)")
+    def test_save_and_load_round_trip(self):
+        import mlx.core as mx
+        from mlx_lm.models.cache import KVCache
+
+        cache = [KVCache()]
+        cache[0].update_and_fetch(mx.zeros((1, 2, 5, 4)), mx.ones((1, 2, 5, 4)))
+        key = prompt_cache_key("model", "tok", "You narrate.")
+        self.store.save("narrator", "model", key, cache, 5)
+
+        loaded = self.store.load("narrator", "model", key, 5)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded[0].offset, 5)
+        self.assertIsNone(self.store.load("narrator", "model", key, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for seeded, headless replays of walkthroughs."""
+
+import contextlib
+import io
+import json
+import random
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.game_engine import GameEngine
+from src.state_accessor import StateAccessor
+from src.state_manager import Actor, GameState, Location, Metadata, game_state_to_dict
+from src.types import ActorId
+from tools.walkthrough import run_walkthrough
+
+BIG_GAME = Path("examples/big_game")
+SCRIPT = Path("walkthroughs/test_wolf_feeding.txt").read_text().splitlines()
+
+
+def replay(seed):
+    """Replay SCRIPT quietly on a seeded session; return (responses, saved state)."""
+    engine = GameEngine(BIG_GAME, seed=seed)
+    results, _, _ = run_walkthrough(engine, SCRIPT, quiet=True)
+    responses = [json.dumps(result["result"], sort_keys=True, default=str) for result in results]
+    return responses, json.dumps(game_state_to_dict(engine.game_state), sort_keys=True, default=str)
+
+
+class TestSeededReplay(unittest.TestCase):
+    """A seeded session replays the same way every time."""
+
+    def test_same_seed_same_transcript_and_state(self):
+        self.assertEqual(replay(7), replay(7))
+
+    def test_quiet_replay_prints_nothing_and_times_commands(self):
+        engine = GameEngine(BIG_GAME, seed=0)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results, _, _ = run_walkthrough(engine, SCRIPT, quiet=True)
+
+        self.assertEqual(output.getvalue(), "")
+        self.assertTrue(results)
+        self.assertTrue(all(result["seconds"] >= 0 for result in results))
+
+    def test_engine_rng_reaches_accessors(self):
+        engine = GameEngine(BIG_GAME, seed=3)
+        self.assertIs(engine.json_handler.rng, engine.rng)
+        self.assertIsInstance(engine.rng, random.Random)
+        self.assertIs(GameEngine(BIG_GAME).rng, None)
+
+
+class TestAccessorRng(unittest.TestCase):
+    """Behaviors draw their random numbers from accessor.rng."""
+
+    def make_state(self):
+        state = GameState(metadata=Metadata(title="Test"))
+        for location_id in ("forest", "meadow", "river", "cave"):
+            state.locations.append(Location(id=location_id, name=location_id.title(), description="A place"))
+        state.actors[ActorId("player")] = Actor(
+            id="player", name="Hero", description="The hero", location="forest", inventory=[])
+        state.actors[ActorId("deer")] = Actor(
+            id="deer", name="Deer", description="A deer", location="forest", inventory=[],
+            _properties={"wander_area": ["forest", "meadow", "river", "cave"], "wander_chance": 0.7})
+        return state
+
+    def wander(self, seed):
+        from behavior_libraries.npc_movement_lib.wander import wander_step
+
+        state = self.make_state()
+        accessor = StateAccessor(state, Mock(), random.Random(seed))
+        deer = state.get_actor(ActorId("deer"))
+        return [wander_step(accessor, deer) for _ in range(20)]
+
+    def test_wander_follows_seed(self):
+        self.assertEqual(self.wander(11), self.wander(11))
+
+    def test_default_is_random_module(self):
+        self.assertIs(StateAccessor(self.make_state(), Mock()).rng, random)
+
+    def test_scheduled_event_ids_follow_seed(self):
+        from behavior_libraries.timing_lib.scheduled_events import schedule_event
+
+        def event_ids():
+            accessor = StateAccessor(self.make_state(), Mock(), random.Random(5))
+            return [schedule_event(accessor, f"event_{n}", trigger_turn=n) for n in range(3)]
+
+        self.assertEqual(event_ids(), event_ids())
+
+
+if __name__ == '__main__':
+    unittest.main()
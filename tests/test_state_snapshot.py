@@ -0,0 +1,100 @@
+"""Tests for compiled game state snapshots."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src import state_snapshot
+from src.state_manager import load_game_state, game_state_to_dict
+from src.state_snapshot import snapshot_path, read_snapshot, write_snapshot, SnapshotError, _INDEX_FIELDS
+
+BIG_GAME = Path("examples/big_game/game_state.json")
+
+
+class TestStateSnapshot(unittest.TestCase):
+    """A snapshot loads to the state it was compiled from."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.json_path = Path(tmp.name) / "game_state.json"
+        shutil.copy(BIG_GAME, self.json_path)
+        self.expected = load_game_state(self.json_path)
+
+    def compile(self, state=None):
+        write_snapshot(state or self.expected, snapshot_path(self.json_path), self.json_path)
+
+    def assertSameState(self, state, expected):
+        self.assertEqual(game_state_to_dict(state), game_state_to_dict(expected))
+        for name in _INDEX_FIELDS:
+            self.assertEqual(getattr(state, name), getattr(expected, name), name)
+        self.assertEqual(state._entity_registry.entries.keys(), expected._entity_registry.entries.keys())
+
+    def test_round_trip(self):
+        self.compile()
+        state = read_snapshot(snapshot_path(self.json_path))
+
+        self.assertSameState(state, self.expected)
+        entity = next(item for item in state.items if "llm_context" in item._properties)
+        self.assertEqual(entity.llm_context, next(i for i in self.expected.items if i.id == entity.id).llm_context)
+
+    def test_indexes_stay_current_after_load(self):
+        self.compile()
+        state = read_snapshot(snapshot_path(self.json_path))
+        for target in (state, self.expected):
+            item = target.items[0]
+            item.location = "player"
+            item.name = "zither"
+            target.items.remove(target.items[1])
+
+        self.assertSameState(state, self.expected)
+
+    def test_fresh_snapshot_used_by_load_game_state(self):
+        self.expected.turn_count = 41
+        self.compile()
+
+        self.assertEqual(load_game_state(self.json_path).turn_count, 41)
+
+    def test_stale_snapshot_ignored(self):
+        self.expected.turn_count = 41
+        self.compile()
+        stat = self.json_path.stat()
+        os.utime(self.json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertEqual(load_game_state(self.json_path).turn_count, 0)
+
+    def test_edit_with_restored_mtime_ignored(self):
+        self.compile()
+        stat = self.json_path.stat()
+        text = self.json_path.read_text()
+        title = self.expected.metadata.title
+        self.json_path.write_text(text.replace(title, title[::-1], 1))
+        os.utime(self.json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(load_game_state(self.json_path).metadata.title, title[::-1])
+
+    def test_snapshot_of_other_schema_ignored(self):
+        self.compile()
+        path = snapshot_path(self.json_path)
+        data = path.read_bytes()
+        path.write_bytes(data.replace(state_snapshot._SCHEMA_FINGERPRINT.encode(), b"0" * 16, 1))
+
+        with self.assertRaises(SnapshotError):
+            read_snapshot(path)
+        with self.assertLogs("src.state_snapshot", level="WARNING"):
+            self.assertSameState(load_game_state(self.json_path), self.expected)
+
+    def test_incompatible_snapshot_falls_back_to_json(self):
+        snapshot_path(self.json_path).write_bytes(b"TGSNAP\x00cpython-00\n")
+
+        with self.assertRaises(SnapshotError):
+            read_snapshot(snapshot_path(self.json_path))
+        with self.assertLogs("src.state_snapshot", level="WARNING"):
+            state = load_game_state(self.json_path)
+        self.assertSameState(state, self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ import unittest
 from dataclasses import dataclass
 from typing import List
 
-from src.turn_executor import initialize, execute_turn_phases, _topological_sort
+from src.turn_executor import TurnScheduler, _topological_sort
 from src.behavior_manager import HookDefinition
 from src.types import TurnHookId
 from src.state_manager import GameState, Actor, Location, Item
@@ -320,8 +320,8 @@ class TestTopologicalSort(unittest.TestCase):
         self.assertIn("not a defined turn phase", error_msg)
 
 
-class TestInitialize(unittest.TestCase):
-    """Test initialize function filters and caches turn phases."""
+class TestTurnSchedulerInit(unittest.TestCase):
+    """Test TurnScheduler filters and caches turn phases."""
 
     def test_filters_to_turn_phases_only(self):
         """Only turn_phase hooks are included in sort."""
@@ -352,11 +352,10 @@ class TestInitialize(unittest.TestCase):
             ),
         }
 
-        initialize(hook_defs)
+        scheduler = TurnScheduler(hook_defs)
 
-        # Check that turn_executor's internal state has correct phases
-        from src import turn_executor
-        self.assertEqual(turn_executor._ordered_turn_phases, ["turn_a", "turn_b"])
+        # Check that the scheduler has the correct phases
+        self.assertEqual(scheduler.ordered_turn_phases, ["turn_a", "turn_b"])
 
     def test_caches_order(self):
         """Topological sort cached and reused."""
@@ -379,10 +378,23 @@ class TestInitialize(unittest.TestCase):
             ),
         }
 
-        initialize(hook_defs)
+        scheduler = TurnScheduler(hook_defs)
 
-        from src import turn_executor
-        self.assertEqual(turn_executor._ordered_turn_phases, ["turn_a", "turn_b"])
+        self.assertEqual(scheduler.ordered_turn_phases, ["turn_a", "turn_b"])
+
+    def test_schedulers_are_independent(self):
+        """Each scheduler keeps its own order (no module-global state)."""
+        def phase(name, before=()):
+            return HookDefinition(
+                hook_id=TurnHookId(name), invocation="turn_phase", after=[],
+                before=[TurnHookId(b) for b in before], description=name, defined_by="test"
+            )
+
+        first = TurnScheduler({"turn_a": phase("turn_a"), "turn_b": phase("turn_b")})
+        second = TurnScheduler({"turn_z": phase("turn_z", before=["turn_y"]), "turn_y": phase("turn_y")})
+
+        self.assertEqual(first.ordered_turn_phases, ["turn_a", "turn_b"])
+        self.assertEqual(second.ordered_turn_phases, ["turn_z", "turn_y"])
 
 
 class TestExecuteTurnPhases(unittest.TestCase):
@@ -403,20 +415,16 @@ class TestExecuteTurnPhases(unittest.TestCase):
 
     def test_increments_turn_count(self):
         """Turn count incremented before phase execution."""
-        from src import turn_executor
-
         # Initialize with empty phases
-        initialize({})
+        scheduler = TurnScheduler({})
 
         initial_turn = self.state.turn_count
-        execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
+        scheduler.execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
 
         self.assertEqual(self.state.turn_count, initial_turn + 1)
 
     def test_invokes_phases_in_order(self):
         """Phases invoked in topological order."""
-        from src import turn_executor
-
         # Set up phases
         hook_defs = {
             "turn_first": HookDefinition(
@@ -436,7 +444,7 @@ class TestExecuteTurnPhases(unittest.TestCase):
                 defined_by="test"
             ),
         }
-        initialize(hook_defs)
+        scheduler = TurnScheduler(hook_defs)
 
         # Mock behavior_manager to track invocations
         invoked_hooks = []
@@ -454,7 +462,7 @@ class TestExecuteTurnPhases(unittest.TestCase):
         self.behavior_manager.get_event_for_hook = mock_get_event
         self.behavior_manager.invoke_behavior = mock_invoke
 
-        messages = execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
+        messages = scheduler.execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
 
         # Check invocation order
         self.assertEqual(invoked_hooks, ["turn_first", "turn_second"])
@@ -462,8 +470,6 @@ class TestExecuteTurnPhases(unittest.TestCase):
 
     def test_skips_hooks_without_events(self):
         """Hooks without registered events are skipped."""
-        from src import turn_executor
-
         hook_defs = {
             "turn_with_event": HookDefinition(
                 hook_id=TurnHookId("turn_with_event"),
@@ -482,7 +488,7 @@ class TestExecuteTurnPhases(unittest.TestCase):
                 defined_by="test"
             ),
         }
-        initialize(hook_defs)
+        scheduler = TurnScheduler(hook_defs)
 
         invoked_hooks = []
 
@@ -501,15 +507,13 @@ class TestExecuteTurnPhases(unittest.TestCase):
         self.behavior_manager.get_event_for_hook = mock_get_event
         self.behavior_manager.invoke_behavior = mock_invoke
 
-        execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
+        scheduler.execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
 
         # Only the hook with an event should be invoked
         self.assertEqual(invoked_hooks, ["turn_with_event"])
 
     def test_collects_narration_messages(self):
         """Narration messages collected from all phases."""
-        from src import turn_executor
-
         hook_defs = {
             "turn_a": HookDefinition(
                 hook_id=TurnHookId("turn_a"),
@@ -528,7 +532,7 @@ class TestExecuteTurnPhases(unittest.TestCase):
                 defined_by="test"
             ),
         }
-        initialize(hook_defs)
+        scheduler = TurnScheduler(hook_defs)
 
         def mock_get_event(hook_id):
             return f"on_{hook_id}"
@@ -544,7 +548,7 @@ class TestExecuteTurnPhases(unittest.TestCase):
         self.behavior_manager.get_event_for_hook = mock_get_event
         self.behavior_manager.invoke_behavior = mock_invoke
 
-        messages = execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
+        messages = scheduler.execute_turn_phases(self.state, self.behavior_manager, self.accessor, self.action)
 
         self.assertEqual(messages, ["Message A", "Message B"])
 
@@ -0,0 +1,102 @@
+"""Tests for the append-only turn journal."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.command_utils import parsed_to_json
+from src.game_engine import GameEngine
+from src.state_accessor import StateAccessor
+from src.state_manager import game_state_to_dict
+from src.turn_journal import TurnJournal, read_journal, restore_game_state, JOURNAL_FILE, SNAPSHOT_FILE
+
+COMMANDS = ["look", "take sword", "inventory", "north", "take key", "south", "drop sword", "look"]
+
+
+def saved_form(state):
+    """What save_game_state would write for state, as plain JSON data."""
+    return json.loads(json.dumps(game_state_to_dict(state)))
+
+
+class TestTurnJournal(unittest.TestCase):
+    """Snapshot + replay reproduces the saved state."""
+
+    def setUp(self):
+        self.engine = GameEngine(Path("examples/simple_game"))
+        self.state = self.engine.game_state
+        self.parser = self.engine.create_parser()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name)
+        self.journal = TurnJournal(self.state, self.directory, fsync=False)
+        self.addCleanup(self.journal.close)
+
+    def play(self, command):
+        self.engine.json_handler.handle_message(parsed_to_json(self.parser.parse_command(command)))
+        return self.journal.commit()
+
+    def assertRestored(self):
+        self.assertEqual(read_journal(self.directory), saved_form(self.state))
+
+    def test_replay_matches_after_each_turn(self):
+        for command in COMMANDS:
+            self.play(command)
+            self.assertRestored()
+        self.assertEqual(restore_game_state(self.directory).turn_count, self.state.turn_count)
+
+    def test_only_changed_entities_written(self):
+        self.play("take sword")
+        entry = json.loads((self.directory / JOURNAL_FILE).read_text().splitlines()[-1])
+
+        self.assertIn("item_sword", entry["set"]["items"])
+        self.assertLess(len(entry["set"].get("items", {})), len(self.state.items))
+        self.assertEqual(self.journal.commit(), 0)
+
+    def test_direct_property_writes_are_journaled(self):
+        self.state.get_item("item_sword").properties["polished"] = True
+        self.assertEqual(self.journal.commit(), 1)
+        self.assertRestored()
+
+    def test_accessor_updates_added_and_removed_entities(self):
+        accessor = StateAccessor(self.state, self.engine.behavior_manager)
+        accessor.update(self.state.get_location("loc_start"), {"properties.visited_twice": True})
+        sword = self.state.get_item("item_sword")
+        self.state.items.remove(sword)
+        self.journal.commit()
+        self.assertRestored()
+
+        self.state.items.append(sword)
+        self.journal.commit()
+        self.assertRestored()
+
+    def test_compaction_truncates_journal(self):
+        self.journal.snapshot_every = 3
+        for command in COMMANDS:
+            self.play(command)
+        self.assertLess(len((self.directory / JOURNAL_FILE).read_text().splitlines()), 3)
+        self.assertRestored()
+
+    def test_incomplete_last_entry_ignored(self):
+        self.play("take sword")
+        expected = read_journal(self.directory)
+        with open(self.directory / JOURNAL_FILE, "a") as f:
+            f.write('{"seq": 99, "set": {"items": {"item_sw')
+
+        with self.assertLogs("src.turn_journal", level="WARNING"):
+            self.assertEqual(read_journal(self.directory), expected)
+
+    def test_attach_starts_from_new_state(self):
+        self.play("take sword")
+        restored = restore_game_state(self.directory)
+        self.engine.reload_state(restored)
+        self.journal.attach(restored)
+        self.state = restored
+
+        self.assertEqual(json.loads((self.directory / SNAPSHOT_FILE).read_text())["state"], saved_form(restored))
+        self.play("drop sword")
+        self.assertRestored()
+
+
+if __name__ == '__main__':
+    unittest.main()
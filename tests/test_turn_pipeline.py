@@ -0,0 +1,108 @@
+"""Tests for the pipelined turn executor."""
+
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.game_engine import GameEngine
+from src.llm_parser_adapter import LLMParserAdapter
+from src.phrase_cache import PhraseCache
+from src.turn_pipeline import TurnPipeline
+from tests.llm_interaction.mock_narrator import MockLLMNarrator
+
+
+class StubLLMParser:
+    """Stands in for LLMCommandParser, answering every input with one command."""
+
+    def __init__(self, output: Optional[Dict[str, Any]], wait_for: Optional[threading.Event] = None):
+        self.output = output
+        self.wait_for = wait_for
+        self.calls: List[tuple] = []
+        self.overlapped = False
+
+    def parse_command(self, player_input: str, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        self.calls.append((player_input, context))
+        if self.wait_for is not None:
+            self.overlapped = self.wait_for.wait(timeout=5)
+        return self.output
+
+
+class SignallingNarrator(MockLLMNarrator):
+    """Mock narrator that signals when prepare_narration runs."""
+
+    prepared: threading.Event
+
+    def prepare_narration(self) -> None:
+        super().prepare_narration()
+        self.prepared.set()
+
+
+class TestTurnPipeline(unittest.TestCase):
+    """Local-first parsing, LLM fallback and narration."""
+
+    def setUp(self):
+        self.engine = GameEngine(Path("examples/simple_game"))
+        self.narrator = SignallingNarrator(self.engine.json_handler, ["The room is quiet."],
+                                           vocabulary=self.engine.merged_vocabulary)
+        self.narrator.prepared = threading.Event()
+        self.adapter = LLMParserAdapter(self.engine.merged_vocabulary)
+
+    def pipeline(self, llm_parser: Optional[StubLLMParser],
+                 phrase_cache: Optional[PhraseCache] = None) -> TurnPipeline:
+        pipeline = TurnPipeline(self.engine, self.narrator, llm_parser,
+                                self.adapter if llm_parser else None, phrase_cache=phrase_cache)
+        self.addCleanup(pipeline.close)
+        return pipeline
+
+    def test_local_parse_skips_llm(self):
+        llm_parser = StubLLMParser({"type": "command", "action": {"verb": "look"}})
+        pipeline = self.pipeline(llm_parser)
+
+        self.assertEqual("".join(pipeline.run_turn_stream("look")), "The room is quiet.")
+        self.assertEqual(llm_parser.calls, [])
+        self.assertEqual(self.narrator.prepare_count, 0)
+        self.assertEqual(pipeline.stats["local"], 1)
+
+    def test_llm_parse_overlaps_narrator_preparation(self):
+        llm_parser = StubLLMParser({"type": "command", "action": {"verb": "look"}},
+                                   wait_for=self.narrator.prepared)
+        pipeline = self.pipeline(llm_parser)
+
+        self.assertEqual("".join(pipeline.run_turn_stream("could you have a look")),
+                         "The room is quiet.")
+        self.assertTrue(llm_parser.overlapped)
+        input_text, context = llm_parser.calls[0]
+        self.assertEqual(input_text, "could you have a look")
+        self.assertIn("sword", context["location_objects"])
+        self.assertEqual(pipeline.stats["llm"], 1)
+
+    def test_repeated_rephrasing_served_from_phrase_cache(self):
+        llm_parser = StubLLMParser({"type": "command", "action": {"verb": "look"}})
+        pipeline = self.pipeline(llm_parser, PhraseCache())
+
+        first = pipeline.parse("could you have a look")
+        second = pipeline.parse("Have a look, please!")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(llm_parser.calls), 1)
+        self.assertEqual(self.narrator.prepare_count, 1)
+        self.assertEqual(pipeline.stats["cached"], 1)
+
+    def test_unparseable_input_returns_none(self):
+        pipeline = self.pipeline(StubLLMParser({"type": "command", "action": {"verb": "xyzzy"}}))
+
+        self.assertIsNone(pipeline.run_turn_stream("please xyzzy"))
+        self.assertEqual(self.narrator.call_count, 0)
+        self.assertEqual(pipeline.stats["unparsed"], 1)
+
+    def test_without_llm_parser(self):
+        pipeline = self.pipeline(None)
+
+        self.assertEqual(pipeline.parse("take sword")["action"]["verb"], "take")
+        self.assertIsNone(pipeline.parse("could you have a look"))
+        self.assertEqual(self.narrator.prepare_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Tests for the opt-in turn latency profiler."""
+
+import unittest
+from pathlib import Path
+
+from src.game_engine import GameEngine
+from src.turn_profiler import TurnProfiler, percentile
+
+
+class TestTurnProfiler(unittest.TestCase):
+    """Profiler bookkeeping independent of the engine."""
+
+    def test_percentile_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(samples, 50), 50.0)
+        self.assertEqual(percentile(samples, 95), 95.0)
+        self.assertEqual(percentile(samples, 99), 99.0)
+        self.assertEqual(percentile([3.0], 99), 3.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_turn_report_and_summary(self):
+        profiler = TurnProfiler()
+        profiler.begin_turn()
+        self.assertEqual(profiler.call("handler", "take (core)", lambda x: x * 2, 21), 42)
+        profiler.record("behavior", "mod.on_take", 0.002)
+        profiler.record("behavior", "mod.on_take", 0.004)
+        report = profiler.end_turn("take")
+
+        self.assertEqual(report["behavior"]["mod.on_take"], {"calls": 2, "ms": 6.0})
+        self.assertEqual(report["handler"]["take (core)"]["calls"], 1)
+        self.assertIn("total_ms", report)
+
+        # Calls outside a turn still count toward the session summary
+        profiler.record("behavior", "mod.on_take", 0.010)
+        summary = profiler.summary()
+        self.assertEqual(summary["behavior"]["mod.on_take"]["calls"], 3)
+        self.assertEqual(summary["behavior"]["mod.on_take"]["p99_ms"], 10.0)
+        self.assertEqual(summary["turn"]["take"]["calls"], 1)
+        self.assertIn("mod.on_take", profiler.format_summary())
+
+
+class TestProtocolProfiling(unittest.TestCase):
+    """Profiling through LLMProtocolHandler.handle_command."""
+
+    def setUp(self):
+        self.engine = GameEngine(Path("examples/simple_game"))
+        self.handler = self.engine.json_handler
+
+    def tearDown(self):
+        self.handler.disable_profiling()
+
+    def test_disabled_by_default(self):
+        result = self.handler.handle_message({"type": "command", "action": {"verb": "look"}})
+        self.assertNotIn("profile", result.get("data", {}))
+        self.assertIsNone(self.engine.behavior_manager.profiler)
+
+    def test_profile_in_response_data(self):
+        profiler = self.handler.enable_profiling()
+        result = self.handler.handle_message({"type": "command", "action": {"verb": "look"}})
+        self.assertTrue(result["success"])
+
+        profile = result["data"]["profile"]
+        self.assertGreater(profile["total_ms"], 0)
+        self.assertTrue(any(name.startswith("look (") for name in profile["handler"]))
+        self.assertIn("scope", profile["narration"])
+
+        self.handler.handle_message({"type": "command", "action": {"verb": "look"}})
+        summary = profiler.summary()
+        self.assertEqual(summary["turn"]["look"]["calls"], 2)
+        self.assertEqual(profiler.turns, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Tests for in-memory undo/redo of turns."""
+
+import json
+import unittest
+from pathlib import Path
+
+from src.command_utils import parsed_to_json
+from src.game_engine import GameEngine
+from src.state_manager import Item, game_state_to_dict, load_game_state
+
+COMMANDS = ["look", "take sword", "inventory", "north", "take key", "south", "drop sword", "look"]
+
+INDEXES = ("_entities_at", "_entity_where", "_ids_by_name_token", "_indexed_name", "_connected_to")
+
+
+def saved_form(state):
+    """What save_game_state would write for state, as plain JSON data."""
+    return json.loads(json.dumps(game_state_to_dict(state)))
+
+
+class TestUndoHistory(unittest.TestCase):
+    """Undo and redo return to the state at each checkpoint."""
+
+    def setUp(self):
+        self.engine = GameEngine(Path("examples/simple_game"))
+        self.state = self.engine.game_state
+        self.parser = self.engine.create_parser()
+        self.history = self.engine.enable_undo()
+        self.addCleanup(self.history.close)
+
+    def play(self, command):
+        self.engine.json_handler.handle_message(parsed_to_json(self.parser.parse_command(command)))
+        return self.history.checkpoint()
+
+    def session(self):
+        handler = self.engine.json_handler
+        return set(handler.visited_locations), set(handler.examined_entities)
+
+    def assertIndexesMatch(self, expected):
+        for name in INDEXES:
+            actual = {key: value for key, value in getattr(self.state, name).items() if value}
+            wanted = {key: value for key, value in getattr(expected, name).items() if value}
+            self.assertEqual(actual, wanted, name)
+
+    def test_undo_and_redo_every_turn(self):
+        saves = [(saved_form(self.state), self.session())]
+        for command in COMMANDS:
+            if self.play(command):
+                saves.append((saved_form(self.state), self.session()))
+
+        for expected in reversed(saves[:-1]):
+            self.assertTrue(self.history.undo())
+            self.assertEqual((saved_form(self.state), self.session()), expected)
+        self.assertFalse(self.history.undo())
+        self.assertIndexesMatch(GameEngine(Path("examples/simple_game")).game_state)
+
+        for expected in saves[1:]:
+            self.assertTrue(self.history.redo())
+            self.assertEqual((saved_form(self.state), self.session()), expected)
+        self.assertFalse(self.history.redo())
+        self.state.check_registry()
+
+    def test_undo_restores_indexes_and_entity_identity(self):
+        sword = self.state.get_item("item_sword")
+        start = sword.location
+        self.play("take sword")
+        self.history.undo()
+
+        self.assertIs(self.state.get_item("item_sword"), sword)
+        self.assertEqual(sword.location, start)
+        self.assertIn("item_sword", self.state._entities_at[start])
+        self.assertNotIn("item_sword", self.state._entities_at.get("player", set()))
+
+    def test_added_and_removed_entities(self):
+        order = [item.id for item in self.state.items]
+        sword = self.state.get_item("item_sword")
+        self.state.items.remove(sword)
+        self.state.items.append(Item(id="item_pebble", name="pebble", description="A pebble.", location="loc_start"))
+        self.history.checkpoint()
+
+        self.history.undo()
+        self.assertEqual([item.id for item in self.state.items], order)
+        self.assertIs(self.state.get_item("item_sword"), sword)
+        self.assertIsNone(self.state.lookup("item", "item_pebble"))
+        self.history.redo()
+        self.assertIsNone(self.state.lookup("item", "item_sword"))
+        self.assertEqual(self.state.get_item("item_pebble").name, "pebble")
+        self.state.check_registry()
+
+    def test_undo_discards_changes_since_checkpoint(self):
+        self.play("take sword")
+        expected = saved_form(self.state)
+        self.play("north")
+        self.state.get_item("item_sword").properties["polished"] = True
+
+        self.history.undo()
+        self.assertEqual(saved_form(self.state), expected)
+        self.history.redo()
+        self.assertNotIn("polished", self.state.get_item("item_sword").properties)
+
+    def test_checkpoint_clears_redo(self):
+        self.play("take sword")
+        self.history.undo()
+        self.assertTrue(self.history.can_redo)
+        self.play("north")
+        self.assertFalse(self.history.can_redo)
+
+    def test_depth_and_memory_limits(self):
+        self.history.depth = 2
+        for command in COMMANDS:
+            self.play(command)
+        self.assertEqual(len(self.history._undo), 2)
+
+        self.history.memory_limit = 0
+        self.play("take sword")
+        self.assertEqual(len(self.history._undo), 1)
+
+    def test_entities_imaged_on_first_access(self):
+        self.assertEqual(self.history.memory_used, 0)
+        sword = self.state.get_item("item_sword")
+        sword.properties["polished"] = True
+        self.assertGreater(self.history.memory_used, 0)
+
+        self.assertTrue(self.history.checkpoint())
+        self.history.undo()
+        self.assertNotIn("polished", sword.properties)
+
+    def test_inventory_edited_in_place(self):
+        expected = saved_form(self.state)
+        self.state.actors["player"].inventory.append("item_sword")
+        self.assertTrue(self.history.checkpoint())
+
+        self.history.undo()
+        self.assertEqual(saved_form(self.state), expected)
+
+    def test_images_count_toward_memory_limit(self):
+        self.play("take sword")
+        self.play("north")
+        self.history.memory_limit = self.history.memory_used
+        for item in self.state.items:
+            item.properties.get("portable")
+        self.assertEqual(len(self.history._undo), 1)
+
+    def test_reload_state_starts_over(self):
+        self.play("take sword")
+        self.engine.reload_state(load_game_state(saved_form(self.state)))
+        self.assertFalse(self.history.can_undo)
+
+        self.engine.json_handler.handle_message(parsed_to_json(self.parser.parse_command("drop sword")))
+        self.history.checkpoint()
+        self.history.undo()
+        self.assertEqual(self.engine.game_state.get_item("item_sword").location, "player")
+
+
+class TestUndoMetaCommands(unittest.TestCase):
+    """The undo and redo verbs signal the game loop."""
+
+    def test_undo_and_redo_parse_to_signals(self):
+        engine = GameEngine(Path("examples/simple_game"))
+        parser = engine.create_parser()
+        for verb in ("undo", "redo"):
+            response = engine.json_handler.handle_message(parsed_to_json(parser.parse_command(verb)))
+            self.assertEqual(response["data"]["signal"], verb)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""Tests for the incrementally maintained session vocabulary."""
+
+import copy
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.game_engine import GameEngine
+from src.parser import Parser
+from src.phrase_cache import PhraseCache
+from src.state_manager import load_game_state
+from src.vocabulary_service import build_merged_vocabulary
+
+
+def vocabulary_signature(vocabulary):
+    """Section -> sorted entries, ignoring entry order and synonym order."""
+    return {
+        section: sorted(
+            json.dumps(dict(entry, synonyms=sorted(entry.get("synonyms", []))) if isinstance(entry, dict) else entry,
+                       sort_keys=True)
+            for entry in entries
+        )
+        for section, entries in vocabulary.items()
+    }
+
+
+def lookup_signature(parser):
+    """Lookup key -> what the parser resolves it to."""
+    return {
+        key: (entry.word, sorted(map(str, entry.word_type)) if isinstance(entry.word_type, set)
+              else str(entry.word_type), sorted(entry.synonyms), entry.object_required, entry.value)
+        for key, entry in parser.word_lookup.items()
+    }
+
+
+class TestVocabularyService(unittest.TestCase):
+    """The live vocabulary matches a full rebuild as entities change."""
+
+    def setUp(self):
+        self.engine = GameEngine(Path("examples/simple_game"))
+        self.state = self.engine.game_state
+        self.parser = self.engine.create_parser()
+
+    def assertMatchesFullRebuild(self):
+        full = build_merged_vocabulary(self.state, self.engine.behavior_manager)
+        self.assertEqual(vocabulary_signature(self.engine.merged_vocabulary), vocabulary_signature(full))
+        self.assertEqual(lookup_signature(self.parser), lookup_signature(Parser(full)))
+
+    def spawn(self, item_id, name):
+        item = copy.deepcopy(self.state.items[0])
+        item.id = item_id
+        item.name = name
+        self.state.items.append(item)
+        return item
+
+    def test_initial_vocabulary_matches_full_build(self):
+        self.assertMatchesFullRebuild()
+
+    def test_spawned_item_is_parsed(self):
+        self.assertNotIn("zithers", self.parser.word_lookup)
+        self.spawn("item_zither", "old zither")
+
+        result = self.parser.parse_command("take zithers")
+        self.assertIsNotNone(result)
+        self.assertEqual(result.direct_object.word, "zither")
+        self.assertMatchesFullRebuild()
+
+    def test_removed_item_noun_dropped(self):
+        item = self.spawn("item_zither", "zither")
+        self.state.items.remove(item)
+
+        self.assertNotIn("zither", self.parser.word_lookup)
+        self.assertMatchesFullRebuild()
+
+    def test_noun_kept_while_another_entity_has_the_name(self):
+        first = self.spawn("item_zither", "zither")
+        self.spawn("item_zither_2", "zither")
+        self.state.items.remove(first)
+
+        self.assertIn("zither", self.parser.word_lookup)
+        self.assertMatchesFullRebuild()
+
+    def test_rename(self):
+        item = self.spawn("item_zither", "zither")
+        item.name = "glowing orb"
+
+        self.assertNotIn("zither", self.parser.word_lookup)
+        self.assertIn("orb", self.parser.word_lookup)
+        self.assertMatchesFullRebuild()
+
+    def test_random_changes_match_full_rebuild(self):
+        rng = random.Random(7)
+        words = ["zither", "sword", "door", "key", "north", "look", "rusty key", "keys", "stand"]
+        for step in range(60):
+            choice = rng.random()
+            if choice < 0.4 or not self.state.items:
+                self.spawn(f"item_spawned_{step}", " ".join(rng.sample(words, rng.randint(1, 2))))
+            elif choice < 0.6:
+                self.state.items.remove(rng.choice(self.state.items))
+            else:
+                rng.choice(self.state.items).name = " ".join(rng.sample(words, rng.randint(1, 2)))
+            self.assertMatchesFullRebuild()
+
+    def test_reload_state_follows_new_state(self):
+        old_state = self.state
+        new_state = load_game_state(str(Path("examples/simple_game/game_state.json")))
+        self.engine.reload_state(new_state)
+        self.state = new_state
+
+        old_state.items[0].name = "anvil"
+        self.assertNotIn("anvil", self.parser.word_lookup)
+        self.spawn("item_anvil", "anvil")
+        self.assertIn("anvil", self.parser.word_lookup)
+        self.assertMatchesFullRebuild()
+
+    def test_phrase_cache_drops_parses_naming_renamed_entity(self):
+        cache = PhraseCache()
+        self.engine.vocabulary_service.add_phrase_cache(cache)
+        scene = {"location": "loc_start"}
+        cache.put("grab the sword", scene, {"type": "command"})
+        cache.put("wave at the stars", scene, {"type": "command"})
+        self.state.get_item("item_sword").name = "anvil"
+
+        self.assertIsNone(cache.get("grab the sword", scene))
+        self.assertIsNotNone(cache.get("wave at the stars", scene))
+
+    def test_phrase_cache_survives_entity_removal_and_reloads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "phrase_cache.json"
+            cache = PhraseCache(path=path)
+            self.engine.vocabulary_service.add_phrase_cache(cache)
+            scene = {"location": "loc_start"}
+            cache.put("grab the sword", scene, {"type": "command"})
+            cache.put("wave at the stars", scene, {"type": "command"})
+            version = self.engine.vocabulary_service.version
+            self.state.items.remove(self.state.get_item("item_potion"))
+
+            self.assertGreater(self.engine.vocabulary_service.version, version)
+            self.assertEqual(len(cache), 2)
+            cache.save()
+
+            reloaded = PhraseCache(path=path)
+            GameEngine(Path("examples/simple_game")).vocabulary_service.add_phrase_cache(reloaded)
+            self.assertEqual(len(reloaded), 2)
+
+    def test_copies_do_not_notify(self):
+        detached = copy.deepcopy(self.state)
+        detached.items[0].name = "anvil"
+        self.assertNotIn("anvil", self.parser.word_lookup)
+
+
+class TestParserUpdateEntries(unittest.TestCase):
+    """Parser.update_entries matches a parser built from the updated vocabulary."""
+
+    VOCAB = {
+        "verbs": [{"word": "take", "synonyms": ["get"]}],
+        "nouns": [{"word": "coin", "synonyms": ["coins"]}, {"word": "coins"}],
+        "adjectives": [{"word": "gold"}],
+        "prepositions": ["in"],
+        "articles": ["the"],
+    }
+
+    def test_removed_synonym_falls_back(self):
+        parser = Parser(self.VOCAB)
+        self.assertEqual(parser.word_lookup["coins"].word, "coins")
+
+        parser.update_entries(["coins"], [])
+        self.assertEqual(parser.word_lookup["coins"].word, "coin")
+
+    def test_inserted_entry_respects_position(self):
+        parser = Parser(self.VOCAB)
+        entry = parser.word_entry_from_data("nouns", {"word": "get"})
+
+        parser.update_entries([], [(1, entry)])
+        self.assertIs(parser.word_lookup["get"], entry)
+        self.assertEqual([e.word for e in parser.word_table][:2], ["take", "get"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Tests for region-sharded worlds loaded on first access."""
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.state_accessor import StateAccessor
+from src.state_manager import load_game_state, game_state_to_dict
+from src.turn_journal import TurnJournal, read_journal
+from src.world_shards import shards_path, write_shards, MANIFEST_FILE
+
+BIG_GAME = Path("examples/big_game/game_state.json")
+
+
+def saved_form(state):
+    """A save of state after a load/save round trip, with sections in id order."""
+    data = game_state_to_dict(load_game_state(json.loads(json.dumps(game_state_to_dict(state)))))
+    for section in ("locations", "items", "locks"):
+        data[section].sort(key=lambda record: record["id"])
+    return data
+
+
+class TestWorldShards(unittest.TestCase):
+    """A sharded world behaves like the fully loaded one."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name)
+        self.json_path = self.directory / "game_state.json"
+        shutil.copy(BIG_GAME, self.json_path)
+        data = json.loads(self.json_path.read_text())
+        self.full = load_game_state(data)
+        write_shards(data, shards_path(self.json_path))
+        self.state = load_game_state(self.json_path)
+
+    def region_location(self, state):
+        """A location id of a region that is not loaded yet."""
+        return state.unloaded_ids("location")[0]
+
+    def test_only_player_region_loaded(self):
+        player_location = self.state.get_location(self.state.actors["player"].location)
+        pending = self.state._shards.pending
+
+        self.assertLess(len(self.state.locations), len(self.full.locations))
+        self.assertNotIn(player_location.properties["region"], pending)
+        self.assertEqual(len(self.state.actors), len(self.full.actors))
+
+    def test_indexes_cover_unloaded_regions(self):
+        self.assertEqual(self.state._entity_where, self.full._entity_where)
+        self.assertEqual(self.state._connected_to, self.full._connected_to)
+
+    def test_lookup_loads_region(self):
+        location_id = self.region_location(self.state)
+        self.assertEqual(self.state.get_location(location_id).id, location_id)
+        self.assertNotIn(location_id, self.state.unloaded_ids("location"))
+
+        self.state.load_regions()
+        self.assertIsNone(self.state._shards)
+        self.state.check_registry()
+        for name in ("_entities_at", "_entity_where", "_ids_by_name_token", "_indexed_name", "_connected_to"):
+            self.assertEqual(getattr(self.state, name), getattr(self.full, name), name)
+
+    def test_containment_query_loads_region(self):
+        location_id = self.region_location(self.state)
+        expected = [entity.id for entity in StateAccessor(self.full, None).get_entities_at(location_id)]
+
+        found = StateAccessor(self.state, None).get_entities_at(location_id)
+        self.assertEqual(sorted(entity.id for entity in found), sorted(expected))
+
+    def test_entering_region_loads_it(self):
+        location_id = self.region_location(self.state)
+        self.state.actors["player"].location = location_id
+
+        self.assertNotIn(location_id, self.state.unloaded_ids("location"))
+        self.assertIn(location_id, self.state._entity_registry.collections["location"].by_id)
+
+    def test_all_entities_loads_matching_regions(self):
+        location_id = self.region_location(self.state)
+        found = self.state.all_entities("location", lambda entity_id: entity_id == location_id)
+
+        self.assertEqual([location.id for location in found], [location_id])
+        self.assertIsNotNone(self.state._shards)
+        self.assertEqual(sorted(location.id for location in self.state.all_entities("location")),
+                         sorted(location.id for location in self.full.locations))
+
+    def test_save_is_complete(self):
+        self.assertEqual(saved_form(self.state), saved_form(self.full))
+        self.state.get_location(self.region_location(self.state))
+        self.assertEqual(saved_form(self.state), saved_form(self.full))
+
+    def test_journal_keeps_unloaded_entities(self):
+        journal = TurnJournal(self.state, self.directory / "journal", fsync=False)
+        self.addCleanup(journal.close)
+        location_id = self.region_location(self.state)
+        self.state.actors["player"].location = location_id
+        journal.commit()
+
+        restored = load_game_state(read_journal(self.directory / "journal"))
+        self.assertEqual(saved_form(restored), saved_form(self.state))
+
+    def test_copies_keep_their_own_pending_regions(self):
+        detached = copy.deepcopy(self.state)
+        location_id = self.region_location(detached)
+        detached.get_location(location_id)
+
+        self.assertIn(location_id, self.state.unloaded_ids("location"))
+        self.assertEqual(self.state.get_location(location_id).id, location_id)
+
+    def test_stale_shards_ignored(self):
+        stat = self.json_path.stat()
+        manifest = shards_path(self.json_path) / MANIFEST_FILE
+        os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+        self.assertIsNone(load_game_state(self.json_path)._shards)
+
+
+if __name__ == '__main__':
+    unittest.main()
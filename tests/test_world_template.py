@@ -0,0 +1,102 @@
+"""Tests for WorldTemplate sessions sharing one parsed game."""
+
+import copy
+import pickle
+import unittest
+from pathlib import Path
+
+from src.game_engine import GameEngine
+from src.state_manager import CoreFieldProtectingDict
+from src.types import ActorId, ItemId
+from src.world_template import FrozenDict, FrozenList, WorldTemplate, freeze
+
+GAME_DIR = Path("examples/simple_game")
+
+
+class TestFrozen(unittest.TestCase):
+    """Read-only shared containers."""
+
+    def test_freeze_is_read_only(self):
+        frozen = freeze({"traits": ["old", "dusty"], "state_variants": {"lit": "glowing"}})
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertIsInstance(frozen["traits"], FrozenList)
+        self.assertEqual(frozen, {"traits": ["old", "dusty"], "state_variants": {"lit": "glowing"}})
+        with self.assertRaises(TypeError):
+            frozen["traits"] = []
+        with self.assertRaises(TypeError):
+            frozen["traits"].append("new")
+        with self.assertRaises(TypeError):
+            frozen["state_variants"].update(lit="dark")
+
+    def test_copy_and_pickle(self):
+        frozen = freeze({"traits": ["old"]})
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        restored = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(restored, frozen)
+        self.assertIsInstance(restored["traits"], FrozenList)
+
+    def test_core_field_dict_pickles(self):
+        properties = CoreFieldProtectingDict({"id", "name"}, {"portable": True})
+        restored = pickle.loads(pickle.dumps(properties))
+        self.assertEqual(restored, {"portable": True})
+        with self.assertRaises(TypeError):
+            restored["name"] = "x"
+
+
+class TestWorldTemplate(unittest.TestCase):
+    """Sessions created from one template."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.template = WorldTemplate(GAME_DIR / "game_state.json")
+
+    def test_sessions_are_independent(self):
+        first = self.template.new_state()
+        second = self.template.new_state()
+        self.assertIsNot(first, second)
+
+        item = first.items[0]
+        item.location = "player"
+        item.states["touched"] = True
+        other = second.get_item(ItemId(item.id))
+        self.assertNotEqual(other.location, "player")
+        self.assertNotIn("touched", other.states)
+        self.assertIn(item.id, first._entities_at["player"])
+        self.assertNotIn(item.id, second._entities_at.get("player", {}))
+        first.check_registry()
+        second.check_registry()
+
+    def test_llm_context_is_shared_and_read_only(self):
+        first = self.template.new_state()
+        second = self.template.new_state()
+        shared = [(a, b) for a, b in zip(first.items, second.items) if a.llm_context]
+        self.assertTrue(shared)
+        item, other = shared[0]
+        self.assertIs(item.llm_context, other.llm_context)
+        with self.assertRaises(TypeError):
+            item.llm_context["traits"] = ["replaced"]
+
+        # Replacing the whole value is private to the session
+        item.llm_context = {"traits": ["replaced"]}
+        self.assertNotEqual(other.llm_context, item.llm_context)
+
+    def test_engines_from_template(self):
+        engine = GameEngine(GAME_DIR, template=self.template)
+        other = GameEngine(GAME_DIR, template=self.template)
+        self.assertIsNotNone(self.template.behavior_modules)
+        self.assertIsNot(engine.game_state, other.game_state)
+
+        result = engine.json_handler.handle_message({"type": "command", "action": {"verb": "look"}})
+        self.assertTrue(result["success"])
+        self.assertEqual(engine.game_state.turn_count, 1)
+        self.assertEqual(other.game_state.turn_count, 0)
+
+        plain = GameEngine(GAME_DIR)
+        self.assertEqual(
+            engine.game_state.get_actor(ActorId("player")).location,
+            plain.game_state.get_actor(ActorId("player")).location,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
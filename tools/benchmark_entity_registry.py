@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for GameState id lookups.
+
+Builds a synthetic state with many items and compares the old linear
+list scan against the id registry for get_item, get_location and
+StateAccessor.get_entity.
+
+Usage:
+    python tools/benchmark_entity_registry.py
+    python tools/benchmark_entity_registry.py --items 50000 --lookups 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import GameState, Metadata, Location, Item, Actor, Lock, Part
+from src.state_accessor import StateAccessor
+from src.types import ActorId, ItemId, LocationId, LockId, PartId
+
+
+def build_state(item_count: int, location_count: int) -> GameState:
+    """Create a synthetic state with item_count items spread over locations."""
+    locations = [
+        Location(id=LocationId(f"loc_{i}"), name=f"Room {i}", description="A room")
+        for i in range(location_count)
+    ]
+    items = [
+        Item(
+            id=ItemId(f"item_{i}"), name=f"thing{i}", description="A thing",
+            location=f"loc_{i % location_count}"
+        )
+        for i in range(item_count)
+    ]
+    locks = [Lock(id=LockId(f"lock_{i}"), name="lock", description="A lock") for i in range(100)]
+    parts = [Part(id=PartId(f"part_{i}"), name="wall", part_of=f"loc_{i}") for i in range(location_count)]
+    player = Actor(id=ActorId("player"), name="Adventurer", description="You", location=LocationId("loc_0"))
+    return GameState(
+        metadata=Metadata(title="Benchmark", version="1.0", start_location="loc_0"),
+        locations=locations, items=items, locks=locks, parts=parts,
+        actors={ActorId("player"): player}
+    )
+
+
+def _scan(entities: List[Any], entity_id: str) -> Optional[Any]:
+    for entity in entities:
+        if entity.id == entity_id:
+            return entity
+    return None
+
+
+def _scan_entity(state: GameState, entity_id: str) -> Optional[Any]:
+    """get_entity as previously implemented: five chained scans."""
+    return (_scan(state.locations, entity_id) or _scan(state.items, entity_id)
+            or state.actors.get(ActorId(entity_id)) or _scan(state.locks, entity_id)
+            or _scan(state.parts, entity_id))
+
+
+def time_lookups(fn: Callable[[str], Any], ids: List[str]) -> float:
+    """Return mean microseconds per lookup."""
+    start = time.perf_counter()
+    for entity_id in ids:
+        fn(entity_id)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=50000, help="Number of synthetic items")
+    parser.add_argument("--locations", type=int, default=1000, help="Number of synthetic locations")
+    parser.add_argument("--lookups", type=int, default=1000, help="Lookups per measurement")
+    args = parser.parse_args()
+
+    build_start = time.perf_counter()
+    state = build_state(args.items, args.locations)
+    build_ms = (time.perf_counter() - build_start) * 1000
+    accessor = StateAccessor(state, None)  # type: ignore[arg-type]
+
+    rng = random.Random(0)
+    item_ids = [f"item_{rng.randrange(args.items)}" for _ in range(args.lookups)]
+    loc_ids = [f"loc_{rng.randrange(args.locations)}" for _ in range(args.lookups)]
+    part_ids = [f"part_{rng.randrange(args.locations)}" for _ in range(args.lookups)]
+
+    rows = [
+        ("get_item", lambda i: _scan(state.items, i), lambda i: accessor.get_item(ItemId(i)), item_ids),
+        ("get_location", lambda i: _scan(state.locations, i), lambda i: accessor.get_location(LocationId(i)), loc_ids),
+        ("get_entity (part)", lambda i: _scan_entity(state, i), accessor.get_entity, part_ids),
+    ]
+
+    print(f"State: {args.items} items, {args.locations} locations (built in {build_ms:.1f} ms)")
+    print(f"{'lookup':<20} {'scan us/op':>12} {'registry us/op':>15} {'speedup':>9}")
+    for label, before, after, ids in rows:
+        scan_us = time_lookups(before, ids)
+        registry_us = time_lookups(after, ids)
+        print(f"{label:<20} {scan_us:>12.2f} {registry_us:>15.3f} {scan_us / registry_us:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
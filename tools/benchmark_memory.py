@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Measure the memory held by a loaded GameState.
+
+Replicates a game's world N times (every entity id gets a "_rK" suffix
+and all references are rewritten, so the copies are disjoint regions),
+round-trips it through JSON text so no strings are shared the way they
+would not be in a real file, then loads it with load_game_state and
+reports the memory retained by the GameState (tracemalloc), per entity
+and in total, plus the load time.
+
+Usage:
+    python tools/benchmark_memory.py
+    python tools/benchmark_memory.py examples/big_game --scale 100
+    python tools/benchmark_memory.py examples/simple_game --scale 1000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Set
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import load_game_state
+
+ENTITY_LISTS = ("locations", "items", "locks", "parts", "exits")
+
+
+def _entity_ids(data: Dict[str, Any]) -> Set[str]:
+    ids = set(data.get("actors", {}))
+    for key in ENTITY_LISTS:
+        ids.update(entity["id"] for entity in data.get(key, []))
+    return ids
+
+
+def _rename(value: Any, ids: Set[str], suffix: str) -> Any:
+    """Copy value with every reference to an entity id suffixed."""
+    if isinstance(value, str):
+        if value in ids:
+            return value + suffix
+        if value.startswith("exit:"):
+            _, location_id, direction = value.split(":", 2)
+            if location_id in ids:
+                return f"exit:{location_id}{suffix}:{direction}"
+        return value
+    if isinstance(value, dict):
+        return {key: _rename(item, ids, suffix) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rename(item, ids, suffix) for item in value]
+    return value
+
+
+def scale_game(data: Dict[str, Any], scale: int) -> Dict[str, Any]:
+    """Return game data with the world replicated scale times (copy 0 keeps the original ids)."""
+    ids = _entity_ids(data)
+    result = {key: value for key, value in data.items() if key not in ENTITY_LISTS and key != "actors"}
+    for key in ENTITY_LISTS:
+        result[key] = list(data.get(key, []))
+    result["actors"] = dict(data["actors"])
+    for copy_index in range(1, scale):
+        suffix = f"_r{copy_index}"
+        for key in ENTITY_LISTS:
+            result[key].extend(_rename(data.get(key, []), ids, suffix))
+        for actor_id, actor in data["actors"].items():
+            result["actors"][actor_id + suffix] = _rename(actor, ids, suffix)
+    return result
+
+
+def measure(text: str) -> Dict[str, float]:
+    """Load a GameState from JSON text and return its retained memory and load time."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    state = load_game_state(json.loads(text))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    entities = (len(state.locations) + len(state.items) + len(state.locks)
+                + len(state.parts) + len(state.exits) + len(state.actors))
+    return {"entities": entities, "bytes": retained, "load_s": elapsed}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", nargs="?", default="examples/big_game", help="Game directory")
+    parser.add_argument("--scale", type=int, default=100, help="Number of copies of the world")
+    args = parser.parse_args()
+
+    with open(Path(args.game_dir) / "game_state.json") as f:
+        data = json.load(f)
+    text = json.dumps(scale_game(data, args.scale))
+
+    result = measure(text)
+    print(f"Game: {args.game_dir} x{args.scale} ({len(text) / 1024 / 1024:.1f} MB of JSON)")
+    print(f"Entities: {result['entities']}")
+    print(f"Retained: {result['bytes'] / 1024 / 1024:.1f} MB, "
+          f"{result['bytes'] / result['entities']:.0f} bytes/entity")
+    print(f"Load:     {result['load_s'] * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark the size of narrator input payloads.
+
+Replays the commands of walkthrough files against the game, builds the
+narration input each turn would send to the narrator, and compares the
+encodings:
+
+    indent2      json.dumps(narration, indent=2)  (previous format)
+    compact      encode_narration(narration)
+    abbreviated  encode_narration(narration, abbreviate=True)
+
+The opening-scene payload (location query result) is compared the same way.
+
+Token counts use the tokenizer given with --tokenizer (a HuggingFace model
+path; needs the transformers package). Without it they are estimated by
+counting words, numbers, punctuation marks and whitespace runs, splitting
+identifiers at underscores; that tracks BPE tokenizers closely enough to
+compare encodings.
+
+Usage:
+    python tools/benchmark_narration_payload.py
+    python tools/benchmark_narration_payload.py "walkthroughs/test_fungal_*.txt"
+    python tools/benchmark_narration_payload.py --tokenizer mlx-community/Llama-3.2-3B-Instruct-4bit
+"""
+
+import argparse
+import glob
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.game_engine import GameEngine
+from src.narration_encoder import encode_narration, encode_payload
+from tools.load_generator import encode_message, walkthrough_messages
+
+DEFAULT_WALKTHROUGHS = "walkthroughs/*.txt"
+
+ENCODINGS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "indent2": lambda narration: json.dumps(narration, indent=2),
+    "compact": encode_narration,
+    "abbreviated": lambda narration: encode_narration(narration, abbreviate=True),
+}
+
+_TOKEN_PATTERN = re.compile(r"[^\W\d_]+|\d+|[^\w\s]|_|\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count: words, numbers, punctuation, underscores and whitespace runs."""
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+def narration_dict(result: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of a command result the narrators send (see LLMNarrator._narration_dict)."""
+    narration: Dict[str, Any] = {
+        "success": result.get("success", True),
+        "verbosity": result.get("verbosity", "full"),
+    }
+    narration.update(result.get("narration", {}))
+    return narration
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("walkthroughs", nargs="?", default=DEFAULT_WALKTHROUGHS,
+                        help=f"Glob of walkthrough files (default: {DEFAULT_WALKTHROUGHS})")
+    parser.add_argument("--game-dir", default="examples/big_game", help="Game the walkthroughs are for")
+    parser.add_argument("--tokenizer", metavar="MODEL", help="HuggingFace tokenizer to count tokens with")
+    args = parser.parse_args()
+
+    count_tokens = estimate_tokens
+    if args.tokenizer:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(args.tokenizer)
+        count_tokens = lambda text: len(tokenizer.encode(text, add_special_tokens=False))  # noqa: E731
+
+    files = sorted(glob.glob(args.walkthroughs))
+    if not files:
+        print(f"No walkthroughs match {args.walkthroughs}", file=sys.stderr)
+        return 1
+
+    text_parser = GameEngine(args.game_dir).create_parser()
+    narrations: List[Dict[str, Any]] = []
+    for path in files:
+        messages, _ = walkthrough_messages(path, text_parser)
+        engine = GameEngine(args.game_dir)
+        for message in messages:
+            result = engine.json_handler.handle_message(json.loads(encode_message(message)))
+            narrations.append(narration_dict(result))
+
+    opening = GameEngine(args.game_dir).json_handler.handle_message({
+        "type": "query",
+        "query_type": "location",
+        "include": ["items", "doors", "exits", "actors"]
+    })
+    opening["verbosity"] = "full"
+    opening_sizes = {
+        "indent2": json.dumps(opening, indent=2),
+        "compact": encode_payload(opening),
+    }
+
+    print(f"Game: {args.game_dir}, {len(files)} walkthroughs, {len(narrations)} narrations")
+    print(f"{'encoding':<12} {'chars/turn':>11} {'tokens/turn':>12} {'tokens':>10} {'vs indent2':>11}")
+    baseline = None
+    for name, encode in ENCODINGS.items():
+        encoded = [encode(narration) for narration in narrations]
+        chars = sum(len(text) for text in encoded)
+        tokens = sum(count_tokens(text) for text in encoded)
+        baseline = baseline or tokens
+        print(f"{name:<12} {chars / len(encoded):>11.0f} {tokens / len(encoded):>12.1f} "
+              f"{tokens:>10} {tokens / baseline:>10.0%}")
+
+    indent_tokens = count_tokens(opening_sizes["indent2"])
+    compact_tokens = count_tokens(opening_sizes["compact"])
+    print(f"Opening scene: {indent_tokens} -> {compact_tokens} tokens "
+          f"({compact_tokens / indent_tokens:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark batched LLM command parsing (src/parse_batcher.py).
+
+N simulated players each send --parses commands, one after another, to a
+shared ParseBatcher in front of a stub batch model. The stub sleeps like a
+local model serving a batch: prefill time for every prompt token in the
+batch, then one decode step per output token whose cost grows slightly
+with batch size.
+
+Compares max_batch=1 (every parse generated alone, as a single
+LLMCommandParser serves players) with batching at --max-batch, reporting
+parses/sec and per-parse latency percentiles. Sleeps are multiplied by
+--time-scale and reported times divided by it (modelled time).
+
+Usage:
+    python tools/benchmark_parse_batching.py
+    python tools/benchmark_parse_batching.py --players 32 --max-batch 16
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parse_batcher import ParseBatcher
+from src.turn_profiler import percentile
+
+
+class StubBatchModel:
+    """Stands in for LLMCommandParser.parse_batch with modelled batch latency."""
+
+    def __init__(self, prompt_tokens: int, output_tokens: int, prefill_ms: float,
+                 decode_ms: float, decode_ms_per_sequence: float, time_scale: float):
+        self.prompt_tokens = prompt_tokens
+        self.output_tokens = output_tokens
+        self.prefill_ms = prefill_ms
+        self.decode_ms = decode_ms
+        self.decode_ms_per_sequence = decode_ms_per_sequence
+        self.time_scale = time_scale
+
+    def batch_ms(self, size: int) -> float:
+        step_ms = self.decode_ms + self.decode_ms_per_sequence * (size - 1)
+        return size * self.prompt_tokens * self.prefill_ms + self.output_tokens * step_ms
+
+    def parse_batch(self, requests: List[Tuple[str, Dict[str, List[str]]]]) -> List[Optional[Dict[str, Any]]]:
+        time.sleep(self.batch_ms(len(requests)) * self.time_scale / 1000)
+        return [{"type": "command", "action": {"verb": "look"}, "raw_input": text} for text, _ in requests]
+
+
+def run(model: StubBatchModel, players: int, parses: int, max_batch: int, max_wait: float
+        ) -> Tuple[float, List[float], Dict[str, float]]:
+    """Run all players to completion; return (elapsed seconds, latencies, batcher stats)."""
+    batcher = ParseBatcher(model, max_batch=max_batch, max_wait=max_wait)
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def player(index: int) -> None:
+        for turn in range(parses):
+            start = time.perf_counter()
+            batcher.parse_command(f"player {index} command {turn}", {})
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=player, args=(i,)) for i in range(players)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    batcher.close()
+    return elapsed, latencies, batcher.stats()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=16, help="Concurrent players (default: 16)")
+    parser.add_argument("--parses", type=int, default=10, help="Parses per player (default: 10)")
+    parser.add_argument("--max-batch", type=int, default=8, help="Batch size limit (default: 8)")
+    parser.add_argument("--max-wait-ms", type=float, default=20.0,
+                        help="Modelled ms a request waits for its batch to fill (default: 20)")
+    parser.add_argument("--prompt-tokens", type=int, default=150,
+                        help="User prompt tokens per parse; the system prompt is cached (default: 150)")
+    parser.add_argument("--output-tokens", type=int, default=30, help="Tokens per parse (default: 30)")
+    parser.add_argument("--prefill-ms", type=float, default=0.4, help="Prefill ms per token (default: 0.4)")
+    parser.add_argument("--decode-ms", type=float, default=25.0, help="Decode ms per step (default: 25)")
+    parser.add_argument("--decode-ms-per-sequence", type=float, default=1.5,
+                        help="Extra decode ms per step for each additional sequence (default: 1.5)")
+    parser.add_argument("--time-scale", type=float, default=0.05,
+                        help="Multiplier applied to modelled sleeps (default: 0.05)")
+    args = parser.parse_args()
+
+    model = StubBatchModel(args.prompt_tokens, args.output_tokens, args.prefill_ms,
+                           args.decode_ms, args.decode_ms_per_sequence, args.time_scale)
+    max_wait = args.max_wait_ms * args.time_scale / 1000
+
+    print(f"{args.players} players x {args.parses} parses; "
+          f"one parse alone takes {model.batch_ms(1):.0f} modelled ms")
+    print(f"{'max_batch':>9} {'parses/s':>9} {'mean batch':>11} {'p50 ms':>8} {'p99 ms':>8}")
+    for max_batch in (1, args.max_batch):
+        elapsed, latencies, stats = run(model, args.players, args.parses, max_batch, max_wait)
+        ms = sorted(latency * 1000 / args.time_scale for latency in latencies)
+        rate = len(latencies) / (elapsed / args.time_scale)
+        print(f"{max_batch:>9} {rate:>9.1f} {stats['mean_batch']:>11.1f} "
+              f"{percentile(ms, 50):>8.0f} {percentile(ms, 99):>8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for writes to entity properties dicts.
+
+Times __setitem__, update and setdefault on a plain dict and on
+CoreFieldProtectingDict with write-time core field checks on (the debug
+mode, TEXT_GAME_CHECK_PROPERTIES=1) and off (the default), and reports
+the per-write overhead relative to a plain dict.
+
+Usage:
+    python tools/benchmark_property_writes.py
+    python tools/benchmark_property_writes.py --writes 1000000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import CoreFieldProtectingDict, set_core_field_checking
+
+OPERATIONS: Dict[str, str] = {
+    "setitem": "props['health'] = 10",
+    "update": "props.update({'health': 10, 'mana': 5})",
+    "setdefault": "props.setdefault('states', None)",
+}
+
+
+def time_writes(make_props: Callable[[], Any], statement: str, writes: int) -> float:
+    """Return mean nanoseconds per write (best of five runs)."""
+    props = make_props()
+    runs = timeit.repeat(statement, globals={"props": props}, number=writes, repeat=5)
+    return min(runs) / writes * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=200000, help="Writes per measurement")
+    args = parser.parse_args()
+
+    def protected() -> Any:
+        return CoreFieldProtectingDict({'id', 'name', 'description', 'location', 'behaviors'}, {"portable": True})
+
+    print(f"{'operation':<12}{'dict':>10}{'checked':>10}{'unchecked':>11}  (ns/write)")
+    for name, statement in OPERATIONS.items():
+        plain = time_writes(lambda: {"portable": True}, statement, args.writes)
+        set_core_field_checking(True)
+        checked = time_writes(protected, statement, args.writes)
+        set_core_field_checking(False)
+        unchecked = time_writes(protected, statement, args.writes)
+        print(f"{name:<12}{plain:>10.1f}{checked:>10.1f}{unchecked:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
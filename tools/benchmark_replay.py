@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Replay every walkthrough headlessly and check for performance regressions.
+
+Runs each walkthroughs/*.txt script against a game with tools/walkthrough.py's
+run_walkthrough in quiet mode, on a session seeded with --seed (see
+GameEngine's seed argument), so every replay takes the same random choices.
+Sessions are created from one WorldTemplate; loading is not timed.
+
+Reports:
+
+- per-command latency (p50/p95/p99/max) and the slowest verbs,
+- total turns per second (commands over the time spent handling them),
+- allocations, as gen-0 garbage collections per turn (one per gc threshold
+  of new container objects) and memory blocks still allocated afterwards.
+
+Each script is replayed --repeat times (3 by default); each command keeps
+its fastest time, and the transcripts of the replays must be identical. The
+summary is compared with a stored baseline (tools/benchmark_replay_baseline.json)
+and the script exits 1 when turns/sec, p95/p99 latency or allocations are
+worse than the baseline by more than --threshold, or when a replay is not
+deterministic. Timings depend on the machine: refresh the baseline with
+--update-baseline on the machine that runs the check.
+
+Usage:
+    python tools/benchmark_replay.py
+    python tools/benchmark_replay.py --repeat 5 --threshold 0.3
+    python tools/benchmark_replay.py --update-baseline
+    python tools/benchmark_replay.py examples/big_game --walkthroughs walkthroughs/test_wolf*.txt
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.game_engine import GameEngine
+from src.turn_profiler import percentile
+from src.world_template import WorldTemplate
+from tools.walkthrough import run_walkthrough
+
+DEFAULT_BASELINE = project_root / "tools" / "benchmark_replay_baseline.json"
+
+# Summary fields compared with the baseline, and whether higher is better
+CHECKED = {
+    "turns_per_second": True,
+    "p95_ms": False,
+    "p99_ms": False,
+    "gc_collections_per_turn": False,
+}
+
+
+def verb_of(command: str) -> str:
+    """The verb of a text or JSON walkthrough command."""
+    if command.startswith("{"):
+        return str(json.loads(command).get("action", {}).get("verb", "?"))
+    return command.split()[0].lower()
+
+
+def transcript(results: List[Dict[str, Any]]) -> List[str]:
+    """The responses of a replay in a comparable form."""
+    return [json.dumps(result["result"], sort_keys=True, default=str) for result in results]
+
+
+def replay(engine: GameEngine, lines: List[str]) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Replay a script quietly; return (results, gen-0 collections, assertion failures)."""
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    results, _, assertion_failures = run_walkthrough(engine, lines, quiet=True)
+    return results, gc.get_stats()[0]["collections"] - collections, assertion_failures
+
+
+def replay_suite(game_dir: Path, scripts: List[Path], seed: int, repeat: int) -> Dict[str, Any]:
+    """Replay every script repeat times and summarize the fastest time of each command."""
+    template = WorldTemplate(game_dir / "game_state.json")
+    seconds: List[float] = []
+    by_verb: Dict[str, List[float]] = defaultdict(list)
+    collections = 0
+    failures = 0
+    nondeterministic = []
+    blocks = sys.getallocatedblocks()
+
+    for script in scripts:
+        lines = script.read_text().splitlines()
+        best: List[float] = []
+        first: List[str] = []
+        for attempt in range(repeat):
+            engine = GameEngine(game_dir, template=template, seed=seed)
+            results, script_collections, assertion_failures = replay(engine, lines)
+            if attempt == 0:
+                first = transcript(results)
+                best = [result["seconds"] for result in results]
+                collections += script_collections
+                failures += assertion_failures + sum(
+                    1 for result in results
+                    if result["expect_success"] and not result["result"].get("success", False))
+            else:
+                if transcript(results) != first:
+                    nondeterministic.append(script.name)
+                best = [min(old, result["seconds"]) for old, result in zip(best, results)]
+        seconds.extend(best)
+        for result, elapsed in zip(results, best):
+            by_verb[verb_of(result["command"])].append(elapsed)
+
+    gc.collect()
+    ordered = sorted(seconds)
+    total = sum(seconds)
+    verbs = sorted(by_verb.items(), key=lambda item: -sum(item[1]))
+    return {
+        "scripts": len(scripts),
+        "turns": len(seconds),
+        "seed": seed,
+        "failures": failures,
+        "turns_per_second": len(seconds) / total if total else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+        "gc_collections_per_turn": collections / len(seconds) if seconds else 0.0,
+        "retained_blocks": sys.getallocatedblocks() - blocks,
+        "verbs": {
+            verb: {
+                "count": len(samples),
+                "total_ms": sum(samples) * 1000,
+                "p95_ms": percentile(sorted(samples), 95) * 1000,
+            }
+            for verb, samples in verbs
+        },
+        "nondeterministic": nondeterministic,
+    }
+
+
+def regressions(summary: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Describe each checked field that is worse than the baseline by more than threshold."""
+    found = []
+    for field, higher_is_better in CHECKED.items():
+        expected = baseline.get(field)
+        if not expected:
+            continue
+        change = summary[field] / expected - 1
+        if (-change if higher_is_better else change) > threshold:
+            found.append(f"{field}: {summary[field]:.3f} vs baseline {expected:.3f} ({change:+.0%})")
+    return found
+
+
+def format_summary(summary: Dict[str, Any], top: int) -> str:
+    """Human-readable report of a replay_suite summary."""
+    lines = [
+        f"{summary['scripts']} scripts, {summary['turns']} turns (seed {summary['seed']}), "
+        f"{summary['failures']} unexpected failures",
+        f"turns/sec:       {summary['turns_per_second']:10.1f}",
+        f"latency ms:      p50 {summary['p50_ms']:.3f}  p95 {summary['p95_ms']:.3f}  "
+        f"p99 {summary['p99_ms']:.3f}  max {summary['max_ms']:.3f}",
+        f"gc gen-0/turn:   {summary['gc_collections_per_turn']:10.3f}",
+        f"retained blocks: {summary['retained_blocks']:10d}",
+        "",
+        f"{'verb':<16}{'count':>8}{'total ms':>12}{'p95 ms':>10}",
+    ]
+    for verb, stats in list(summary["verbs"].items())[:top]:
+        lines.append(f"{verb:<16}{stats['count']:>8}{stats['total_ms']:>12.1f}{stats['p95_ms']:>10.3f}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", nargs="?", default="examples/big_game", help="Game directory")
+    parser.add_argument("--walkthroughs", nargs="+", type=Path, metavar="FILE",
+                        help="Scripts to replay (default: walkthroughs/*.txt)")
+    parser.add_argument("--seed", type=int, default=0, help="Session random seed")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Replays per script; each command's fastest time counts (default: 3)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative regression versus the baseline (default: 0.25)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--top", type=int, default=10, help="Verbs listed in the report")
+    args = parser.parse_args()
+
+    scripts = args.walkthroughs or sorted((project_root / "walkthroughs").glob("*.txt"))
+    start = time.perf_counter()
+    summary = replay_suite(Path(args.game_dir), scripts, args.seed, args.repeat)
+    print(format_summary(summary, args.top))
+    print(f"\nreplayed in {time.perf_counter() - start:.1f}s")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(summary, indent=2) + "\n")
+        print(f"Wrote baseline {args.baseline}")
+        return 0
+
+    status = 0
+    if summary["nondeterministic"]:
+        print(f"\nNot deterministic: {', '.join(summary['nondeterministic'])}")
+        status = 1
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline")
+        return status
+
+    baseline = json.loads(args.baseline.read_text())
+    if (baseline.get("scripts"), baseline.get("turns"), baseline.get("seed")) != \
+            (summary["scripts"], summary["turns"], summary["seed"]):
+        print("\nNote: the baseline replayed different scripts or seed; comparison is approximate")
+    if baseline.get("failures") != summary["failures"]:
+        print(f"\nNote: {summary['failures']} unexpected failures, baseline had {baseline.get('failures')}")
+
+    found = regressions(summary, baseline, args.threshold)
+    if found:
+        print(f"\nREGRESSION (threshold {args.threshold:.0%}):")
+        for line in found:
+            print(f"  {line}")
+        return 1
+    print(f"\nNo regression beyond {args.threshold:.0%} of the baseline")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare full saves with turn journal commits on a scaled world.
+
+Replicates a game's world N times (see benchmark_memory.scale_game), plays
+the commands of a walkthrough file, and after every turn commits a
+TurnJournal. Reports the journal commit latency and bytes written per turn
+next to the latency and size of a full save_game_state of the same state,
+plus the cost of a compaction snapshot, and checks that replaying the
+journal gives the saved state.
+
+Usage:
+    python tools/benchmark_save_journal.py
+    python tools/benchmark_save_journal.py examples/big_game --scale 100
+    python tools/benchmark_save_journal.py examples/big_game --file walkthroughs/test_archivist.txt --no-fsync
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.command_utils import parsed_to_json
+from src.game_engine import GameEngine
+from src.state_manager import game_state_to_dict, save_game_state
+from src.turn_journal import TurnJournal, read_journal, JOURNAL_FILE
+from src.world_template import WorldTemplate
+from tools.benchmark_memory import scale_game
+
+
+def walkthrough_commands(path: Path) -> List[str]:
+    """Player commands of a walkthrough file (comments and directives skipped)."""
+    commands = []
+    for line in path.read_text().splitlines():
+        line = line.split("#")[0].strip()
+        if line and not line.startswith("@") and not line.split()[0].isupper():
+            commands.append(line)
+    return commands
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", nargs="?", default="examples/big_game", help="Game directory")
+    parser.add_argument("--scale", type=int, default=100, help="World copies")
+    parser.add_argument("--file", default="walkthroughs/frozen_observatory.txt", help="Walkthrough to play")
+    parser.add_argument("--saves", type=int, default=3, help="Full saves to time")
+    parser.add_argument("--no-fsync", action="store_true", help="Do not fsync journal entries")
+    args = parser.parse_args()
+
+    game_dir = Path(args.game_dir)
+    data = scale_game(json.loads((game_dir / "game_state.json").read_text()), args.scale)
+    engine = GameEngine(game_dir, template=WorldTemplate(data))
+    state = engine.game_state
+    text_parser = engine.create_parser()
+    commands = walkthrough_commands(Path(args.file))
+    print(f"{args.game_dir} x{args.scale}: {len(state.locations)} locations, {len(state.items)} items, "
+          f"{len(state.actors)} actors; {len(commands)} commands")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "journal"
+        start = time.perf_counter()
+        journal = TurnJournal(state, directory, snapshot_every=10**9, fsync=not args.no_fsync)
+        snapshot_ms = (time.perf_counter() - start) * 1000
+
+        commit_ms: List[float] = []
+        records: List[int] = []
+        for command in commands:
+            parsed = text_parser.parse_command(command)
+            if parsed is None:
+                continue
+            engine.json_handler.handle_message(parsed_to_json(parsed))
+            start = time.perf_counter()
+            records.append(journal.commit())
+            commit_ms.append((time.perf_counter() - start) * 1000)
+        journal_bytes = (directory / JOURNAL_FILE).stat().st_size
+
+        save_ms: List[float] = []
+        save_path = Path(tmp) / "save.json"
+        for _ in range(args.saves):
+            start = time.perf_counter()
+            save_game_state(state, save_path)
+            save_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        replayed = read_journal(directory)
+        replay_ms = (time.perf_counter() - start) * 1000
+        matches = replayed == json.loads(json.dumps(game_state_to_dict(state)))
+        journal.close()
+
+        turns = len(commit_ms)
+        print(f"full save:        {statistics.median(save_ms):9.1f} ms median, "
+              f"{save_path.stat().st_size / 1024:9.0f} KiB per save")
+        print(f"journal commit:   {statistics.median(commit_ms):9.2f} ms median, "
+              f"{percentile(commit_ms, 0.95):.2f} ms p95, {max(commit_ms):.2f} ms max, "
+              f"{journal_bytes / max(1, turns) / 1024:.1f} KiB per turn "
+              f"({sum(records) / max(1, turns):.1f} records)")
+        print(f"snapshot:         {snapshot_ms:9.1f} ms (once per --snapshot_every entries)")
+        print(f"restore (replay): {replay_ms:9.1f} ms for {turns} turns; matches full save: {matches}")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
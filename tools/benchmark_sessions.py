@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark hosting many independent game sessions in one process.
+
+Creates N GameEngine sessions, then plays a short command script on every
+session with the turns interleaved (session 1 turn 1, session 2 turn 1,
+...), the way a multi-session worker would. Reports sessions created per
+second, turns per second, and checks that every session ended on the same
+turn count and location (no state leaking between sessions).
+
+Sessions of one game share the imported behavior modules (they are
+stateless functions); all per-session state - GameState, BehaviorManager,
+TurnScheduler, protocol handler - is owned by each GameEngine.
+
+With --template, the game is parsed once into a WorldTemplate and each
+session's state is created from it (see src/world_template.py).
+
+Usage:
+    python tools/benchmark_sessions.py
+    python tools/benchmark_sessions.py examples/big_game --sessions 200
+    python tools/benchmark_sessions.py examples/big_game --sessions 200 --template
+    python tools/benchmark_sessions.py examples/simple_game --commands "look" "take lantern" "inventory"
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.command_utils import parsed_to_json
+from src.game_engine import GameEngine
+from src.parser import Parser
+from src.types import ActorId
+from src.world_template import WorldTemplate
+
+DEFAULT_COMMANDS = ["look", "inventory", "look", "inventory", "look"]
+
+
+def command_message(parser: Parser, text: str) -> Dict[str, Any]:
+    """Parse a text command into a protocol command message."""
+    parsed = parser.parse_command(text)
+    if not parsed or not parsed.verb:
+        raise ValueError(f"Could not parse: {text}")
+    return parsed_to_json(parsed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", nargs="?", default="examples/simple_game", help="Game directory")
+    parser.add_argument("--sessions", type=int, default=100, help="Number of sessions to host")
+    parser.add_argument("--commands", nargs="+", default=DEFAULT_COMMANDS, help="Commands played per session")
+    parser.add_argument("--template", action="store_true",
+                        help="Create sessions from a shared WorldTemplate")
+    args = parser.parse_args()
+
+    game_dir = Path(args.game_dir)
+    template = None
+    if args.template:
+        start = time.perf_counter()
+        template = WorldTemplate(game_dir / "game_state.json")
+        template_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engines: List[GameEngine] = [GameEngine(game_dir, template=template) for _ in range(args.sessions)]
+    create_s = time.perf_counter() - start
+
+    text_parser = engines[0].create_parser()
+    messages = [command_message(text_parser, text) for text in args.commands]
+
+    start = time.perf_counter()
+    for message in messages:
+        for engine in engines:
+            engine.json_handler.handle_message(message)
+    play_s = time.perf_counter() - start
+
+    turns = len(messages) * len(engines)
+    outcomes = {
+        (engine.game_state.turn_count, engine.game_state.get_actor(ActorId("player")).location)
+        for engine in engines
+    }
+
+    print(f"Game: {args.game_dir}")
+    print(f"Sessions: {len(engines)}, commands per session: {len(messages)}")
+    if template is not None:
+        print(f"Template: {template_s * 1000:.1f} ms to build, "
+              f"{template.snapshot_size / 1024:.1f} KB per-session snapshot")
+    print(f"Create: {create_s * 1000:.1f} ms total, {len(engines) / create_s:.1f} sessions/s")
+    print(f"Play:   {play_s * 1000:.1f} ms total, {turns / play_s:.1f} turns/s, "
+          f"{len(engines) / play_s:.1f} sessions/s")
+    if len(outcomes) != 1:
+        print(f"ERROR: sessions diverged: {sorted(outcomes)}")
+        return 1
+    print(f"All sessions ended at turn {next(iter(outcomes))[0]} (no cross-session state)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare a full load with a region-sharded load as the explored area grows.
+
+Replicates a game's world N times (see benchmark_memory.scale_game), giving
+each copy its own regions (beast_wilds_r7, ...), so the world has N times
+as many regions rather than N times bigger ones. Splits it into shards and
+reports load time and retained memory (tracemalloc) of:
+
+- load_game_state of the whole JSON file,
+- the sharded startup (core + the player's region), and
+- the sharded world after exploring a share of its regions.
+
+Usage:
+    python tools/benchmark_sharded_load.py
+    python tools/benchmark_sharded_load.py examples/big_game --scale 20 --explore 0.05 0.5 1
+    python tools/benchmark_sharded_load.py --shard-actors
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import GameState, load_game_state
+from src.world_shards import shards_path, write_shards
+from tools.benchmark_memory import scale_game
+
+
+def split_regions(data: Dict[str, Any], scale: int) -> None:
+    """Give the locations of each world copy (ids ending _rN) their own region names."""
+    for location in data["locations"]:
+        properties = location.get("properties", {})
+        suffix = location["id"].rsplit("_r", 1)[-1] if "_r" in location["id"] else ""
+        if "region" in properties and suffix.isdigit() and int(suffix) < scale:
+            properties["region"] = f"{properties['region']}_r{suffix}"
+
+
+def measure(load: Callable[[], GameState]) -> Tuple[GameState, float, float]:
+    """Run load twice: timed, then under tracemalloc; return (state, seconds, retained MiB)."""
+    gc.collect()
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    state = load()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return state, elapsed, retained / 1024 / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", nargs="?", default="examples/big_game", help="Game directory")
+    parser.add_argument("--scale", type=int, default=100, help="World copies")
+    parser.add_argument("--shard-actors", action="store_true", help="Split actors by region too")
+    parser.add_argument("--explore", type=float, nargs="+", default=[0.01, 0.1, 1.0],
+                        help="Shares of the regions to load after startup")
+    args = parser.parse_args()
+
+    data = scale_game(json.loads((Path(args.game_dir) / "game_state.json").read_text()), args.scale)
+    split_regions(data, args.scale)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "game_state.json"
+        json_path.write_text(json.dumps(data))
+        start = time.perf_counter()
+        counts = write_shards(data, shards_path(json_path), shard_actors=args.shard_actors)
+        split_s = time.perf_counter() - start
+        del data
+        print(f"{args.game_dir} x{args.scale}: {len(counts)} regions, split in {split_s:.1f}s")
+
+        full, full_s, full_mib = measure(lambda: load_game_state(json.loads(json_path.read_text())))
+        entities = len(full.locations) + len(full.items) + len(full.exits) + len(full.parts) + len(full.actors)
+        del full
+        print(f"full load:        {full_s * 1000:8.0f} ms {full_mib:8.1f} MiB  ({entities} entities)")
+
+        state, shard_s, shard_mib = measure(lambda: load_game_state(json_path))
+        loaded = len(state.locations) + len(state.items) + len(state.exits) + len(state.parts) + len(state.actors)
+        print(f"sharded startup:  {shard_s * 1000:8.0f} ms {shard_mib:8.1f} MiB  ({loaded} loaded)")
+        del state
+
+        regions = list(counts)
+        for share in args.explore:
+            count = max(1, round(share * len(regions)))
+
+            def explore() -> GameState:
+                explored = load_game_state(json_path)
+                explored.load_regions(regions[:count])
+                return explored
+
+            state, explore_s, explore_mib = measure(explore)
+            loaded = len(state.locations) + len(state.items) + len(state.exits) + len(state.parts) + len(state.actors)
+            print(f"{count:5d} regions:    {explore_s * 1000:8.0f} ms {explore_mib:8.1f} MiB  ({loaded} loaded)")
+            del state
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
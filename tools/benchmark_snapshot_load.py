@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare load_game_state from game_state.json and from its compiled snapshot.
+
+Replicates a game's world N times (see benchmark_memory.scale_game), writes
+it as game_state.json in a temporary directory, compiles the snapshot, and
+times load_game_state on the same path with and without the snapshot
+present. Checks that both loads give the same state and indexes.
+
+Usage:
+    python tools/benchmark_snapshot_load.py
+    python tools/benchmark_snapshot_load.py examples/big_game --scale 1 --runs 50
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import GameState, load_game_state, game_state_to_dict
+from src.state_snapshot import snapshot_path, write_snapshot, _INDEX_FIELDS
+from tools.benchmark_memory import scale_game
+
+
+def time_loads(load: Callable[[], GameState], runs: int) -> List[float]:
+    """Milliseconds per load; garbage from the previous run is collected untimed."""
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        load()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_dir", nargs="?", default="examples/big_game", help="Game directory")
+    parser.add_argument("--scale", type=int, default=100, help="World copies")
+    parser.add_argument("--runs", type=int, default=5, help="Loads to time of each kind")
+    args = parser.parse_args()
+
+    data = scale_game(json.loads((Path(args.game_dir) / "game_state.json").read_text()), args.scale)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "game_state.json"
+        json_path.write_text(json.dumps(data))
+        print(f"{args.game_dir} x{args.scale}: {len(data['locations'])} locations, {len(data['items'])} items, "
+              f"{len(data['actors'])} actors; {json_path.stat().st_size / 1024:.0f} KiB JSON")
+
+        json_ms = time_loads(lambda: load_game_state(json_path), args.runs)
+        from_json = load_game_state(json_path)
+
+        start = time.perf_counter()
+        write_snapshot(from_json, snapshot_path(json_path), json_path)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        snapshot_ms = time_loads(lambda: load_game_state(json_path), args.runs)
+        from_snapshot = load_game_state(json_path)
+
+        matches = game_state_to_dict(from_snapshot) == game_state_to_dict(from_json) and all(
+            getattr(from_snapshot, name) == getattr(from_json, name) for name in _INDEX_FIELDS
+        )
+        json_median = statistics.median(json_ms)
+        snapshot_median = statistics.median(snapshot_ms)
+        print(f"json load:     {json_median:9.1f} ms median")
+        print(f"snapshot load: {snapshot_median:9.1f} ms median "
+              f"({snapshot_path(json_path).stat().st_size / 1024:.0f} KiB, compiled in {compile_ms:.0f} ms)")
+        print(f"speedup:       {json_median / snapshot_median:9.1f}x; same state: {matches}")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
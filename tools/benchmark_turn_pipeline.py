@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Benchmark the pipelined turn executor (src/turn_pipeline.py).
+
+Replays walkthrough commands twice against the game, with stub models
+standing in for the parser LLM and the narrator:
+
+    sequential  the former xplm_game loop: build parser context, LLM parse,
+                adapter, execute, narrate
+    pipelined   TurnPipeline: local parse first, LLM parse only when that
+                fails (overlapped with narrator.prepare_narration()), then
+                execute and narrate
+
+The stub models sleep per token: prefill for every prompt token, decode for
+every generated token. The narrator's system prompt is prefilled only when
+its prompt cache is cold, which happens every --cold-every turns (a player
+pausing longer than the cache lifetime). Sleeps are multiplied by
+--time-scale and measured times divided by it, so a run is quick but
+reports modelled milliseconds.
+
+A fraction of the commands (--llm-fraction) is prefixed with "please ",
+which the local parser rejects, so the LLM fallback path is measured too.
+
+Usage:
+    python tools/benchmark_turn_pipeline.py
+    python tools/benchmark_turn_pipeline.py --llm-fraction 0.5 --cold-every 4
+    python tools/benchmark_turn_pipeline.py "walkthroughs/test_fungal_*.txt" --limit 0
+"""
+
+import argparse
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.command_utils import parsed_to_json
+from src.game_engine import GameEngine
+from src.llm_parser_adapter import LLMParserAdapter
+from src.narration_encoder import encode_narration
+from src.parser import Parser
+from src.turn_pipeline import TurnPipeline
+from src.turn_profiler import percentile
+from tools.load_generator import DEFAULT_WALKTHROUGHS, encode_message
+from tools.walkthrough import parse_command_annotations
+
+POLITE_PREFIX = "please "
+
+
+class TokenModel:
+    """Per-token latencies of a stub model."""
+
+    def __init__(self, prefill_ms: float, decode_ms: float, time_scale: float):
+        self.prefill_ms = prefill_ms
+        self.decode_ms = decode_ms
+        self.time_scale = time_scale
+
+    def prefill(self, tokens: int) -> None:
+        time.sleep(tokens * self.prefill_ms * self.time_scale / 1000)
+
+    def decode(self, tokens: int = 1) -> None:
+        time.sleep(tokens * self.decode_ms * self.time_scale / 1000)
+
+
+class StubLLMParser:
+    """LLMCommandParser stand-in: pays model latency, answers with the local parse."""
+
+    def __init__(self, parser: Parser, model: TokenModel, prompt_tokens: int, output_tokens: int):
+        self.parser = parser
+        self.model = model
+        self.prompt_tokens = prompt_tokens
+        self.output_tokens = output_tokens
+
+    def parse_command(self, player_input: str, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        self.model.prefill(self.prompt_tokens + len(json.dumps(context)) // 4)
+        self.model.decode(self.output_tokens)
+        parsed = self.parser.parse_command(player_input.removeprefix(POLITE_PREFIX))
+        if parsed is None or not parsed.verb:
+            return None
+        output = json.loads(encode_message(parsed_to_json(parsed)))
+        output["action"].pop("actor_id", None)
+        return output
+
+
+class StubNarrator:
+    """Narrator stand-in with a system prompt cache that goes cold every few turns."""
+
+    def __init__(self, model: TokenModel, system_tokens: int, output_tokens: int, cold_every: int):
+        self.model = model
+        self.system_tokens = system_tokens
+        self.output_tokens = output_tokens
+        self.cold_every = cold_every
+        self.turn = 0
+        self.cache_warm = False
+
+    def start_turn(self) -> None:
+        self.turn += 1
+        if self.cold_every and self.turn % self.cold_every == 1:
+            self.cache_warm = False
+
+    def _prefill_system_prompt(self) -> None:
+        if not self.cache_warm:
+            self.model.prefill(self.system_tokens)
+            self.cache_warm = True
+
+    def prepare_narration(self) -> None:
+        self._prefill_system_prompt()
+
+    def narrate_result_stream(self, result: Dict[str, Any]) -> Iterator[str]:
+        narration = {"success": result.get("success", True), "verbosity": result.get("verbosity", "full")}
+        narration.update(result.get("narration", {}))
+        return self._generate(len(encode_narration(narration)) // 4)
+
+    def _generate(self, input_tokens: int) -> Iterator[str]:
+        self._prefill_system_prompt()
+        self.model.prefill(input_tokens)
+        for _ in range(self.output_tokens):
+            self.model.decode()
+            yield "word "
+
+
+def walkthrough_commands(path: str) -> List[str]:
+    """Text commands of a walkthrough (directives, assertions and JSON lines skipped)."""
+    commands = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(("#", "@", "ASSERT ")):
+                continue
+            cmd, _ = parse_command_annotations(line)
+            if cmd and not cmd.startswith("{"):
+                commands.append(cmd)
+    return commands
+
+
+def play_turn(mode: str, engine: GameEngine, narrator: StubNarrator, llm_parser: StubLLMParser,
+              adapter: LLMParserAdapter, pipeline: TurnPipeline, player_input: str
+              ) -> Optional[Tuple[float, float]]:
+    """Play one turn; return (first chunk, total) seconds, or None if it did not parse."""
+    narrator.start_turn()
+    start = time.perf_counter()
+    if mode == "sequential":
+        parser_output = llm_parser.parse_command(player_input, engine.build_parser_context())
+        parsed = adapter.to_parsed_command(parser_output, player_input)
+        if parsed is None:
+            return None
+        result = engine.json_handler.handle_message(parsed_to_json(parsed))
+        stream = narrator.narrate_result_stream(result)
+    else:
+        stream = pipeline.run_turn_stream(player_input)
+        if stream is None:
+            return None
+    first_chunk = None
+    for _ in stream:
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - start
+    total = time.perf_counter() - start
+    return (first_chunk if first_chunk is not None else total), total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("walkthroughs", nargs="?", default=DEFAULT_WALKTHROUGHS,
+                        help=f"Glob of walkthrough files (default: {DEFAULT_WALKTHROUGHS})")
+    parser.add_argument("--game-dir", default="examples/big_game", help="Game the walkthroughs are for")
+    parser.add_argument("--limit", type=int, default=200, help="Commands to replay (0 = all, default: 200)")
+    parser.add_argument("--llm-fraction", type=float, default=0.2,
+                        help="Fraction of commands the local parser cannot parse (default: 0.2)")
+    parser.add_argument("--cold-every", type=int, default=8,
+                        help="Narrator prompt cache is cold every N turns (0 = never, default: 8)")
+    parser.add_argument("--prefill-ms", type=float, default=0.4, help="Prefill ms per token (default: 0.4)")
+    parser.add_argument("--decode-ms", type=float, default=25.0, help="Decode ms per token (default: 25)")
+    parser.add_argument("--parser-prompt-tokens", type=int, default=600,
+                        help="Parser prompt tokens besides the context (default: 600)")
+    parser.add_argument("--parser-output-tokens", type=int, default=30,
+                        help="Tokens in a parser answer (default: 30)")
+    parser.add_argument("--system-tokens", type=int, default=3000,
+                        help="Narrator system prompt tokens (default: 3000)")
+    parser.add_argument("--narration-tokens", type=int, default=60,
+                        help="Tokens in a narration (default: 60)")
+    parser.add_argument("--time-scale", type=float, default=0.05,
+                        help="Multiplier applied to modelled sleeps (default: 0.05)")
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(args.walkthroughs))
+    if not files:
+        print(f"No walkthroughs match {args.walkthroughs}", file=sys.stderr)
+        return 1
+
+    model = TokenModel(args.prefill_ms, args.decode_ms, args.time_scale)
+    polite_every = round(1 / args.llm_fraction) if args.llm_fraction > 0 else 0
+    results: Dict[str, List[Tuple[float, float]]] = {"sequential": [], "pipelined": []}
+    stats: Dict[str, int] = {}
+    unparsed = 0
+
+    for mode in results:
+        played = 0
+        for path in files:
+            if args.limit and played >= args.limit:
+                break
+            commands = walkthrough_commands(path)
+            if args.limit:
+                commands = commands[:args.limit - played]
+            if not commands:
+                continue
+            engine = GameEngine(args.game_dir)
+            narrator = StubNarrator(model, args.system_tokens, args.narration_tokens, args.cold_every)
+            llm_parser = StubLLMParser(engine.create_parser(), model,
+                                       args.parser_prompt_tokens, args.parser_output_tokens)
+            adapter = LLMParserAdapter(engine.merged_vocabulary)
+            pipeline = TurnPipeline(engine, narrator, llm_parser, adapter)
+            for command in commands:
+                played += 1
+                if polite_every and played % polite_every == 0:
+                    command = POLITE_PREFIX + command
+                timing = play_turn(mode, engine, narrator, llm_parser, adapter, pipeline, command)
+                if timing is None:
+                    unparsed += mode == "sequential"
+                    continue
+                results[mode].append(timing)
+            if mode == "pipelined":
+                for key, count in pipeline.stats.items():
+                    stats[key] = stats.get(key, 0) + count
+            pipeline.close()
+
+    print(f"Game: {args.game_dir}, {len(results['sequential'])} turns "
+          f"({unparsed} unparsed), cold narrator cache every {args.cold_every} turns")
+    print(f"Pipelined parses: {stats.get('local', 0)} local, {stats.get('llm', 0)} LLM, "
+          f"{stats.get('unparsed', 0)} unparsed")
+    print(f"{'mode':<11} {'first chunk p50':>16} {'p95':>8} {'mean':>8} {'total mean':>11}   (modelled ms)")
+    for mode, timings in results.items():
+        first = sorted(t[0] * 1000 / args.time_scale for t in timings)
+        totals = [t[1] * 1000 / args.time_scale for t in timings]
+        print(f"{mode:<11} {percentile(first, 50):>16.0f} {percentile(first, 95):>8.0f} "
+              f"{sum(first) / len(first):>8.0f} {sum(totals) / len(totals):>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
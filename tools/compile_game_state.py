@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Compile a game's game_state.json into a binary snapshot.
+
+Loads and validates game_state.json and writes game_state.snapshot next to
+it (see src/state_snapshot.py). load_game_state() then loads the snapshot
+instead of the JSON file for as long as the JSON file is unchanged (same
+size, mtime and SHA-256); re-run this after editing the JSON file (a stale
+snapshot is ignored, not an error).
+
+Usage:
+    python tools/compile_game_state.py examples/big_game
+    python tools/compile_game_state.py examples/big_game/game_state.json
+    python tools/compile_game_state.py examples/big_game --check
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import load_game_state, game_state_to_dict
+from src.state_snapshot import snapshot_path, fresh_snapshot, read_snapshot, write_snapshot, SnapshotError
+
+
+def check(json_path: Path) -> bool:
+    """Report whether json_path has a fresh snapshot that loads to the same state."""
+    path = fresh_snapshot(json_path)
+    if path is None:
+        print(f"✗ {snapshot_path(json_path)} is missing or was not compiled from {json_path} as it is now")
+        return False
+    try:
+        compiled = read_snapshot(path)
+    except SnapshotError as e:
+        print(f"✗ {e}")
+        return False
+    expected = load_game_state(json.loads(json_path.read_text()))
+    if game_state_to_dict(compiled) != game_state_to_dict(expected):
+        print(f"✗ {path} does not match {json_path}")
+        return False
+    print(f"✓ {path} is up to date")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game", help="Game directory or game_state.json file")
+    parser.add_argument("--check", action="store_true",
+                        help="Only check that the snapshot is up to date (exit 1 if not)")
+    args = parser.parse_args()
+
+    json_path = Path(args.game)
+    if json_path.is_dir():
+        json_path = json_path / "game_state.json"
+
+    if args.check:
+        return 0 if check(json_path) else 1
+
+    start = time.perf_counter()
+    # Load from the data, not the path, so an existing snapshot is not used
+    state = load_game_state(json.loads(json_path.read_text()))
+    path = snapshot_path(json_path)
+    write_snapshot(state, path, json_path)
+    print(f"Wrote {path} ({path.stat().st_size / 1024:.0f} KiB) in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Load generator for the asyncio game server (src/game_server.py).
+
+Replays the commands of walkthrough files across N simulated players,
+each on its own connection (= its own game session). Player i plays
+walkthrough i mod len(files); every player sends one command, waits for
+its response, then sends the next. Reports commands/sec and latency
+percentiles over all commands.
+
+Only command lines are replayed. Tool directives (@set, @goto, @advance,
+@expect, ASSERT) act on the engine directly and have no protocol
+equivalent, so they are skipped; walkthroughs that rely on them will see
+more failed commands, which still count as served load. Text commands are
+parsed client-side into protocol messages.
+
+Without --host/--port/--unix, an in-process server is started on a
+temporary Unix socket.
+
+Usage:
+    python tools/load_generator.py
+    python tools/load_generator.py --players 200 --workers 8
+    python tools/load_generator.py "walkthroughs/test_fungal_*.txt" --players 50
+    python tools/load_generator.py --unix /tmp/text-game.sock --game-dir examples/big_game
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.command_utils import parsed_to_json
+from src.game_engine import GameEngine
+from src.game_server import GameServer
+from src.parser import Parser
+from src.turn_profiler import percentile
+from src.word_entry import WordEntry
+from tools.walkthrough import parse_command_annotations
+
+DEFAULT_WALKTHROUGHS = "walkthroughs/*.txt"
+
+
+def walkthrough_messages(path: str, parser: Parser) -> Tuple[List[Dict[str, Any]], int]:
+    """Return the protocol messages for a walkthrough's commands, and how many lines failed to parse."""
+    messages: List[Dict[str, Any]] = []
+    unparsed = 0
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(("#", "@", "ASSERT ")):
+                continue
+            cmd, _ = parse_command_annotations(line)
+            if not cmd:
+                continue
+            if cmd.startswith("{"):
+                messages.append(json.loads(cmd))
+                continue
+            parsed = parser.parse_command(cmd)
+            if not parsed or not parsed.verb:
+                unparsed += 1
+                continue
+            messages.append(parsed_to_json(parsed))
+    return messages, unparsed
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a message for the wire (WordEntry objects become their word)."""
+    def default(value: Any) -> Any:
+        if isinstance(value, WordEntry):
+            return value.word
+        return str(value)
+    return json.dumps(message, default=default).encode() + b"\n"
+
+
+async def play(
+    messages: List[Dict[str, Any]], host: str, port: int, unix_path: Optional[str],
+    latencies: List[float]
+) -> int:
+    """Play one walkthrough on a new connection; return the number of failed commands."""
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path, limit=1024 * 1024)
+    else:
+        reader, writer = await asyncio.open_connection(host, port, limit=1024 * 1024)
+    failures = 0
+    try:
+        for message in messages:
+            start = time.perf_counter()
+            writer.write(encode_message(message))
+            await writer.drain()
+            line = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if not line:
+                raise ConnectionError("Server closed the connection")
+            if not json.loads(line).get("success", False):
+                failures += 1
+    finally:
+        writer.close()
+    return failures
+
+
+async def run(args: argparse.Namespace) -> int:
+    files = sorted(glob.glob(args.walkthroughs))
+    if not files:
+        print(f"No walkthroughs match {args.walkthroughs}", file=sys.stderr)
+        return 1
+
+    parser = GameEngine(args.game_dir).create_parser()
+    scripts: List[List[Dict[str, Any]]] = []
+    unparsed = 0
+    for path in files:
+        messages, skipped = walkthrough_messages(path, parser)
+        unparsed += skipped
+        if messages:
+            scripts.append(messages)
+
+    server = None
+    unix_path = args.unix
+    if not (args.unix or args.port):
+        server = GameServer(args.game_dir, workers=args.workers, max_pending=args.max_pending)
+        unix_path = os.path.join(tempfile.mkdtemp(), "game.sock")
+        await server.start(unix_path=unix_path)
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    try:
+        failures = await asyncio.gather(*(
+            play(scripts[i % len(scripts)], args.host, args.port, unix_path, latencies)
+            for i in range(args.players)
+        ))
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    print(f"Game: {args.game_dir}, {len(scripts)} walkthroughs ({unparsed} unparseable lines skipped)")
+    print(f"Players: {args.players}" + (f", server workers: {args.workers}" if server else ""))
+    print(f"Commands: {len(latencies)} in {elapsed:.2f} s, {len(latencies) / elapsed:.1f} commands/s "
+          f"({sum(failures)} failed)")
+    print(f"Latency ms: p50 {percentile(ms, 50):.1f}  p90 {percentile(ms, 90):.1f}  "
+          f"p99 {percentile(ms, 99):.1f}  p99.9 {percentile(ms, 99.9):.1f}  max {ms[-1]:.1f}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("walkthroughs", nargs="?", default=DEFAULT_WALKTHROUGHS,
+                        help=f"Glob of walkthrough files (default: {DEFAULT_WALKTHROUGHS})")
+    parser.add_argument("--game-dir", default="examples/big_game", help="Game the walkthroughs are for")
+    parser.add_argument("--players", type=int, default=50, help="Simulated players (connections)")
+    parser.add_argument("--host", default="127.0.0.1", help="Server TCP host")
+    parser.add_argument("--port", type=int, default=0, help="Server TCP port (external server)")
+    parser.add_argument("--unix", metavar="PATH", help="Server Unix socket (external server)")
+    parser.add_argument("--workers", type=int, default=4, help="In-process server worker threads")
+    parser.add_argument("--max-pending", type=int, default=8, help="In-process server per-session backlog")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ import argparse
 import json
 import re
 import sys
+import time
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
@@ -48,6 +49,10 @@ class EvalResult:
     passed: bool = False
     notes: str = ""
 
+    # Streaming latency: first narration chunk and complete narration
+    first_chunk_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+
     def evaluate(self) -> None:
         """Run evaluation and populate result fields."""
         narration_lower = self.narration.lower()
@@ -243,23 +248,25 @@ class NarratorEvalHarness:
             behavior_manager=self.behavior_manager
         )
 
-    def run_command(self, command: str) -> tuple[Dict[str, Any], str]:
+    def run_command(self, command: str) -> tuple[Dict[str, Any], str, Optional[tuple[float, float]]]:
         """
         Run a command and capture the JSON sent to narrator.
 
         Returns:
-            Tuple of (json_sent_to_narrator, narration_text)
+            Tuple of (json_sent_to_narrator, narration_text, latency), where
+            latency is (first_chunk_ms, total_ms) of the streamed narration
         """
         # We need to intercept the JSON before it goes to the narrator
         # The cleanest way is to call the handler directly, then narrate
 
         from src.parser import Parser
         from src.command_utils import parsed_to_json
+        from src.narration_encoder import encode_narration
 
         # Parse command
         parsed = self.narrator.parser.parse_command(command)
         if parsed is None:
-            return {}, f"Could not parse: {command}"
+            return {}, f"Could not parse: {command}", None
 
         # Convert to JSON command
         if parsed.direct_object and not parsed.verb:
@@ -282,12 +289,19 @@ class NarratorEvalHarness:
         # Capture the JSON that would be sent to narrator
         self.captured_json.append(narration_dict)
 
-        # Get narration
-        narration = self.narrator._call_llm(
-            f"Narrate this result:\n{json.dumps(narration_dict, indent=2)}"
-        )
+        # Get narration, timing the stream
+        start = time.perf_counter()
+        first_chunk_ms = None
+        chunks = []
+        for chunk in self.narrator._stream_llm(
+            f"Narrate this result:\n{encode_narration(narration_dict, self.narrator.abbreviate_fields)}"
+        ):
+            if first_chunk_ms is None:
+                first_chunk_ms = (time.perf_counter() - start) * 1000
+            chunks.append(chunk)
+        total_ms = (time.perf_counter() - start) * 1000
 
-        return narration_dict, narration
+        return narration_dict, "".join(chunks), (first_chunk_ms or total_ms, total_ms)
 
     def run_scenario(self, scenario: TestScenario) -> EvalResult:
         """Run a single test scenario and evaluate."""
@@ -302,7 +316,7 @@ class NarratorEvalHarness:
                 print(f"  Setup command '{cmd}' failed: {e}", file=sys.stderr)
 
         # Run test command and capture
-        json_sent, narration = self.run_command(scenario.test_command)
+        json_sent, narration, latency = self.run_command(scenario.test_command)
 
         # Create and run evaluation
         result = EvalResult(
@@ -312,6 +326,8 @@ class NarratorEvalHarness:
             narration=narration,
             criteria=scenario.criteria
         )
+        if latency is not None:
+            result.first_chunk_ms, result.total_ms = latency
         result.evaluate()
 
         return result
@@ -330,6 +346,9 @@ class NarratorEvalHarness:
                 results.append(result)
 
                 print(f"  Narration: {result.narration[:100]}...")
+                if result.total_ms is not None:
+                    print(f"  Latency: first chunk {result.first_chunk_ms:.0f} ms, "
+                          f"total {result.total_ms:.0f} ms")
                 print(f"  Passed: {result.passed}")
                 if result.missing_required:
                     print(f"  Missing: {result.missing_required}")
@@ -356,6 +375,8 @@ class NarratorEvalHarness:
         missing_count = sum(
             len(r.missing_required) for r in results
         )
+        first_chunk = [r.first_chunk_ms for r in results if r.first_chunk_ms is not None]
+        total_time = [r.total_ms for r in results if r.total_ms is not None]
 
         return {
             "total_scenarios": total,
@@ -364,6 +385,8 @@ class NarratorEvalHarness:
             "pass_rate": passed / total if total > 0 else 0,
             "total_hallucinations": hallucination_count,
             "total_missing_required": missing_count,
+            "mean_first_chunk_ms": sum(first_chunk) / len(first_chunk) if first_chunk else None,
+            "mean_total_ms": sum(total_time) / len(total_time) if total_time else None,
         }
 
 
@@ -400,6 +423,9 @@ def main():
     print(f"Pass rate: {summary['pass_rate']:.1%}")
     print(f"Total hallucinations: {summary['total_hallucinations']}")
     print(f"Total missing required: {summary['total_missing_required']}")
+    if summary["mean_total_ms"] is not None:
+        print(f"Mean narration latency: first chunk {summary['mean_first_chunk_ms']:.0f} ms, "
+              f"total {summary['mean_total_ms']:.0f} ms")
 
     # Save results
     output_data = {
@@ -414,6 +440,8 @@ def main():
                 "unwanted_present": r.unwanted_present,
                 "sentence_count": r.sentence_count,
                 "notes": r.notes,
+                "first_chunk_ms": r.first_chunk_ms,
+                "total_ms": r.total_ms,
                 "json_sent": r.json_sent
             }
             for r in results
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Split a game's game_state.json into region shards for lazy loading.
+
+Loads and validates game_state.json and writes game_state.shards/ next to
+it (see src/world_shards.py): a manifest with the core of the world and one
+file per location "region". load_game_state() then loads the manifest and
+reads each region on first access, for as long as the manifest is at least
+as new as game_state.json; re-run this after editing the JSON file.
+
+Usage:
+    python tools/shard_game_state.py examples/big_game
+    python tools/shard_game_state.py examples/big_game --shard-actors
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.state_manager import load_game_state
+from src.world_shards import shards_path, write_shards
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game", help="Game directory or game_state.json file")
+    parser.add_argument("--shard-actors", action="store_true",
+                        help="Also split actors by region (they are dormant until their region loads)")
+    args = parser.parse_args()
+
+    json_path = Path(args.game)
+    if json_path.is_dir():
+        json_path = json_path / "game_state.json"
+
+    data = json.loads(json_path.read_text())
+    # Validate before splitting: shards are not validated when loaded
+    load_game_state(data)
+    directory = shards_path(json_path)
+    counts = write_shards(data, directory, shard_actors=args.shard_actors)
+
+    print(f"Wrote {directory}: {len(counts)} regions")
+    for region, count in counts.items():
+        print(f"  {region}: {count} entities")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
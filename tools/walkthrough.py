@@ -13,13 +13,21 @@ Examples:
     python tools/walkthrough.py examples/big_game --file grotto_test.txt
     python tools/walkthrough.py examples/big_game --file test.txt --stop-on-error
     python tools/walkthrough.py examples/big_game --file test.txt --save-state final.json
+    python tools/walkthrough.py examples/big_game --file test.txt --profile
+    python tools/walkthrough.py examples/big_game --file test.txt --seed 1 --quiet
 
 The --verbose flag shows full JSON responses instead of just primary_text.
+The --seed flag seeds the session's random number generator, so wandering
+NPCs, flee attempts and narration fragments come out the same on every run.
+The --quiet flag prints only the summary.
+The --profile flag prints per-handler, per-behavior, per-turn-phase and
+narration timings (p50/p95/p99) for the whole run.
 """
 
 import argparse
 import json
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
@@ -525,13 +533,21 @@ def run_walkthrough(
     stop_on_error: bool = False,
     show_hp: bool = False,
     show_state: bool = False,
-    show_vitals: bool = False
+    show_vitals: bool = False,
+    quiet: bool = False
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int], int]:
     """Run a sequence of commands and return results.
 
+    Each result records the command, the engine's response, whether it was
+    expected to succeed, and the seconds the engine took to handle it.
+
+    Args:
+        quiet: Print nothing (for replays that only need the results)
+
     Returns:
         (results, failure_counts, assertion_failures)
     """
+    emit = (lambda *args, **kwargs: None) if quiet else print
     results = []
     parser = engine.create_parser()
     failure_counts: Dict[str, int] = {}
@@ -549,9 +565,9 @@ def run_walkthrough(
         set_cmd = parse_set_command(line)
         if set_cmd:
             field_path, value_str = set_cmd
-            print(f"\n{'='*60}")
-            print(f"@set {field_path} = {value_str}")
-            print("-" * 60)
+            emit(f"\n{'='*60}")
+            emit(f"@set {field_path} = {value_str}")
+            emit("-" * 60)
 
             try:
                 # Parse value
@@ -586,11 +602,11 @@ def run_walkthrough(
 
                 # Set the value
                 set_field_path(engine.game_state, field_path, value)
-                print(f"[✓] Set {field_path} = {value}")
+                emit(f"[✓] Set {field_path} = {value}")
             except Exception as e:
-                print(f"[✗] Failed to set {field_path}: {e}")
+                emit(f"[✗] Failed to set {field_path}: {e}")
                 if stop_on_error:
-                    print(f"\n⚠️  Stopped at line {i} due to @set failure")
+                    emit(f"\n⚠️  Stopped at line {i} due to @set failure")
                     break
 
             continue
@@ -598,26 +614,27 @@ def run_walkthrough(
         # Check if this is a @goto command
         if line.startswith("@goto "):
             target_location = line[6:].strip()
-            print(f"\n{'='*60}")
-            print(f"@goto {target_location}")
-            print("-" * 60)
+            emit(f"\n{'='*60}")
+            emit(f"@goto {target_location}")
+            emit("-" * 60)
 
             try:
-                # Build graph and find path
+                # Build graph and find path (over every region of a sharded world)
+                engine.game_state.load_regions()
                 graph = build_exit_graph(engine.game_state)
                 current_loc = engine.game_state.actors["player"].location
                 path = find_path(graph, current_loc, target_location)
 
                 if path is None:
-                    print(f"[✗] No path from {current_loc} to {target_location}")
+                    emit(f"[✗] No path from {current_loc} to {target_location}")
                     if stop_on_error:
-                        print(f"\n⚠️  Stopped at line {i} due to @goto failure")
+                        emit(f"\n⚠️  Stopped at line {i} due to @goto failure")
                         break
                 elif len(path) == 0:
-                    print(f"[✓] Already at {target_location}")
+                    emit(f"[✓] Already at {target_location}")
                 else:
                     # Execute each go command along the path
-                    print(f"    Path: {' → '.join(path)} ({len(path)} steps)")
+                    emit(f"    Path: {' → '.join(path)} ({len(path)} steps)")
                     goto_failed = False
                     for direction in path:
                         go_result = engine.json_handler.handle_message({
@@ -627,19 +644,19 @@ def run_walkthrough(
                         go_success = bool(go_result.get("success", False))
                         if not go_success:
                             msg = extract_result_message(go_result)
-                            print(f"[✗] go {direction}: {msg}")
+                            emit(f"[✗] go {direction}: {msg}")
                             goto_failed = True
                             break
                     if goto_failed:
                         if stop_on_error:
-                            print(f"\n⚠️  Stopped at line {i} due to @goto navigation failure")
+                            emit(f"\n⚠️  Stopped at line {i} due to @goto navigation failure")
                             break
                     else:
-                        print(f"[✓] Arrived at {target_location}")
+                        emit(f"[✓] Arrived at {target_location}")
             except Exception as e:
-                print(f"[✗] @goto failed: {e}")
+                emit(f"[✗] @goto failed: {e}")
                 if stop_on_error:
-                    print(f"\n⚠️  Stopped at line {i} due to @goto failure")
+                    emit(f"\n⚠️  Stopped at line {i} due to @goto failure")
                     break
 
             continue
@@ -647,27 +664,27 @@ def run_walkthrough(
         # Check if this is an @advance command
         advance_turns = parse_advance_command(line)
         if advance_turns is not None:
-            print(f"\n{'='*60}")
-            print(f"@advance {advance_turns} turns")
-            print("-" * 60)
+            emit(f"\n{'='*60}")
+            emit(f"@advance {advance_turns} turns")
+            emit("-" * 60)
 
             try:
-                # Import turn_executor and types
-                from src import turn_executor
+                # Import accessor and types
                 from src.state_accessor import StateAccessor
                 from src.types import ActorId as ActorIdType
 
                 # Create accessor for turn processing
                 accessor = StateAccessor(
                     game_state=engine.game_state,
-                    behavior_manager=engine.behavior_manager
+                    behavior_manager=engine.behavior_manager,
+                    rng=engine.rng
                 )
 
                 # Advance turns and execute turn phases
                 for turn_num in range(advance_turns):
                     # Execute turn phases (this also increments turn_count internally)
                     # Pass empty action since this is just time passing
-                    turn_messages = turn_executor.execute_turn_phases(
+                    turn_messages = engine.turn_scheduler.execute_turn_phases(
                         engine.game_state,
                         engine.behavior_manager,
                         accessor,
@@ -677,13 +694,13 @@ def run_walkthrough(
                     # Print turn messages if any
                     if turn_messages:
                         for msg in turn_messages:
-                            print(f"  Turn {engine.game_state.turn_count}: {msg}")
+                            emit(f"  Turn {engine.game_state.turn_count}: {msg}")
 
-                print(f"[✓] Advanced to turn {engine.game_state.turn_count}")
+                emit(f"[✓] Advanced to turn {engine.game_state.turn_count}")
             except Exception as e:
-                print(f"[✗] Failed to advance turns: {e}")
+                emit(f"[✗] Failed to advance turns: {e}")
                 if stop_on_error:
-                    print(f"\n⚠️  Stopped at line {i} due to @advance failure")
+                    emit(f"\n⚠️  Stopped at line {i} due to @advance failure")
                     break
 
             continue
@@ -691,19 +708,19 @@ def run_walkthrough(
         # Check if this is an @expect command
         expect_cmd = parse_expect_command(line)
         if expect_cmd:
-            print(f"\n{'='*60}")
-            print(f'@expect "{expect_cmd}"')
-            print("-" * 60)
+            emit(f"\n{'='*60}")
+            emit(f'@expect "{expect_cmd}"')
+            emit("-" * 60)
 
             if expect_cmd.lower() in last_output.lower():
-                print(f"[✓] Found expected text in output")
+                emit(f"[✓] Found expected text in output")
             else:
-                print(f"[✗] Expected text not found in last output:")
-                print(f"    Expected: {expect_cmd}")
-                print(f"    Last output: {last_output[:200]}...")
+                emit(f"[✗] Expected text not found in last output:")
+                emit(f"    Expected: {expect_cmd}")
+                emit(f"    Last output: {last_output[:200]}...")
                 assertion_failures.append((i, line, f"Expected text not found: {expect_cmd}"))
                 if stop_on_error:
-                    print(f"\n⚠️  Stopped at line {i} due to @expect failure")
+                    emit(f"\n⚠️  Stopped at line {i} due to @expect failure")
                     break
 
             continue
@@ -712,18 +729,18 @@ def run_walkthrough(
         assertion = parse_assertion(line)
         if assertion:
             field_path, operator, expected = assertion
-            print(f"\n{'='*60}")
-            print(f"ASSERT {field_path} {operator} {expected}")
-            print("-" * 60)
+            emit(f"\n{'='*60}")
+            emit(f"ASSERT {field_path} {operator} {expected}")
+            emit("-" * 60)
 
             assert_success, error = evaluate_assertion(engine, field_path, operator, expected)
             if assert_success:
-                print(f"[✓] Assertion passed")
+                emit(f"[✓] Assertion passed")
             else:
-                print(f"[✗] {error}")
+                emit(f"[✗] {error}")
                 assertion_failures.append((i, line, error))
                 if stop_on_error:
-                    print(f"\n⚠️  Stopped at line {i} due to assertion failure")
+                    emit(f"\n⚠️  Stopped at line {i} due to assertion failure")
                     break
 
             continue
@@ -733,10 +750,11 @@ def run_walkthrough(
         if not cmd:
             continue
 
-        print(f"\n{'='*60}")
-        print(f"> {cmd}")
-        print("-" * 60)
+        emit(f"\n{'='*60}")
+        emit(f"> {cmd}")
+        emit("-" * 60)
 
+        started = time.perf_counter()
         # Check if command is JSON (starts with '{')
         if cmd.strip().startswith('{'):
             import json
@@ -744,13 +762,13 @@ def run_walkthrough(
                 json_message = json.loads(cmd)
                 result = engine.json_handler.handle_message(json_message)
             except json.JSONDecodeError as e:
-                print(f"JSON PARSE ERROR: {e}")
+                emit(f"JSON PARSE ERROR: {e}")
                 result = {"success": False, "error": {"message": f"Invalid JSON: {e}"}}
         else:
             # Parse the command using text parser
             parsed = parser.parse_command(cmd)
             if not parsed:
-                print(f"PARSE ERROR: Could not parse '{cmd}'")
+                emit(f"PARSE ERROR: Could not parse '{cmd}'")
                 result = {"success": False, "error": {"message": f"Could not parse: {cmd}"}}
             else:
                 # Build action dict from parsed command
@@ -772,11 +790,13 @@ def run_walkthrough(
                     "action": action
                 })
 
+        seconds = time.perf_counter() - started
         success = bool(result.get("success", False))
         results.append({
             "command": cmd,
             "result": result,
-            "expect_success": expect_success
+            "expect_success": expect_success,
+            "seconds": seconds
         })
 
         # Categorize failure if command failed
@@ -789,7 +809,7 @@ def run_walkthrough(
                 unexpected_failures.append((i, cmd, category))
 
         if verbose:
-            print(json.dumps(result, indent=2, default=str))
+            emit(json.dumps(result, indent=2, default=str))
         else:
             msg = extract_result_message(result)
             last_output = msg  # Store for @expect commands
@@ -801,55 +821,55 @@ def run_walkthrough(
             elif success and not expect_success:
                 status = "?"  # Expected to fail but succeeded
 
-            print(f"[{status}] {msg}")
+            emit(f"[{status}] {msg}")
 
             # Show vitals if requested
             if show_vitals:
                 vitals_info = extract_vitals_info(engine)
-                print(vitals_info)
+                emit(vitals_info)
 
             # Show HP if requested and available
             if show_hp:
                 hp_info = extract_hp_info(result)
                 if hp_info:
-                    print(hp_info)
+                    emit(hp_info)
 
             # Show state if requested
             if show_state:
-                print("\nPlayer State:")
+                emit("\nPlayer State:")
                 from src.state_manager import ActorId
                 player = engine.game_state.actors.get(ActorId("player"))
                 if player:
-                    print(f"  HP: {player.properties.get('health')}")
-                    print(f"  Location: {player.location}")
+                    emit(f"  HP: {player.properties.get('health')}")
+                    emit(f"  Location: {player.location}")
                     if player.inventory:
-                        print(f"  Inventory: {player.inventory}")
+                        emit(f"  Inventory: {player.inventory}")
                     conditions = player.properties.get('conditions')
                     if conditions:
-                        print(f"  Conditions: {list(conditions.keys())}")
+                        emit(f"  Conditions: {list(conditions.keys())}")
                         for cond_name, cond_data in conditions.items():
-                            print(f"    {cond_name}: {cond_data}")
+                            emit(f"    {cond_name}: {cond_data}")
 
         # Stop on error if requested
         if stop_on_error and not success:
-            print(f"\n⚠️  Stopped at command {i} due to failure")
+            emit(f"\n⚠️  Stopped at command {i} due to failure")
             break
 
     # Report unexpected failures
     if unexpected_failures:
-        print(f"\n{'='*60}")
-        print(f"⚠️  {len(unexpected_failures)} UNEXPECTED FAILURES:")
+        emit(f"\n{'='*60}")
+        emit(f"⚠️  {len(unexpected_failures)} UNEXPECTED FAILURES:")
         for line_num, cmd, category in unexpected_failures:
-            print(f"  Line {line_num}: {cmd}")
-            print(f"    Category: {category.value}")
+            emit(f"  Line {line_num}: {cmd}")
+            emit(f"    Category: {category.value}")
 
     # Report assertion failures
     if assertion_failures:
-        print(f"\n{'='*60}")
-        print(f"⚠️  {len(assertion_failures)} ASSERTION FAILURES:")
+        emit(f"\n{'='*60}")
+        emit(f"⚠️  {len(assertion_failures)} ASSERTION FAILURES:")
         for line_num, assertion_text, error in assertion_failures:
-            print(f"  Line {line_num}: {assertion_text}")
-            print(f"    {error}")
+            emit(f"  Line {line_num}: {assertion_text}")
+            emit(f"    {error}")
 
     return results, failure_counts, len(assertion_failures)
 
@@ -886,6 +906,14 @@ def main():
                           help="Show player state after each command (for debugging)")
     argparser.add_argument("--show-vitals", action="store_true",
                           help="Show vital stats (HP, equipment, conditions) after each command")
+    argparser.add_argument("--profile", action="store_true",
+                          help="Print turn latency profile (handlers, behaviors, turn phases, narration)")
+    argparser.add_argument("--profile-top", type=int, default=10, metavar="N",
+                          help="Rows per category in the --profile report (default: 10)")
+    argparser.add_argument("--seed", type=int, metavar="N",
+                          help="Seed the session's random number generator for a repeatable run")
+    argparser.add_argument("--quiet", "-q", action="store_true",
+                          help="Print only the summary, not each command's output")
 
     args = argparser.parse_args()
 
@@ -903,13 +931,15 @@ def main():
     print(f"Loading game from {args.game_dir}...")
 
     try:
-        engine = GameEngine(Path(args.game_dir))
+        engine = GameEngine(Path(args.game_dir), seed=args.seed)
     except Exception as e:
         print(f"Error loading game: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         return 1
 
+    profiler = engine.json_handler.enable_profiling() if args.profile else None
+
     # Filter out pure comment lines and empty lines for count
     executable_commands = [c for c in commands if c.strip() and not c.strip().startswith("#")]
     print(f"Running {len(executable_commands)} commands...")
@@ -921,7 +951,8 @@ def main():
         args.stop_on_error,
         args.show_hp,
         args.show_state,
-        args.show_vitals
+        args.show_vitals,
+        args.quiet
     )
 
     # Summary
@@ -951,6 +982,10 @@ def main():
     if assertion_failure_count > 0:
         print(f"\n⚠️  {assertion_failure_count} assertions failed")
 
+    if profiler is not None:
+        print(f"\n{'='*60}")
+        print(profiler.format_summary(top=args.profile_top))
+
     # Save state if requested
     if args.save_state:
         save_game_state(engine, Path(args.save_state))
@@ -11,6 +11,8 @@ functions.
 import random
 from typing import Any, Dict, Optional, TYPE_CHECKING, cast
 
+from src.state_accessor import accessor_rng
+
 if TYPE_CHECKING:
     from src.state_manager import Item, Location, Actor, ExitDescriptor, Lock
     from src.state_accessor import StateAccessor
@@ -19,7 +21,8 @@ if TYPE_CHECKING:
 
 def entity_to_dict(entity: Any, include_llm_context: bool = True,
                    max_traits: Optional[int] = None,
-                   player_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                   player_context: Optional[Dict[str, Any]] = None,
+                   rng: Any = random) -> Dict[str, Any]:
     """Convert any entity to a dict suitable for LLM communication.
 
     Handles: Item, Location, Actor, ExitDescriptor, Lock
@@ -31,6 +34,8 @@ def entity_to_dict(entity: Any, include_llm_context: bool = True,
                    Use for brief verbosity mode to reduce LLM output length.
         player_context: If set, compute spatial_relation based on player's
                        posture and focus. Dict with posture, focused_on keys.
+        rng: Random number generator for the trait order (default: the random
+             module; pass accessor.rng for the session's generator)
 
     Returns:
         Dict representation of entity
@@ -39,7 +44,7 @@ def entity_to_dict(entity: Any, include_llm_context: bool = True,
 
     if include_llm_context:
         _add_llm_context(result, entity, max_traits=max_traits,
-                        player_context=player_context)
+                        player_context=player_context, rng=rng)
 
     # Add spatial_relation if player has non-null posture
     if player_context and player_context.get("posture"):
@@ -176,7 +181,8 @@ def _detect_entity_type(entity: Any) -> Optional[str]:
 
 def _add_llm_context(result: Dict[str, Any], entity: Any,
                      max_traits: Optional[int] = None,
-                     player_context: Optional[Dict[str, Any]] = None) -> None:
+                     player_context: Optional[Dict[str, Any]] = None,
+                     rng: Any = random) -> None:
     """Add llm_context with randomized traits and perspective variant selection.
 
     Randomizes trait order to encourage varied LLM narration.
@@ -189,6 +195,7 @@ def _add_llm_context(result: Dict[str, Any], entity: Any,
         entity: Entity to get llm_context from
         max_traits: If set, limit traits to this count after randomization
         player_context: If set, used for perspective_variants selection
+        rng: Random number generator for the trait order
     """
     llm_context = _get_llm_context(entity)
 
@@ -201,7 +208,7 @@ def _add_llm_context(result: Dict[str, Any], entity: Any,
     # Randomize traits if present
     if 'traits' in context_copy and isinstance(context_copy['traits'], list):
         traits_copy = list(context_copy['traits'])
-        random.shuffle(traits_copy)
+        rng.shuffle(traits_copy)
         # Apply max_traits limit if specified
         if max_traits is not None:
             traits_copy = traits_copy[:max_traits]
@@ -320,7 +327,8 @@ def serialize_for_handler_result(
     Convenience function for behavior handlers. Always includes llm_context
     with randomized traits. When accessor and actor_id are provided, also
     computes spatial_relation and selects appropriate perspective_variant
-    based on the actor's current posture.
+    based on the actor's current posture. Traits are shuffled with the
+    accessor's generator when an accessor is given.
 
     Args:
         entity: Entity to serialize
@@ -334,4 +342,5 @@ def serialize_for_handler_result(
     if accessor is not None and actor_id is not None:
         player_context = _build_player_context(accessor, actor_id)
 
-    return entity_to_dict(entity, include_llm_context=True, player_context=player_context)
+    return entity_to_dict(entity, include_llm_context=True, player_context=player_context,
+                          rng=accessor_rng(accessor))
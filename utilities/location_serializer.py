@@ -9,6 +9,7 @@ All location serialization for LLM communication should use this function.
 """
 from typing import Any, Dict, Optional
 
+from src.state_accessor import accessor_rng
 from src.types import ActorId
 from utilities.entity_serializer import entity_to_dict
 from utilities.state_variant_selector import select_state_variant
@@ -76,13 +77,14 @@ def serialize_location_for_llm(accessor, location, actor_id: ActorId) -> Dict[st
         }
     """
     result: Dict[str, Any] = {}
+    rng = accessor_rng(accessor)
 
     # Build player context for perspective-aware narration
     player_context = _build_player_context(accessor, actor_id)
     result["player_context"] = player_context
 
     # Serialize location
-    location_dict = entity_to_dict(location)
+    location_dict = entity_to_dict(location, rng=rng)
 
     # Select state variant based on world state (Context Builder logic)
     if 'llm_context' in location_dict:
@@ -111,19 +113,19 @@ def serialize_location_for_llm(accessor, location, actor_id: ActorId) -> Dict[st
 
     # Items directly in location
     for item in contents["items"]:
-        items.append(entity_to_dict(item, player_context=player_context))
+        items.append(entity_to_dict(item, player_context=player_context, rng=rng))
 
     # Items on surfaces - add with on_surface marker
     for container_name, container_items in contents["surface_items"].items():
         for item in container_items:
-            item_dict = entity_to_dict(item, player_context=player_context)
+            item_dict = entity_to_dict(item, player_context=player_context, rng=rng)
             item_dict["on_surface"] = container_name
             items.append(item_dict)
 
     # Items in open containers - add with in_container marker
     for container_name, container_items in contents["open_container_items"].items():
         for item in container_items:
-            item_dict = entity_to_dict(item, player_context=player_context)
+            item_dict = entity_to_dict(item, player_context=player_context, rng=rng)
             item_dict["in_container"] = container_name
             items.append(item_dict)
 
@@ -141,7 +143,7 @@ def serialize_location_for_llm(accessor, location, actor_id: ActorId) -> Dict[st
             door = accessor.get_door_item(exit_entity.door_id)
             if door and exit_entity.door_id not in seen_door_ids:
                 seen_door_ids.add(exit_entity.door_id)
-                door_dict = entity_to_dict(door, player_context=player_context)
+                door_dict = entity_to_dict(door, player_context=player_context, rng=rng)
                 door_dict["direction"] = direction
                 doors.append(door_dict)
     result["doors"] = doors
@@ -176,7 +178,7 @@ def serialize_location_for_llm(accessor, location, actor_id: ActorId) -> Dict[st
             exit_data["door_id"] = exit_entity.door_id
         # Include llm_context if present in traits - pass player_context for perspective_variants
         if "llm_context" in exit_entity.traits:
-            exit_dict = entity_to_dict(exit_entity, player_context=player_context)
+            exit_dict = entity_to_dict(exit_entity, player_context=player_context, rng=rng)
             if "llm_context" in exit_dict:
                 exit_data["llm_context"] = exit_dict["llm_context"]
             # Also include perspective_note if present
@@ -188,7 +190,7 @@ def serialize_location_for_llm(accessor, location, actor_id: ActorId) -> Dict[st
     # Serialize actors (don't need player_context - spatial_relation is for items)
     actors = []
     for actor in contents["actors"]:
-        actors.append(entity_to_dict(actor))
+        actors.append(entity_to_dict(actor, rng=rng))
     result["actors"] = actors
 
     return result
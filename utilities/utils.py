@@ -12,6 +12,7 @@ parameter and use it correctly. Never hardcode "player" - use the actor_id varia
 from typing import Optional, List, Tuple, Dict, Any, Union, TYPE_CHECKING, cast, Callable
 
 from src.state_accessor import EventResult
+from src.state_manager import AT_EXIT
 from src.types import ActorId, LocationId, LockId, HookName
 from src.word_entry import WordEntry
 from utilities.entity_serializer import serialize_for_handler_result
@@ -177,6 +178,13 @@ def name_matches(
     return False
 
 
+def _search_words(search_term: Union[str, WordEntry]) -> List[str]:
+    """Get the canonical word and synonyms of a search term (a plain string is its own word)."""
+    if isinstance(search_term, str):
+        return [search_term]
+    return [search_term.word] + search_term.synonyms
+
+
 def is_observable(
     entity: EntityLike,
     accessor: "StateAccessor",
@@ -307,20 +315,33 @@ def find_accessible_item(
     adjective_str = _extract_word(adjective)
     has_adjective = adjective_str and adjective_str.strip()
 
+    # Resolve the name through the token index first; every search below
+    # only considers these ids, so an unknown noun costs no scanning at all
+    name_ids = accessor.game_state.ids_with_name_token("item", _search_words(name))
+    if not name_ids:
+        return None
+
     # Collect all accessible items matching name
     matching_items = []
 
-    # Check all visible items in location (uses _is_item_visible_in_location)
+    # Check all visible items in location (same rules as _is_item_visible_in_location)
     # This includes door items visible through exits and excludes hidden items
-    for item in accessor.game_state.items:
-        if _is_item_visible_in_location(item, location.id, accessor, actor_id):
-            if name_matches(name, item.name):
+    items_placed_here = _items_placed_in_location(accessor, location.id)
+    for item in items_placed_here:
+        if item.id in name_ids:
+            visible, _ = is_observable(
+                item, accessor, accessor.behavior_manager,
+                actor_id=actor_id, method="look"
+            )
+            if visible:
                 matching_items.append(item)
 
     # Check inventory (inventory items use observability check)
     for item_id in actor.inventory:
+        if item_id not in name_ids:
+            continue
         inventory_item = accessor.get_item(item_id)
-        if inventory_item and name_matches(name, inventory_item.name):
+        if inventory_item:
             # Check observability even in inventory
             visible, _ = is_observable(
                 inventory_item, accessor, accessor.behavior_manager,
@@ -334,23 +355,28 @@ def find_accessible_item(
     for other_actor in accessor.get_actors_in_location(location.id):
         if other_actor.id == actor_id:
             continue  # Already checked player's inventory above
+        carried_ids = [item_id for item_id in other_actor.inventory if item_id in name_ids]
+        if not carried_ids:
+            continue
         # Check if actor is visible
         actor_visible, _ = is_observable(
             other_actor, accessor, accessor.behavior_manager,
             actor_id=actor_id, method="look"
         )
         if actor_visible:
-            for item_id in other_actor.inventory:
+            for item_id in carried_ids:
                 carried_item = accessor.get_item(item_id)
                 # Only include equipped items from other actors
-                if carried_item and carried_item.states.get("equipped", False) and name_matches(name, carried_item.name):
+                if carried_item and carried_item.states.get("equipped", False):
                     matching_items.append(carried_item)
 
     # Check containers in location
-    # Get visible items that are containers
-    visible_items = [item for item in accessor.game_state.items
-                     if _is_item_visible_in_location(item, location.id, accessor, actor_id)]
-    for container in visible_items:
+    # Only containers holding a name match need their visibility checked
+    entity_where = accessor.game_state._entity_where
+    match_locations = {entity_where.get(item_id) for item_id in name_ids}
+    for container in items_placed_here:
+        if container.id not in match_locations:
+            continue
         container_info = container.properties.get("container", {})
         if not container_info:
             continue
@@ -361,9 +387,15 @@ def find_accessible_item(
         # Surface containers are always accessible
         # Enclosed containers must be open
         if is_surface or is_open:
+            container_visible, _ = is_observable(
+                container, accessor, accessor.behavior_manager,
+                actor_id=actor_id, method="look"
+            )
+            if not container_visible:
+                continue
             # Get items inside this container (check observability)
-            for item in accessor.game_state.items:
-                if item.location == container.id and name_matches(name, item.name):
+            for item in accessor.get_items_in_location(LocationId(container.id)):
+                if item.id in name_ids:
                     visible, _ = is_observable(
                         item, accessor, accessor.behavior_manager,
                         actor_id=actor_id, method="look"
@@ -567,14 +599,9 @@ def get_doors_in_location(accessor: "StateAccessor", location_id: str, actor_id:
     Returns:
         List of door Item objects
     """
-    doors_in_location = []
-
     # Get door items visible in this location
-    for item in accessor.game_state.items:
-        if item.is_door and _is_item_visible_in_location(item, location_id, accessor, actor_id):
-            doors_in_location.append(item)
-
-    return doors_in_location
+    return [item for item in _visible_items_in_location(accessor, location_id, actor_id)
+            if item.is_door]
 
 
 def _matches_adjective(adjective: str, entity: "Item") -> bool:
@@ -837,7 +864,7 @@ def find_door_with_adjective(
     matching_doors = []
 
     # Check door items (unified model)
-    for item in accessor.game_state.items:
+    for item in _items_placed_in_location(accessor, location_id):
         if not item.is_door:
             continue
         if not _is_item_visible_in_location(item, location_id, accessor, actor_id, verb or "look"):
@@ -903,6 +930,84 @@ def find_door_with_adjective(
     return matching_doors[0]
 
 
+def _items_placed_in_location(accessor: "StateAccessor", location_id: str) -> List["Item"]:
+    """
+    Get items whose placement puts them in a location, before observability.
+
+    Reads the containment index rather than scanning every item, so the cost
+    is proportional to what is in the room. Candidates are:
+    - items located directly in the room
+    - door items located at an exit reference (exit:{location_id}:{direction})
+    - door items referenced by an exit in the room via door_id
+
+    Visibility itself (hidden state, on_observe behaviors) is not cached; callers
+    still run is_observable() on each candidate, because behaviors and direct
+    state writes can change it at any time.
+
+    Args:
+        accessor: StateAccessor instance
+        location_id: ID of the location
+
+    Returns:
+        List of candidate Item objects in game file order
+    """
+    game_state = accessor.game_state
+    registry = game_state._entity_registry
+    buckets = game_state._entities_at_by_kind.get(location_id)
+    if not buckets:
+        return []
+
+    candidate_ids: Dict[str, None] = dict(buckets.get("item", {}))
+    for item_id in buckets.get(AT_EXIT, ()):
+        door = registry.get("item", item_id)
+        if door is not None and door.is_door:
+            candidate_ids[item_id] = None
+    for exit_id in buckets.get("exit", ()):
+        exit_entity = registry.get("exit", exit_id)
+        door_id = exit_entity.door_id if exit_entity is not None else None
+        if door_id and door_id not in candidate_ids:
+            door = registry.get("item", door_id)
+            if door is not None and door.is_door:
+                candidate_ids[door_id] = None
+
+    return registry.ordered("item", candidate_ids)
+
+
+def _visible_items_in_location(
+    accessor: "StateAccessor",
+    location_id: str,
+    actor_id: ActorId,
+    method: str = "look"
+) -> List["Item"]:
+    """
+    Get items visible in a location: _items_placed_in_location() filtered by is_observable().
+
+    Equivalent to checking _is_item_visible_in_location() for every item in the game.
+    """
+    visible_items = []
+    for item in _items_placed_in_location(accessor, location_id):
+        visible, _ = is_observable(
+            item, accessor, accessor.behavior_manager,
+            actor_id=actor_id, method=method
+        )
+        if visible:
+            visible_items.append(item)
+    return visible_items
+
+
+def _visible_items_in_container(accessor: "StateAccessor", container_id: str, actor_id: ActorId) -> List["Item"]:
+    """Get observable items whose location is container_id, in game file order."""
+    visible_items = []
+    for item in accessor.get_items_in_location(LocationId(container_id)):
+        visible, _ = is_observable(
+            item, accessor, accessor.behavior_manager,
+            actor_id=actor_id, method="look"
+        )
+        if visible:
+            visible_items.append(item)
+    return visible_items
+
+
 def _is_item_visible_in_location(
     item: "Item",
     location_id: str,
@@ -983,11 +1088,8 @@ def gather_location_contents(accessor: "StateAccessor", location_id: str, actor_
             - open_container_items: Dict of container_name -> list of items in open containers
             - actors: List of other actors in location
     """
-    # Collect all visible items in location
-    items_here = []
-    for item in accessor.game_state.items:
-        if _is_item_visible_in_location(item, location_id, accessor, actor_id):
-            items_here.append(item)
+    # Collect all visible items in location (candidates come from the containment index)
+    items_here = _visible_items_in_location(accessor, location_id, actor_id)
 
     # Collect items on surfaces and in open containers
     surface_items = {}  # container_name -> [items]
@@ -1002,16 +1104,7 @@ def gather_location_contents(accessor: "StateAccessor", location_id: str, actor_
         is_open = container_props.get("open", False)
 
         if is_surface or is_open:
-            items_in_container = []
-            for item in accessor.game_state.items:
-                if item.location == container.id:
-                    # Check observability for items in containers
-                    visible, _ = is_observable(
-                        item, accessor, accessor.behavior_manager,
-                        actor_id=actor_id, method="look"
-                    )
-                    if visible:
-                        items_in_container.append(item)
+            items_in_container = _visible_items_in_container(accessor, container.id, actor_id)
 
             if items_in_container:
                 if is_surface:
@@ -1021,8 +1114,8 @@ def gather_location_contents(accessor: "StateAccessor", location_id: str, actor_
 
     # Collect other visible actors
     actors_here = []
-    for other_actor_id, other_actor in accessor.game_state.actors.items():
-        if other_actor.location == location_id and other_actor_id != actor_id:
+    for other_actor in accessor.get_actors_in_location(LocationId(location_id)):
+        if other_actor.id != actor_id:
             # Check observability for actors
             visible, _ = is_observable(
                 other_actor, accessor, accessor.behavior_manager,
@@ -1215,7 +1308,7 @@ def find_lock_by_context(
 
     # Strategy 3: Find lock if only one visible door has a visible lock
     visible_locks = []
-    for item in accessor.game_state.items:
+    for item in _items_placed_in_location(accessor, location_id):
         if item.is_door and item.door_lock_id:
             if _is_item_visible_in_location(item, location_id, accessor, actor_id):
                 lock = _get_visible_lock(item.door_lock_id)